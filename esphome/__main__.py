@@ -11,7 +11,7 @@ import time
 
 import argcomplete
 
-from esphome import const, writer, yaml_util
+from esphome import const, loader, writer, yaml_util
 import esphome.codegen as cg
 from esphome.config import iter_component_configs, read_config, strip_default_ids
 from esphome.const import (
@@ -49,12 +49,25 @@ from esphome.util import (
     list_yaml_files,
     run_external_command,
     run_external_process,
+    run_external_process_prefixed,
     safe_print,
+    safe_print_lines,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _positive_int(value: str) -> int:
+    """Argument type for a number of parallel jobs."""
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result < 1:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a positive integer")
+    return result
+
+
 def choose_prompt(options, purpose: str = None):
     if not options:
         raise EsphomeError(
@@ -336,6 +349,41 @@ def check_permissions(port):
             )
 
 
+def _get_ota_port_and_password(config) -> tuple[int, str]:
+    ota_conf = {}
+    for ota_item in config.get(CONF_OTA, []):
+        if ota_item[CONF_PLATFORM] == CONF_ESPHOME:
+            ota_conf = ota_item
+            break
+
+    if not ota_conf:
+        raise EsphomeError(
+            f"Cannot upload Over the Air as the {CONF_OTA} configuration is not present or does not include {CONF_PLATFORM}: {CONF_ESPHOME}"
+        )
+    return int(ota_conf[CONF_PORT]), ota_conf.get(CONF_PASSWORD, "")
+
+
+def upload_program_many(config, args, hosts):
+    """Upload the firmware to several devices over the air at the same time."""
+    from esphome import espota2
+
+    hosts = [CORE.address if host == "OTA" else host for host in hosts]
+    if serial_ports := [host for host in hosts if get_port_type(host) != "NETWORK"]:
+        raise EsphomeError(
+            f"Uploading to several devices is only supported over the air, got {', '.join(serial_ports)}"
+        )
+
+    remote_port, password = _get_ota_port_and_password(config)
+    filename = getattr(args, "file", None) or CORE.firmware_bin
+    results = espota2.run_ota_many(
+        hosts, remote_port, password, filename, args.ota_jobs
+    )
+    failed = [host for host, rc in results.items() if rc != 0]
+    for host in failed:
+        _LOGGER.error("Upload to %s failed", host)
+    return 1 if failed else 0
+
+
 def upload_program(config, args, host):
     try:
         module = importlib.import_module("esphome.components." + CORE.target_platform)
@@ -358,21 +406,9 @@ def upload_program(config, args, host):
 
         return 1  # Unknown target platform
 
-    ota_conf = {}
-    for ota_item in config.get(CONF_OTA, []):
-        if ota_item[CONF_PLATFORM] == CONF_ESPHOME:
-            ota_conf = ota_item
-            break
-
-    if not ota_conf:
-        raise EsphomeError(
-            f"Cannot upload Over the Air as the {CONF_OTA} configuration is not present or does not include {CONF_PLATFORM}: {CONF_ESPHOME}"
-        )
-
     from esphome import espota2
 
-    remote_port = int(ota_conf[CONF_PORT])
-    password = ota_conf.get(CONF_PASSWORD, "")
+    remote_port, password = _get_ota_port_and_password(config)
 
     if (
         CONF_MQTT in config  # pylint: disable=too-many-boolean-expressions
@@ -472,7 +508,114 @@ def command_compile(args, config):
     return 0
 
 
+def command_watch(args, config):
+    """Regenerate (and compile) the program each time one of its input files changes.
+
+    The process stays alive between builds, so a change only costs validation,
+    code generation and the incremental PlatformIO build.
+    """
+    command_line_substitutions = dict(args.substitution) if args.substitution else {}
+
+    while True:
+        _build_watched_config(args, config)
+        watched = yaml_util.loaded_files()
+        _LOGGER.info(
+            "Watching %s files for changes, press Ctrl+C to stop...", len(watched)
+        )
+        _wait_for_file_change(watched, args.interval)
+
+        config = _read_watched_config(args, command_line_substitutions)
+        while config is None:
+            # Keep the files of the failed attempt so fixing any of them retries
+            _wait_for_file_change(yaml_util.loaded_files(), args.interval)
+            config = _read_watched_config(args, command_line_substitutions)
+        CORE.config = config
+
+
+def _read_watched_config(args, command_line_substitutions):
+    """Validate the configuration again, return None if it is invalid."""
+    config_path = CORE.config_path
+    CORE.reset()
+    CORE.config_path = config_path
+    CORE.dashboard = args.dashboard
+    # Components fill module state while validating, start from scratch
+    loader.reset_components()
+    start = time.perf_counter()
+    try:
+        config = read_config(command_line_substitutions)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Unexpected error while reading the configuration")
+        return None
+    _LOGGER.info("Validation took %.2fs", time.perf_counter() - start)
+    return config
+
+
+def _build_watched_config(args, config) -> None:
+    start = time.perf_counter()
+    try:
+        generate_cpp_contents(config)
+        generated = time.perf_counter()
+        write_cpp_file()
+    except EsphomeError as e:
+        _LOGGER.error(e, exc_info=args.verbose)
+        return
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Unexpected error while generating the code")
+        return
+    written = time.perf_counter()
+    _LOGGER.info(
+        "Code generation took %.2fs, writing sources took %.2fs",
+        generated - start,
+        written - generated,
+    )
+    if args.only_generate:
+        return
+    try:
+        rc = compile_program(args, config)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Unexpected error while compiling")
+        rc = 1
+    _LOGGER.info(
+        "Compile %s after %.2fs",
+        "succeeded" if rc == 0 else "failed",
+        time.perf_counter() - written,
+    )
+
+
+def _wait_for_file_change(files: dict[str, str | None], interval: float) -> None:
+    """Block until the content of one of the given files changed."""
+
+    def stat_key(path: str) -> tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    stats = {path: stat_key(path) for path in files}
+    while True:
+        time.sleep(interval)
+        for path, digest in files.items():
+            current = stat_key(path)
+            if current == stats[path]:
+                continue
+            stats[path] = current
+            # Only content changes count, editors often touch files on save
+            if yaml_util.file_digest(path) != digest:
+                _LOGGER.info("%s changed", path)
+                return
+
+
 def command_upload(args, config):
+    devices = args.device or [None]
+    if len(devices) > 1:
+        exit_code = upload_program_many(config, args, devices)
+        if exit_code != 0:
+            return exit_code
+        _LOGGER.info("Successfully uploaded program to %s devices.", len(devices))
+        return 0
+
+    args.device = devices[0]
     port = choose_upload_log_host(
         default=args.device,
         check_default=None,
@@ -509,6 +652,24 @@ def command_logs(args, config):
     return show_logs(config, args, port)
 
 
+def command_profile(args, config):
+    if "profiler" not in config:
+        raise EsphomeError("Profiler is not configured!")
+    if "api" not in config:
+        raise EsphomeError("The profile command needs the native API to be configured")
+    port = choose_upload_log_host(
+        default=args.device,
+        check_default=None,
+        show_ota=False,
+        show_mqtt=False,
+        show_api=True,
+        purpose="profiling",
+    )
+    from esphome.components.profiler.client import run_profile
+
+    return run_profile(config, port)
+
+
 def command_run(args, config):
     exit_code = write_cpp(config)
     if exit_code != 0:
@@ -582,6 +743,12 @@ def command_dashboard(args):
     return dashboard.start_dashboard(args)
 
 
+def _esphome_command(*args: str) -> list[str]:
+    if CORE.dashboard:
+        return ["esphome", "--dashboard", *args]
+    return ["esphome", *args]
+
+
 def command_update_all(args):
     import click
 
@@ -593,30 +760,28 @@ def command_update_all(args):
         middle_text = f" {middle_text} "
         width = len(click.unstyle(middle_text))
         half_line = "=" * ((twidth - width) // 2)
-        safe_print(f"{half_line}{middle_text}{half_line}")
+        safe_print_lines(f"{half_line}{middle_text}{half_line}")
 
-    for f in files:
-        safe_print(f"Updating {color(AnsiFore.CYAN, f)}")
-        safe_print("-" * twidth)
-        safe_print()
-        if CORE.dashboard:
-            rc = run_external_process(
-                "esphome", "--dashboard", "run", f, "--no-logs", "--device", "OTA"
-            )
-        else:
+    if args.jobs > 1:
+        success = _update_all_parallel(args, files, print_bar)
+    else:
+        for f in files:
+            safe_print(f"Updating {color(AnsiFore.CYAN, f)}")
+            safe_print("-" * twidth)
+            safe_print()
             rc = run_external_process(
-                "esphome", "run", f, "--no-logs", "--device", "OTA"
+                *_esphome_command("run", f, "--no-logs", "--device", "OTA")
             )
-        if rc == 0:
-            print_bar(f"[{color(AnsiFore.BOLD_GREEN, 'SUCCESS')}] {f}")
-            success[f] = True
-        else:
-            print_bar(f"[{color(AnsiFore.BOLD_RED, 'ERROR')}] {f}")
-            success[f] = False
+            if rc == 0:
+                print_bar(f"[{color(AnsiFore.BOLD_GREEN, 'SUCCESS')}] {f}")
+                success[f] = True
+            else:
+                print_bar(f"[{color(AnsiFore.BOLD_RED, 'ERROR')}] {f}")
+                success[f] = False
 
-        safe_print()
-        safe_print()
-        safe_print()
+            safe_print()
+            safe_print()
+            safe_print()
 
     print_bar(f"[{color(AnsiFore.BOLD_WHITE, 'SUMMARY')}]")
     failed = 0
@@ -629,6 +794,58 @@ def command_update_all(args):
     return failed
 
 
+def _update_all_parallel(args, files, print_bar) -> dict[str, bool]:
+    """Compile all configurations concurrently and upload them as they finish.
+
+    Compilation is bounded by the number of CPUs, uploads have their own limit
+    as they are bound by the network and the devices instead.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    compile_jobs = min(args.jobs, os.cpu_count() or 1)
+    _LOGGER.info(
+        "Updating %s devices with %s compile and %s upload jobs",
+        len(files),
+        compile_jobs,
+        args.ota_jobs,
+    )
+    width = max(len(os.path.basename(f)) for f in files) if files else 0
+
+    def prefix(f: str) -> str:
+        return color(AnsiFore.CYAN, f"{os.path.basename(f):<{width}} | ")
+
+    def upload(f: str) -> bool:
+        rc = run_external_process_prefixed(
+            prefix(f), *_esphome_command("upload", f, "--device", "OTA")
+        )
+        if rc != 0:
+            print_bar(f"[{color(AnsiFore.BOLD_RED, 'ERROR')}] {f} (upload)")
+            return False
+        print_bar(f"[{color(AnsiFore.BOLD_GREEN, 'SUCCESS')}] {f}")
+        return True
+
+    with (
+        ThreadPoolExecutor(max_workers=compile_jobs) as compile_pool,
+        ThreadPoolExecutor(max_workers=args.ota_jobs) as upload_pool,
+    ):
+
+        def compile_and_queue_upload(f: str):
+            rc = run_external_process_prefixed(
+                prefix(f), *_esphome_command("compile", f)
+            )
+            if rc != 0:
+                print_bar(f"[{color(AnsiFore.BOLD_RED, 'ERROR')}] {f} (compile)")
+                return None
+            return upload_pool.submit(upload, f)
+
+        compiles = {f: compile_pool.submit(compile_and_queue_upload, f) for f in files}
+        success = {}
+        for f, compile_future in compiles.items():
+            upload_future = compile_future.result()
+            success[f] = upload_future is not None and upload_future.result()
+    return success
+
+
 def command_idedata(args, config):
     import json
 
@@ -751,8 +968,10 @@ PRE_CONFIG_ACTIONS = {
 POST_CONFIG_ACTIONS = {
     "config": command_config,
     "compile": command_compile,
+    "watch": command_watch,
     "upload": command_upload,
     "logs": command_logs,
+    "profile": command_profile,
     "run": command_run,
     "clean-mqtt": command_clean_mqtt,
     "mqtt-fingerprint": command_mqtt_fingerprint,
@@ -794,6 +1013,12 @@ def parse_args(argv):
         help="Add a substitution",
         metavar=("key", "value"),
     )
+    options_parser.add_argument(
+        "--config-cache",
+        help="Reuse the validated configuration if none of its files changed.",
+        action="store_true",
+        default=get_bool_env("ESPHOME_CONFIG_CACHE"),
+    )
 
     parser = argparse.ArgumentParser(
         description=f"ESPHome {const.__version__}", parents=[options_parser]
@@ -839,6 +1064,25 @@ def parse_args(argv):
         action="store_true",
     )
 
+    parser_watch = subparsers.add_parser(
+        "watch",
+        help="Regenerate and compile the program whenever the configuration changes.",
+    )
+    parser_watch.add_argument(
+        "configuration", help="Your YAML configuration file.", nargs=1
+    )
+    parser_watch.add_argument(
+        "--only-generate",
+        help="Only generate source code, do not compile.",
+        action="store_true",
+    )
+    parser_watch.add_argument(
+        "--interval",
+        help="Seconds between checks for changed files.",
+        type=float,
+        default=1.0,
+    )
+
     parser_upload = subparsers.add_parser(
         "upload",
         help="Validate the configuration and upload the latest binary.",
@@ -849,7 +1093,15 @@ def parse_args(argv):
     )
     parser_upload.add_argument(
         "--device",
-        help="Manually specify the serial port/address to use, for example /dev/ttyUSB0.",
+        help="Manually specify the serial port/address to use, for example /dev/ttyUSB0. "
+        "Can be given multiple times to upload to several devices over the air.",
+        action="append",
+    )
+    parser_upload.add_argument(
+        "--ota-jobs",
+        help="Number of devices to upload to in parallel when using several --device.",
+        type=_positive_int,
+        default=4,
     )
     parser_upload.add_argument(
         "--upload_speed",
@@ -881,6 +1133,18 @@ def parse_args(argv):
         default=os.getenv("ESPHOME_SERIAL_LOGGING_RESET"),
     )
 
+    parser_profile = subparsers.add_parser(
+        "profile",
+        help="Validate the configuration and show the time components spend in a table.",
+    )
+    parser_profile.add_argument(
+        "configuration", help="Your YAML configuration file.", nargs=1
+    )
+    parser_profile.add_argument(
+        "--device",
+        help="Manually specify the address to use, for example 192.168.1.50.",
+    )
+
     parser_discover = subparsers.add_parser(
         "discover",
         help="Validate the configuration and show all discovered devices.",
@@ -996,6 +1260,19 @@ def parse_args(argv):
     parser_update.add_argument(
         "configuration", help="Your YAML configuration file directories.", nargs="+"
     )
+    parser_update.add_argument(
+        "--jobs",
+        "-j",
+        help="Number of configurations to compile in parallel (limited to the number of CPUs).",
+        type=_positive_int,
+        default=1,
+    )
+    parser_update.add_argument(
+        "--ota-jobs",
+        help="Number of devices to upload to in parallel when using --jobs.",
+        type=_positive_int,
+        default=4,
+    )
 
     parser_idedata = subparsers.add_parser("idedata")
     parser_idedata.add_argument(
@@ -1063,7 +1340,10 @@ def run_esphome(argv):
         CORE.config_path = conf_path
         CORE.dashboard = args.dashboard
 
-        config = read_config(dict(args.substitution) if args.substitution else {})
+        config = read_config(
+            dict(args.substitution) if args.substitution else {},
+            use_cache=args.config_cache,
+        )
         if config is None:
             return 2
         CORE.config = config
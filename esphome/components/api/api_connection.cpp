@@ -166,14 +166,26 @@ void APIConnection::loop() {
     }
   }
 
+  if (!this->batch_packets_.empty() &&
+      App.get_loop_component_start_time() - this->batch_start_ >= this->parent_->get_batch_delay()) {
+    this->flush_batch_(true);
+  }
+
   if (!this->deferred_message_queue_.empty() && this->helper_->can_write_without_blocking()) {
     this->deferred_message_queue_.process_queue();
   }
 
   if (!this->list_entities_iterator_.completed())
     this->list_entities_iterator_.advance();
-  if (!this->initial_state_iterator_.completed() && this->list_entities_iterator_.completed())
-    this->initial_state_iterator_.advance();
+  if (!this->initial_state_iterator_.completed() && this->list_entities_iterator_.completed()) {
+    // The initial states are batched, send as many of them as fit in one batch at once
+    for (uint8_t i = 0; i < MAX_INITIAL_STATES_PER_LOOP; i++) {
+      this->initial_state_iterator_.advance();
+      if (this->initial_state_iterator_.completed() || this->remove_ || !this->deferred_message_queue_.empty() ||
+          this->batch_buffer_.size() >= MAX_BATCH_SIZE_BYTES)
+        break;
+    }
+  }
 
   static uint8_t max_ping_retries = 60;
   static uint16_t ping_retry_interval = 1000;
@@ -300,9 +312,10 @@ bool APIConnection::try_send_binary_sensor_state_(binary_sensor::BinarySensor *b
 }
 bool APIConnection::try_send_binary_sensor_info_(binary_sensor::BinarySensor *binary_sensor) {
   ListEntitiesBinarySensorResponse msg;
-  msg.device_class = binary_sensor->get_device_class();
+  msg.set_device_class(binary_sensor->get_device_class_ref());
   msg.is_status_binary_sensor = binary_sensor->is_status_binary_sensor();
-  msg.unique_id = get_default_unique_id("binary_sensor", binary_sensor);
+  std::string unique_id = get_default_unique_id("binary_sensor", binary_sensor);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(binary_sensor), msg,
                                      &APIConnection::send_list_entities_binary_sensor_response);
 }
@@ -336,8 +349,9 @@ bool APIConnection::try_send_cover_info_(cover::Cover *cover) {
   msg.supports_position = traits.get_supports_position();
   msg.supports_tilt = traits.get_supports_tilt();
   msg.supports_stop = traits.get_supports_stop();
-  msg.device_class = cover->get_device_class();
-  msg.unique_id = get_default_unique_id("cover", cover);
+  msg.set_device_class(cover->get_device_class_ref());
+  std::string unique_id = get_default_unique_id("cover", cover);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(cover), msg,
                                      &APIConnection::send_list_entities_cover_response);
 }
@@ -404,7 +418,8 @@ bool APIConnection::try_send_fan_info_(fan::Fan *fan) {
   msg.supported_speed_count = traits.supported_speed_count();
   for (auto const &preset : traits.supported_preset_modes())
     msg.supported_preset_modes.push_back(preset);
-  msg.unique_id = get_default_unique_id("fan", fan);
+  std::string unique_id = get_default_unique_id("fan", fan);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(fan), msg,
                                      &APIConnection::send_list_entities_fan_response);
 }
@@ -482,7 +497,8 @@ bool APIConnection::try_send_light_info_(light::LightState *light) {
       msg.effects.push_back(effect->get_name());
     }
   }
-  msg.unique_id = get_default_unique_id("light", light);
+  std::string unique_id = get_default_unique_id("light", light);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(light), msg,
                                      &APIConnection::send_list_entities_light_response);
 }
@@ -545,14 +561,15 @@ bool APIConnection::try_send_sensor_state_(sensor::Sensor *sensor, float state)
 }
 bool APIConnection::try_send_sensor_info_(sensor::Sensor *sensor) {
   ListEntitiesSensorResponse msg;
-  msg.unit_of_measurement = sensor->get_unit_of_measurement();
+  msg.set_unit_of_measurement(sensor->get_unit_of_measurement_ref());
   msg.accuracy_decimals = sensor->get_accuracy_decimals();
   msg.force_update = sensor->get_force_update();
-  msg.device_class = sensor->get_device_class();
+  msg.set_device_class(sensor->get_device_class_ref());
   msg.state_class = static_cast<enums::SensorStateClass>(sensor->get_state_class());
-  msg.unique_id = sensor->unique_id();
-  if (msg.unique_id.empty())
-    msg.unique_id = get_default_unique_id("sensor", sensor);
+  std::string unique_id = sensor->unique_id();
+  if (unique_id.empty())
+    unique_id = get_default_unique_id("sensor", sensor);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(sensor), msg,
                                      &APIConnection::send_list_entities_sensor_response);
 }
@@ -580,8 +597,9 @@ bool APIConnection::try_send_switch_state_(switch_::Switch *a_switch, bool state
 bool APIConnection::try_send_switch_info_(switch_::Switch *a_switch) {
   ListEntitiesSwitchResponse msg;
   msg.assumed_state = a_switch->assumed_state();
-  msg.device_class = a_switch->get_device_class();
-  msg.unique_id = get_default_unique_id("switch", a_switch);
+  msg.set_device_class(a_switch->get_device_class_ref());
+  std::string unique_id = get_default_unique_id("switch", a_switch);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(a_switch), msg,
                                      &APIConnection::send_list_entities_switch_response);
 }
@@ -620,10 +638,11 @@ bool APIConnection::try_send_text_sensor_state_(text_sensor::TextSensor *text_se
 }
 bool APIConnection::try_send_text_sensor_info_(text_sensor::TextSensor *text_sensor) {
   ListEntitiesTextSensorResponse msg;
-  msg.device_class = text_sensor->get_device_class();
-  msg.unique_id = text_sensor->unique_id();
-  if (msg.unique_id.empty())
-    msg.unique_id = get_default_unique_id("text_sensor", text_sensor);
+  msg.set_device_class(text_sensor->get_device_class_ref());
+  std::string unique_id = text_sensor->unique_id();
+  if (unique_id.empty())
+    unique_id = get_default_unique_id("text_sensor", text_sensor);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(text_sensor), msg,
                                      &APIConnection::send_list_entities_text_sensor_response);
 }
@@ -696,7 +715,8 @@ bool APIConnection::try_send_climate_info_(climate::Climate *climate) {
     msg.supported_custom_presets.push_back(custom_preset);
   for (auto swing_mode : traits.get_supported_swing_modes())
     msg.supported_swing_modes.push_back(static_cast<enums::ClimateSwingMode>(swing_mode));
-  msg.unique_id = get_default_unique_id("climate", climate);
+  std::string unique_id = get_default_unique_id("climate", climate);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(climate), msg,
                                      &APIConnection::send_list_entities_climate_response);
 }
@@ -752,13 +772,14 @@ bool APIConnection::try_send_number_state_(number::Number *number, float state)
 }
 bool APIConnection::try_send_number_info_(number::Number *number) {
   ListEntitiesNumberResponse msg;
-  msg.unit_of_measurement = number->traits.get_unit_of_measurement();
+  msg.set_unit_of_measurement(number->traits.get_unit_of_measurement_ref());
   msg.mode = static_cast<enums::NumberMode>(number->traits.get_mode());
-  msg.device_class = number->traits.get_device_class();
+  msg.set_device_class(number->traits.get_device_class_ref());
   msg.min_value = number->traits.get_min_value();
   msg.max_value = number->traits.get_max_value();
   msg.step = number->traits.get_step();
-  msg.unique_id = get_default_unique_id("number", number);
+  std::string unique_id = get_default_unique_id("number", number);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(number), msg,
                                      &APIConnection::send_list_entities_number_response);
 }
@@ -794,7 +815,8 @@ bool APIConnection::try_send_date_state_(datetime::DateEntity *date) {
 }
 bool APIConnection::try_send_date_info_(datetime::DateEntity *date) {
   ListEntitiesDateResponse msg;
-  msg.unique_id = get_default_unique_id("date", date);
+  std::string unique_id = get_default_unique_id("date", date);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(date), msg,
                                      &APIConnection::send_list_entities_date_response);
 }
@@ -830,7 +852,8 @@ bool APIConnection::try_send_time_state_(datetime::TimeEntity *time) {
 }
 bool APIConnection::try_send_time_info_(datetime::TimeEntity *time) {
   ListEntitiesTimeResponse msg;
-  msg.unique_id = get_default_unique_id("time", time);
+  std::string unique_id = get_default_unique_id("time", time);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(time), msg,
                                      &APIConnection::send_list_entities_time_response);
 }
@@ -867,7 +890,8 @@ bool APIConnection::try_send_datetime_state_(datetime::DateTimeEntity *datetime)
 }
 bool APIConnection::try_send_datetime_info_(datetime::DateTimeEntity *datetime) {
   ListEntitiesDateTimeResponse msg;
-  msg.unique_id = get_default_unique_id("datetime", datetime);
+  std::string unique_id = get_default_unique_id("datetime", datetime);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(datetime), msg,
                                      &APIConnection::send_list_entities_date_time_response);
 }
@@ -905,8 +929,10 @@ bool APIConnection::try_send_text_info_(text::Text *text) {
   msg.mode = static_cast<enums::TextMode>(text->traits.get_mode());
   msg.min_length = text->traits.get_min_length();
   msg.max_length = text->traits.get_max_length();
-  msg.pattern = text->traits.get_pattern();
-  msg.unique_id = get_default_unique_id("text", text);
+  std::string pattern = text->traits.get_pattern();
+  msg.set_pattern(StringRef(pattern));
+  std::string unique_id = get_default_unique_id("text", text);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(text), msg,
                                      &APIConnection::send_list_entities_text_response);
 }
@@ -945,7 +971,8 @@ bool APIConnection::try_send_select_info_(select::Select *select) {
   ListEntitiesSelectResponse msg;
   for (const auto &option : select->traits.get_options())
     msg.options.push_back(option);
-  msg.unique_id = get_default_unique_id("select", select);
+  std::string unique_id = get_default_unique_id("select", select);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(select), msg,
                                      &APIConnection::send_list_entities_select_response);
 }
@@ -967,8 +994,9 @@ void esphome::api::APIConnection::send_button_info(button::Button *button) {
 }
 bool esphome::api::APIConnection::try_send_button_info_(button::Button *button) {
   ListEntitiesButtonResponse msg;
-  msg.device_class = button->get_device_class();
-  msg.unique_id = get_default_unique_id("button", button);
+  msg.set_device_class(button->get_device_class_ref());
+  std::string unique_id = get_default_unique_id("button", button);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(button), msg,
                                      &APIConnection::send_list_entities_button_response);
 }
@@ -1005,7 +1033,8 @@ bool APIConnection::try_send_lock_info_(lock::Lock *a_lock) {
   msg.assumed_state = a_lock->traits.get_assumed_state();
   msg.supports_open = a_lock->traits.get_supports_open();
   msg.requires_code = a_lock->traits.get_requires_code();
-  msg.unique_id = get_default_unique_id("lock", a_lock);
+  std::string unique_id = get_default_unique_id("lock", a_lock);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(a_lock), msg,
                                      &APIConnection::send_list_entities_lock_response);
 }
@@ -1048,11 +1077,12 @@ bool APIConnection::try_send_valve_state_(valve::Valve *valve) {
 bool APIConnection::try_send_valve_info_(valve::Valve *valve) {
   ListEntitiesValveResponse msg;
   auto traits = valve->get_traits();
-  msg.device_class = valve->get_device_class();
+  msg.set_device_class(valve->get_device_class_ref());
   msg.assumed_state = traits.get_is_assumed_state();
   msg.supports_position = traits.get_supports_position();
   msg.supports_stop = traits.get_supports_stop();
-  msg.unique_id = get_default_unique_id("valve", valve);
+  std::string unique_id = get_default_unique_id("valve", valve);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(valve), msg,
                                      &APIConnection::send_list_entities_valve_response);
 }
@@ -1104,7 +1134,8 @@ bool APIConnection::try_send_media_player_info_(media_player::MediaPlayer *media
     media_format.sample_bytes = supported_format.sample_bytes;
     msg.supported_formats.push_back(media_format);
   }
-  msg.unique_id = get_default_unique_id("media_player", media_player);
+  std::string unique_id = get_default_unique_id("media_player", media_player);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(media_player), msg,
                                      &APIConnection::send_list_entities_media_player_response);
 }
@@ -1146,7 +1177,8 @@ void APIConnection::send_camera_info(esp32_camera::ESP32Camera *camera) {
 }
 bool APIConnection::try_send_camera_info_(esp32_camera::ESP32Camera *camera) {
   ListEntitiesCameraResponse msg;
-  msg.unique_id = get_default_unique_id("camera", camera);
+  std::string unique_id = get_default_unique_id("camera", camera);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(camera), msg,
                                      &APIConnection::send_list_entities_camera_response);
 }
@@ -1356,7 +1388,8 @@ bool APIConnection::try_send_alarm_control_panel_info_(alarm_control_panel::Alar
   msg.supported_features = a_alarm_control_panel->get_supported_features();
   msg.requires_code = a_alarm_control_panel->get_requires_code();
   msg.requires_code_to_arm = a_alarm_control_panel->get_requires_code_to_arm();
-  msg.unique_id = get_default_unique_id("alarm_control_panel", a_alarm_control_panel);
+  std::string unique_id = get_default_unique_id("alarm_control_panel", a_alarm_control_panel);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(a_alarm_control_panel), msg,
                                      &APIConnection::send_list_entities_alarm_control_panel_response);
 }
@@ -1415,10 +1448,11 @@ bool APIConnection::try_send_event_(event::Event *event, std::string event_type)
 }
 bool APIConnection::try_send_event_info_(event::Event *event) {
   ListEntitiesEventResponse msg;
-  msg.device_class = event->get_device_class();
+  msg.set_device_class(event->get_device_class_ref());
   for (const auto &event_type : event->get_event_types())
     msg.event_types.push_back(event_type);
-  msg.unique_id = get_default_unique_id("event", event);
+  std::string unique_id = get_default_unique_id("event", event);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(event), msg,
                                      &APIConnection::send_list_entities_event_response);
 }
@@ -1454,8 +1488,9 @@ bool APIConnection::try_send_update_state_(update::UpdateEntity *update) {
 }
 bool APIConnection::try_send_update_info_(update::UpdateEntity *update) {
   ListEntitiesUpdateResponse msg;
-  msg.device_class = update->get_device_class();
-  msg.unique_id = get_default_unique_id("update", update);
+  msg.set_device_class(update->get_device_class_ref());
+  std::string unique_id = get_default_unique_id("update", update);
+  msg.set_unique_id(StringRef(unique_id));
   return this->try_send_entity_info_(static_cast<EntityBase *>(update), msg,
                                      &APIConnection::send_list_entities_update_response);
 }
@@ -1652,11 +1687,54 @@ bool APIConnection::try_to_clear_buffer(bool log_out_of_space) {
   return false;
 }
 bool APIConnection::send_buffer(ProtoWriteBuffer buffer, uint32_t message_type) {
+  if (this->batching_) {
+    // The message was encoded into the batch by create_buffer(), it is sent by the next flush
+    this->batching_ = false;
+    uint16_t offset = this->batch_offset_;
+    uint16_t payload_size =
+        static_cast<uint16_t>(this->batch_buffer_.size() - offset - this->helper_->frame_header_padding());
+    this->batch_buffer_.resize(this->batch_buffer_.size() + this->helper_->frame_footer_size());
+    this->batch_packets_.emplace_back(static_cast<uint16_t>(message_type), offset, payload_size);
+    return true;
+  }
+  // Batched state updates go out first to keep the order of the messages
+  if (!this->flush_batch_(message_type != 29)) {  // SubscribeLogsResponse
+    return false;
+  }
   if (!this->try_to_clear_buffer(message_type != 29)) {  // SubscribeLogsResponse
     return false;
   }
 
-  APIError err = this->helper_->write_protobuf_packet(message_type, buffer);
+  return this->check_write_result_(this->helper_->write_protobuf_packet(message_type, buffer));
+}
+bool APIConnection::begin_batch_() {
+  if (this->remove_)
+    return false;
+  if (this->batch_buffer_.size() >= MAX_BATCH_SIZE_BYTES && !this->flush_batch_(true))
+    return false;
+  if (this->batch_packets_.empty()) {
+    this->batch_start_ = App.get_loop_component_start_time();
+#ifdef USE_SOCKET_EPOLL
+    // Wake the loop once the batch is due, instead of polling until then
+    App.scheduler.set_timeout(this->parent_, "", this->parent_->get_batch_delay(),
+                              [parent = this->parent_]() { parent->wake_loop(); });
+#endif
+  }
+  this->batching_ = true;
+  return true;
+}
+bool APIConnection::flush_batch_(bool log_out_of_space) {
+  if (this->batch_packets_.empty())
+    return true;
+  if (!this->try_to_clear_buffer(log_out_of_space))
+    return false;
+  if (!this->check_write_result_(this->helper_->write_protobuf_packets(&this->batch_buffer_, this->batch_packets_)))
+    return false;
+  this->batch_buffer_.clear();
+  this->batch_packets_.clear();
+  return true;
+}
+bool APIConnection::check_write_result_(APIError err) {
   if (err == APIError::WOULD_BLOCK)
     return false;
   if (err != APIError::OK) {
@@ -1669,9 +1747,27 @@ bool APIConnection::send_buffer(ProtoWriteBuffer buffer, uint32_t message_type)
     }
     return false;
   }
+  // What didn't fit into the socket is sent by the loop
+  if (this->helper_->has_pending_tx())
+    this->parent_->wake_loop();
   // Do not set last_traffic_ on send
   return true;
 }
+bool APIConnection::has_pending_work_() {
+  if (this->remove_ || this->next_close_ || this->helper_->has_pending_tx() || !this->deferred_message_queue_.empty() ||
+      !this->list_entities_iterator_.completed() || !this->initial_state_iterator_.completed() ||
+      this->state_subs_at_ != -1)
+    return true;
+  // A timer wakes the loop when a batch is due, it is only retried if it couldn't be sent then
+  if (!this->batch_packets_.empty() &&
+      App.get_loop_component_start_time() - this->batch_start_ >= this->parent_->get_batch_delay())
+    return true;
+#ifdef USE_ESP32_CAMERA
+  if (this->image_reader_.available())
+    return true;
+#endif
+  return false;
+}
 void APIConnection::on_unauthenticated_access() {
   this->on_fatal_error();
   ESP_LOGD(TAG, "%s: tried to access without authentication.", this->client_combined_info_.c_str());
@@ -1683,6 +1779,8 @@ void APIConnection::on_no_setup_connection() {
 void APIConnection::on_fatal_error() {
   this->helper_->close();
   this->remove_ = true;
+  // Removed by the loop of the server
+  this->parent_->wake_loop();
 }
 
 }  // namespace api
@@ -17,6 +17,10 @@ namespace api {
 
 // Keepalive timeout in milliseconds
 static constexpr uint32_t KEEPALIVE_TIMEOUT_MS = 60000;
+// State updates are flushed once the batch reaches this size, so it fits in one TCP segment on a 1500 byte MTU
+static constexpr uint16_t MAX_BATCH_SIZE_BYTES = 1390;
+// Upper bound of the initial states the iterator visits in one loop
+static constexpr uint8_t MAX_INITIAL_STATES_PER_LOOP = 32;
 
 using send_message_t = bool (APIConnection::*)(void *);
 
@@ -406,10 +410,16 @@ class APIConnection : public APIServerConnection {
   void on_unauthenticated_access() override;
   void on_no_setup_connection() override;
   ProtoWriteBuffer create_buffer(uint32_t reserve_size) override {
-    // FIXME: ensure no recursive writes can happen
-    this->proto_write_buffer_.clear();
     // Get header padding size - used for both reserve and insert
     uint8_t header_padding = this->helper_->frame_header_padding();
+    if (this->batching_) {
+      // Append the message to the batch, send_buffer() records where it starts
+      this->batch_offset_ = static_cast<uint16_t>(this->batch_buffer_.size());
+      this->batch_buffer_.resize(this->batch_offset_ + header_padding);
+      return {&this->batch_buffer_};
+    }
+    // FIXME: ensure no recursive writes can happen
+    this->proto_write_buffer_.clear();
     // Reserve space for header padding + message + footer
     // - Header padding: space for protocol headers (7 bytes for Noise, 6 for Plaintext)
     // - Footer: space for MAC (16 bytes for Noise, 0 for Plaintext)
@@ -426,9 +436,29 @@ class APIConnection : public APIServerConnection {
  protected:
   friend APIServer;
 
+  /**
+   * Prepare to encode a state update into the batch.
+   * The batch is flushed first if it is full.
+   *
+   * @return True if the next message is added to the batch, false if the batch is full and cannot be sent
+   */
+  bool begin_batch_();
+  /**
+   * Send all batched state updates with a single write.
+   *
+   * @param log_out_of_space Whether to log when the transmit buffer is full
+   * @return True if the batch was sent or is empty
+   */
+  bool flush_batch_(bool log_out_of_space);
+  // Handle the result of writing to the frame helper, returns true on success
+  bool check_write_result_(APIError err);
+  /// Whether loop() has work left that no socket data or new state wakes it for.
+  bool has_pending_work_();
+
   /**
    * Generic send entity state method to reduce code duplication.
-   * Only attempts to build and send the message if the transmit buffer is available.
+   * The state is added to the batch that is sent by the next loop after the batch delay.
+   * If the batch is full and cannot be sent, the entity is deferred.
    *
    * This is the base version for entities that use their current state.
    *
@@ -439,19 +469,23 @@ class APIConnection : public APIServerConnection {
   bool send_state_(esphome::EntityBase *entity, send_message_t try_send_func) {
     if (!this->state_subscription_)
       return false;
-    if (this->try_to_clear_buffer(true) && (this->*try_send_func)(entity)) {
-      return true;
+    if (this->begin_batch_()) {
+      bool batched = (this->*try_send_func)(entity);
+      this->batching_ = false;
+      if (batched)
+        return true;
     }
     this->deferred_message_queue_.defer(entity, try_send_func);
+    this->parent_->wake_loop();
     return true;
   }
 
   /**
    * Send entity state method that handles explicit state values.
-   * Only attempts to build and send the message if the transmit buffer is available.
+   * The state is added to the batch that is sent by the next loop after the batch delay.
    *
    * This method accepts a state parameter to be used instead of the entity's current state.
-   * It attempts to send the state with the provided value first, and if that fails due to buffer constraints,
+   * It attempts to batch the state with the provided value first, and if the batch is full and cannot be sent,
    * it defers the entity for later processing using the entity-only function.
    *
    * @tparam EntityT The entity type
@@ -470,10 +504,14 @@ class APIConnection : public APIServerConnection {
                               Args... args) {
     if (!this->state_subscription_)
       return false;
-    if (this->try_to_clear_buffer(true) && (this->*try_send_state_func)(entity, state, args...)) {
-      return true;
+    if (this->begin_batch_()) {
+      bool batched = (this->*try_send_state_func)(entity, state, args...);
+      this->batching_ = false;
+      if (batched)
+        return true;
     }
     this->deferred_message_queue_.defer(entity, reinterpret_cast<send_message_t>(try_send_entity_func));
+    this->parent_->wake_loop();
     return true;
   }
 
@@ -489,6 +527,7 @@ class APIConnection : public APIServerConnection {
       return;
     }
     this->deferred_message_queue_.defer(entity, try_send_func);
+    this->parent_->wake_loop();
   }
 
   /**
@@ -505,13 +544,15 @@ class APIConnection : public APIServerConnection {
                              bool (APIServerConnectionBase::*send_response_func)(const ResponseT &)) {
     // Set common fields that are shared by all entity types
     response.key = entity->get_object_id_hash();
-    response.object_id = entity->get_object_id();
+    // The message only references its strings, the object ID may be built on the fly so keep it until it is sent
+    std::string object_id = entity->get_object_id();
+    response.set_object_id(StringRef(object_id));
 
     if (entity->has_own_name())
-      response.name = entity->get_name();
+      response.set_name(entity->get_name());
 
     // Set common EntityBase properties
-    response.icon = entity->get_icon();
+    response.set_icon(entity->get_icon_ref());
     response.disabled_by_default = entity->is_disabled_by_default();
     response.entity_category = static_cast<enums::EntityCategory>(entity->get_entity_category());
 
@@ -532,6 +573,13 @@ class APIConnection : public APIServerConnection {
   // Buffer used to encode proto messages
   // Re-use to prevent allocations
   std::vector<uint8_t> proto_write_buffer_;
+  // State updates waiting to be sent together, each framed like proto_write_buffer_
+  std::vector<uint8_t> batch_buffer_;
+  std::vector<PacketInfo> batch_packets_;
+  uint32_t batch_start_{0};
+  uint16_t batch_offset_{0};
+  // Set while a state update is encoded into the batch
+  bool batching_{false};
   std::unique_ptr<APIFrameHelper> helper_;
 
   std::string client_info_;
@@ -191,6 +191,44 @@ APIError APIFrameHelper::try_send_tx_buf_() {
   return APIError::OK;  // All buffers sent successfully
 }
 
+APIError APIFrameHelper::write_protobuf_packet(uint16_t type, ProtoWriteBuffer buffer) {
+  APIError aerr = this->check_write_state_();
+  if (aerr != APIError::OK)
+    return aerr;
+
+  std::vector<uint8_t> *raw_buffer = buffer.get_buffer();
+  // Message data starts after padding
+  uint16_t payload_len = static_cast<uint16_t>(raw_buffer->size() - this->frame_header_padding_);
+  // We need to resize to include the footer space, but we already reserved it in create_buffer
+  raw_buffer->resize(raw_buffer->size() + this->frame_footer_size_);
+
+  struct iovec iov;
+  aerr = this->frame_packet_(raw_buffer->data(), type, payload_len, &iov);
+  if (aerr != APIError::OK)
+    return aerr;
+  // write raw to not have two packets sent if NAGLE disabled
+  return this->write_raw_(&iov, 1);
+}
+
+APIError APIFrameHelper::write_protobuf_packets(ProtoWriteBuffer buffer, const std::vector<PacketInfo> &packets) {
+  APIError aerr = this->check_write_state_();
+  if (aerr != APIError::OK)
+    return aerr;
+  if (packets.empty())
+    return APIError::OK;
+
+  // Every message is framed (and encrypted) on its own, but all of them go out in one write
+  uint8_t *buf_start = buffer.get_buffer()->data();
+  this->iovs_.resize(packets.size());
+  for (size_t i = 0; i < packets.size(); i++) {
+    const PacketInfo &packet = packets[i];
+    aerr = this->frame_packet_(buf_start + packet.offset, packet.message_type, packet.payload_size, &this->iovs_[i]);
+    if (aerr != APIError::OK)
+      return aerr;
+  }
+  return this->write_raw_(this->iovs_.data(), static_cast<int>(this->iovs_.size()));
+}
+
 APIError APIFrameHelper::init_common_() {
   if (state_ != State::INITIALIZE || this->socket_ == nullptr) {
     ESP_LOGVV(TAG, "%s: Bad state for init %d", this->info_.c_str(), (int) state_);
@@ -604,10 +642,8 @@ APIError APINoiseFrameHelper::read_packet(ReadPacketBuffer *buffer) {
   buffer->type = type;
   return APIError::OK;
 }
-APIError APINoiseFrameHelper::write_protobuf_packet(uint16_t type, ProtoWriteBuffer buffer) {
-  int err;
-  APIError aerr;
-  aerr = state_action_();
+APIError APINoiseFrameHelper::check_write_state_() {
+  APIError aerr = state_action_();
   if (aerr != APIError::OK) {
     return aerr;
   }
@@ -615,16 +651,14 @@ APIError APINoiseFrameHelper::write_protobuf_packet(uint16_t type, ProtoWriteBuf
   if (state_ != State::DATA) {
     return APIError::WOULD_BLOCK;
   }
-
-  std::vector<uint8_t> *raw_buffer = buffer.get_buffer();
-  // Message data starts after padding
-  uint16_t payload_len = raw_buffer->size() - frame_header_padding_;
+  return APIError::OK;
+}
+APIError APINoiseFrameHelper::frame_packet_(uint8_t *buf_start, uint16_t type, uint16_t payload_len,
+                                            struct iovec *iov) {
+  int err;
   uint16_t padding = 0;
   uint16_t msg_len = 4 + payload_len + padding;
 
-  // We need to resize to include MAC space, but we already reserved it in create_buffer
-  raw_buffer->resize(raw_buffer->size() + frame_footer_size_);
-
   // Write the noise header in the padded area
   // Buffer layout:
   // [0]    - 0x01 indicator byte
@@ -632,7 +666,7 @@ APIError APINoiseFrameHelper::write_protobuf_packet(uint16_t type, ProtoWriteBuf
   // [3-4]  - Message type (encrypted)
   // [5-6]  - Payload length (encrypted)
   // [7...] - Actual payload data (encrypted)
-  uint8_t *buf_start = raw_buffer->data();
+  // followed by the space for the MAC
   buf_start[0] = 0x01;  // indicator
   // buf_start[1], buf_start[2] to be set later after encryption
   const uint8_t msg_offset = 3;
@@ -653,18 +687,14 @@ APIError APINoiseFrameHelper::write_protobuf_packet(uint16_t type, ProtoWriteBuf
     return APIError::CIPHERSTATE_ENCRYPT_FAILED;
   }
 
-  uint16_t total_len = 3 + mbuf.size;
   buf_start[1] = (uint8_t) (mbuf.size >> 8);
   buf_start[2] = (uint8_t) mbuf.size;
 
-  struct iovec iov;
-  // Point iov_base to the beginning of the buffer (no unused padding in Noise)
+  // Point iov_base to the beginning of the frame (no unused padding in Noise)
   // We send the entire frame: indicator + size + encrypted(type + data_len + payload + MAC)
-  iov.iov_base = buf_start;
-  iov.iov_len = total_len;
-
-  // write raw to not have two packets sent if NAGLE disabled
-  return this->write_raw_(&iov, 1);
+  iov->iov_base = buf_start;
+  iov->iov_len = 3 + mbuf.size;
+  return APIError::OK;
 }
 APIError APINoiseFrameHelper::write_frame_(const uint8_t *data, uint16_t len) {
   uint8_t header[3];
@@ -1003,15 +1033,15 @@ APIError APIPlaintextFrameHelper::read_packet(ReadPacketBuffer *buffer) {
   buffer->type = rx_header_parsed_type_;
   return APIError::OK;
 }
-APIError APIPlaintextFrameHelper::write_protobuf_packet(uint16_t type, ProtoWriteBuffer buffer) {
+APIError APIPlaintextFrameHelper::check_write_state_() {
   if (state_ != State::DATA) {
     return APIError::BAD_STATE;
   }
-
-  std::vector<uint8_t> *raw_buffer = buffer.get_buffer();
+  return APIError::OK;
+}
+APIError APIPlaintextFrameHelper::frame_packet_(uint8_t *buf_start, uint16_t type, uint16_t payload_len,
+                                                struct iovec *iov) {
   // Message data starts after padding (frame_header_padding_ = 6)
-  uint16_t payload_len = static_cast<uint16_t>(raw_buffer->size() - frame_header_padding_);
-
   // Calculate varint sizes for header components
   uint8_t size_varint_len = api::ProtoSize::varint(static_cast<uint32_t>(payload_len));
   uint8_t type_varint_len = api::ProtoSize::varint(static_cast<uint32_t>(type));
@@ -1044,7 +1074,6 @@ APIError APIPlaintextFrameHelper::write_protobuf_packet(uint16_t type, ProtoWrit
   // [1-3]  - Payload size varint (3 bytes, for sizes 16384-2097151)
   // [4-5]  - Message type varint (2 bytes, for types 128-32767)
   // [6...] - Actual payload data
-  uint8_t *buf_start = raw_buffer->data();
   uint8_t header_offset = frame_header_padding_ - total_header_len;
 
   // Write the plaintext header
@@ -1056,13 +1085,11 @@ APIError APIPlaintextFrameHelper::write_protobuf_packet(uint16_t type, ProtoWrit
   // Encode type varint directly into buffer
   ProtoVarInt(type).encode_to_buffer_unchecked(buf_start + header_offset + 1 + size_varint_len, type_varint_len);
 
-  struct iovec iov;
   // Point iov_base to the beginning of our header (skip unused padding)
   // This ensures we only send the actual header and payload, not the empty padding bytes
-  iov.iov_base = buf_start + header_offset;
-  iov.iov_len = total_header_len + payload_len;
-
-  return write_raw_(&iov, 1);
+  iov->iov_base = buf_start + header_offset;
+  iov->iov_len = total_header_len + payload_len;
+  return APIError::OK;
 }
 
 #endif  // USE_API_PLAINTEXT
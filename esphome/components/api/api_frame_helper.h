@@ -27,6 +27,16 @@ struct ReadPacketBuffer {
   uint16_t data_len;
 };
 
+// A message encoded into a batch buffer: the header padding starts at offset,
+// followed by the payload and the footer space
+struct PacketInfo {
+  uint16_t message_type;
+  uint16_t offset;
+  uint16_t payload_size;
+
+  PacketInfo(uint16_t type, uint16_t off, uint16_t size) : message_type(type), offset(off), payload_size(size) {}
+};
+
 enum class APIError : int {
   OK = 0,
   WOULD_BLOCK = 1001,
@@ -66,6 +76,7 @@ class APIFrameHelper {
   virtual APIError loop() = 0;
   virtual APIError read_packet(ReadPacketBuffer *buffer) = 0;
   bool can_write_without_blocking() { return state_ == State::DATA && tx_buf_.empty(); }
+  bool has_pending_tx() const { return !tx_buf_.empty(); }
   std::string getpeername() { return socket_->getpeername(); }
   int getpeername(struct sockaddr *addr, socklen_t *addrlen) { return socket_->getpeername(addr, addrlen); }
   APIError close() {
@@ -86,7 +97,9 @@ class APIFrameHelper {
   }
   // Give this helper a name for logging
   void set_log_info(std::string info) { info_ = std::move(info); }
-  virtual APIError write_protobuf_packet(uint16_t type, ProtoWriteBuffer buffer) = 0;
+  APIError write_protobuf_packet(uint16_t type, ProtoWriteBuffer buffer);
+  // Write several messages of one buffer with a single socket write
+  APIError write_protobuf_packets(ProtoWriteBuffer buffer, const std::vector<PacketInfo> &packets);
   // Get the frame header padding required by this protocol
   virtual uint8_t frame_header_padding() = 0;
   // Get the frame footer size required by this protocol
@@ -142,6 +155,11 @@ class APIFrameHelper {
   socket::Socket *socket_{nullptr};
   std::unique_ptr<socket::Socket> socket_owned_;
 
+  // Frame one message of the buffer in place and point iov at the bytes to send
+  virtual APIError frame_packet_(uint8_t *buf_start, uint16_t type, uint16_t payload_len, struct iovec *iov) = 0;
+  // Check that the helper is ready to send messages
+  virtual APIError check_write_state_() = 0;
+
   // Common implementation for writing raw data to socket
   APIError write_raw_(const struct iovec *iov, int iovcnt);
 
@@ -161,6 +179,9 @@ class APIFrameHelper {
   std::vector<uint8_t> rx_buf_;
   uint16_t rx_buf_len_ = 0;
 
+  // Frames of the messages of a batch, kept to reuse its capacity
+  std::vector<struct iovec> iovs_;
+
   // Common initialization for both plaintext and noise protocols
   APIError init_common_();
 };
@@ -181,13 +202,14 @@ class APINoiseFrameHelper : public APIFrameHelper {
   APIError init() override;
   APIError loop() override;
   APIError read_packet(ReadPacketBuffer *buffer) override;
-  APIError write_protobuf_packet(uint16_t type, ProtoWriteBuffer buffer) override;
   // Get the frame header padding required by this protocol
   uint8_t frame_header_padding() override { return frame_header_padding_; }
   // Get the frame footer size required by this protocol
   uint8_t frame_footer_size() override { return frame_footer_size_; }
 
  protected:
+  APIError frame_packet_(uint8_t *buf_start, uint16_t type, uint16_t payload_len, struct iovec *iov) override;
+  APIError check_write_state_() override;
   APIError state_action_();
   APIError try_read_frame_(ParsedFrame *frame);
   APIError write_frame_(const uint8_t *data, uint16_t len);
@@ -225,12 +247,13 @@ class APIPlaintextFrameHelper : public APIFrameHelper {
   APIError init() override;
   APIError loop() override;
   APIError read_packet(ReadPacketBuffer *buffer) override;
-  APIError write_protobuf_packet(uint16_t type, ProtoWriteBuffer buffer) override;
   uint8_t frame_header_padding() override { return frame_header_padding_; }
   // Get the frame footer size required by this protocol
   uint8_t frame_footer_size() override { return frame_footer_size_; }
 
  protected:
+  APIError frame_packet_(uint8_t *buf_start, uint16_t type, uint16_t payload_len, struct iovec *iov) override;
+  APIError check_write_state_() override;
   APIError try_read_frame_(ParsedFrame *frame);
   // Fixed-size header buffer for plaintext protocol:
   // We now store the indicator byte + the two varints.
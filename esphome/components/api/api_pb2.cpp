@@ -1069,32 +1069,6 @@ bool ListEntitiesBinarySensorResponse::decode_varint(uint32_t field_id, ProtoVar
       return false;
   }
 }
-bool ListEntitiesBinarySensorResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    case 8: {
-      this->icon = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesBinarySensorResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -1106,25 +1080,25 @@ bool ListEntitiesBinarySensorResponse::decode_32bit(uint32_t field_id, Proto32Bi
   }
 }
 void ListEntitiesBinarySensorResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->device_class);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->device_class_ref_);
   buffer.encode_bool(6, this->is_status_binary_sensor);
   buffer.encode_bool(7, this->disabled_by_default);
-  buffer.encode_string(8, this->icon);
+  buffer.encode_string(8, this->icon_ref_);
   buffer.encode_enum<enums::EntityCategory>(9, this->entity_category);
 }
 void ListEntitiesBinarySensorResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->is_status_binary_sensor, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -1132,7 +1106,7 @@ void ListEntitiesBinarySensorResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesBinarySensorResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -1141,15 +1115,15 @@ void ListEntitiesBinarySensorResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  is_status_binary_sensor: ");
@@ -1161,7 +1135,7 @@ void ListEntitiesBinarySensorResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  entity_category: ");
@@ -1253,32 +1227,6 @@ bool ListEntitiesCoverResponse::decode_varint(uint32_t field_id, ProtoVarInt val
       return false;
   }
 }
-bool ListEntitiesCoverResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 8: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    case 10: {
-      this->icon = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesCoverResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -1290,30 +1238,30 @@ bool ListEntitiesCoverResponse::decode_32bit(uint32_t field_id, Proto32Bit value
   }
 }
 void ListEntitiesCoverResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
   buffer.encode_bool(5, this->assumed_state);
   buffer.encode_bool(6, this->supports_position);
   buffer.encode_bool(7, this->supports_tilt);
-  buffer.encode_string(8, this->device_class);
+  buffer.encode_string(8, this->device_class_ref_);
   buffer.encode_bool(9, this->disabled_by_default);
-  buffer.encode_string(10, this->icon);
+  buffer.encode_string(10, this->icon_ref_);
   buffer.encode_enum<enums::EntityCategory>(11, this->entity_category);
   buffer.encode_bool(12, this->supports_stop);
 }
 void ListEntitiesCoverResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->assumed_state, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_position, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_tilt, false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_stop, false);
 }
@@ -1322,7 +1270,7 @@ void ListEntitiesCoverResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesCoverResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -1331,11 +1279,11 @@ void ListEntitiesCoverResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  assumed_state: ");
@@ -1351,7 +1299,7 @@ void ListEntitiesCoverResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -1359,7 +1307,7 @@ void ListEntitiesCoverResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  entity_category: ");
@@ -1584,22 +1532,6 @@ bool ListEntitiesFanResponse::decode_varint(uint32_t field_id, ProtoVarInt value
 }
 bool ListEntitiesFanResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 10: {
-      this->icon = value.as_string();
-      return true;
-    }
     case 12: {
       this->supported_preset_modes.push_back(value.as_string());
       return true;
@@ -1619,32 +1551,32 @@ bool ListEntitiesFanResponse::decode_32bit(uint32_t field_id, Proto32Bit value)
   }
 }
 void ListEntitiesFanResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
   buffer.encode_bool(5, this->supports_oscillation);
   buffer.encode_bool(6, this->supports_speed);
   buffer.encode_bool(7, this->supports_direction);
   buffer.encode_int32(8, this->supported_speed_count);
   buffer.encode_bool(9, this->disabled_by_default);
-  buffer.encode_string(10, this->icon);
+  buffer.encode_string(10, this->icon_ref_);
   buffer.encode_enum<enums::EntityCategory>(11, this->entity_category);
   for (auto &it : this->supported_preset_modes) {
     buffer.encode_string(12, it, true);
   }
 }
 void ListEntitiesFanResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_oscillation, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_speed, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_direction, false);
   ProtoSize::add_int32_field(total_size, 1, this->supported_speed_count, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
   if (!this->supported_preset_modes.empty()) {
     for (const auto &it : this->supported_preset_modes) {
@@ -1657,7 +1589,7 @@ void ListEntitiesFanResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesFanResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -1666,11 +1598,11 @@ void ListEntitiesFanResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  supports_oscillation: ");
@@ -1695,7 +1627,7 @@ void ListEntitiesFanResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  entity_category: ");
@@ -2006,26 +1938,10 @@ bool ListEntitiesLightResponse::decode_varint(uint32_t field_id, ProtoVarInt val
 }
 bool ListEntitiesLightResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
     case 11: {
       this->effects.push_back(value.as_string());
       return true;
     }
-    case 14: {
-      this->icon = value.as_string();
-      return true;
-    }
     default:
       return false;
   }
@@ -2049,10 +1965,10 @@ bool ListEntitiesLightResponse::decode_32bit(uint32_t field_id, Proto32Bit value
   }
 }
 void ListEntitiesLightResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
   for (auto &it : this->supported_color_modes) {
     buffer.encode_enum<enums::ColorMode>(12, it, true);
   }
@@ -2066,14 +1982,14 @@ void ListEntitiesLightResponse::encode(ProtoWriteBuffer buffer) const {
     buffer.encode_string(11, it, true);
   }
   buffer.encode_bool(13, this->disabled_by_default);
-  buffer.encode_string(14, this->icon);
+  buffer.encode_string(14, this->icon_ref_);
   buffer.encode_enum<enums::EntityCategory>(15, this->entity_category);
 }
 void ListEntitiesLightResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
   if (!this->supported_color_modes.empty()) {
     for (const auto &it : this->supported_color_modes) {
       ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(it), true);
@@ -2091,7 +2007,7 @@ void ListEntitiesLightResponse::calculate_size(uint32_t &total_size) const {
     }
   }
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -2099,7 +2015,7 @@ void ListEntitiesLightResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesLightResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -2108,11 +2024,11 @@ void ListEntitiesLightResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   for (const auto &it : this->supported_color_modes) {
@@ -2158,7 +2074,7 @@ void ListEntitiesLightResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  entity_category: ");
@@ -2675,36 +2591,6 @@ bool ListEntitiesSensorResponse::decode_varint(uint32_t field_id, ProtoVarInt va
       return false;
   }
 }
-bool ListEntitiesSensorResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 6: {
-      this->unit_of_measurement = value.as_string();
-      return true;
-    }
-    case 9: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesSensorResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -2716,30 +2602,30 @@ bool ListEntitiesSensorResponse::decode_32bit(uint32_t field_id, Proto32Bit valu
   }
 }
 void ListEntitiesSensorResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
-  buffer.encode_string(6, this->unit_of_measurement);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
+  buffer.encode_string(6, this->unit_of_measurement_ref_);
   buffer.encode_int32(7, this->accuracy_decimals);
   buffer.encode_bool(8, this->force_update);
-  buffer.encode_string(9, this->device_class);
+  buffer.encode_string(9, this->device_class_ref_);
   buffer.encode_enum<enums::SensorStateClass>(10, this->state_class);
   buffer.encode_enum<enums::SensorLastResetType>(11, this->legacy_last_reset_type);
   buffer.encode_bool(12, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(13, this->entity_category);
 }
 void ListEntitiesSensorResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
-  ProtoSize::add_string_field(total_size, 1, this->unit_of_measurement, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unit_of_measurement_ref_, false);
   ProtoSize::add_int32_field(total_size, 1, this->accuracy_decimals, false);
   ProtoSize::add_bool_field(total_size, 1, this->force_update, false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->state_class), false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->legacy_last_reset_type), false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
@@ -2750,7 +2636,7 @@ void ListEntitiesSensorResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesSensorResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -2759,19 +2645,19 @@ void ListEntitiesSensorResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unit_of_measurement: ");
-  out.append("'").append(this->unit_of_measurement).append("'");
+  out.append("'").append(this->unit_of_measurement_ref_.c_str(), this->unit_of_measurement_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  accuracy_decimals: ");
@@ -2784,7 +2670,7 @@ void ListEntitiesSensorResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  state_class: ");
@@ -2877,32 +2763,6 @@ bool ListEntitiesSwitchResponse::decode_varint(uint32_t field_id, ProtoVarInt va
       return false;
   }
 }
-bool ListEntitiesSwitchResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 9: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesSwitchResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -2914,33 +2774,33 @@ bool ListEntitiesSwitchResponse::decode_32bit(uint32_t field_id, Proto32Bit valu
   }
 }
 void ListEntitiesSwitchResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->assumed_state);
   buffer.encode_bool(7, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(8, this->entity_category);
-  buffer.encode_string(9, this->device_class);
+  buffer.encode_string(9, this->device_class_ref_);
 }
 void ListEntitiesSwitchResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->assumed_state, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
 void ListEntitiesSwitchResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesSwitchResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -2949,15 +2809,15 @@ void ListEntitiesSwitchResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  assumed_state: ");
@@ -2973,7 +2833,7 @@ void ListEntitiesSwitchResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
   out.append("}");
 }
@@ -3078,32 +2938,6 @@ bool ListEntitiesTextSensorResponse::decode_varint(uint32_t field_id, ProtoVarIn
       return false;
   }
 }
-bool ListEntitiesTextSensorResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 8: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesTextSensorResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -3115,31 +2949,31 @@ bool ListEntitiesTextSensorResponse::decode_32bit(uint32_t field_id, Proto32Bit
   }
 }
 void ListEntitiesTextSensorResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
-  buffer.encode_string(8, this->device_class);
+  buffer.encode_string(8, this->device_class_ref_);
 }
 void ListEntitiesTextSensorResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
 void ListEntitiesTextSensorResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesTextSensorResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -3148,15 +2982,15 @@ void ListEntitiesTextSensorResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -3168,7 +3002,7 @@ void ListEntitiesTextSensorResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
   out.append("}");
 }
@@ -3674,10 +3508,6 @@ void ListEntitiesServicesArgument::dump_to(std::string &out) const {
 #endif
 bool ListEntitiesServicesResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->name = value.as_string();
-      return true;
-    }
     case 3: {
       this->args.push_back(value.as_message<ListEntitiesServicesArgument>());
       return true;
@@ -3697,14 +3527,14 @@ bool ListEntitiesServicesResponse::decode_32bit(uint32_t field_id, Proto32Bit va
   }
 }
 void ListEntitiesServicesResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->name);
+  buffer.encode_string(1, this->name_ref_);
   buffer.encode_fixed32(2, this->key);
   for (auto &it : this->args) {
     buffer.encode_message<ListEntitiesServicesArgument>(3, it, true);
   }
 }
 void ListEntitiesServicesResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
   ProtoSize::add_repeated_message(total_size, 1, this->args);
 }
@@ -3713,7 +3543,7 @@ void ListEntitiesServicesResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesServicesResponse {\n");
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -3945,28 +3775,6 @@ bool ListEntitiesCameraResponse::decode_varint(uint32_t field_id, ProtoVarInt va
       return false;
   }
 }
-bool ListEntitiesCameraResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 6: {
-      this->icon = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesCameraResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -3978,21 +3786,21 @@ bool ListEntitiesCameraResponse::decode_32bit(uint32_t field_id, Proto32Bit valu
   }
 }
 void ListEntitiesCameraResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
   buffer.encode_bool(5, this->disabled_by_default);
-  buffer.encode_string(6, this->icon);
+  buffer.encode_string(6, this->icon_ref_);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
 }
 void ListEntitiesCameraResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -4000,7 +3808,7 @@ void ListEntitiesCameraResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesCameraResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -4009,11 +3817,11 @@ void ListEntitiesCameraResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -4021,7 +3829,7 @@ void ListEntitiesCameraResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  entity_category: ");
@@ -4181,18 +3989,6 @@ bool ListEntitiesClimateResponse::decode_varint(uint32_t field_id, ProtoVarInt v
 }
 bool ListEntitiesClimateResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
     case 15: {
       this->supported_custom_fan_modes.push_back(value.as_string());
       return true;
@@ -4201,10 +3997,6 @@ bool ListEntitiesClimateResponse::decode_length(uint32_t field_id, ProtoLengthDe
       this->supported_custom_presets.push_back(value.as_string());
       return true;
     }
-    case 19: {
-      this->icon = value.as_string();
-      return true;
-    }
     default:
       return false;
   }
@@ -4244,10 +4036,10 @@ bool ListEntitiesClimateResponse::decode_32bit(uint32_t field_id, Proto32Bit val
   }
 }
 void ListEntitiesClimateResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
   buffer.encode_bool(5, this->supports_current_temperature);
   buffer.encode_bool(6, this->supports_two_point_target_temperature);
   for (auto &it : this->supported_modes) {
@@ -4274,7 +4066,7 @@ void ListEntitiesClimateResponse::encode(ProtoWriteBuffer buffer) const {
     buffer.encode_string(17, it, true);
   }
   buffer.encode_bool(18, this->disabled_by_default);
-  buffer.encode_string(19, this->icon);
+  buffer.encode_string(19, this->icon_ref_);
   buffer.encode_enum<enums::EntityCategory>(20, this->entity_category);
   buffer.encode_float(21, this->visual_current_temperature_step);
   buffer.encode_bool(22, this->supports_current_humidity);
@@ -4283,10 +4075,10 @@ void ListEntitiesClimateResponse::encode(ProtoWriteBuffer buffer) const {
   buffer.encode_float(25, this->visual_max_humidity);
 }
 void ListEntitiesClimateResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_current_temperature, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_two_point_target_temperature, false);
   if (!this->supported_modes.empty()) {
@@ -4325,7 +4117,7 @@ void ListEntitiesClimateResponse::calculate_size(uint32_t &total_size) const {
     }
   }
   ProtoSize::add_bool_field(total_size, 2, this->disabled_by_default, false);
-  ProtoSize::add_string_field(total_size, 2, this->icon, false);
+  ProtoSize::add_string_field(total_size, 2, this->icon_ref_, false);
   ProtoSize::add_enum_field(total_size, 2, static_cast<uint32_t>(this->entity_category), false);
   ProtoSize::add_fixed_field<4>(total_size, 2, this->visual_current_temperature_step != 0.0f, false);
   ProtoSize::add_bool_field(total_size, 2, this->supports_current_humidity, false);
@@ -4338,7 +4130,7 @@ void ListEntitiesClimateResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesClimateResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -4347,11 +4139,11 @@ void ListEntitiesClimateResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  supports_current_temperature: ");
@@ -4426,7 +4218,7 @@ void ListEntitiesClimateResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  entity_category: ");
@@ -4924,36 +4716,6 @@ bool ListEntitiesNumberResponse::decode_varint(uint32_t field_id, ProtoVarInt va
       return false;
   }
 }
-bool ListEntitiesNumberResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 11: {
-      this->unit_of_measurement = value.as_string();
-      return true;
-    }
-    case 13: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesNumberResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -4977,41 +4739,41 @@ bool ListEntitiesNumberResponse::decode_32bit(uint32_t field_id, Proto32Bit valu
   }
 }
 void ListEntitiesNumberResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_float(6, this->min_value);
   buffer.encode_float(7, this->max_value);
   buffer.encode_float(8, this->step);
   buffer.encode_bool(9, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(10, this->entity_category);
-  buffer.encode_string(11, this->unit_of_measurement);
+  buffer.encode_string(11, this->unit_of_measurement_ref_);
   buffer.encode_enum<enums::NumberMode>(12, this->mode);
-  buffer.encode_string(13, this->device_class);
+  buffer.encode_string(13, this->device_class_ref_);
 }
 void ListEntitiesNumberResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->min_value != 0.0f, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->max_value != 0.0f, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->step != 0.0f, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
-  ProtoSize::add_string_field(total_size, 1, this->unit_of_measurement, false);
+  ProtoSize::add_string_field(total_size, 1, this->unit_of_measurement_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->mode), false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
 void ListEntitiesNumberResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesNumberResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -5020,15 +4782,15 @@ void ListEntitiesNumberResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  min_value: ");
@@ -5055,7 +4817,7 @@ void ListEntitiesNumberResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  unit_of_measurement: ");
-  out.append("'").append(this->unit_of_measurement).append("'");
+  out.append("'").append(this->unit_of_measurement_ref_.c_str(), this->unit_of_measurement_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  mode: ");
@@ -5063,7 +4825,7 @@ void ListEntitiesNumberResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
   out.append("}");
 }
@@ -5176,22 +4938,6 @@ bool ListEntitiesSelectResponse::decode_varint(uint32_t field_id, ProtoVarInt va
 }
 bool ListEntitiesSelectResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
     case 6: {
       this->options.push_back(value.as_string());
       return true;
@@ -5211,11 +4957,11 @@ bool ListEntitiesSelectResponse::decode_32bit(uint32_t field_id, Proto32Bit valu
   }
 }
 void ListEntitiesSelectResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   for (auto &it : this->options) {
     buffer.encode_string(6, it, true);
   }
@@ -5223,11 +4969,11 @@ void ListEntitiesSelectResponse::encode(ProtoWriteBuffer buffer) const {
   buffer.encode_enum<enums::EntityCategory>(8, this->entity_category);
 }
 void ListEntitiesSelectResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   if (!this->options.empty()) {
     for (const auto &it : this->options) {
       ProtoSize::add_string_field(total_size, 1, it, true);
@@ -5241,7 +4987,7 @@ void ListEntitiesSelectResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesSelectResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -5250,15 +4996,15 @@ void ListEntitiesSelectResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   for (const auto &it : this->options) {
@@ -5403,22 +5149,6 @@ bool ListEntitiesSirenResponse::decode_varint(uint32_t field_id, ProtoVarInt val
 }
 bool ListEntitiesSirenResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
     case 7: {
       this->tones.push_back(value.as_string());
       return true;
@@ -5438,11 +5168,11 @@ bool ListEntitiesSirenResponse::decode_32bit(uint32_t field_id, Proto32Bit value
   }
 }
 void ListEntitiesSirenResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   for (auto &it : this->tones) {
     buffer.encode_string(7, it, true);
@@ -5452,11 +5182,11 @@ void ListEntitiesSirenResponse::encode(ProtoWriteBuffer buffer) const {
   buffer.encode_enum<enums::EntityCategory>(10, this->entity_category);
 }
 void ListEntitiesSirenResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   if (!this->tones.empty()) {
     for (const auto &it : this->tones) {
@@ -5472,7 +5202,7 @@ void ListEntitiesSirenResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesSirenResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -5481,15 +5211,15 @@ void ListEntitiesSirenResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -5706,32 +5436,6 @@ bool ListEntitiesLockResponse::decode_varint(uint32_t field_id, ProtoVarInt valu
       return false;
   }
 }
-bool ListEntitiesLockResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 11: {
-      this->code_format = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesLockResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -5743,37 +5447,37 @@ bool ListEntitiesLockResponse::decode_32bit(uint32_t field_id, Proto32Bit value)
   }
 }
 void ListEntitiesLockResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
   buffer.encode_bool(8, this->assumed_state);
   buffer.encode_bool(9, this->supports_open);
   buffer.encode_bool(10, this->requires_code);
-  buffer.encode_string(11, this->code_format);
+  buffer.encode_string(11, this->code_format_ref_);
 }
 void ListEntitiesLockResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
   ProtoSize::add_bool_field(total_size, 1, this->assumed_state, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_open, false);
   ProtoSize::add_bool_field(total_size, 1, this->requires_code, false);
-  ProtoSize::add_string_field(total_size, 1, this->code_format, false);
+  ProtoSize::add_string_field(total_size, 1, this->code_format_ref_, false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
 void ListEntitiesLockResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesLockResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -5782,15 +5486,15 @@ void ListEntitiesLockResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -5814,7 +5518,7 @@ void ListEntitiesLockResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  code_format: ");
-  out.append("'").append(this->code_format).append("'");
+  out.append("'").append(this->code_format_ref_.c_str(), this->code_format_ref_.size()).append("'");
   out.append("\n");
   out.append("}");
 }
@@ -5945,32 +5649,6 @@ bool ListEntitiesButtonResponse::decode_varint(uint32_t field_id, ProtoVarInt va
       return false;
   }
 }
-bool ListEntitiesButtonResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 8: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesButtonResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -5982,31 +5660,31 @@ bool ListEntitiesButtonResponse::decode_32bit(uint32_t field_id, Proto32Bit valu
   }
 }
 void ListEntitiesButtonResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
-  buffer.encode_string(8, this->device_class);
+  buffer.encode_string(8, this->device_class_ref_);
 }
 void ListEntitiesButtonResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
 void ListEntitiesButtonResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesButtonResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -6015,15 +5693,15 @@ void ListEntitiesButtonResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -6035,7 +5713,7 @@ void ListEntitiesButtonResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
   out.append("}");
 }
@@ -6160,22 +5838,6 @@ bool ListEntitiesMediaPlayerResponse::decode_varint(uint32_t field_id, ProtoVarI
 }
 bool ListEntitiesMediaPlayerResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
     case 9: {
       this->supported_formats.push_back(value.as_message<MediaPlayerSupportedFormat>());
       return true;
@@ -6195,11 +5857,11 @@ bool ListEntitiesMediaPlayerResponse::decode_32bit(uint32_t field_id, Proto32Bit
   }
 }
 void ListEntitiesMediaPlayerResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
   buffer.encode_bool(8, this->supports_pause);
@@ -6208,11 +5870,11 @@ void ListEntitiesMediaPlayerResponse::encode(ProtoWriteBuffer buffer) const {
   }
 }
 void ListEntitiesMediaPlayerResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_pause, false);
@@ -6223,7 +5885,7 @@ void ListEntitiesMediaPlayerResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesMediaPlayerResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -6232,15 +5894,15 @@ void ListEntitiesMediaPlayerResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -8580,28 +8242,6 @@ bool ListEntitiesAlarmControlPanelResponse::decode_varint(uint32_t field_id, Pro
       return false;
   }
 }
-bool ListEntitiesAlarmControlPanelResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesAlarmControlPanelResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -8613,11 +8253,11 @@ bool ListEntitiesAlarmControlPanelResponse::decode_32bit(uint32_t field_id, Prot
   }
 }
 void ListEntitiesAlarmControlPanelResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
   buffer.encode_uint32(8, this->supported_features);
@@ -8625,11 +8265,11 @@ void ListEntitiesAlarmControlPanelResponse::encode(ProtoWriteBuffer buffer) cons
   buffer.encode_bool(10, this->requires_code_to_arm);
 }
 void ListEntitiesAlarmControlPanelResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
   ProtoSize::add_uint32_field(total_size, 1, this->supported_features, false);
@@ -8641,7 +8281,7 @@ void ListEntitiesAlarmControlPanelResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesAlarmControlPanelResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -8650,15 +8290,15 @@ void ListEntitiesAlarmControlPanelResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -8812,32 +8452,6 @@ bool ListEntitiesTextResponse::decode_varint(uint32_t field_id, ProtoVarInt valu
       return false;
   }
 }
-bool ListEntitiesTextResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 10: {
-      this->pattern = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesTextResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -8849,29 +8463,29 @@ bool ListEntitiesTextResponse::decode_32bit(uint32_t field_id, Proto32Bit value)
   }
 }
 void ListEntitiesTextResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
   buffer.encode_uint32(8, this->min_length);
   buffer.encode_uint32(9, this->max_length);
-  buffer.encode_string(10, this->pattern);
+  buffer.encode_string(10, this->pattern_ref_);
   buffer.encode_enum<enums::TextMode>(11, this->mode);
 }
 void ListEntitiesTextResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
   ProtoSize::add_uint32_field(total_size, 1, this->min_length, false);
   ProtoSize::add_uint32_field(total_size, 1, this->max_length, false);
-  ProtoSize::add_string_field(total_size, 1, this->pattern, false);
+  ProtoSize::add_string_field(total_size, 1, this->pattern_ref_, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->mode), false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -8879,7 +8493,7 @@ void ListEntitiesTextResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesTextResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -8888,15 +8502,15 @@ void ListEntitiesTextResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -8918,7 +8532,7 @@ void ListEntitiesTextResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  pattern: ");
-  out.append("'").append(this->pattern).append("'");
+  out.append("'").append(this->pattern_ref_.c_str(), this->pattern_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  mode: ");
@@ -9043,28 +8657,6 @@ bool ListEntitiesDateResponse::decode_varint(uint32_t field_id, ProtoVarInt valu
       return false;
   }
 }
-bool ListEntitiesDateResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesDateResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -9076,20 +8668,20 @@ bool ListEntitiesDateResponse::decode_32bit(uint32_t field_id, Proto32Bit value)
   }
 }
 void ListEntitiesDateResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
 }
 void ListEntitiesDateResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
 }
@@ -9098,7 +8690,7 @@ void ListEntitiesDateResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesDateResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -9107,15 +8699,15 @@ void ListEntitiesDateResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -9284,28 +8876,6 @@ bool ListEntitiesTimeResponse::decode_varint(uint32_t field_id, ProtoVarInt valu
       return false;
   }
 }
-bool ListEntitiesTimeResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesTimeResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -9317,20 +8887,20 @@ bool ListEntitiesTimeResponse::decode_32bit(uint32_t field_id, Proto32Bit value)
   }
 }
 void ListEntitiesTimeResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
 }
 void ListEntitiesTimeResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
 }
@@ -9339,7 +8909,7 @@ void ListEntitiesTimeResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesTimeResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -9348,15 +8918,15 @@ void ListEntitiesTimeResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -9527,26 +9097,6 @@ bool ListEntitiesEventResponse::decode_varint(uint32_t field_id, ProtoVarInt val
 }
 bool ListEntitiesEventResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
   switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 8: {
-      this->device_class = value.as_string();
-      return true;
-    }
     case 9: {
       this->event_types.push_back(value.as_string());
       return true;
@@ -9566,27 +9116,27 @@ bool ListEntitiesEventResponse::decode_32bit(uint32_t field_id, Proto32Bit value
   }
 }
 void ListEntitiesEventResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
-  buffer.encode_string(8, this->device_class);
+  buffer.encode_string(8, this->device_class_ref_);
   for (auto &it : this->event_types) {
     buffer.encode_string(9, it, true);
   }
 }
 void ListEntitiesEventResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
   if (!this->event_types.empty()) {
     for (const auto &it : this->event_types) {
       ProtoSize::add_string_field(total_size, 1, it, true);
@@ -9598,7 +9148,7 @@ void ListEntitiesEventResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesEventResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -9607,15 +9157,15 @@ void ListEntitiesEventResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -9627,7 +9177,7 @@ void ListEntitiesEventResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
 
   for (const auto &it : this->event_types) {
@@ -9707,32 +9257,6 @@ bool ListEntitiesValveResponse::decode_varint(uint32_t field_id, ProtoVarInt val
       return false;
   }
 }
-bool ListEntitiesValveResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 8: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesValveResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -9744,27 +9268,27 @@ bool ListEntitiesValveResponse::decode_32bit(uint32_t field_id, Proto32Bit value
   }
 }
 void ListEntitiesValveResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
-  buffer.encode_string(8, this->device_class);
+  buffer.encode_string(8, this->device_class_ref_);
   buffer.encode_bool(9, this->assumed_state);
   buffer.encode_bool(10, this->supports_position);
   buffer.encode_bool(11, this->supports_stop);
 }
 void ListEntitiesValveResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->assumed_state, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_position, false);
   ProtoSize::add_bool_field(total_size, 1, this->supports_stop, false);
@@ -9774,7 +9298,7 @@ void ListEntitiesValveResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesValveResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -9783,15 +9307,15 @@ void ListEntitiesValveResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -9803,7 +9327,7 @@ void ListEntitiesValveResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  assumed_state: ");
@@ -9952,28 +9476,6 @@ bool ListEntitiesDateTimeResponse::decode_varint(uint32_t field_id, ProtoVarInt
       return false;
   }
 }
-bool ListEntitiesDateTimeResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesDateTimeResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -9985,20 +9487,20 @@ bool ListEntitiesDateTimeResponse::decode_32bit(uint32_t field_id, Proto32Bit va
   }
 }
 void ListEntitiesDateTimeResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
 }
 void ListEntitiesDateTimeResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
 }
@@ -10007,7 +9509,7 @@ void ListEntitiesDateTimeResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesDateTimeResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -10016,15 +9518,15 @@ void ListEntitiesDateTimeResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -10143,32 +9645,6 @@ bool ListEntitiesUpdateResponse::decode_varint(uint32_t field_id, ProtoVarInt va
       return false;
   }
 }
-bool ListEntitiesUpdateResponse::decode_length(uint32_t field_id, ProtoLengthDelimited value) {
-  switch (field_id) {
-    case 1: {
-      this->object_id = value.as_string();
-      return true;
-    }
-    case 3: {
-      this->name = value.as_string();
-      return true;
-    }
-    case 4: {
-      this->unique_id = value.as_string();
-      return true;
-    }
-    case 5: {
-      this->icon = value.as_string();
-      return true;
-    }
-    case 8: {
-      this->device_class = value.as_string();
-      return true;
-    }
-    default:
-      return false;
-  }
-}
 bool ListEntitiesUpdateResponse::decode_32bit(uint32_t field_id, Proto32Bit value) {
   switch (field_id) {
     case 2: {
@@ -10180,31 +9656,31 @@ bool ListEntitiesUpdateResponse::decode_32bit(uint32_t field_id, Proto32Bit valu
   }
 }
 void ListEntitiesUpdateResponse::encode(ProtoWriteBuffer buffer) const {
-  buffer.encode_string(1, this->object_id);
+  buffer.encode_string(1, this->object_id_ref_);
   buffer.encode_fixed32(2, this->key);
-  buffer.encode_string(3, this->name);
-  buffer.encode_string(4, this->unique_id);
-  buffer.encode_string(5, this->icon);
+  buffer.encode_string(3, this->name_ref_);
+  buffer.encode_string(4, this->unique_id_ref_);
+  buffer.encode_string(5, this->icon_ref_);
   buffer.encode_bool(6, this->disabled_by_default);
   buffer.encode_enum<enums::EntityCategory>(7, this->entity_category);
-  buffer.encode_string(8, this->device_class);
+  buffer.encode_string(8, this->device_class_ref_);
 }
 void ListEntitiesUpdateResponse::calculate_size(uint32_t &total_size) const {
-  ProtoSize::add_string_field(total_size, 1, this->object_id, false);
+  ProtoSize::add_string_field(total_size, 1, this->object_id_ref_, false);
   ProtoSize::add_fixed_field<4>(total_size, 1, this->key != 0, false);
-  ProtoSize::add_string_field(total_size, 1, this->name, false);
-  ProtoSize::add_string_field(total_size, 1, this->unique_id, false);
-  ProtoSize::add_string_field(total_size, 1, this->icon, false);
+  ProtoSize::add_string_field(total_size, 1, this->name_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->unique_id_ref_, false);
+  ProtoSize::add_string_field(total_size, 1, this->icon_ref_, false);
   ProtoSize::add_bool_field(total_size, 1, this->disabled_by_default, false);
   ProtoSize::add_enum_field(total_size, 1, static_cast<uint32_t>(this->entity_category), false);
-  ProtoSize::add_string_field(total_size, 1, this->device_class, false);
+  ProtoSize::add_string_field(total_size, 1, this->device_class_ref_, false);
 }
 #ifdef HAS_PROTO_MESSAGE_DUMP
 void ListEntitiesUpdateResponse::dump_to(std::string &out) const {
   __attribute__((unused)) char buffer[64];
   out.append("ListEntitiesUpdateResponse {\n");
   out.append("  object_id: ");
-  out.append("'").append(this->object_id).append("'");
+  out.append("'").append(this->object_id_ref_.c_str(), this->object_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  key: ");
@@ -10213,15 +9689,15 @@ void ListEntitiesUpdateResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  name: ");
-  out.append("'").append(this->name).append("'");
+  out.append("'").append(this->name_ref_.c_str(), this->name_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  unique_id: ");
-  out.append("'").append(this->unique_id).append("'");
+  out.append("'").append(this->unique_id_ref_.c_str(), this->unique_id_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  icon: ");
-  out.append("'").append(this->icon).append("'");
+  out.append("'").append(this->icon_ref_.c_str(), this->icon_ref_.size()).append("'");
   out.append("\n");
 
   out.append("  disabled_by_default: ");
@@ -10233,7 +9709,7 @@ void ListEntitiesUpdateResponse::dump_to(std::string &out) const {
   out.append("\n");
 
   out.append("  device_class: ");
-  out.append("'").append(this->device_class).append("'");
+  out.append("'").append(this->device_class_ref_.c_str(), this->device_class_ref_.size()).append("'");
   out.append("\n");
   out.append("}");
 }
@@ -421,14 +421,14 @@ class SubscribeStatesRequest : public ProtoMessage {
 };
 class ListEntitiesBinarySensorResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string device_class{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   bool is_status_binary_sensor{false};
   bool disabled_by_default{false};
-  std::string icon{};
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   enums::EntityCategory entity_category{};
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
@@ -438,8 +438,12 @@ class ListEntitiesBinarySensorResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef device_class_ref_{};
+  StringRef icon_ref_{};
 };
 class BinarySensorStateResponse : public ProtoMessage {
  public:
@@ -458,16 +462,16 @@ class BinarySensorStateResponse : public ProtoMessage {
 };
 class ListEntitiesCoverResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
   bool assumed_state{false};
   bool supports_position{false};
   bool supports_tilt{false};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   bool disabled_by_default{false};
-  std::string icon{};
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   enums::EntityCategory entity_category{};
   bool supports_stop{false};
   void encode(ProtoWriteBuffer buffer) const override;
@@ -478,8 +482,12 @@ class ListEntitiesCoverResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef device_class_ref_{};
+  StringRef icon_ref_{};
 };
 class CoverStateResponse : public ProtoMessage {
  public:
@@ -520,16 +528,16 @@ class CoverCommandRequest : public ProtoMessage {
 };
 class ListEntitiesFanResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
   bool supports_oscillation{false};
   bool supports_speed{false};
   bool supports_direction{false};
   int32_t supported_speed_count{0};
   bool disabled_by_default{false};
-  std::string icon{};
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   enums::EntityCategory entity_category{};
   std::vector<std::string> supported_preset_modes{};
   void encode(ProtoWriteBuffer buffer) const override;
@@ -542,6 +550,10 @@ class ListEntitiesFanResponse : public ProtoMessage {
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class FanStateResponse : public ProtoMessage {
  public:
@@ -591,10 +603,10 @@ class FanCommandRequest : public ProtoMessage {
 };
 class ListEntitiesLightResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
   std::vector<enums::ColorMode> supported_color_modes{};
   bool legacy_supports_brightness{false};
   bool legacy_supports_rgb{false};
@@ -604,7 +616,7 @@ class ListEntitiesLightResponse : public ProtoMessage {
   float max_mireds{0.0f};
   std::vector<std::string> effects{};
   bool disabled_by_default{false};
-  std::string icon{};
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   enums::EntityCategory entity_category{};
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
@@ -616,6 +628,10 @@ class ListEntitiesLightResponse : public ProtoMessage {
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class LightStateResponse : public ProtoMessage {
  public:
@@ -685,15 +701,15 @@ class LightCommandRequest : public ProtoMessage {
 };
 class ListEntitiesSensorResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
-  std::string unit_of_measurement{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
+  void set_unit_of_measurement(const StringRef &ref) { this->unit_of_measurement_ref_ = ref; }
   int32_t accuracy_decimals{0};
   bool force_update{false};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   enums::SensorStateClass state_class{};
   enums::SensorLastResetType legacy_last_reset_type{};
   bool disabled_by_default{false};
@@ -706,8 +722,13 @@ class ListEntitiesSensorResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef unit_of_measurement_ref_{};
+  StringRef device_class_ref_{};
 };
 class SensorStateResponse : public ProtoMessage {
  public:
@@ -726,15 +747,15 @@ class SensorStateResponse : public ProtoMessage {
 };
 class ListEntitiesSwitchResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool assumed_state{false};
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -743,8 +764,12 @@ class ListEntitiesSwitchResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef device_class_ref_{};
 };
 class SwitchStateResponse : public ProtoMessage {
  public:
@@ -776,14 +801,14 @@ class SwitchCommandRequest : public ProtoMessage {
 };
 class ListEntitiesTextSensorResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -792,8 +817,12 @@ class ListEntitiesTextSensorResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef device_class_ref_{};
 };
 class TextSensorStateResponse : public ProtoMessage {
  public:
@@ -980,7 +1009,7 @@ class ListEntitiesServicesArgument : public ProtoMessage {
 };
 class ListEntitiesServicesResponse : public ProtoMessage {
  public:
-  std::string name{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
   uint32_t key{0};
   std::vector<ListEntitiesServicesArgument> args{};
   void encode(ProtoWriteBuffer buffer) const override;
@@ -992,6 +1021,7 @@ class ListEntitiesServicesResponse : public ProtoMessage {
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
+  StringRef name_ref_{};
 };
 class ExecuteServiceArgument : public ProtoMessage {
  public:
@@ -1031,12 +1061,12 @@ class ExecuteServiceRequest : public ProtoMessage {
 };
 class ListEntitiesCameraResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
   bool disabled_by_default{false};
-  std::string icon{};
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   enums::EntityCategory entity_category{};
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
@@ -1046,8 +1076,11 @@ class ListEntitiesCameraResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class CameraImageResponse : public ProtoMessage {
  public:
@@ -1080,10 +1113,10 @@ class CameraImageRequest : public ProtoMessage {
 };
 class ListEntitiesClimateResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
   bool supports_current_temperature{false};
   bool supports_two_point_target_temperature{false};
   std::vector<enums::ClimateMode> supported_modes{};
@@ -1098,7 +1131,7 @@ class ListEntitiesClimateResponse : public ProtoMessage {
   std::vector<enums::ClimatePreset> supported_presets{};
   std::vector<std::string> supported_custom_presets{};
   bool disabled_by_default{false};
-  std::string icon{};
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   enums::EntityCategory entity_category{};
   float visual_current_temperature_step{0.0f};
   bool supports_current_humidity{false};
@@ -1115,6 +1148,10 @@ class ListEntitiesClimateResponse : public ProtoMessage {
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class ClimateStateResponse : public ProtoMessage {
  public:
@@ -1182,19 +1219,19 @@ class ClimateCommandRequest : public ProtoMessage {
 };
 class ListEntitiesNumberResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   float min_value{0.0f};
   float max_value{0.0f};
   float step{0.0f};
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
-  std::string unit_of_measurement{};
+  void set_unit_of_measurement(const StringRef &ref) { this->unit_of_measurement_ref_ = ref; }
   enums::NumberMode mode{};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -1203,8 +1240,13 @@ class ListEntitiesNumberResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef unit_of_measurement_ref_{};
+  StringRef device_class_ref_{};
 };
 class NumberStateResponse : public ProtoMessage {
  public:
@@ -1236,11 +1278,11 @@ class NumberCommandRequest : public ProtoMessage {
 };
 class ListEntitiesSelectResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   std::vector<std::string> options{};
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
@@ -1254,6 +1296,10 @@ class ListEntitiesSelectResponse : public ProtoMessage {
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class SelectStateResponse : public ProtoMessage {
  public:
@@ -1287,11 +1333,11 @@ class SelectCommandRequest : public ProtoMessage {
 };
 class ListEntitiesSirenResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   std::vector<std::string> tones{};
   bool supports_duration{false};
@@ -1307,6 +1353,10 @@ class ListEntitiesSirenResponse : public ProtoMessage {
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class SirenStateResponse : public ProtoMessage {
  public:
@@ -1346,17 +1396,17 @@ class SirenCommandRequest : public ProtoMessage {
 };
 class ListEntitiesLockResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
   bool assumed_state{false};
   bool supports_open{false};
   bool requires_code{false};
-  std::string code_format{};
+  void set_code_format(const StringRef &ref) { this->code_format_ref_ = ref; }
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -1365,8 +1415,12 @@ class ListEntitiesLockResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef code_format_ref_{};
 };
 class LockStateResponse : public ProtoMessage {
  public:
@@ -1401,14 +1455,14 @@ class LockCommandRequest : public ProtoMessage {
 };
 class ListEntitiesButtonResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -1417,8 +1471,12 @@ class ListEntitiesButtonResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef device_class_ref_{};
 };
 class ButtonCommandRequest : public ProtoMessage {
  public:
@@ -1451,11 +1509,11 @@ class MediaPlayerSupportedFormat : public ProtoMessage {
 };
 class ListEntitiesMediaPlayerResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
   bool supports_pause{false};
@@ -1470,6 +1528,10 @@ class ListEntitiesMediaPlayerResponse : public ProtoMessage {
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class MediaPlayerStateResponse : public ProtoMessage {
  public:
@@ -2135,11 +2197,11 @@ class VoiceAssistantSetConfiguration : public ProtoMessage {
 };
 class ListEntitiesAlarmControlPanelResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
   uint32_t supported_features{0};
@@ -2153,8 +2215,11 @@ class ListEntitiesAlarmControlPanelResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class AlarmControlPanelStateResponse : public ProtoMessage {
  public:
@@ -2188,16 +2253,16 @@ class AlarmControlPanelCommandRequest : public ProtoMessage {
 };
 class ListEntitiesTextResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
   uint32_t min_length{0};
   uint32_t max_length{0};
-  std::string pattern{};
+  void set_pattern(const StringRef &ref) { this->pattern_ref_ = ref; }
   enums::TextMode mode{};
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
@@ -2207,8 +2272,12 @@ class ListEntitiesTextResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef pattern_ref_{};
 };
 class TextStateResponse : public ProtoMessage {
  public:
@@ -2242,11 +2311,11 @@ class TextCommandRequest : public ProtoMessage {
 };
 class ListEntitiesDateResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
   void encode(ProtoWriteBuffer buffer) const override;
@@ -2257,8 +2326,11 @@ class ListEntitiesDateResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class DateStateResponse : public ProtoMessage {
  public:
@@ -2295,11 +2367,11 @@ class DateCommandRequest : public ProtoMessage {
 };
 class ListEntitiesTimeResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
   void encode(ProtoWriteBuffer buffer) const override;
@@ -2310,8 +2382,11 @@ class ListEntitiesTimeResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class TimeStateResponse : public ProtoMessage {
  public:
@@ -2348,14 +2423,14 @@ class TimeCommandRequest : public ProtoMessage {
 };
 class ListEntitiesEventResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   std::vector<std::string> event_types{};
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
@@ -2367,6 +2442,11 @@ class ListEntitiesEventResponse : public ProtoMessage {
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
   bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef device_class_ref_{};
 };
 class EventResponse : public ProtoMessage {
  public:
@@ -2384,14 +2464,14 @@ class EventResponse : public ProtoMessage {
 };
 class ListEntitiesValveResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   bool assumed_state{false};
   bool supports_position{false};
   bool supports_stop{false};
@@ -2403,8 +2483,12 @@ class ListEntitiesValveResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef device_class_ref_{};
 };
 class ValveStateResponse : public ProtoMessage {
  public:
@@ -2439,11 +2523,11 @@ class ValveCommandRequest : public ProtoMessage {
 };
 class ListEntitiesDateTimeResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
   void encode(ProtoWriteBuffer buffer) const override;
@@ -2454,8 +2538,11 @@ class ListEntitiesDateTimeResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
 };
 class DateTimeStateResponse : public ProtoMessage {
  public:
@@ -2487,14 +2574,14 @@ class DateTimeCommandRequest : public ProtoMessage {
 };
 class ListEntitiesUpdateResponse : public ProtoMessage {
  public:
-  std::string object_id{};
+  void set_object_id(const StringRef &ref) { this->object_id_ref_ = ref; }
   uint32_t key{0};
-  std::string name{};
-  std::string unique_id{};
-  std::string icon{};
+  void set_name(const StringRef &ref) { this->name_ref_ = ref; }
+  void set_unique_id(const StringRef &ref) { this->unique_id_ref_ = ref; }
+  void set_icon(const StringRef &ref) { this->icon_ref_ = ref; }
   bool disabled_by_default{false};
   enums::EntityCategory entity_category{};
-  std::string device_class{};
+  void set_device_class(const StringRef &ref) { this->device_class_ref_ = ref; }
   void encode(ProtoWriteBuffer buffer) const override;
   void calculate_size(uint32_t &total_size) const override;
 #ifdef HAS_PROTO_MESSAGE_DUMP
@@ -2503,8 +2590,12 @@ class ListEntitiesUpdateResponse : public ProtoMessage {
 
  protected:
   bool decode_32bit(uint32_t field_id, Proto32Bit value) override;
-  bool decode_length(uint32_t field_id, ProtoLengthDelimited value) override;
   bool decode_varint(uint32_t field_id, ProtoVarInt value) override;
+  StringRef object_id_ref_{};
+  StringRef name_ref_{};
+  StringRef unique_id_ref_{};
+  StringRef icon_ref_{};
+  StringRef device_class_ref_{};
 };
 class UpdateStateResponse : public ProtoMessage {
  public:
@@ -293,6 +293,19 @@ class ProtoSize {
     total_size += field_id_size + varint(str_size) + str_size;
   }
 
+  /**
+   * @brief Calculates and adds the size of a string field referenced by a StringRef to the total message size
+   */
+  static inline void add_string_field(uint32_t &total_size, uint32_t field_id_size, const StringRef &ref,
+                                      bool force = false) {
+    if (ref.empty() && !force) {
+      return;  // No need to update total_size
+    }
+
+    const uint32_t str_size = static_cast<uint32_t>(ref.size());
+    total_size += field_id_size + varint(str_size) + str_size;
+  }
+
   /**
    * @brief Calculates and adds the size of a nested message field to the total message size
    *
@@ -98,6 +98,13 @@ void APIServer::setup() {
 
   this->last_connected_ = millis();
 
+#ifdef USE_SOCKET_EPOLL
+  // The sockets wake the loop, it only needs to poll while a client has other work. The keepalive and reboot
+  // timeouts are checked on a timer instead.
+  this->set_loop_on_wake(true);
+  this->set_interval(1000, [this]() { this->wake_loop(); });
+#endif
+
 #ifdef USE_ESP32_CAMERA
   if (esp32_camera::global_esp32_camera != nullptr && !esp32_camera::global_esp32_camera->is_internal()) {
     esp32_camera::global_esp32_camera->add_image_callback(
@@ -166,11 +173,18 @@ void APIServer::loop() {
       this->status_clear_warning();
     }
   }
+
+#ifdef USE_SOCKET_EPOLL
+  this->set_loop_on_wake(
+      std::none_of(this->clients_.begin(), this->clients_.end(),
+                   [](const std::unique_ptr<APIConnection> &client) { return client->has_pending_work_(); }));
+#endif
 }
 
 void APIServer::dump_config() {
   ESP_LOGCONFIG(TAG, "API Server:");
   ESP_LOGCONFIG(TAG, "  Address: %s:%u", network::get_use_address().c_str(), this->port_);
+  ESP_LOGCONFIG(TAG, "  Batch delay: %ums", this->batch_delay_);
 #ifdef USE_API_NOISE
   ESP_LOGCONFIG(TAG, "  Using noise encryption: %s", YESNO(this->noise_ctx_->has_psk()));
   if (!this->noise_ctx_->has_psk()) {
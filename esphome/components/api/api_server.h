@@ -39,6 +39,8 @@ class APIServer : public Component, public Controller {
   void set_port(uint16_t port);
   void set_password(const std::string &password);
   void set_reboot_timeout(uint32_t reboot_timeout);
+  void set_batch_delay(uint16_t batch_delay) { this->batch_delay_ = batch_delay; }
+  uint16_t get_batch_delay() const { return this->batch_delay_; }
 
 #ifdef USE_API_NOISE
   bool save_noise_psk(psk_t psk, bool make_active = true);
@@ -140,6 +142,8 @@ class APIServer : public Component, public Controller {
   uint16_t port_{6053};
   uint32_t reboot_timeout_{300000};
   uint32_t last_connected_{0};
+  // Maximum time in ms state updates are held back to be sent together
+  uint16_t batch_delay_{0};
   std::vector<std::unique_ptr<APIConnection>> clients_;
   std::string password_;
   std::vector<HomeAssistantStateSubscription> state_subs_;
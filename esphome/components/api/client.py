@@ -10,6 +10,7 @@ from aioesphomeapi.log_runner import async_run
 
 from esphome.const import CONF_KEY, CONF_PASSWORD, CONF_PORT, __version__
 from esphome.core import CORE
+from esphome.resolver import get_resolver
 
 from . import CONF_ENCRYPTION
 
@@ -22,8 +23,10 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_run_logs(config: dict[str, Any], address: str) -> None:
-    """Run the logs command in the event loop."""
+def create_api_client(
+    config: dict[str, Any], address: str, client_info: str
+) -> APIClient:
+    """Create a client for the API of the device of a configuration."""
     conf = config["api"]
     name = config["esphome"]["name"]
     port: int = int(conf[CONF_PORT])
@@ -31,14 +34,25 @@ async def async_run_logs(config: dict[str, Any], address: str) -> None:
     noise_psk: str | None = None
     if CONF_ENCRYPTION in conf:
         noise_psk = conf[CONF_ENCRYPTION][CONF_KEY]
-    _LOGGER.info("Starting log output from %s using esphome API", address)
-    cli = APIClient(
+    # Skip the mDNS lookup if a previous command found the device recently,
+    # the name check protects against addresses that were reassigned since
+    addresses = get_resolver().cached(address)
+    return APIClient(
         address,
         port,
         password,
-        client_info=f"ESPHome Logs {__version__}",
+        client_info=f"{client_info} {__version__}",
         noise_psk=noise_psk,
+        addresses=addresses,
+        expected_name=name if addresses else None,
     )
+
+
+async def async_run_logs(config: dict[str, Any], address: str) -> None:
+    """Run the logs command in the event loop."""
+    name = config["esphome"]["name"]
+    _LOGGER.info("Starting log output from %s using esphome API", address)
+    cli = create_api_client(config, address, "ESPHome Logs")
     dashboard = CORE.dashboard
 
     def on_log(msg: SubscribeLogsResponse) -> None:
@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 import logging
 from pathlib import Path
 
@@ -39,15 +40,22 @@ async def to_code(config):
     pass
 
 
-def _process_git_config(config: dict, refresh) -> str:
-    repo_dir, _ = git.clone_or_update(
-        url=config[CONF_URL],
-        ref=config.get(CONF_REF),
-        refresh=refresh,
-        domain=DOMAIN,
-        username=config.get(CONF_USERNAME),
-        password=config.get(CONF_PASSWORD),
-    )
+def _git_source(config: dict, refresh) -> dict:
+    return {
+        "url": config[CONF_URL],
+        "ref": config.get(CONF_REF),
+        "refresh": refresh,
+        "domain": DOMAIN,
+        "username": config.get(CONF_USERNAME),
+        "password": config.get(CONF_PASSWORD),
+    }
+
+
+def _process_git_config(config: dict, refresh, fetched: Future | None = None) -> str:
+    if fetched is not None:
+        repo_dir, _ = fetched.result()
+    else:
+        repo_dir, _ = git.clone_or_update(**_git_source(config, refresh))
 
     if path := config.get(CONF_PATH):
         if (repo_dir / path).is_dir():
@@ -70,12 +78,12 @@ def _process_git_config(config: dict, refresh) -> str:
     return components_dir
 
 
-def _process_single_config(config: dict):
+def _process_single_config(config: dict, fetched: Future | None = None):
     conf = config[CONF_SOURCE]
     if conf[CONF_TYPE] == TYPE_GIT:
         with cv.prepend_path([CONF_SOURCE]):
             components_dir = _process_git_config(
-                config[CONF_SOURCE], config[CONF_REFRESH]
+                config[CONF_SOURCE], config[CONF_REFRESH], fetched
             )
     elif conf[CONF_TYPE] == TYPE_LOCAL:
         components_dir = Path(CORE.relative_config_path(conf[CONF_PATH]))
@@ -111,6 +119,12 @@ def do_external_components_pass(config: dict) -> None:
         return
     with cv.prepend_path(DOMAIN):
         conf = CONFIG_SCHEMA(conf)
+        # Fetch all git sources at once, before their components are loaded
+        git_configs = [c for c in conf if c[CONF_SOURCE][CONF_TYPE] == TYPE_GIT]
+        futures = git.clone_or_update_many(
+            [_git_source(c[CONF_SOURCE], c[CONF_REFRESH]) for c in git_configs]
+        )
+        fetched = {id(c): future for c, future in zip(git_configs, futures)}
         for i, c in enumerate(conf):
             with cv.prepend_path(i):
-                _process_single_config(c)
+                _process_single_config(c, fetched.get(id(c)))
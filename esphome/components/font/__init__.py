@@ -1,12 +1,16 @@
 from collections.abc import MutableMapping
+import ctypes
 import functools
 import hashlib
+import json
 import logging
 import os
 from pathlib import Path
 import re
+from typing import NamedTuple
 
 import esphome_glyphsets as glyphsets
+import freetype
 
 # pylint: disable=no-name-in-module
 from freetype import (
@@ -16,6 +20,7 @@ from freetype import (
     Face,
     ft_pixel_mode_mono,
 )
+from PIL import Image
 import requests
 
 from esphome import external_files
@@ -34,8 +39,8 @@ from esphome.const import (
     CONF_URL,
     CONF_WEIGHT,
 )
-from esphome.core import CORE, HexInt
-from esphome.helpers import cpp_string_escape
+from esphome.core import CORE, EsphomeError
+from esphome.helpers import cpp_string_escape, write_file
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,9 +84,11 @@ class FontCache(MutableMapping):
 
     def __init__(self):
         self.store = {}
+        self.digests = {}
 
     def __delitem__(self, key):
         del self.store[self._keytransform(key)]
+        del self.digests[self._keytransform(key)]
 
     def __iter__(self):
         return iter(self.store)
@@ -94,6 +101,13 @@ class FontCache(MutableMapping):
 
     def __setitem__(self, key, value):
         self.store[self._keytransform(key)] = Face(str(value))
+        self.digests[self._keytransform(key)] = hashlib.sha256(
+            Path(value).read_bytes()
+        ).hexdigest()
+
+    def get_digest(self, item):
+        """Return the sha256 digest of the font file"""
+        return self.digests[self._keytransform(item)]
 
 
 FONT_CACHE = FontCache()
@@ -477,6 +491,112 @@ class GlyphInfo:
         self.height = height
 
 
+class RenderedGlyph(NamedTuple):
+    data: bytes
+    advance: int
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+class GlyphCache:
+    """
+    On-disk cache of the glyphs rendered from one font file at one size and bpp,
+    so unchanged fonts don't have to be rasterized again on every compile.
+    """
+
+    # Bump when the layout of the cache file changes
+    VERSION = 1
+
+    def __init__(self, digest: str, size: int, bpp: int):
+        self.path = (
+            external_files.compute_local_file_dir(DOMAIN)
+            / "glyphs"
+            / f"{digest}-{size}-{bpp}.json"
+        )
+        # Rendering differs between freetype versions
+        self.key = [self.VERSION, *freetype.version()]
+        self.glyphs: dict[str, RenderedGlyph] = {}
+        self.dirty = False
+        try:
+            content = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if content.get("key") == self.key:
+            self.glyphs = {
+                codepoint: RenderedGlyph(bytes.fromhex(data), *metrics)
+                for codepoint, (data, *metrics) in content["glyphs"].items()
+            }
+
+    def get(self, codepoint: str) -> RenderedGlyph | None:
+        return self.glyphs.get(codepoint)
+
+    def add(self, codepoint: str, glyph: RenderedGlyph):
+        self.glyphs[codepoint] = glyph
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        content = {
+            "key": self.key,
+            "glyphs": {
+                codepoint: [glyph.data.hex(), *glyph[1:]]
+                for codepoint, glyph in self.glyphs.items()
+            },
+        }
+        try:
+            write_file(self.path, json.dumps(content, separators=(",", ":")))
+        except EsphomeError as e:
+            _LOGGER.warning("Could not write glyph cache %s: %s", self.path, e)
+        self.dirty = False
+
+
+def pack_bitmap(bitmap, bpp: int) -> bytes:
+    """
+    Convert a rendered freetype bitmap to consecutive pixels of bpp bits,
+    most significant bit first
+    """
+    width = bitmap.width
+    height = bitmap.rows
+    if width == 0 or height == 0:
+        return b""
+    pitch = bitmap.pitch
+    # Much faster than the buffer property, which builds a list of every byte
+    # pylint: disable=protected-access
+    buffer = ctypes.string_at(bitmap._FT_Bitmap.buffer, abs(pitch) * height)
+    if bitmap.pixel_mode == ft_pixel_mode_mono:
+        image = Image.frombytes("1", (width, height), buffer, "raw", "1", pitch)
+        table = bytes((1 << bpp) - 1 if v else 0 for v in range(256))
+        pixels = image.convert("L").tobytes().translate(table)
+    else:
+        image = Image.frombytes("L", (width, height), buffer, "raw", "L", pitch)
+        table = bytes(v >> (8 - bpp) for v in range(256))
+        pixels = image.tobytes().translate(table)
+    if bpp == 8:
+        return pixels
+    # The palette packers write consecutive pixels without row padding
+    return Image.frombytes("P", (len(pixels), 1), pixels).tobytes("raw", f"P;{bpp}")
+
+
+def render_glyph(font: Face, codepoint: str, bpp: int) -> RenderedGlyph:
+    flags = FT_LOAD_RENDER
+    if bpp != 1:
+        flags |= FT_LOAD_NO_BITMAP
+    else:
+        flags |= FT_LOAD_TARGET_MONO
+    font.load_char(codepoint, flags)
+    return RenderedGlyph(
+        pack_bitmap(font.glyph.bitmap, bpp),
+        pt_to_px(font.glyph.metrics.horiAdvance),
+        font.glyph.bitmap_left,
+        font.glyph.bitmap_top,
+        font.glyph.bitmap.width,
+        font.glyph.bitmap.rows,
+    )
+
+
 async def to_code(config):
     """
     Collect all glyph codepoints, construct a map from a codepoint to a font file.
@@ -497,20 +617,26 @@ async def to_code(config):
     # Create the codepoint to font file map
     base_font = FONT_CACHE[config[CONF_FILE]]
     point_font_map: dict[str, Face] = {c: base_font for c in point_set}
+    bpp = config[CONF_BPP]
+    size = config[CONF_SIZE]
+    glyph_caches = {
+        base_font: GlyphCache(FONT_CACHE.get_digest(config[CONF_FILE]), size, bpp)
+    }
     # process extras, updating the map and extending the codepoint list
     for extra in config[CONF_EXTRAS]:
         extra_points = flatten(extra[CONF_GLYPHS])
         point_set.update(extra_points)
         extra_font = FONT_CACHE[extra[CONF_FILE]]
         point_font_map.update({c: extra_font for c in extra_points})
+        if extra_font not in glyph_caches:
+            glyph_caches[extra_font] = GlyphCache(
+                FONT_CACHE.get_digest(extra[CONF_FILE]), size, bpp
+            )
 
     codepoints = list(point_set)
     codepoints.sort(key=functools.cmp_to_key(glyph_comparator))
     glyph_args = {}
-    data = []
-    bpp = config[CONF_BPP]
-    scale = 256 // (1 << bpp)
-    size = config[CONF_SIZE]
+    data = bytearray()
     # create the data array for all glyphs
     for codepoint in codepoints:
         font = point_font_map[codepoint]
@@ -520,33 +646,10 @@ async def to_code(config):
                 font.select_size(sizes.index(size))
         else:
             font.set_pixel_sizes(size, 0)
-        flags = FT_LOAD_RENDER
-        if bpp != 1:
-            flags |= FT_LOAD_NO_BITMAP
-        else:
-            flags |= FT_LOAD_TARGET_MONO
-        font.load_char(codepoint, flags)
-        width = font.glyph.bitmap.width
-        height = font.glyph.bitmap.rows
-        buffer = font.glyph.bitmap.buffer
-        pitch = font.glyph.bitmap.pitch
-        glyph_data = [0] * ((height * width * bpp + 7) // 8)
-        src_mode = font.glyph.bitmap.pixel_mode
-        pos = 0
-        for y in range(height):
-            for x in range(width):
-                if src_mode == ft_pixel_mode_mono:
-                    pixel = (
-                        (1 << bpp) - 1
-                        if buffer[y * pitch + x // 8] & (1 << (7 - x % 8))
-                        else 0
-                    )
-                else:
-                    pixel = buffer[y * pitch + x] // scale
-                for bit_num in range(bpp):
-                    if pixel & (1 << (bpp - bit_num - 1)):
-                        glyph_data[pos // 8] |= 0x80 >> (pos % 8)
-                    pos += 1
+        glyph_cache = glyph_caches[font]
+        if (glyph := glyph_cache.get(codepoint)) is None:
+            glyph = render_glyph(font, codepoint, bpp)
+            glyph_cache.add(codepoint, glyph)
         ascender = pt_to_px(font.size.ascender)
         if ascender == 0:
             if not font.is_scalable:
@@ -557,16 +660,17 @@ async def to_code(config):
                 )
         glyph_args[codepoint] = GlyphInfo(
             len(data),
-            pt_to_px(font.glyph.metrics.horiAdvance),
-            font.glyph.bitmap_left,
-            ascender - font.glyph.bitmap_top,
-            width,
-            height,
+            glyph.advance,
+            glyph.left,
+            ascender - glyph.top,
+            glyph.width,
+            glyph.height,
         )
-        data += glyph_data
+        data += glyph.data
+    for glyph_cache in glyph_caches.values():
+        glyph_cache.save()
 
-    rhs = [HexInt(x) for x in data]
-    prog_arr = cg.progmem_array(config[CONF_RAW_DATA_ID], rhs)
+    prog_arr = cg.progmem_array(config[CONF_RAW_DATA_ID], bytes(data))
 
     # Create the glyph table that points to data in the above array.
     glyph_initializer = []
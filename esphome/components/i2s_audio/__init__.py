@@ -144,7 +144,12 @@ def validate_mclk_divisible_by_3(config):
     return config
 
 
-_use_legacy_driver = None
+# Kept in CORE.data, validation can be skipped for a cached configuration
+KEY_USE_LEGACY = "use_legacy"
+
+
+def _get_use_legacy() -> bool | None:
+    return CORE.data.get(CONF_I2S_AUDIO, {}).get(KEY_USE_LEGACY)
 
 
 def i2s_audio_component_schema(
@@ -210,17 +215,19 @@ async def register_i2s_audio_component(var, config):
 
 
 def validate_use_legacy(value):
-    global _use_legacy_driver  # noqa: PLW0603
     if CONF_USE_LEGACY in value:
-        if (_use_legacy_driver is not None) and (
-            _use_legacy_driver != value[CONF_USE_LEGACY]
+        use_legacy_driver = _get_use_legacy()
+        if (use_legacy_driver is not None) and (
+            use_legacy_driver != value[CONF_USE_LEGACY]
         ):
             raise cv.Invalid(
                 f"All i2s_audio components must set {CONF_USE_LEGACY} to the same value."
             )
         if (not value[CONF_USE_LEGACY]) and (CORE.using_arduino):
             raise cv.Invalid("Arduino supports only the legacy i2s driver.")
-        _use_legacy_driver = value[CONF_USE_LEGACY]
+        CORE.data.setdefault(CONF_I2S_AUDIO, {})[KEY_USE_LEGACY] = value[
+            CONF_USE_LEGACY
+        ]
     return value
 
 
@@ -252,7 +259,7 @@ def _final_validate(_):
 def use_legacy():
     framework_version = CORE.data[KEY_CORE][KEY_FRAMEWORK_VERSION]
     if CORE.using_esp_idf and framework_version >= cv.Version(5, 0, 0):
-        if not _use_legacy_driver:
+        if not _get_use_legacy():
             return False
     return True
 
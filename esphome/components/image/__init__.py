@@ -6,7 +6,7 @@ import logging
 from pathlib import Path
 import re
 
-from PIL import Image, UnidentifiedImageError
+from PIL import Image, ImageChops, UnidentifiedImageError
 
 from esphome import core, external_files
 import esphome.codegen as cg
@@ -23,7 +23,7 @@ from esphome.const import (
     CONF_TYPE,
     CONF_URL,
 )
-from esphome.core import CORE, HexInt
+from esphome.core import CORE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,7 +78,7 @@ class ImageEncoder:
         self.transparency = transparency
         self.width = width
         self.height = height
-        self.data = [0 for _ in range(width * height)]
+        self.data = bytearray(width * height)
         self.dither = dither
         self.index = 0
         self.invert_alpha = invert_alpha
@@ -104,6 +104,60 @@ class ImageEncoder:
         :return:
         """
 
+    def encode_frame(self, image):
+        """
+        Encode all pixels of a converted frame
+        :param image: Image returned by convert
+        """
+        self.add_bytes(self.frame_bytes(image))
+
+    def frame_bytes(self, image):
+        """
+        Return the encoded bytes of a converted frame.
+        Subclasses override this with bulk operations on the whole frame, the
+        result must be identical to calling encode for every pixel.
+        """
+        start = self.index
+        width, height = image.size
+        pixels = image.getdata()
+        for row in range(height):
+            for col in range(width):
+                self.encode(pixels[row * width + col])
+            self.end_row()
+        end, self.index = self.index, start
+        return self.data[start:end]
+
+    def add_bytes(self, data):
+        """
+        Append already encoded bytes
+        """
+        self.data[self.index : self.index + len(data)] = data
+        self.index += len(data)
+
+
+def channel_mask(channel: Image, test):
+    """
+    Return a mode "1" image selecting the pixels of a single channel passing test
+    """
+    return channel.point(lambda v: 255 if test(v) else 0, "1")
+
+
+def apply_chroma_key(image: Image, key, key_color):
+    """
+    Apply chroma keying to an RGBA image, returning the R, G and B channels.
+    Pixels matching key (one test per channel) get their green channel cleared,
+    other transparent pixels are replaced by key_color.
+    """
+    r, g, b, a = image.split()
+    matches = channel_mask(r, key[0])
+    matches = ImageChops.logical_and(matches, channel_mask(g, key[1]))
+    matches = ImageChops.logical_and(matches, channel_mask(b, key[2]))
+    transparent = channel_mask(a, lambda v: v < 128)
+    for channel, value in zip((r, g, b), key_color):
+        channel.paste(value, mask=transparent)
+    g.paste(0, mask=matches)
+    return r, g, b
+
 
 def is_alpha_only(image: Image):
     """
@@ -146,6 +200,12 @@ class ImageBinary(ImageEncoder):
             self.bitno = 0
             self.index += 1
 
+    def frame_bytes(self, image):
+        # Mode "1" is packed most significant bit first with rows padded to a byte
+        if self.invert_alpha:
+            image = ImageChops.invert(image)
+        return image.tobytes()
+
 
 class ImageGrayscale(ImageEncoder):
     allow_config = {CONF_ALPHA_CHANNEL, CONF_CHROMA_KEY, CONF_INVERT_ALPHA, CONF_OPAQUE}
@@ -177,6 +237,17 @@ class ImageGrayscale(ImageEncoder):
         self.data[self.index] = b
         self.index += 1
 
+    def frame_bytes(self, image):
+        b, a = image.split()
+        if self.transparency == CONF_CHROMA_KEY:
+            b = b.point(lambda v: 0 if v == 1 else v)
+            b.paste(1, mask=channel_mask(a, lambda v: v != 0xFF))
+        if self.invert_alpha:
+            b = ImageChops.invert(b)
+        if self.transparency == CONF_ALPHA_CHANNEL:
+            b.paste(a, mask=channel_mask(a, lambda v: v != 0xFF))
+        return b.tobytes()
+
 
 class ImageRGB565(ImageEncoder):
     def __init__(self, width, height, transparency, dither, invert_alpha):
@@ -215,6 +286,27 @@ class ImageRGB565(ImageEncoder):
             self.data[self.index] = a
             self.index += 1
 
+    def frame_bytes(self, image):
+        if self.transparency == CONF_CHROMA_KEY:
+            # Compares the reduced values like encode: r == 0, g == 1, b == 0
+            r, g, b = apply_chroma_key(
+                image,
+                (lambda v: v < 8, lambda v: 4 <= v < 8, lambda v: v < 8),
+                (0, 4, 0),
+            )
+        else:
+            r, g, b, _ = image.split()
+        high = ImageChops.add(r.point(lambda v: v & 0xF8), g.point(lambda v: v >> 5))
+        low = ImageChops.add(
+            g.point(lambda v: (v << 3) & 0xE0), b.point(lambda v: v >> 3)
+        )
+        if self.transparency == CONF_ALPHA_CHANNEL:
+            a = image.getchannel("A")
+            if self.invert_alpha:
+                a = ImageChops.invert(a)
+            return Image.merge("RGB", (high, low, a)).tobytes()
+        return Image.merge("LA", (high, low)).tobytes()
+
 
 class ImageRGB(ImageEncoder):
     def __init__(self, width, height, transparency, dither, invert_alpha):
@@ -251,6 +343,23 @@ class ImageRGB(ImageEncoder):
             self.data[self.index] = a
             self.index += 1
 
+    def frame_bytes(self, image):
+        if self.transparency == CONF_CHROMA_KEY:
+            return Image.merge(
+                "RGB",
+                apply_chroma_key(
+                    image,
+                    (lambda v: v == 0, lambda v: v == 1, lambda v: v == 0),
+                    (0, 1, 0),
+                ),
+            ).tobytes()
+        if self.transparency == CONF_ALPHA_CHANNEL:
+            if self.invert_alpha:
+                r, g, b, a = image.split()
+                image = Image.merge("RGBA", (r, g, b, ImageChops.invert(a)))
+            return image.tobytes()
+        return image.convert("RGB").tobytes()
+
 
 class ReplaceWith:
     """
@@ -587,14 +696,9 @@ async def write_image(config, all_frames=False):
     encoder = IMAGE_TYPE[type](width, total_rows, transparency, dither, invert_alpha)
     for frame_index in range(frame_count):
         image.seek(frame_index)
-        pixels = encoder.convert(image.resize((width, height)), path).getdata()
-        for row in range(height):
-            for col in range(width):
-                encoder.encode(pixels[row * width + col])
-            encoder.end_row()
+        encoder.encode_frame(encoder.convert(image.resize((width, height)), path))
 
-    rhs = [HexInt(x) for x in encoder.data]
-    prog_arr = cg.progmem_array(config[CONF_RAW_DATA_ID], rhs)
+    prog_arr = cg.progmem_array(config[CONF_RAW_DATA_ID], bytes(encoder.data))
     image_type = get_image_type_enum(type)
     trans_value = get_transparency_enum(encoder.transparency)
 
@@ -26,7 +26,7 @@ from esphome.const import (
     TYPE_GIT,
     TYPE_LOCAL,
 )
-from esphome.core import CORE, HexInt
+from esphome.core import CORE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -472,8 +472,7 @@ async def to_code(config):
         data = []
         manifest, data = _model_config_to_manifest_data(model_config)
 
-        rhs = [HexInt(x) for x in data]
-        prog_arr = cg.progmem_array(model_parameters[CONF_RAW_DATA_ID], rhs)
+        prog_arr = cg.progmem_array(model_parameters[CONF_RAW_DATA_ID], data)
 
         probability_cutoff = model_parameters.get(
             CONF_PROBABILITY_CUTOFF, manifest[KEY_MICRO][CONF_PROBABILITY_CUTOFF]
@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from pathlib import Path
 
 from esphome import git, yaml_util
@@ -105,15 +106,38 @@ CONFIG_SCHEMA = cv.Any(
 )
 
 
-def _process_base_package(config: dict) -> dict:
-    repo_dir, revert = git.clone_or_update(
-        url=config[CONF_URL],
-        ref=config.get(CONF_REF),
-        refresh=config[CONF_REFRESH],
-        domain=DOMAIN,
-        username=config.get(CONF_USERNAME),
-        password=config.get(CONF_PASSWORD),
-    )
+def _git_source(config: dict) -> dict:
+    return {
+        "url": config[CONF_URL],
+        "ref": config.get(CONF_REF),
+        "refresh": config[CONF_REFRESH],
+        "domain": DOMAIN,
+        "username": config.get(CONF_USERNAME),
+        "password": config.get(CONF_PASSWORD),
+    }
+
+
+def _fetch_remote_packages(packages: list) -> dict[int, Future]:
+    """Clone or update the repositories of all remote packages at once.
+
+    Returns the futures of the results by the id of the package config.
+    """
+    remote = [
+        package_config
+        for package_config in packages
+        if isinstance(package_config, dict) and CONF_URL in package_config
+    ]
+    if not remote:
+        return {}
+    futures = git.clone_or_update_many([_git_source(config) for config in remote])
+    return {id(config): future for config, future in zip(remote, futures)}
+
+
+def _process_base_package(config: dict, fetched: Future | None = None) -> dict:
+    if fetched is not None:
+        repo_dir, revert = fetched.result()
+    else:
+        repo_dir, revert = git.clone_or_update(**_git_source(config))
     files = []
 
     for file in config[CONF_FILES]:
@@ -177,10 +201,10 @@ def _process_base_package(config: dict) -> dict:
     return {"packages": packages}
 
 
-def _process_package(package_config, config):
+def _process_package(package_config, config, fetched: Future | None = None):
     recursive_package = package_config
     if CONF_URL in package_config:
-        package_config = _process_base_package(package_config)
+        package_config = _process_base_package(package_config, fetched)
     if isinstance(package_config, dict):
         recursive_package = do_packages_pass(package_config)
     config = merge_config(recursive_package, config)
@@ -194,12 +218,18 @@ def do_packages_pass(config: dict):
     with cv.prepend_path(CONF_PACKAGES):
         packages = CONFIG_SCHEMA(packages)
         if isinstance(packages, dict):
+            fetched = _fetch_remote_packages(list(packages.values()))
             for package_name, package_config in reversed(packages.items()):
                 with cv.prepend_path(package_name):
-                    config = _process_package(package_config, config)
+                    config = _process_package(
+                        package_config, config, fetched.get(id(package_config))
+                    )
         elif isinstance(packages, list):
+            fetched = _fetch_remote_packages(packages)
             for package_config in reversed(packages):
-                config = _process_package(package_config, config)
+                config = _process_package(
+                    package_config, config, fetched.get(id(package_config))
+                )
         else:
             raise cv.Invalid(
                 f"Packages must be a key to value mapping or list, got {type(packages)} instead"
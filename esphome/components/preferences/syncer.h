@@ -12,6 +12,8 @@ class IntervalSyncer : public Component {
   void setup() override {
     if (this->write_interval_ != 0) {
       set_interval(this->write_interval_, []() { global_preferences->sync(); });
+      // Nothing to do in loop(), let the main loop sleep
+      this->set_loop_on_wake(true);
     }
   }
   void loop() override {
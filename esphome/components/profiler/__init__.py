@@ -0,0 +1,27 @@
+import esphome.codegen as cg
+import esphome.config_validation as cv
+from esphome.const import CONF_ID
+
+DEPENDENCIES = ["logger"]
+
+CONF_REPORT_INTERVAL = "report_interval"
+
+profiler_ns = cg.esphome_ns.namespace("profiler")
+Profiler = profiler_ns.class_("Profiler", cg.Component)
+
+CONFIG_SCHEMA = cv.Schema(
+    {
+        cv.GenerateID(): cv.declare_id(Profiler),
+        cv.Optional(CONF_REPORT_INTERVAL, default="10s"): cv.All(
+            cv.positive_time_period_milliseconds,
+            cv.Range(min=cv.TimePeriod(seconds=1)),
+        ),
+    }
+).extend(cv.COMPONENT_SCHEMA)
+
+
+async def to_code(config):
+    var = cg.new_Pvariable(config[CONF_ID])
+    await cg.register_component(var, config)
+    cg.add(var.set_report_interval(config[CONF_REPORT_INTERVAL]))
+    cg.add_define("USE_PROFILER")
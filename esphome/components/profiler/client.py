@@ -0,0 +1,187 @@
+"""Show the reports of the profiler component as a table.
+
+The profiler logs a header line followed by one line per integration, like:
+
+    [I][profiler:085]: report interval_ms=10000 rows=2
+    [I][profiler:095]: api loop_calls=625 loop_us=12345 ... setup_us=1203
+
+The reports are read from the log subscription of the native API, so they don't
+need any support in the API client library.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import re
+import sys
+from typing import TYPE_CHECKING, Any
+
+from aioesphomeapi import LogLevel
+from aioesphomeapi.log_runner import async_run
+
+from esphome.components.api.client import create_api_client
+
+if TYPE_CHECKING:
+    from aioesphomeapi.api_pb2 import (
+        SubscribeLogsResponse,  # pylint: disable=no-name-in-module
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+_ANSI_ESCAPE = re.compile(r"\033\[[0-9;]*m")
+_PROFILER_LINE = re.compile(r"\[I\]\[profiler(?::\d+)?\]: (.*)$")
+
+CLEAR_SCREEN = "\033[H\033[2J"
+
+
+@dataclass
+class ProfileRow:
+    """Time spent in one integration during a report interval."""
+
+    source: str
+    loop_calls: int = 0
+    loop_us: int = 0
+    loop_max_us: int = 0
+    loop_p99_us: int = 0
+    scheduler_calls: int = 0
+    scheduler_us: int = 0
+    scheduler_max_us: int = 0
+    scheduler_p99_us: int = 0
+    setup_us: int = 0
+
+    @property
+    def total_us(self) -> int:
+        return self.loop_us + self.scheduler_us
+
+
+@dataclass
+class ProfileReport:
+    """All rows of one report."""
+
+    interval_ms: int
+    rows: list[ProfileRow] = field(default_factory=list)
+
+
+def _parse_fields(text: str) -> dict[str, int] | None:
+    try:
+        return {
+            key: int(value)
+            for key, _, value in (item.partition("=") for item in text.split())
+        }
+    except ValueError:
+        return None
+
+
+class ReportParser:
+    """Collects the log lines of the profiler into reports."""
+
+    def __init__(self) -> None:
+        self._report: ProfileReport | None = None
+        self._expected = 0
+
+    def feed(self, line: str) -> ProfileReport | None:
+        """Parse a log line, return the report once all of its rows were seen."""
+        if (match := _PROFILER_LINE.search(_ANSI_ESCAPE.sub("", line))) is None:
+            return None
+        source, _, rest = match.group(1).partition(" ")
+        if (values := _parse_fields(rest)) is None:
+            return None
+        if source == "report":
+            self._report = ProfileReport(values.get("interval_ms", 0))
+            self._expected = values.get("rows", 0)
+        elif self._report is not None:
+            fields = ProfileRow.__dataclass_fields__
+            self._report.rows.append(
+                ProfileRow(source, **{k: v for k, v in values.items() if k in fields})
+            )
+        if self._report is None or len(self._report.rows) < self._expected:
+            return None
+        report, self._report = self._report, None
+        return report
+
+
+def _format_us(value: int) -> str:
+    if value >= 10_000:
+        return f"{value / 1000:.1f}ms"
+    return f"{value}us"
+
+
+def render_report(report: ProfileReport) -> str:
+    """Render a report as a table, the integrations that took longest first."""
+    interval_us = max(report.interval_ms * 1000, 1)
+    header = (
+        "COMPONENT",
+        "CPU%",
+        "LOOPS",
+        "LOOP AVG",
+        "LOOP MAX",
+        "LOOP P99",
+        "TIMERS",
+        "TIMER AVG",
+        "TIMER MAX",
+        "TIMER P99",
+        "SETUP",
+    )
+    lines = [header]
+    for row in sorted(report.rows, key=lambda row: row.total_us, reverse=True):
+        lines.append(
+            (
+                row.source,
+                f"{row.total_us * 100 / interval_us:.1f}",
+                str(row.loop_calls),
+                _format_us(row.loop_us // max(row.loop_calls, 1)),
+                _format_us(row.loop_max_us),
+                _format_us(row.loop_p99_us),
+                str(row.scheduler_calls),
+                _format_us(row.scheduler_us // max(row.scheduler_calls, 1)),
+                _format_us(row.scheduler_max_us),
+                _format_us(row.scheduler_p99_us),
+                _format_us(row.setup_us),
+            )
+        )
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    total_us = sum(row.total_us for row in report.rows)
+    out = [
+        f"Profile over {report.interval_ms / 1000:.1f}s, "
+        f"{total_us * 100 / interval_us:.1f}% spent in components",
+        "",
+    ]
+    for line in lines:
+        cells = [line[0].ljust(widths[0])]
+        cells += [cell.rjust(width) for cell, width in zip(line[1:], widths[1:])]
+        out.append("  ".join(cells))
+    return "\n".join(out)
+
+
+async def async_run_profile(config: dict[str, Any], address: str) -> None:
+    """Run the profile command in the event loop."""
+    name = config["esphome"]["name"]
+    _LOGGER.info("Starting profiler output from %s using esphome API", address)
+    cli = create_api_client(config, address, "ESPHome Profile")
+    parser = ReportParser()
+    clear = CLEAR_SCREEN if sys.stdout.isatty() else ""
+    _LOGGER.info("Waiting for the first report")
+
+    def on_log(msg: SubscribeLogsResponse) -> None:
+        """Handle a new log message."""
+        report = parser.feed(msg.message.decode("utf8", "backslashreplace"))
+        if report is not None:
+            print(clear + render_report(report), flush=True)
+
+    stop = await async_run(
+        cli, on_log, log_level=LogLevel.LOG_LEVEL_INFO, dump_config=False, name=name
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stop()
+
+
+def run_profile(config: dict[str, Any], address: str) -> None:
+    """Run the profile command."""
+    try:
+        asyncio.run(async_run_profile(config, address))
+    except KeyboardInterrupt:
+        pass
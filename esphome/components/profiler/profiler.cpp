@@ -0,0 +1,132 @@
+#include "profiler.h"
+
+#include <algorithm>
+#include <cinttypes>
+#include <cstring>
+
+#include "esphome/core/hal.h"
+#include "esphome/core/log.h"
+
+namespace esphome {
+namespace profiler {
+
+static const char *const TAG = "profiler";
+
+static const char *const UNKNOWN_SOURCE = "<unknown>";
+
+Profiler *global_profiler = nullptr;  // NOLINT(cppcoreguidelines-avoid-non-const-global-variables)
+
+Profiler::Profiler() { global_profiler = this; }
+
+void Profiler::setup() {
+  this->interval_start_ = millis();
+  this->set_interval("report", this->report_interval_, [this]() { this->report_(); });
+}
+
+void Profiler::dump_config() {
+  ESP_LOGCONFIG(TAG, "Profiler:");
+  ESP_LOGCONFIG(TAG, "  Report Interval: %" PRIu32 " ms", this->report_interval_);
+}
+
+uint16_t Profiler::get_entry_(Component *component) {
+  auto it = std::lower_bound(
+      this->components_.begin(), this->components_.end(), component,
+      [](const std::pair<Component *, uint16_t> &item, Component *value) { return item.first < value; });
+  if (it != this->components_.end() && it->first == component)
+    return it->second;
+
+  // First time this component is seen, components of the same integration share an entry
+  const char *source = component != nullptr ? component->get_component_source() : UNKNOWN_SOURCE;
+  uint16_t index = 0;
+  while (index < this->entries_.size() && strcmp(this->entries_[index].source, source) != 0)
+    index++;
+  if (index == this->entries_.size()) {
+    Entry entry{};
+    entry.source = source;
+    this->entries_.push_back(entry);
+  }
+  this->components_.insert(it, std::make_pair(component, index));
+  return index;
+}
+
+void Profiler::record_setup(Component *component, uint32_t duration_us) {
+  this->entries_[this->get_entry_(component)].setup_us += duration_us;
+}
+
+void Profiler::record(Component *component, ProfileKind kind, uint32_t duration_us) {
+  Stats &stats = this->entries_[this->get_entry_(component)].stats[kind];
+  stats.calls++;
+  stats.total_us += duration_us;
+  stats.max_us = std::max(stats.max_us, duration_us);
+
+  uint16_t &count = stats.buckets[bucket_for_(duration_us)];
+  if (count == UINT16_MAX) {
+    // Halving every bucket keeps the percentiles, buckets that were used stay used
+    for (uint16_t &bucket : stats.buckets)
+      bucket = (bucket + 1) / 2;
+  }
+  count++;
+}
+
+uint8_t Profiler::bucket_for_(uint32_t duration_us) {
+  // Durations below one bucket per microsecond are counted exactly
+  if (duration_us < PROFILE_BUCKETS_PER_OCTAVE)
+    return duration_us;
+  const uint8_t octave = 31 - __builtin_clz(duration_us);
+  if (octave >= PROFILE_MAX_OCTAVE)
+    return PROFILE_BUCKET_COUNT - 1;
+  // The two bits after the leading one select the bucket within the octave
+  return (octave - 1) * PROFILE_BUCKETS_PER_OCTAVE + ((duration_us >> (octave - 2)) & 3);
+}
+
+uint32_t Profiler::percentile_99_(const Stats &stats) {
+  uint32_t total = 0;
+  for (uint16_t count : stats.buckets)
+    total += count;
+  if (total == 0)
+    return 0;
+  // The bucket of the smallest duration at least 99% of the calls don't exceed
+  const uint32_t rank = (total * 99 + 99) / 100;
+  uint32_t seen = 0;
+  uint8_t bucket = 0;
+  while ((seen += stats.buckets[bucket]) < rank)
+    bucket++;
+  if (bucket < PROFILE_BUCKETS_PER_OCTAVE)
+    return bucket;
+  if (bucket == PROFILE_BUCKET_COUNT - 1)
+    return stats.max_us;
+  // Report the largest duration of the bucket, but not more than was measured
+  const uint8_t octave = bucket / PROFILE_BUCKETS_PER_OCTAVE + 1;
+  const uint32_t upper = ((PROFILE_BUCKETS_PER_OCTAVE + bucket % PROFILE_BUCKETS_PER_OCTAVE + 1) << (octave - 2)) - 1;
+  return std::min(upper, stats.max_us);
+}
+
+void Profiler::report_() {
+  const uint32_t now = millis();
+  size_t rows = 0;
+  for (const Entry &entry : this->entries_) {
+    if (entry.stats[PROFILE_LOOP].calls != 0 || entry.stats[PROFILE_SCHEDULER].calls != 0 || entry.setup_us != 0)
+      rows++;
+  }
+  // One line per entry, the header tells how many follow
+  ESP_LOGI(TAG, "report interval_ms=%" PRIu32 " rows=%u", now - this->interval_start_, (unsigned) rows);
+  for (uint16_t i = 0; i < this->entries_.size(); i++) {
+    Entry &entry = this->entries_[i];
+    const Stats &loop = entry.stats[PROFILE_LOOP];
+    const Stats &scheduler = entry.stats[PROFILE_SCHEDULER];
+    if (loop.calls == 0 && scheduler.calls == 0 && entry.setup_us == 0)
+      continue;
+    ESP_LOGI(TAG,
+             "%s loop_calls=%" PRIu32 " loop_us=%" PRIu32 " loop_max_us=%" PRIu32 " loop_p99_us=%" PRIu32
+             " scheduler_calls=%" PRIu32 " scheduler_us=%" PRIu32 " scheduler_max_us=%" PRIu32
+             " scheduler_p99_us=%" PRIu32 " setup_us=%" PRIu32,
+             entry.source, loop.calls, loop.total_us, loop.max_us, percentile_99_(loop), scheduler.calls,
+             scheduler.total_us, scheduler.max_us, percentile_99_(scheduler), entry.setup_us);
+    entry.stats[PROFILE_LOOP] = Stats{};
+    entry.stats[PROFILE_SCHEDULER] = Stats{};
+  }
+  this->interval_start_ = now;
+}
+
+}  // namespace profiler
+}  // namespace esphome
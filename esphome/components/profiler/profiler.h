@@ -0,0 +1,71 @@
+#pragma once
+
+#include <vector>
+
+#include "esphome/core/component.h"
+
+namespace esphome {
+namespace profiler {
+
+/// What a duration was measured for.
+enum ProfileKind : uint8_t {
+  PROFILE_LOOP = 0,
+  PROFILE_SCHEDULER = 1,
+};
+static const uint8_t PROFILE_KIND_COUNT = 2;
+
+/// Histogram buckets per power of two, durations of one bucket differ by at most 25%.
+static const uint8_t PROFILE_BUCKETS_PER_OCTAVE = 4;
+/// Durations from 2^20 us (about a second) on share the last bucket.
+static const uint8_t PROFILE_MAX_OCTAVE = 20;
+static const uint8_t PROFILE_BUCKET_COUNT = (PROFILE_MAX_OCTAVE - 1) * PROFILE_BUCKETS_PER_OCTAVE + 1;
+
+/** Measures how long the loop(), setup() and scheduler callbacks of every component take.
+ *
+ * Durations are summed up per integration and counted in a log-scale histogram to estimate the 99th percentile
+ * over the whole report interval. Every report interval, the statistics are logged and reset. The report is
+ * parsed by the `esphome profile` command, which shows it as a table.
+ */
+class Profiler : public Component {
+ public:
+  Profiler();
+
+  void setup() override;
+  void dump_config() override;
+
+  void set_report_interval(uint32_t report_interval) { this->report_interval_ = report_interval; }
+
+  void record_setup(Component *component, uint32_t duration_us);
+  void record(Component *component, ProfileKind kind, uint32_t duration_us);
+
+ protected:
+  struct Stats {
+    uint32_t calls{0};
+    uint32_t total_us{0};
+    uint32_t max_us{0};
+    /// Calls per duration bucket, all counts are halved when one would overflow.
+    uint16_t buckets[PROFILE_BUCKET_COUNT]{};
+  };
+  struct Entry {
+    const char *source;
+    uint32_t setup_us{0};
+    Stats stats[PROFILE_KIND_COUNT];
+  };
+
+  uint16_t get_entry_(Component *component);
+  static uint8_t bucket_for_(uint32_t duration_us);
+  static uint32_t percentile_99_(const Stats &stats);
+  void report_();
+
+  uint32_t report_interval_{10000};
+  uint32_t interval_start_{0};
+  /// Entries, one per integration.
+  std::vector<Entry> entries_;
+  /// The entry of every component seen so far, sorted by component.
+  std::vector<std::pair<Component *, uint16_t>> components_;
+};
+
+extern Profiler *global_profiler;  // NOLINT(cppcoreguidelines-avoid-non-const-global-variables)
+
+}  // namespace profiler
+}  // namespace esphome
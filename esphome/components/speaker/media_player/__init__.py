@@ -23,7 +23,7 @@ from esphome.const import (
     CONF_TYPE,
     CONF_URL,
 )
-from esphome.core import CORE, HexInt
+from esphome.core import CORE
 from esphome.core.entity_helpers import inherit_property_from
 from esphome.external_files import download_content
 
@@ -406,8 +406,7 @@ async def to_code(config):
     for file_config in config.get(CONF_FILES, []):
         data, media_file_type = _read_audio_file_and_type(file_config)
 
-        rhs = [HexInt(x) for x in data]
-        prog_arr = cg.progmem_array(file_config[CONF_RAW_DATA_ID], rhs)
+        prog_arr = cg.progmem_array(file_config[CONF_RAW_DATA_ID], data)
 
         media_files_struct = cg.StructInitializer(
             audio.AudioFile,
@@ -417,7 +416,7 @@ async def to_code(config):
             ),
             (
                 "length",
-                len(rhs),
+                len(data),
             ),
             (
                 "file_type",
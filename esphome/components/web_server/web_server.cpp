@@ -85,6 +85,8 @@ void DeferredUpdateEventSource::deq_push_back_with_dedup_(void *source, message_
   } else {
     this->deferred_queue_.push_back(item);
   }
+  // The queue is sent from the loop
+  this->web_server_->wake_loop();
 }
 
 void DeferredUpdateEventSource::process_deferred_queue_() {
@@ -106,6 +108,10 @@ void DeferredUpdateEventSource::loop() {
     this->entities_iterator_.advance();
 }
 
+bool DeferredUpdateEventSource::has_pending_work() {
+  return !this->deferred_queue_.empty() || !this->entities_iterator_.completed();
+}
+
 void DeferredUpdateEventSource::deferrable_send_state(void *source, const char *event_type,
                                                       message_generator_t *message_generator) {
   // allow all json "details_all" to go through before publishing bare state events, this avoids unnamed entries showing
@@ -149,6 +155,11 @@ void DeferredUpdateEventSourceList::loop() {
   }
 }
 
+bool DeferredUpdateEventSourceList::has_pending_work() {
+  return std::any_of(this->begin(), this->end(),
+                     [](DeferredUpdateEventSource *dues) { return dues->has_pending_work(); });
+}
+
 void DeferredUpdateEventSourceList::deferrable_send_state(void *source, const char *event_type,
                                                           message_generator_t *message_generator) {
   for (DeferredUpdateEventSource *dues : *this) {
@@ -195,6 +206,7 @@ void DeferredUpdateEventSourceList::on_client_connect_(WebServer *ws, DeferredUp
   }
 
   source->entities_iterator_.begin(ws->include_internal_);
+  ws->wake_loop();
 
   // just dump them all up-front and take advantage of the deferred queue
   //     on second thought that takes too long, but leaving the commented code here for debug purposes
@@ -262,6 +274,7 @@ void WebServer::setup() {
   this->set_interval(10000, [this]() { this->events_.try_send_nodefer("", "ping", millis(), 30000); });
 }
 void WebServer::loop() {
+  bool pending = false;
 #ifdef USE_ESP32
   if (xSemaphoreTake(this->to_schedule_lock_, 0L)) {
     std::function<void()> fn;
@@ -272,6 +285,7 @@ void WebServer::loop() {
       fn = std::move(to_schedule_.front());
       to_schedule_.pop_front();
     }
+    pending = !to_schedule_.empty();
     xSemaphoreGive(this->to_schedule_lock_);
     if (fn) {
       fn();
@@ -280,6 +294,8 @@ void WebServer::loop() {
 #endif
 
   this->events_.loop();
+  // Requests, clients and queued events wake the loop, it only polls while some of them are left
+  this->set_loop_on_wake(!pending && !this->events_.has_pending_work());
 }
 void WebServer::dump_config() {
   ESP_LOGCONFIG(TAG, "Web Server:");
@@ -2158,6 +2174,7 @@ void WebServer::schedule_(std::function<void()> &&f) {
   xSemaphoreTake(this->to_schedule_lock_, portMAX_DELAY);
   to_schedule_.push_back(std::move(f));
   xSemaphoreGive(this->to_schedule_lock_);
+  this->wake_loop();
 #else
   this->defer(std::move(f));
 #endif
@@ -117,6 +117,8 @@ class DeferredUpdateEventSource : public AsyncEventSource {
       : AsyncEventSource(url), entities_iterator_(ListEntitiesIterator(ws, this)), web_server_(ws) {}
 
   void loop();
+  /// Whether loop() still has events to send.
+  bool has_pending_work();
 
   void deferrable_send_state(void *source, const char *event_type, message_generator_t *message_generator);
   void try_send_nodefer(const char *message, const char *event = nullptr, uint32_t id = 0, uint32_t reconnect = 0);
@@ -129,6 +131,7 @@ class DeferredUpdateEventSourceList : public std::list<DeferredUpdateEventSource
 
  public:
   void loop();
+  bool has_pending_work();
 
   void deferrable_send_state(void *source, const char *event_type, message_generator_t *message_generator);
   void try_send_nodefer(const char *message, const char *event = nullptr, uint32_t id = 0, uint32_t reconnect = 0);
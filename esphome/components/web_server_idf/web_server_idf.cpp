@@ -286,6 +286,8 @@ void AsyncEventSource::handleRequest(AsyncWebServerRequest *request) {
     this->on_connect_(rsp);
   }
   this->sessions_.insert(rsp);
+  // The entities are sent from the loop
+  this->web_server_->wake_loop();
 }
 
 void AsyncEventSource::loop() {
@@ -294,6 +296,11 @@ void AsyncEventSource::loop() {
   }
 }
 
+bool AsyncEventSource::has_pending_work() {
+  return std::any_of(this->sessions_.begin(), this->sessions_.end(),
+                     [](AsyncEventSourceResponse *ses) { return ses->has_pending_work(); });
+}
+
 void AsyncEventSource::try_send_nodefer(const char *message, const char *event, uint32_t id, uint32_t reconnect) {
   for (auto *ses : this->sessions_) {
     ses->try_send_nodefer(message, event, id, reconnect);
@@ -373,6 +380,8 @@ void AsyncEventSourceResponse::deq_push_back_with_dedup_(void *source, message_g
   } else {
     this->deferred_queue_.push_back(item);
   }
+  // The queue is sent from the loop
+  this->web_server_->wake_loop();
 }
 
 void AsyncEventSourceResponse::process_deferred_queue_() {
@@ -418,6 +427,10 @@ void AsyncEventSourceResponse::loop() {
     this->entities_iterator_->advance();
 }
 
+bool AsyncEventSourceResponse::has_pending_work() {
+  return !this->event_buffer_.empty() || !this->deferred_queue_.empty() || !this->entities_iterator_->completed();
+}
+
 bool AsyncEventSourceResponse::try_send_nodefer(const char *message, const char *event, uint32_t id,
                                                 uint32_t reconnect) {
   if (this->fd_ == 0) {
@@ -475,6 +488,9 @@ bool AsyncEventSourceResponse::try_send_nodefer(const char *message, const char
 
   event_bytes_sent_ = 0;
   process_buffer_();
+  // What didn't fit into the socket is sent from the loop
+  if (!event_buffer_.empty())
+    this->web_server_->wake_loop();
 
   return true;
 }
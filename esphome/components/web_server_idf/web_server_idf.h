@@ -255,6 +255,8 @@ class AsyncEventSourceResponse {
   bool try_send_nodefer(const char *message, const char *event = nullptr, uint32_t id = 0, uint32_t reconnect = 0);
   void deferrable_send_state(void *source, const char *event_type, message_generator_t *message_generator);
   void loop();
+  /// Whether loop() still has events to send.
+  bool has_pending_work();
 
  protected:
   AsyncEventSourceResponse(const AsyncWebServerRequest *request, esphome::web_server_idf::AsyncEventSource *server,
@@ -297,6 +299,7 @@ class AsyncEventSource : public AsyncWebHandler {
   void try_send_nodefer(const char *message, const char *event = nullptr, uint32_t id = 0, uint32_t reconnect = 0);
   void deferrable_send_state(void *source, const char *event_type, message_generator_t *message_generator);
   void loop();
+  bool has_pending_work();
   bool empty() { return this->count() == 0; }
 
   size_t count() const { return this->sessions_.size(); }
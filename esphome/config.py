@@ -11,7 +11,7 @@ from typing import Any
 
 import voluptuous as vol
 
-from esphome import core, loader, pins, yaml_util
+from esphome import config_cache, core, loader, pins, yaml_util
 from esphome.config_helpers import Extend, Remove
 import esphome.config_validation as cv
 from esphome.const import (
@@ -105,6 +105,10 @@ class Config(OrderedDict, fv.FinalValidateConfig):
         self.output_paths: list[tuple[ConfigPath, str]] = []
         # A list of components ids with the config path
         self.declare_ids: list[tuple[core.ID, ConfigPath]] = []
+        # Index of declare_ids by ID name
+        self._declare_ids_by_name: dict[str, tuple[core.ID, ConfigPath]] = {}
+        # Index of declared IDs by the name of their type and every parent type
+        self._declare_ids_by_type: dict[str, list[core.ID]] = {}
         self._data = {}
         # Store pending validation tasks (in heap order)
         self._validation_tasks: list[_ValidationStepTask] = []
@@ -235,11 +239,36 @@ class Config(OrderedDict, fv.FinalValidateConfig):
             part.append(item_index)
         return part
 
+    def add_declared_id(self, id: core.ID, path: ConfigPath) -> None:
+        """Add an ID declaration, indexing it by name (if set) and type."""
+        from esphome.cpp_generator import MockObjClass
+
+        self.declare_ids.append((id, path))
+        if id.id is not None:
+            self._declare_ids_by_name[id.id] = (id, path)
+        if isinstance(id.type, MockObjClass):
+            # pylint: disable=protected-access
+            for type_name in dict.fromkeys(
+                [str(id.type), *(str(p) for p in id.type._parents)]
+            ):
+                self._declare_ids_by_type.setdefault(type_name, []).append(id)
+
+    def index_declared_id_name(self, id: core.ID, path: ConfigPath) -> None:
+        """Index a declared ID by name after it has been resolved."""
+        self._declare_ids_by_name.setdefault(id.id, (id, path))
+
+    def get_declared_id(self, name: str) -> tuple[core.ID, ConfigPath] | None:
+        """Return the declared ID with the given name and its path."""
+        return self._declare_ids_by_name.get(name)
+
+    def get_declared_ids_of_type(self, type_) -> list[core.ID]:
+        """Return all declared IDs whose type is or inherits from type_."""
+        return self._declare_ids_by_type.get(str(type_), [])
+
     def get_path_for_id(self, id: core.ID):
         """Return the config fragment where the given ID is declared."""
-        for declared_id, path in self.declare_ids:
-            if declared_id.id == str(id):
-                return path
+        if (match := self._declare_ids_by_name.get(str(id))) is not None:
+            return match[1]
         raise KeyError(f"ID {id} not found in configuration")
 
     def get_config_for_path(self, path: ConfigPath) -> ConfigFragmentType:
@@ -596,22 +625,38 @@ class IDPassValidationStep(ConfigValidationStep):
             if id.is_declaration:
                 if id.id is not None:
                     # Look for duplicate definitions
-                    match = next(
-                        (v for v in result.declare_ids if v[0].id == id.id), None
-                    )
+                    match = result.get_declared_id(id.id)
                     if match is not None:
                         opath = "->".join(str(v) for v in match[1])
                         result.add_str_error(
                             f"ID {id.id} redefined! Check {opath}", path
                         )
                         continue
-                result.declare_ids.append((id, path))
+                result.add_declared_id(id, path)
             else:
                 searching_ids.append((id, path))
 
         # Resolve default ids after manual IDs
-        for id, _ in result.declare_ids:
-            id.resolve([v[0].id for v in result.declare_ids])
+        used_ids = (
+            {v[0].id for v in result.declare_ids if v[0].id is not None}
+            | set(cv.RESERVED_IDS)
+            | CORE.loaded_integrations
+        )
+        # Next suffix to try for each default name, the lowest free suffix only
+        # grows as names are added, so there is no need to start from 1 every time
+        next_suffix: dict[str, int] = {}
+        for id, path in result.declare_ids:
+            if id.id is None:
+                name = id.default_name
+                tries = next_suffix.get(name, 1)
+                unique = name if tries == 1 else f"{name}_{tries}"
+                while unique in used_ids:
+                    tries += 1
+                    unique = f"{name}_{tries}"
+                next_suffix[name] = tries
+                id.id = unique
+                used_ids.add(unique)
+                result.index_declared_id_name(id, path)
             if isinstance(id.type, MockObjClass) and id.type.inherits_from(Component):
                 CORE.component_ids.add(id.id)
 
@@ -619,9 +664,8 @@ class IDPassValidationStep(ConfigValidationStep):
         for id, path in searching_ids:
             if id.id is not None:
                 # manually declared
-                match = next(
-                    (v[0] for v in result.declare_ids if v[0].id == id.id), None
-                )
+                match = result.get_declared_id(id.id)
+                match = None if match is None else match[0]
                 if match is None or not match.is_manual:
                     # No declared ID with this name
                     import difflib
@@ -651,13 +695,7 @@ class IDPassValidationStep(ConfigValidationStep):
                     )
 
             if id.id is None and id.type is not None:
-                matches = []
-                for v in result.declare_ids:
-                    if v[0] is None or not isinstance(v[0].type, MockObjClass):
-                        continue
-                    inherits = v[0].type.inherits_from(id.type)
-                    if inherits:
-                        matches.append(v[0])
+                matches = result.get_declared_ids_of_type(id.type)
 
                 if len(matches) == 0:
                     result.add_str_error(
@@ -928,25 +966,42 @@ class InvalidYAMLError(EsphomeError):
         self.base_exc = base_exc
 
 
-def _load_config(command_line_substitutions: dict[str, Any]) -> Config:
+def _load_config(
+    command_line_substitutions: dict[str, Any], use_cache: bool = False
+) -> Config:
     """Load the configuration file."""
+    if use_cache:
+        cached = config_cache.load_cached_config(command_line_substitutions)
+        if cached is not None:
+            _LOGGER.info("Configuration unchanged, using cached validation result")
+            loader.clear_component_meta_finders()
+            loader.install_custom_components_meta_finder()
+            return cached
+
+    yaml_util.clear_loaded_files()
     try:
         config = yaml_util.load_yaml(CORE.config_path)
     except EsphomeError as e:
         raise InvalidYAMLError(e) from e
 
     try:
-        return validate_config(config, command_line_substitutions)
+        result = validate_config(config, command_line_substitutions)
     except EsphomeError:
         raise
     except Exception:
         _LOGGER.error("Unexpected exception while reading configuration:")
         raise
 
+    if use_cache:
+        config_cache.store_cached_config(result, command_line_substitutions)
+    return result
+
 
-def load_config(command_line_substitutions: dict[str, Any]) -> Config:
+def load_config(
+    command_line_substitutions: dict[str, Any], use_cache: bool = False
+) -> Config:
     try:
-        return _load_config(command_line_substitutions)
+        return _load_config(command_line_substitutions, use_cache)
     except vol.Invalid as err:
         raise EsphomeError(f"Error while parsing config: {err}") from err
 
@@ -1089,10 +1144,10 @@ def strip_default_ids(config):
     return config
 
 
-def read_config(command_line_substitutions):
+def read_config(command_line_substitutions, use_cache: bool = False):
     _LOGGER.info("Reading configuration %s...", CORE.config_path)
     try:
-        res = load_config(command_line_substitutions)
+        res = load_config(command_line_substitutions, use_cache)
     except EsphomeError as err:
         _LOGGER.error("Error while reading config: %s", err)
         return None
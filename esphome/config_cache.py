@@ -0,0 +1,267 @@
+"""On-disk cache of validated configurations.
+
+Validating a configuration (packages, substitutions, every component schema and the
+ID pass) is by far the slowest part of reading it. The result of a successful
+validation is stored under the data directory together with the digest of every
+file that was read while loading it, and restored if none of those files changed.
+
+Secret values are never written to the cache. Every string that holds one is stored
+as a reference to the secret's name and read again from the secrets files when the
+entry is restored.
+"""
+
+from __future__ import annotations
+
+import copyreg
+import io
+import logging
+import os
+import pickle
+import sys
+from typing import Any
+
+from esphome import helpers, yaml_util
+from esphome.const import CONF_EXTERNAL_COMPONENTS, CONF_PACKAGES, __version__
+from esphome.core import CORE, EsphomeError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the layout of the cache file changes
+CACHE_VERSION = 3
+
+# Attributes of CORE that are set during validation and needed afterwards
+_CORE_ATTRIBUTES = (
+    "name",
+    "friendly_name",
+    "area",
+    "build_path",
+    "data",
+    "raw_config",
+    "loaded_integrations",
+    "component_ids",
+)
+
+# Components whose validators fill module state that code generation reads later,
+# a restored configuration would skip filling it
+_UNCACHEABLE_COMPONENTS = frozenset({"font", "lvgl"})
+
+
+def cache_path() -> str:
+    return CORE.relative_internal_path("config_cache", f"{CORE.config_filename}.pickle")
+
+
+def _module_files() -> dict[str, tuple[int, int] | None]:
+    """Return the stat of every imported esphome module file.
+
+    This catches component code changing without the version being bumped, for
+    example in development checkouts and for custom components.
+    """
+    result = {}
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("esphome"):
+            continue
+        if (path := getattr(module, "__file__", None)) is None:
+            continue
+        result[path] = _stat_key(path)
+    return result
+
+
+def _stat_key(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _dynamic_class_specs() -> dict[type, Any]:
+    """Return a picklable description of every class created by add_class_to_obj."""
+    # pylint: disable=protected-access
+    specs: dict[type, Any] = {
+        value: ("overload", type_) for type_, value in helpers._TYPE_OVERLOADS.items()
+    }
+    lookup = {value: key for key, value in helpers._CLASS_LOOKUP.items()}
+
+    def spec_for(cls: type) -> Any:
+        if cls in specs:
+            return specs[cls]
+        if (key := lookup.get(cls)) is None:
+            return cls
+        specs[cls] = ("add", spec_for(key[0]), spec_for(key[1]))
+        return specs[cls]
+
+    for cls in lookup:
+        spec_for(cls)
+    return specs
+
+
+def _resolve_class_spec(spec: Any) -> type:
+    # pylint: disable=protected-access
+    if not isinstance(spec, tuple):
+        return spec
+    if spec[0] == "overload":
+        return helpers._TYPE_OVERLOADS[spec[1]]
+    orig_cls = _resolve_class_spec(spec[1])
+    cls = _resolve_class_spec(spec[2])
+    key = (orig_cls, cls)
+    if (new_cls := helpers._CLASS_LOOKUP.get(key)) is None:
+        new_cls = orig_cls.__class__(orig_cls.__name__, (orig_cls, cls), {})
+        helpers._CLASS_LOOKUP[key] = new_cls
+    return new_cls
+
+
+def _reconstruct(spec: Any, newobj: bool, *args: Any) -> Any:
+    cls = _resolve_class_spec(spec)
+    if newobj:
+        return cls.__new__(cls, *args)
+    return cls(*args)
+
+
+class _ConfigPickler(pickle.Pickler):
+    """Pickler that can handle the dynamic classes created by the YAML loader.
+
+    Strings holding the value of a secret are replaced by the name of the secret.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._specs = _dynamic_class_specs()
+        # pylint: disable=protected-access
+        self._secrets = dict(yaml_util._SECRET_VALUES)
+
+    def persistent_id(self, obj):
+        if isinstance(obj, str) and (name := self._secrets.get(str(obj))):
+            return name
+        return None
+
+    def reducer_override(self, obj):
+        if (spec := self._specs.get(type(obj))) is None:
+            return NotImplemented
+        func, args, *rest = obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        if func is copyreg.__newobj__:
+            return (_reconstruct, (spec, True, *args[1:]), *rest)
+        return (_reconstruct, (spec, False, *args), *rest)
+
+
+class _ConfigUnpickler(pickle.Unpickler):
+    """Unpickler that reads the secrets from the secrets files."""
+
+    def __init__(self, file, files: dict[str, str | None]) -> None:
+        super().__init__(file)
+        self._files = files
+        self._secrets: dict[str, Any] | None = None
+
+    def persistent_load(self, pid):
+        if self._secrets is None:
+            self._secrets = {}
+            for fname in self._files:
+                if os.path.basename(fname) == yaml_util.SECRET_YAML:
+                    self._secrets.update(
+                        yaml_util.load_yaml(fname, clear_secrets=False)
+                    )
+        value = self._secrets[pid]
+        # pylint: disable=protected-access
+        yaml_util._SECRET_VALUES[str(value)] = pid
+        return value
+
+
+def _cache_key(command_line_substitutions: dict[str, Any]) -> tuple:
+    return (
+        CACHE_VERSION,
+        __version__,
+        os.path.abspath(CORE.config_path),
+        sorted((str(k), str(v)) for k, v in command_line_substitutions.items()),
+    )
+
+
+def load_cached_config(command_line_substitutions: dict[str, Any]):
+    """Restore the validated configuration if none of its inputs changed.
+
+    Returns None if there is no usable cache entry.
+    """
+    path = cache_path()
+    try:
+        with open(path, "rb") as f_handle:
+            entry = pickle.load(f_handle)
+    except FileNotFoundError:
+        return None
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.debug("Ignoring unreadable config cache %s: %s", path, err)
+        return None
+
+    if entry.get("key") != _cache_key(command_line_substitutions):
+        return None
+    for fname, digest in entry["files"].items():
+        if yaml_util.file_digest(fname) != digest:
+            _LOGGER.debug("Config cache is stale, %s changed", fname)
+            return None
+    for name, value in entry["env_vars"].items():
+        if os.environ.get(name) != value:
+            _LOGGER.debug("Config cache is stale, $%s changed", name)
+            return None
+    for fname, stat_key in entry["modules"].items():
+        if _stat_key(fname) != stat_key:
+            _LOGGER.debug("Config cache is stale, %s changed", fname)
+            return None
+
+    try:
+        # pylint: disable=protected-access
+        yaml_util._SECRET_VALUES.clear()
+        config, core_state = _ConfigUnpickler(
+            io.BytesIO(entry["payload"]), entry["files"]
+        ).load()
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.debug("Ignoring unreadable config cache %s: %s", path, err)
+        return None
+
+    for attr, value in core_state.items():
+        setattr(CORE, attr, value)
+    yaml_util.restore_loaded_files(entry["files"], entry["env_vars"])
+    return config
+
+
+def store_cached_config(config, command_line_substitutions: dict[str, Any]) -> None:
+    """Store a successfully validated configuration."""
+    if config.errors:
+        return
+    files = yaml_util.loaded_files()
+    packages_dir = os.path.abspath(CORE.relative_internal_path(CONF_PACKAGES))
+    if CONF_EXTERNAL_COMPONENTS in config or any(
+        fname.startswith(packages_dir) for fname in files
+    ):
+        # Remote sources have their own refresh interval that has to be honored,
+        # and external components install import hooks during validation
+        return
+    if uncacheable := _UNCACHEABLE_COMPONENTS & CORE.loaded_integrations:
+        _LOGGER.debug(
+            "Configuration can not be cached, it uses %s",
+            ", ".join(sorted(uncacheable)),
+        )
+        return
+
+    core_state = {attr: getattr(CORE, attr) for attr in _CORE_ATTRIBUTES}
+    buffer = io.BytesIO()
+    try:
+        _ConfigPickler(buffer, pickle.HIGHEST_PROTOCOL).dump((config, core_state))
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.debug("Configuration can not be cached: %s", err)
+        return
+    payload = buffer.getvalue()
+    # pylint: disable=protected-access
+    if any(value.encode() in payload for value in yaml_util._SECRET_VALUES if value):
+        # A value derived from a secret, for example the build path of a name
+        _LOGGER.debug("Configuration can not be cached, it would contain a secret")
+        return
+
+    entry = {
+        "key": _cache_key(command_line_substitutions),
+        "files": files,
+        "env_vars": yaml_util.loaded_env_vars(),
+        "modules": _module_files(),
+        "payload": payload,
+    }
+    path = cache_path()
+    try:
+        helpers.write_file(path, pickle.dumps(entry, pickle.HIGHEST_PROTOCOL))
+    except EsphomeError as err:
+        _LOGGER.debug("Could not write config cache %s: %s", path, err)
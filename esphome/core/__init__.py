@@ -27,6 +27,7 @@ from esphome.const import (
 from esphome.coroutine import (  # noqa: F401
     FakeAwaitable as _FakeAwaitable,
     FakeEventLoop as _FakeEventLoop,
+    WaitFor as _WaitFor,
     coroutine,
     coroutine_with_priority,
 )
@@ -34,7 +35,7 @@ from esphome.helpers import ensure_unique_string, get_str_env, is_ha_addon
 from esphome.util import OrderedDict
 
 if TYPE_CHECKING:
-    from ..cpp_generator import MockObj, MockObjClass, Statement
+    from ..cpp_generator import MockObj, MockObjClass, ProgmemData, Statement
     from ..types import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -328,16 +329,20 @@ class ID:
         self.is_declaration = is_declaration
         self.type: MockObjClass | None = type
 
+    @property
+    def default_name(self) -> str:
+        """The name an automatic ID is based on, before making it unique."""
+        base = str(self.type).replace("::", "_").lower()
+        if base == self.type:
+            base = base + "_id"
+        return "".join(c for c in base if c.isalnum() or c == "_")
+
     def resolve(self, registered_ids):
         from esphome.config_validation import RESERVED_IDS
 
         if self.id is None:
-            base = str(self.type).replace("::", "_").lower()
-            if base == self.type:
-                base = base + "_id"
-            name = "".join(c for c in base if c.isalnum() or c == "_")
             used = set(registered_ids) | set(RESERVED_IDS) | CORE.loaded_integrations
-            self.id = ensure_unique_string(name, used)
+            self.id = ensure_unique_string(self.default_name, used)
         return self.id
 
     def __str__(self):
@@ -502,6 +507,8 @@ class EsphomeCore:
         self.main_statements: list[Statement] = []
         # A list of statements to insert in the global block (includes and global variables)
         self.global_statements: list[Statement] = []
+        # A list of bytes backed progmem arrays, each written to its own source file
+        self.progmem_data: list[ProgmemData] = []
         # A set of platformio libraries to add to the project
         self.libraries: list[Library] = []
         # A set of build flags to set in the platformio project
@@ -537,6 +544,7 @@ class EsphomeCore:
         self.variables = {}
         self.main_statements = []
         self.global_statements = []
+        self.progmem_data = []
         self.libraries = []
         self.build_flags = set()
         self.defines = set()
@@ -787,7 +795,7 @@ class EsphomeCore:
                 return self.variables[id]
             except KeyError:
                 _LOGGER.debug("Waiting for variable %s (%r)", id, id)
-                yield
+                yield _WaitFor(id)
 
     async def get_variable(self, id) -> "MockObj":
         if not isinstance(id, ID):
@@ -804,7 +812,7 @@ class EsphomeCore:
                     if k == id:
                         return (k, v)
             _LOGGER.debug("Waiting for variable %s", id)
-            yield
+            yield _WaitFor(id)
 
     async def get_variable_with_full_id(self, id: ID) -> tuple[ID, "MockObj"]:
         if not isinstance(id, ID):
@@ -816,6 +824,7 @@ class EsphomeCore:
             raise EsphomeError(f"ID {id} is already registered")
         _LOGGER.debug("Registered variable %s of type %s", id.id, id.type)
         self.variables[id] = obj
+        self.event_loop.resolve(id)
 
     def has_id(self, id):
         return id in self.variables
@@ -8,6 +8,10 @@
 #include "esphome/components/status_led/status_led.h"
 #endif
 
+#ifdef USE_PROFILER
+#include "esphome/components/profiler/profiler.h"
+#endif
+
 #ifdef USE_SOCKET_SELECT_SUPPORT
 #include <cerrno>
 
@@ -19,6 +23,10 @@
 #ifdef USE_ESP32
 // ESP32 "BSD sockets" are actually LWIP under the hood
 #include <lwip/sockets.h>
+#elif defined(USE_SOCKET_EPOLL)
+#include <sys/epoll.h>
+#include <sys/eventfd.h>
+#include <unistd.h>
 #else
 // True BSD sockets (e.g., host platform)
 #include <sys/select.h>
@@ -30,6 +38,12 @@ namespace esphome {
 
 static const char *const TAG = "app";
 
+// Items scheduled from other threads don't wake the loop, so an idle loop still checks the scheduler regularly
+static const uint32_t MAX_IDLE_SLEEP_MS = 1000;
+#ifdef USE_SOCKET_EPOLL
+static const int MAX_EPOLL_EVENTS = 32;
+#endif
+
 void Application::register_component_(Component *comp) {
   if (comp == nullptr) {
     ESP_LOGW(TAG, "Tried to register null component!");
@@ -46,6 +60,10 @@ void Application::register_component_(Component *comp) {
 }
 void Application::setup() {
   ESP_LOGI(TAG, "Running through setup()...");
+#ifdef USE_SOCKET_EPOLL
+  if (this->epoll_fd_ < 0)
+    this->setup_epoll_();
+#endif
   ESP_LOGV(TAG, "Sorting components by setup priority...");
   std::stable_sort(this->components_.begin(), this->components_.end(), [](const Component *a, const Component *b) {
     return a->get_actual_setup_priority() > b->get_actual_setup_priority();
@@ -56,7 +74,13 @@ void Application::setup() {
 
     // Update loop_component_start_time_ before calling each component during setup
     this->loop_component_start_time_ = millis();
+#ifdef USE_PROFILER
+    const uint32_t setup_started_us = micros();
     component->call();
+    profiler::global_profiler->record_setup(component, micros() - setup_started_us);
+#else
+    component->call();
+#endif
     this->scheduler.process_to_add();
     this->feed_wdt();
     if (component->can_proceed())
@@ -97,27 +121,63 @@ void Application::loop() {
   // Feed WDT with time
   this->feed_wdt(last_op_end_time);
 
+  // Components that only loop when woken also run after a monitored socket had data
+  const bool sockets_ready = this->sockets_ready_;
+  this->sockets_ready_ = false;
+  bool polled = false;
   for (Component *component : this->looping_components_) {
+    if (component->loop_on_wake_ && !component->loop_woken_.exchange(false) && !sockets_ready) {
+      new_app_state |= component->get_component_state();
+      continue;
+    }
+
     // Update the cached time before each component runs
     this->loop_component_start_time_ = last_op_end_time;
 
     {
       this->set_current_component(component);
       WarnIfComponentBlockingGuard guard{component, last_op_end_time};
+#ifdef USE_PROFILER
+      const uint32_t started_us = micros();
       component->call();
+      profiler::global_profiler->record(component, profiler::PROFILE_LOOP, micros() - started_us);
+#else
+      component->call();
+#endif
       // Use the finish method to get the current time as the end time
       last_op_end_time = guard.finish();
     }
+    // A component may only go back to waiting for a wake once its work is done
+    if (!component->loop_on_wake_)
+      polled = true;
     new_app_state |= component->get_component_state();
     this->app_state_ |= new_app_state;
     this->feed_wdt(last_op_end_time);
   }
   this->app_state_ = new_app_state;
 
+#ifdef USE_SOCKET_EPOLL
+  // Without components to poll, only the scheduler, the sockets and wake_loop() need the loop to run
+  const bool idle = !polled && this->dump_config_at_ >= this->components_.size();
+#else
+  const bool idle = false;
+  (void) polled;
+#endif
+
+  // Timeouts set by the components above are only known to next_schedule_in() once added
+  this->scheduler.process_to_add();
+
   // Use the last component's end time instead of calling millis() again
   auto elapsed = last_op_end_time - this->last_loop_;
-  if (elapsed >= this->loop_interval_ || HighFrequencyLoopRequester::is_high_frequency()) {
+  if (HighFrequencyLoopRequester::is_high_frequency() || (!idle && elapsed >= this->loop_interval_)) {
+#ifdef USE_SOCKET_EPOLL
+    // Still check the sockets, they would never become ready while the loop runs continuously
+    this->sleep_(0);
+#else
     yield();
+#endif
+  } else if (idle) {
+    this->sleep_(std::min(this->scheduler.next_schedule_in().value_or(MAX_IDLE_SLEEP_MS), MAX_IDLE_SLEEP_MS));
   } else {
     uint32_t delay_time = this->loop_interval_ - elapsed;
     uint32_t next_schedule = this->scheduler.next_schedule_in().value_or(delay_time);
@@ -125,64 +185,7 @@ void Application::loop() {
     // otherwise interval=0 schedules result in constant looping with almost no sleep
     next_schedule = std::max(next_schedule, delay_time / 2);
     delay_time = std::min(next_schedule, delay_time);
-
-#ifdef USE_SOCKET_SELECT_SUPPORT
-    if (!this->socket_fds_.empty()) {
-      // Use select() with timeout when we have sockets to monitor
-
-      // Update fd_set if socket list has changed
-      if (this->socket_fds_changed_) {
-        FD_ZERO(&this->base_read_fds_);
-        for (int fd : this->socket_fds_) {
-          if (fd >= 0 && fd < FD_SETSIZE) {
-            FD_SET(fd, &this->base_read_fds_);
-          }
-        }
-        this->socket_fds_changed_ = false;
-      }
-
-      // Copy base fd_set before each select
-      this->read_fds_ = this->base_read_fds_;
-
-      // Convert delay_time (milliseconds) to timeval
-      struct timeval tv;
-      tv.tv_sec = delay_time / 1000;
-      tv.tv_usec = (delay_time - tv.tv_sec * 1000) * 1000;
-
-      // Call select with timeout
-#if defined(USE_SOCKET_IMPL_LWIP_SOCKETS) || (defined(USE_ESP32) && defined(USE_SOCKET_IMPL_BSD_SOCKETS))
-      // Use lwip_select() on platforms with lwIP - it's faster
-      // Note: On ESP32 with BSD sockets, select() is already mapped to lwip_select() via macros,
-      // but we explicitly call lwip_select() for clarity and to ensure we get the optimized version
-      int ret = lwip_select(this->max_fd_ + 1, &this->read_fds_, nullptr, nullptr, &tv);
-#else
-      // Use standard select() on other platforms (e.g., host/native builds)
-      int ret = ::select(this->max_fd_ + 1, &this->read_fds_, nullptr, nullptr, &tv);
-#endif
-
-      // Process select() result:
-      // ret < 0: error (except EINTR which is normal)
-      // ret > 0: socket(s) have data ready - normal and expected
-      // ret == 0: timeout occurred - normal and expected
-      if (ret < 0) {
-        if (errno == EINTR) {
-          // Interrupted by signal - this is normal, just continue
-          // No need to delay as some time has already passed
-          ESP_LOGVV(TAG, "select() interrupted by signal");
-        } else {
-          // Actual error - log and fall back to delay
-          ESP_LOGW(TAG, "select() failed with errno %d", errno);
-          delay(delay_time);
-        }
-      }
-    } else {
-      // No sockets registered, use regular delay
-      delay(delay_time);
-    }
-#else
-    // No select support, use regular delay
-    delay(delay_time);
-#endif
+    this->sleep_(delay_time);
   }
   this->last_loop_ = last_op_end_time;
 
@@ -214,6 +217,105 @@ void IRAM_ATTR HOT Application::feed_wdt(uint32_t time) {
 #endif
   }
 }
+void Application::sleep_(uint32_t delay_ms) {
+#ifdef USE_SOCKET_EPOLL
+  if (this->epoll_fd_ < 0) {
+    delay(delay_ms);
+    return;
+  }
+
+  struct epoll_event events[MAX_EPOLL_EVENTS];
+  int ret = epoll_wait(this->epoll_fd_, events, MAX_EPOLL_EVENTS, static_cast<int>(delay_ms));
+  this->ready_fds_.clear();
+  if (ret < 0) {
+    if (errno == EINTR) {
+      // Interrupted by signal - this is normal, just continue
+      ESP_LOGVV(TAG, "epoll_wait() interrupted by signal");
+    } else {
+      ESP_LOGW(TAG, "epoll_wait() failed with errno %d", errno);
+      delay(delay_ms);
+    }
+    return;
+  }
+  for (int i = 0; i < ret; i++) {
+    int fd = events[i].data.fd;
+    if (fd == this->wake_fd_) {
+      // Reset the counter, the woken components were already marked by wake_loop()
+      uint64_t count;
+      ssize_t read_ret = ::read(fd, &count, sizeof(count));
+      (void) read_ret;
+      continue;
+    }
+    this->ready_fds_.push_back(fd);
+  }
+  this->sockets_ready_ = !this->ready_fds_.empty();
+#elif defined(USE_SOCKET_SELECT_SUPPORT)
+  if (this->socket_fds_.empty()) {
+    // No sockets registered, use regular delay
+    delay(delay_ms);
+    return;
+  }
+
+  // Update fd_set if socket list has changed
+  if (this->socket_fds_changed_) {
+    FD_ZERO(&this->base_read_fds_);
+    for (int fd : this->socket_fds_) {
+      if (fd >= 0 && fd < FD_SETSIZE) {
+        FD_SET(fd, &this->base_read_fds_);
+      }
+    }
+    this->socket_fds_changed_ = false;
+  }
+
+  // Copy base fd_set before each select
+  this->read_fds_ = this->base_read_fds_;
+
+  // Convert delay_ms to timeval
+  struct timeval tv;
+  tv.tv_sec = delay_ms / 1000;
+  tv.tv_usec = (delay_ms - tv.tv_sec * 1000) * 1000;
+
+  // Call select with timeout
+#if defined(USE_SOCKET_IMPL_LWIP_SOCKETS) || (defined(USE_ESP32) && defined(USE_SOCKET_IMPL_BSD_SOCKETS))
+  // Use lwip_select() on platforms with lwIP - it's faster
+  // Note: On ESP32 with BSD sockets, select() is already mapped to lwip_select() via macros,
+  // but we explicitly call lwip_select() for clarity and to ensure we get the optimized version
+  int ret = lwip_select(this->max_fd_ + 1, &this->read_fds_, nullptr, nullptr, &tv);
+#else
+  // Use standard select() on other platforms (e.g., host/native builds)
+  int ret = ::select(this->max_fd_ + 1, &this->read_fds_, nullptr, nullptr, &tv);
+#endif
+
+  // Process select() result:
+  // ret < 0: error (except EINTR which is normal)
+  // ret > 0: socket(s) have data ready - normal and expected
+  // ret == 0: timeout occurred - normal and expected
+  if (ret < 0) {
+    if (errno == EINTR) {
+      // Interrupted by signal - this is normal, just continue
+      // No need to delay as some time has already passed
+      ESP_LOGVV(TAG, "select() interrupted by signal");
+    } else {
+      // Actual error - log and fall back to delay
+      ESP_LOGW(TAG, "select() failed with errno %d", errno);
+      delay(delay_ms);
+    }
+  }
+  this->sockets_ready_ = ret > 0;
+#else
+  // No select support, use regular delay
+  delay(delay_ms);
+#endif
+}
+void Application::wake_loop() {
+#ifdef USE_SOCKET_EPOLL
+  if (this->wake_fd_ >= 0) {
+    const uint64_t one = 1;
+    ssize_t ret = ::write(this->wake_fd_, &one, sizeof(one));
+    (void) ret;
+  }
+#endif
+}
 void Application::reboot() {
   ESP_LOGI(TAG, "Forcing a reboot...");
   for (auto it = this->components_.rbegin(); it != this->components_.rend(); ++it) {
@@ -244,12 +346,45 @@ void Application::calculate_looping_components_() {
 }
 
 #ifdef USE_SOCKET_SELECT_SUPPORT
+#ifdef USE_SOCKET_EPOLL
+bool Application::setup_epoll_() {
+  this->epoll_fd_ = epoll_create1(EPOLL_CLOEXEC);
+  if (this->epoll_fd_ < 0) {
+    ESP_LOGE(TAG, "epoll_create1() failed with errno %d", errno);
+    return false;
+  }
+  this->wake_fd_ = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+  if (this->wake_fd_ < 0) {
+    ESP_LOGW(TAG, "eventfd() failed with errno %d, wake_loop() won't interrupt sleeping", errno);
+    return true;
+  }
+  struct epoll_event event {};
+  event.events = EPOLLIN;
+  event.data.fd = this->wake_fd_;
+  epoll_ctl(this->epoll_fd_, EPOLL_CTL_ADD, this->wake_fd_, &event);
+  return true;
+}
+#endif
+
 bool Application::register_socket_fd(int fd) {
   // WARNING: This function is NOT thread-safe and must only be called from the main loop
   // It modifies socket_fds_ and related variables without locking
   if (fd < 0)
     return false;
 
+#ifdef USE_SOCKET_EPOLL
+  if (this->epoll_fd_ < 0 && !this->setup_epoll_())
+    return false;
+
+  struct epoll_event event {};
+  event.events = EPOLLIN;
+  event.data.fd = fd;
+  if (epoll_ctl(this->epoll_fd_, EPOLL_CTL_ADD, fd, &event) < 0) {
+    ESP_LOGE(TAG, "Cannot monitor socket fd %d: epoll_ctl() failed with errno %d", fd, errno);
+    return false;
+  }
+  this->socket_fds_.push_back(fd);
+#else
   if (fd >= FD_SETSIZE) {
     ESP_LOGE(TAG, "Cannot monitor socket fd %d: exceeds FD_SETSIZE (%d)", fd, FD_SETSIZE);
     ESP_LOGE(TAG, "Socket will not be monitored for data - may cause performance issues!");
@@ -262,6 +397,7 @@ bool Application::register_socket_fd(int fd) {
   if (fd > this->max_fd_) {
     this->max_fd_ = fd;
   }
+#endif
 
   return true;
 }
@@ -279,6 +415,13 @@ void Application::unregister_socket_fd(int fd) {
       std::swap(*it, this->socket_fds_.back());
     }
     this->socket_fds_.pop_back();
+#ifdef USE_SOCKET_EPOLL
+    epoll_ctl(this->epoll_fd_, EPOLL_CTL_DEL, fd, nullptr);
+    // The number may be reused by the next socket before the next wait
+    auto ready = std::find(this->ready_fds_.begin(), this->ready_fds_.end(), fd);
+    if (ready != this->ready_fds_.end())
+      this->ready_fds_.erase(ready);
+#else
     this->socket_fds_changed_ = true;
 
     // Only recalculate max_fd if we removed the current max
@@ -290,6 +433,7 @@ void Application::unregister_socket_fd(int fd) {
         this->max_fd_ = *std::max_element(this->socket_fds_.begin(), this->socket_fds_.end());
       }
     }
+#endif
   }
 }
 
@@ -297,10 +441,14 @@ bool Application::is_socket_ready(int fd) const {
   // This function is thread-safe for reading the result of select()
   // However, it should only be called after select() has been executed in the main loop
   // The read_fds_ is only modified by select() in the main loop
+#ifdef USE_SOCKET_EPOLL
+  return std::find(this->ready_fds_.begin(), this->ready_fds_.end(), fd) != this->ready_fds_.end();
+#else
   if (fd < 0 || fd >= FD_SETSIZE)
     return false;
 
   return FD_ISSET(fd, &this->read_fds_);
+#endif
 }
 #endif
 
@@ -10,8 +10,13 @@
 #include "esphome/core/scheduler.h"
 
 #ifdef USE_SOCKET_SELECT_SUPPORT
+#if defined(USE_HOST) && defined(__linux__)
+// Wait with epoll instead of select(), it has no limit on the number or value of the file descriptors
+#define USE_SOCKET_EPOLL
+#else
 #include <sys/select.h>
 #endif
+#endif
 
 #ifdef USE_BINARY_SENSOR
 #include "esphome/components/binary_sensor/binary_sensor.h"
@@ -253,6 +258,9 @@ class Application {
 
   uint32_t get_app_state() const { return this->app_state_; }
 
+  /// Wake the main loop if it is sleeping. Can be called from other threads.
+  void wake_loop();
+
 #ifdef USE_BINARY_SENSOR
   const std::vector<binary_sensor::BinarySensor *> &get_binary_sensors() { return this->binary_sensors_; }
   binary_sensor::BinarySensor *get_binary_sensor_by_key(uint32_t key, bool include_internal = false) {
@@ -473,9 +481,9 @@ class Application {
 
   /// Register/unregister a socket file descriptor to be monitored for read events.
 #ifdef USE_SOCKET_SELECT_SUPPORT
-  /// These functions update the fd_set used by select() in the main loop.
+  /// These functions update the fd_set used by select() (or the epoll set on Linux hosts) in the main loop.
   /// WARNING: These functions are NOT thread-safe. They must only be called from the main loop.
-  /// NOTE: File descriptors >= FD_SETSIZE (typically 10 on ESP) will be rejected with an error.
+  /// NOTE: Without epoll, file descriptors >= FD_SETSIZE (typically 10 on ESP) will be rejected with an error.
   /// @return true if registration was successful, false if fd exceeds limits
   bool register_socket_fd(int fd);
   void unregister_socket_fd(int fd);
@@ -491,6 +499,12 @@ class Application {
 
   void calculate_looping_components_();
 
+  /// Sleep for at most delay_ms, returns early when a monitored socket has data or the loop is woken.
+  void sleep_(uint32_t delay_ms);
+#ifdef USE_SOCKET_EPOLL
+  bool setup_epoll_();
+#endif
+
   void feed_wdt_arch_();
 
   std::vector<Component *> components_{};
@@ -572,15 +586,22 @@ class Application {
   uint32_t app_state_{0};
   Component *current_component_{nullptr};
   uint32_t loop_component_start_time_{0};
+  bool sockets_ready_{false};  // Whether the last sleep ended because a monitored socket had data
 
 #ifdef USE_SOCKET_SELECT_SUPPORT
   // Socket select management
-  std::vector<int> socket_fds_;     // Vector of all monitored socket file descriptors
+  std::vector<int> socket_fds_;  // Vector of all monitored socket file descriptors
+#ifdef USE_SOCKET_EPOLL
+  int epoll_fd_{-1};            // epoll instance watching socket_fds_ and wake_fd_
+  int wake_fd_{-1};             // eventfd written by wake_loop()
+  std::vector<int> ready_fds_;  // Sockets with data after the last epoll_wait()
+#else
   bool socket_fds_changed_{false};  // Flag to rebuild base_read_fds_ when socket_fds_ changes
   int max_fd_{-1};                  // Highest file descriptor number for select()
   fd_set base_read_fds_{};          // Cached fd_set rebuilt only when socket_fds_ changes
   fd_set read_fds_{};               // Working fd_set for select(), copied from base_read_fds_
 #endif
+#endif
 };
 
 /// Global storage of Application pointer - only one Application can exist.
@@ -203,8 +203,12 @@ float Component::get_actual_setup_priority() const {
 }
 void Component::set_setup_priority(float priority) { this->setup_priority_override_ = priority; }
 
+void Component::wake_loop() {
+  this->loop_woken_ = true;
+  App.wake_loop();
+}
 bool Component::has_overridden_loop() const {
-#if defined(USE_HOST) || defined(CLANG_TIDY)
+#if defined(CLANG_TIDY) || defined(__clang__)
   bool loop_overridden = true;
   bool call_loop_overridden = true;
 #else
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <atomic>
 #include <cmath>
 #include <cstdint>
 #include <functional>
@@ -149,6 +150,18 @@ class Component {
 
   bool has_overridden_loop() const;
 
+  /** Only call loop() after this component was woken, instead of on every iteration of the main loop.
+   *
+   * A component is woken by wake_loop() and whenever a socket monitored by the main loop has data. If no other
+   * component needs its loop() called on every iteration, the main loop sleeps until the next timeout or interval.
+   * Components with work that nothing else wakes them for can turn this off from loop() until the work is done.
+   */
+  void set_loop_on_wake(bool loop_on_wake) { this->loop_on_wake_ = loop_on_wake; }
+  bool is_loop_on_wake() const { return this->loop_on_wake_; }
+
+  /// Call loop() on the next iteration of the main loop and wake it up. Can be called from other threads.
+  void wake_loop();
+
   /** Set where this component was loaded from for some debug messages.
    *
    * This is set by the ESPHome core, and should not be called manually.
@@ -290,6 +303,8 @@ class Component {
   const char *component_source_{nullptr};
   uint32_t warn_if_blocking_over_{WARN_IF_BLOCKING_OVER_MS};
   std::string error_message_{};
+  bool loop_on_wake_{false};
+  std::atomic<bool> loop_woken_{false};
 };
 
 /** This class simplifies creating components that periodically check a state.
@@ -45,6 +45,8 @@ class EntityBase {
 
   // Get/set this entity's icon
   std::string get_icon() const;
+  // Get this entity's icon without copying it
+  StringRef get_icon_ref() const { return StringRef::from_maybe_nullptr(this->icon_c_str_); }
   void set_icon(const char *icon);
 
  protected:
@@ -67,6 +69,8 @@ class EntityBase_DeviceClass {  // NOLINT(readability-identifier-naming)
  public:
   /// Get the device class, using the manual override if set.
   std::string get_device_class();
+  /// Get the device class without copying it.
+  StringRef get_device_class_ref() const { return StringRef::from_maybe_nullptr(this->device_class_); }
   /// Manually set the device class.
   void set_device_class(const char *device_class);
 
@@ -78,6 +82,8 @@ class EntityBase_UnitOfMeasurement {  // NOLINT(readability-identifier-naming)
  public:
   /// Get the unit of measurement, using the manual override if set.
   std::string get_unit_of_measurement();
+  /// Get the unit of measurement without copying it.
+  StringRef get_unit_of_measurement_ref() const { return StringRef::from_maybe_nullptr(this->unit_of_measurement_); }
   /// Manually set the unit of measurement.
   void set_unit_of_measurement(const char *unit_of_measurement);
 
@@ -8,6 +8,10 @@
 #include <algorithm>
 #include <cinttypes>
 
+#ifdef USE_PROFILER
+#include "esphome/components/profiler/profiler.h"
+#endif
+
 namespace esphome {
 
 static const char *const TAG = "scheduler";
@@ -22,20 +26,38 @@ static const uint32_t MAX_LOGICALLY_DELETED_ITEMS = 10;
 // iterating over them from the loop task is fine; but iterating from any other context requires the lock to be held to
 // avoid the main thread modifying the list while it is being accessed.
 
+static const uint32_t MAX_POOLED_ITEMS = 10;
+static const size_t MIN_INDEX_BUCKETS = 16;
+
+// Items without a name get the hash 0, so they are never replaced by or cancelled with a named item.
+static uint32_t hash_name(const std::string &name) {
+  if (name.empty())
+    return 0;
+  const uint32_t hash = fnv1_hash(name);
+  return hash != 0 ? hash : 1;
+}
+
 void HOT Scheduler::set_timeout(Component *component, const std::string &name, uint32_t timeout,
                                 std::function<void()> func) {
+  this->set_timeout_(component, name, timeout, std::move(func));
+}
+void HOT Scheduler::set_timeout_(Component *component, const std::string &name, uint32_t timeout,
+                                 std::function<void()> func) {
   const auto now = this->millis_();
 
   if (!name.empty())
-    this->cancel_timeout(component, name);
+    this->cancel_item_(component, name, SchedulerItem::TIMEOUT);
 
   if (timeout == SCHEDULER_DONT_RUN)
     return;
 
-  auto item = make_unique<SchedulerItem>();
+  auto item = this->acquire_item_();
   item->component = component;
+  // Pooled items keep the buffer of their name
   item->name = name;
+  item->name_hash = hash_name(name);
   item->type = SchedulerItem::TIMEOUT;
+  item->interval = 0;
   item->next_execution_ = now + timeout;
   item->callback = std::move(func);
   item->remove = false;
@@ -52,7 +74,7 @@ void HOT Scheduler::set_interval(Component *component, const std::string &name,
   const auto now = this->millis_();
 
   if (!name.empty())
-    this->cancel_interval(component, name);
+    this->cancel_item_(component, name, SchedulerItem::INTERVAL);
 
   if (interval == SCHEDULER_DONT_RUN)
     return;
@@ -62,9 +84,10 @@ void HOT Scheduler::set_interval(Component *component, const std::string &name,
   if (interval != 0)
     offset = (random_uint32() % interval) / 2;
 
-  auto item = make_unique<SchedulerItem>();
+  auto item = this->acquire_item_();
   item->component = component;
   item->name = name;
+  item->name_hash = hash_name(name);
   item->type = SchedulerItem::INTERVAL;
   item->interval = interval;
   item->next_execution_ = now + offset;
@@ -90,12 +113,12 @@ struct RetryArgs {
   Scheduler *scheduler;
 };
 
-static void retry_handler(const std::shared_ptr<RetryArgs> &args) {
+void retry_handler(const std::shared_ptr<RetryArgs> &args) {
   RetryResult const retry_result = args->func(--args->retry_countdown);
   if (retry_result == RetryResult::DONE || args->retry_countdown <= 0)
     return;
   // second execution of `func` happens after `initial_wait_time`
-  args->scheduler->set_timeout(args->component, args->name, args->current_interval, [args]() { retry_handler(args); });
+  args->scheduler->set_timeout_(args->component, args->name, args->current_interval, [args]() { retry_handler(args); });
   // backoff_increase_factor applied to third & later executions
   args->current_interval *= args->backoff_increase_factor;
 }
@@ -129,10 +152,10 @@ void HOT Scheduler::set_retry(Component *component, const std::string &name, uin
   args->scheduler = this;
 
   // First execution of `func` immediately
-  this->set_timeout(component, args->name, 0, [args]() { retry_handler(args); });
+  this->set_timeout_(component, args->name, 0, [args]() { retry_handler(args); });
 }
 bool HOT Scheduler::cancel_retry(Component *component, const std::string &name) {
-  return this->cancel_timeout(component, "retry$" + name);
+  return this->cancel_item_(component, "retry$" + name, SchedulerItem::TIMEOUT);
 }
 
 optional<uint32_t> HOT Scheduler::next_schedule_in() {
@@ -154,12 +177,11 @@ void HOT Scheduler::call() {
   if (now - last_print > 2000) {
     last_print = now;
     std::vector<std::unique_ptr<SchedulerItem>> old_items;
-    ESP_LOGD(TAG, "Items: count=%u, now=%" PRIu64 " (%u, %" PRIu32 ")", this->items_.size(), now, this->millis_major_,
-             this->last_millis_);
+    ESP_LOGD(TAG, "Items: count=%u, pooled=%u, now=%" PRIu64 " (%u, %" PRIu32 ")", this->items_.size(),
+             this->pool_.size(), now, this->millis_major_, this->last_millis_);
     while (!this->empty_()) {
       this->lock_.lock();
-      auto item = std::move(this->items_[0]);
-      this->pop_raw_();
+      auto item = this->pop_raw_();
       this->lock_.unlock();
 
       ESP_LOGD(TAG, "  %s '%s/%s' interval=%" PRIu32 " next_execution in %" PRIu64 "ms at %" PRIu64,
@@ -181,18 +203,16 @@ void HOT Scheduler::call() {
   auto items_was = this->items_.size();
   // If we have too many items to remove
   if (to_remove_ > MAX_LOGICALLY_DELETED_ITEMS) {
-    std::vector<std::unique_ptr<SchedulerItem>> valid_items;
-    while (!this->empty_()) {
-      LockGuard guard{this->lock_};
-      auto item = std::move(this->items_[0]);
-      this->pop_raw_();
-      valid_items.push_back(std::move(item));
-    }
-
-    {
-      LockGuard guard{this->lock_};
-      this->items_ = std::move(valid_items);
+    // Drop them all at once and rebuild the heap in place
+    LockGuard guard{this->lock_};
+    auto removed = std::partition(this->items_.begin(), this->items_.end(),
+                                  [](const std::unique_ptr<SchedulerItem> &item) { return !item->remove; });
+    for (auto it = removed; it != this->items_.end(); ++it) {
+      to_remove_--;
+      this->recycle_item_(std::move(*it));
     }
+    this->items_.erase(removed, this->items_.end());
+    std::make_heap(this->items_.begin(), this->items_.end(), SchedulerItem::cmp);
 
     // The following should not happen unless I'm missing something
     if (to_remove_ != 0) {
@@ -214,7 +234,10 @@ void HOT Scheduler::call() {
       // Don't run on failed components
       if (item->component != nullptr && item->component->is_failed()) {
         LockGuard guard{this->lock_};
-        this->pop_raw_();
+        auto failed = this->pop_raw_();
+        if (failed->name_hash != 0)
+          this->index_remove_(failed.get());
+        this->recycle_item_(std::move(failed));
         continue;
       }
       App.set_current_component(item->component);
@@ -231,33 +254,42 @@ void HOT Scheduler::call() {
       {
         uint32_t now_ms = millis();
         WarnIfComponentBlockingGuard guard{item->component, now_ms};
+#ifdef USE_PROFILER
+        const uint32_t started_us = micros();
+        item->callback();
+        profiler::global_profiler->record(item->component, profiler::PROFILE_SCHEDULER, micros() - started_us);
+#else
         item->callback();
+#endif
         // Call finish to ensure blocking time is properly calculated and reported
         guard.finish();
       }
     }
 
     {
-      this->lock_.lock();
+      LockGuard guard{this->lock_};
 
       // new scope, item from before might have been moved in the vector
-      auto item = std::move(this->items_[0]);
-
       // Only pop after function call, this ensures we were reachable
       // during the function call and know if we were cancelled.
-      this->pop_raw_();
-
-      this->lock_.unlock();
+      auto item = this->pop_raw_();
 
       if (item->remove) {
         // We were removed/cancelled in the function call, stop
         to_remove_--;
+        this->recycle_item_(std::move(item));
         continue;
       }
 
       if (item->type == SchedulerItem::INTERVAL) {
+        // Still in the index, so it is queued again without going through push_()
         item->next_execution_ = now + item->interval;
-        this->push_(std::move(item));
+        item->in_heap = false;
+        this->to_add_.push_back(std::move(item));
+      } else {
+        if (item->name_hash != 0)
+          this->index_remove_(item.get());
+        this->recycle_item_(std::move(item));
       }
     }
   }
@@ -268,9 +300,11 @@ void HOT Scheduler::process_to_add() {
   LockGuard guard{this->lock_};
   for (auto &it : this->to_add_) {
     if (it->remove) {
+      this->recycle_item_(std::move(it));
       continue;
     }
 
+    it->in_heap = true;
     this->items_.push_back(std::move(it));
     std::push_heap(this->items_.begin(), this->items_.end(), SchedulerItem::cmp);
   }
@@ -286,38 +320,130 @@ void HOT Scheduler::cleanup_() {
 
     {
       LockGuard guard{this->lock_};
-      this->pop_raw_();
+      this->recycle_item_(this->pop_raw_());
     }
   }
 }
-void HOT Scheduler::pop_raw_() {
+std::unique_ptr<Scheduler::SchedulerItem> HOT Scheduler::pop_raw_() {
   std::pop_heap(this->items_.begin(), this->items_.end(), SchedulerItem::cmp);
+  auto item = std::move(this->items_.back());
   this->items_.pop_back();
+  return item;
 }
 void HOT Scheduler::push_(std::unique_ptr<Scheduler::SchedulerItem> item) {
   LockGuard guard{this->lock_};
+  item->in_heap = false;
+  if (item->name_hash != 0)
+    this->index_insert_(item.get());
   this->to_add_.push_back(std::move(item));
 }
 bool HOT Scheduler::cancel_item_(Component *component, const std::string &name, Scheduler::SchedulerItem::Type type) {
-  // obtain lock because this function iterates and can be called from non-loop task context
+  // obtain lock because this function can be called from non-loop task context
   LockGuard guard{this->lock_};
   bool ret = false;
-  for (auto &it : this->items_) {
-    if (it->component == component && it->name == name && it->type == type && !it->remove) {
-      to_remove_++;
-      it->remove = true;
-      ret = true;
+  const uint32_t name_hash = hash_name(name);
+  if (name_hash == 0) {
+    // Items without a name aren't indexed, cancelling them all is rare enough to search for them
+    for (auto &it : this->items_) {
+      if (it->component == component && it->name_hash == 0 && it->type == type && !it->remove) {
+        to_remove_++;
+        it->remove = true;
+        ret = true;
+      }
     }
-  }
-  for (auto &it : this->to_add_) {
-    if (it->component == component && it->name == name && it->type == type) {
-      it->remove = true;
-      ret = true;
+    for (auto &it : this->to_add_) {
+      if (it->component == component && it->name_hash == 0 && it->type == type) {
+        it->remove = true;
+        ret = true;
+      }
     }
+    return ret;
   }
 
+  SchedulerItem **slot;
+  while ((slot = this->index_slot_(component, name, name_hash, type)) != nullptr) {
+    auto *item = *slot;
+    *slot = item->index_next;
+    item->index_next = nullptr;
+    this->index_size_--;
+    if (item->in_heap)
+      to_remove_++;
+    item->remove = true;
+    ret = true;
+  }
   return ret;
 }
+std::unique_ptr<Scheduler::SchedulerItem> Scheduler::acquire_item_() {
+  {
+    LockGuard guard{this->lock_};
+    if (!this->pool_.empty()) {
+      auto item = std::move(this->pool_.back());
+      this->pool_.pop_back();
+      return item;
+    }
+  }
+  return make_unique<SchedulerItem>();
+}
+// Must be called with `lock_` held
+void Scheduler::recycle_item_(std::unique_ptr<SchedulerItem> item) {
+  if (this->pool_.size() >= MAX_POOLED_ITEMS)
+    return;
+  // Release what the callback captured now rather than when the item is used again
+  item->callback = nullptr;
+  item->index_next = nullptr;
+  this->pool_.push_back(std::move(item));
+}
+static inline size_t index_bucket(Component *component, uint32_t name_hash, size_t buckets) {
+  return (name_hash ^ static_cast<uint32_t>(reinterpret_cast<uintptr_t>(component) >> 2)) & (buckets - 1);
+}
+Scheduler::SchedulerItem **Scheduler::index_slot_(Component *component, const std::string &name, uint32_t name_hash,
+                                                  SchedulerItem::Type type) {
+  if (this->index_.empty())
+    return nullptr;
+  SchedulerItem **slot = &this->index_[index_bucket(component, name_hash, this->index_.size())];
+  for (; *slot != nullptr; slot = &(*slot)->index_next) {
+    SchedulerItem *item = *slot;
+    // Different names can share a hash
+    if (item->component == component && item->name_hash == name_hash && item->type == type && item->name == name)
+      return slot;
+  }
+  return nullptr;
+}
+void Scheduler::index_insert_(SchedulerItem *item) {
+  if (this->index_size_ >= this->index_.size())
+    this->index_grow_();
+  SchedulerItem *&bucket = this->index_[index_bucket(item->component, item->name_hash, this->index_.size())];
+  item->index_next = bucket;
+  bucket = item;
+  this->index_size_++;
+}
+void Scheduler::index_remove_(SchedulerItem *item) {
+  if (this->index_.empty())
+    return;
+  SchedulerItem **slot = &this->index_[index_bucket(item->component, item->name_hash, this->index_.size())];
+  for (; *slot != nullptr; slot = &(*slot)->index_next) {
+    if (*slot == item) {
+      *slot = item->index_next;
+      item->index_next = nullptr;
+      this->index_size_--;
+      return;
+    }
+  }
+}
+void Scheduler::index_grow_() {
+  // Only ever grows, named items are usually re-armed over and over
+  std::vector<SchedulerItem *> old_index = std::move(this->index_);
+  this->index_.assign(std::max(MIN_INDEX_BUCKETS, old_index.size() * 2), nullptr);
+  for (SchedulerItem *head : old_index) {
+    while (head != nullptr) {
+      SchedulerItem *next = head->index_next;
+      SchedulerItem *&bucket = this->index_[index_bucket(head->component, head->name_hash, this->index_.size())];
+      head->index_next = bucket;
+      bucket = head;
+      head = next;
+    }
+  }
+}
 uint64_t Scheduler::millis_() {
   const uint32_t now = millis();
   if (now < this->last_millis_) {
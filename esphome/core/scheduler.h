@@ -9,7 +9,14 @@
 namespace esphome {
 
 class Component;
+struct RetryArgs;
 
+/** Runs timeouts and intervals of components from the main loop.
+ *
+ * Items are kept in a binary heap ordered by their next execution. Named items are also linked into an intrusive hash
+ * index on (component, name, type), so that replacing or cancelling an item doesn't have to search the heap. Items are
+ * recycled through a small pool, so re-arming a timeout doesn't allocate (apart from what the callback itself needs).
+ */
 class Scheduler {
  public:
   void set_timeout(Component *component, const std::string &name, uint32_t timeout, std::function<void()> func);
@@ -28,14 +35,22 @@ class Scheduler {
   void process_to_add();
 
  protected:
+  friend void retry_handler(const std::shared_ptr<RetryArgs> &args);
+
   struct SchedulerItem {
     Component *component;
     std::string name;
+    /// Hash of the name for the index, 0 for items without a name which are never replaced or cancelled.
+    uint32_t name_hash;
     enum Type { TIMEOUT, INTERVAL } type;
     uint32_t interval;
     uint64_t next_execution_;
     std::function<void()> callback;
     bool remove;
+    /// Whether the item is in `items_`, as opposed to `to_add_`.
+    bool in_heap;
+    /// Next item in the same bucket of the name index.
+    SchedulerItem *index_next;
 
     static bool cmp(const std::unique_ptr<SchedulerItem> &a, const std::unique_ptr<SchedulerItem> &b);
     const char *get_type_str() {
@@ -55,9 +70,17 @@ class Scheduler {
 
   uint64_t millis_();
   void cleanup_();
-  void pop_raw_();
+  std::unique_ptr<SchedulerItem> pop_raw_();
   void push_(std::unique_ptr<SchedulerItem> item);
+  void set_timeout_(Component *component, const std::string &name, uint32_t timeout, std::function<void()> func);
   bool cancel_item_(Component *component, const std::string &name, SchedulerItem::Type type);
+  std::unique_ptr<SchedulerItem> acquire_item_();
+  void recycle_item_(std::unique_ptr<SchedulerItem> item);
+  SchedulerItem **index_slot_(Component *component, const std::string &name, uint32_t name_hash,
+                              SchedulerItem::Type type);
+  void index_insert_(SchedulerItem *item);
+  void index_remove_(SchedulerItem *item);
+  void index_grow_();
   bool empty_() {
     this->cleanup_();
     return this->items_.empty();
@@ -66,6 +89,11 @@ class Scheduler {
   Mutex lock_;
   std::vector<std::unique_ptr<SchedulerItem>> items_;
   std::vector<std::unique_ptr<SchedulerItem>> to_add_;
+  /// Items that finished, ready to be used again.
+  std::vector<std::unique_ptr<SchedulerItem>> pool_;
+  /// Buckets of the name index, a power of two in size.
+  std::vector<SchedulerItem *> index_;
+  size_t index_size_{0};
   uint32_t last_millis_{0};
   uint16_t millis_major_{0};
   uint32_t to_remove_{0};
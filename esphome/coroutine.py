@@ -7,8 +7,9 @@ codegen can emit code using that variable (or otherwise the C++ won't compile).
 
 ESPHome's codegen system solves this by using coroutine-like methods. When a component depends on
 a variable, it waits for it to be registered using `await cg.get_variable()`. If the variable
-hasn't been registered yet, control will be yielded back to another component until the variable
-is registered. This leads to a topological sort, solving the dependency problem.
+hasn't been registered yet, the task is parked until the variable is registered and control is
+given to another component in the meantime. This leads to a topological sort, solving the
+dependency problem. If tasks are left waiting on each other, the chain of IDs is reported.
 
 Importantly, ESPHome only uses the coroutine *syntax*, no actual asyncio event loop is running in
 the background. This is so that we can ensure the order of execution is constant for the same
@@ -50,6 +51,8 @@ import logging
 import types
 from typing import Any
 
+from esphome.const import CONF_ID
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -159,6 +162,19 @@ class FakeAwaitable:
         return ret
 
 
+class WaitFor:
+    """Yielded by a task that can't continue until `key` is resolved.
+
+    Instead of retrying the task over and over, the event loop parks it until
+    `FakeEventLoop.resolve(key)` is called.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+
 @functools.total_ordering
 class _Task:
     def __init__(
@@ -167,14 +183,30 @@ class _Task:
         id_number: int,
         iterator: Iterator[None],
         original_function: Any,
+        provides: Any = None,
     ):
         self.priority = priority
         self.id_number = id_number
         self.iterator = iterator
         self.original_function = original_function
+        # The key this task is expected to resolve (the declared ID of its config),
+        # only used to report dependency cycles
+        self.provides = provides
 
     def with_priority(self, priority: float) -> "_Task":
-        return _Task(priority, self.id_number, self.iterator, self.original_function)
+        return _Task(
+            priority,
+            self.id_number,
+            self.iterator,
+            self.original_function,
+            self.provides,
+        )
+
+    @property
+    def name(self) -> str:
+        return (
+            f"{self.original_function.__module__}.{self.original_function.__qualname__}"
+        )
 
     @property
     def _cmp_tuple(self) -> tuple[float, int]:
@@ -196,6 +228,8 @@ class FakeEventLoop:
     def __init__(self):
         self._pending_tasks: list[_Task] = []
         self._task_counter = 0
+        # Tasks parked until the key they wait for is resolved
+        self._waiting_tasks: dict[Any, list[_Task]] = {}
 
     def add_job(self, func, *args, **kwargs):
         """Add a job to the task queue,
@@ -211,10 +245,19 @@ class FakeEventLoop:
             coro = coroutine(func)
             gen = coro(*args, **kwargs)
         prio = getattr(coro, "priority", 0.0)
-        task = _Task(prio, self._task_counter, gen, func)
+        provides = None
+        if args and isinstance(args[0], dict):
+            provides = args[0].get(CONF_ID)
+        task = _Task(prio, self._task_counter, gen, func, provides)
         self._task_counter += 1
         heapq.heappush(self._pending_tasks, task)
 
+    def resolve(self, key: Any) -> None:
+        """Wake up all tasks waiting for key."""
+        for task in self._waiting_tasks.pop(key, []):
+            _LOGGER.debug(" -> resuming %s (num %s)", task.name, task.id_number)
+            heapq.heappush(self._pending_tasks, task)
+
     def flush_tasks(self):
         """Run until all tasks have been completed.
 
@@ -224,9 +267,9 @@ class FakeEventLoop:
         while self._pending_tasks:
             i += 1
             if i > 1000000:
-                # Detect deadlock/circular dependency by measuring how many times tasks have been
-                # executed. On the big tests/test1.yaml we only get to a fraction of this, so
-                # this shouldn't be a problem.
+                # Only tasks that poll a condition by yielding without a key are
+                # retried, detect those never finishing by measuring how many times
+                # tasks have been executed.
                 raise RuntimeError(
                     "Circular dependency detected! "
                     "Please run with -v option to see what functions failed to "
@@ -242,11 +285,48 @@ class FakeEventLoop:
             )
 
             try:
-                next(task.iterator)
-                # Decrease priority over time, so that if this task is blocked
-                # due to a dependency others will clear the dependency
-                # This could be improved with a less naive approach
-                new_task = task.with_priority(task.priority - 1)
-                heapq.heappush(self._pending_tasks, new_task)
+                val = next(task.iterator)
             except StopIteration:
                 _LOGGER.debug(" -> finished")
+                continue
+
+            # Decrease priority over time, so that if this task is blocked
+            # due to a dependency others will clear the dependency
+            new_task = task.with_priority(task.priority - 1)
+            if isinstance(val, WaitFor):
+                _LOGGER.debug(" -> waiting for %s", val.key)
+                self._waiting_tasks.setdefault(val.key, []).append(new_task)
+            else:
+                heapq.heappush(self._pending_tasks, new_task)
+
+        if self._waiting_tasks:
+            raise RuntimeError(self._describe_deadlock())
+
+    def _describe_deadlock(self) -> str:
+        waiting_on: dict[int, Any] = {}
+        providers: dict[Any, _Task] = {}
+        for key, tasks in self._waiting_tasks.items():
+            for task in tasks:
+                waiting_on[task.id_number] = key
+                if task.provides is not None:
+                    providers[task.provides] = task
+
+        # Follow task -> awaited key -> task providing that key until a key repeats
+        for tasks in self._waiting_tasks.values():
+            for task in tasks:
+                chain = [] if task.provides is None else [task.provides]
+                while task is not None:
+                    key = waiting_on[task.id_number]
+                    if key in chain:
+                        cycle = chain[chain.index(key) :] + [key]
+                        return "Circular dependency detected! " + " -> ".join(
+                            f"'{k}'" for k in cycle
+                        )
+                    chain.append(key)
+                    task = providers.get(key)
+
+        missing = ", ".join(
+            f"'{key}' (needed by {', '.join(t.name for t in tasks)})"
+            for key, tasks in self._waiting_tasks.items()
+        )
+        return f"Waiting for IDs that are never registered: {missing}"
@@ -1,5 +1,6 @@
 import abc
 from collections.abc import Callable, Sequence
+import hashlib
 import inspect
 import math
 import re
@@ -443,11 +444,60 @@ class StaticConstAssignmentExpression(AssignmentExpression):
         return f"static const {self.type} {self.name}[] = {self.rhs}"
 
 
+_HEX_BYTES = [str(HexInt(x)) for x in range(256)]
+
+
+class ProgmemData:
+    """The contents of a progmem array given as bytes.
+
+    Large arrays are defined in their own source file instead of main.cpp, which
+    keeps main.cpp small and lets the build skip them when they did not change.
+    """
+
+    __slots__ = ("type", "name", "data", "digest")
+
+    # Number of values on each line of the generated source
+    VALUES_PER_LINE = 16
+
+    def __init__(self, type_, name, data: bytes):
+        self.type = type_
+        self.name = name
+        self.data = data
+        self.digest = hashlib.sha256(f"{type_} {name}\n".encode() + data).hexdigest()
+
+    @property
+    def declaration(self) -> str:
+        return f"extern const {self.type} {self.name}[] PROGMEM;"
+
+    @property
+    def source(self) -> str:
+        values = [_HEX_BYTES[x] for x in self.data]
+        step = self.VALUES_PER_LINE
+        lines = [", ".join(values[i : i + step]) for i in range(0, len(values), step)]
+        content = ",\n  ".join(lines)
+        return (
+            f"// {self.digest}\n"
+            "// Auto generated code by esphome\n"
+            '#include "esphome/core/hal.h"\n'
+            "\n"
+            f"{self.declaration}\n"
+            f"const {self.type} {self.name}[] PROGMEM = {{\n  {content},\n}};\n"
+        )
+
+
 def progmem_array(id_, rhs) -> "MockObj":
-    rhs = safe_exp(rhs)
+    """Declare a constant array in flash.
+
+    If rhs is bytes the array is written to its own source file.
+    """
     obj = MockObj(id_, ".")
-    assignment = ProgmemAssignmentExpression(id_.type, id_, rhs)
-    CORE.add(assignment)
+    if isinstance(rhs, bytes | bytearray):
+        data = ProgmemData(id_.type, id_, bytes(rhs))
+        CORE.progmem_data.append(data)
+        CORE.add_global(RawStatement(data.declaration))
+    else:
+        assignment = ProgmemAssignmentExpression(id_.type, id_, safe_exp(rhs))
+        CORE.add(assignment)
     CORE.register_variable(id_, obj)
     return obj
 
@@ -4,6 +4,7 @@ EVENT_ENTRY_ADDED = "entry_added"
 EVENT_ENTRY_REMOVED = "entry_removed"
 EVENT_ENTRY_UPDATED = "entry_updated"
 EVENT_ENTRY_STATE_CHANGED = "entry_state_changed"
+EVENT_IMPORTABLE_CHANGED = "importable_changed"
 MAX_EXECUTOR_WORKERS = 48
 
 
@@ -8,17 +8,27 @@ from functools import partial
 import json
 import logging
 from pathlib import Path
+import secrets
 import threading
 from typing import Any
 
 from esphome.storage_json import ignored_devices_storage_path
 
 from ..zeroconf import DiscoveredImport
+from .const import (
+    EVENT_ENTRY_ADDED,
+    EVENT_ENTRY_REMOVED,
+    EVENT_ENTRY_STATE_CHANGED,
+    EVENT_ENTRY_UPDATED,
+    EVENT_IMPORTABLE_CHANGED,
+)
 from .dns import DNSCache
-from .entries import DashboardEntries
+from .entries import DashboardEntries, DashboardEntry, entry_state_to_bool
+from .json_config import JsonConfigCache
 from .settings import DashboardSettings
 from .status.mdns import MDNSStatus
 from .status.ping import PingStatus
+from .workers import WorkerPool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +36,16 @@ IGNORED_DEVICES_STORAGE_PATH = "ignored-devices.json"
 
 MDNS_BOOTSTRAP_TIME = 7.5
 
+# Entry events are collected for this many seconds and sent as one message
+EVENT_BATCH_INTERVAL = 0.1
+
+_ENTRY_EVENT_KINDS = {
+    EVENT_ENTRY_ADDED: "added",
+    EVENT_ENTRY_UPDATED: "updated",
+    EVENT_ENTRY_REMOVED: "removed",
+    EVENT_ENTRY_STATE_CHANGED: "state",
+}
+
 
 @dataclass
 class Event:
@@ -65,6 +85,146 @@ class EventBus:
             listener(event)
 
 
+def _merge_entry_change(previous: str | None, kind: str) -> str | None:
+    """Return the change of an entry after another one, None if there is none."""
+    if previous == "added":
+        # Subscribers never saw the entry
+        return None if kind == "removed" else "added"
+    if previous == "removed":
+        return "updated" if kind == "added" else "removed"
+    if previous == "updated" and kind == "state":
+        return "updated"
+    return kind
+
+
+class EntryEventBatcher:
+    """Coalesces entry events into one delta message per batch interval.
+
+    Every subscriber receives the same JSON encoded message, the bus is only
+    listened to while there are subscribers. The importable devices returned by
+    get_importable are sent again whenever they may have changed, they are
+    filtered by the configured names.
+    """
+
+    def __init__(
+        self, bus: EventBus, get_importable: Callable[[], list[dict[str, Any]]]
+    ) -> None:
+        """Initialize the batcher."""
+        self._bus = bus
+        self._get_importable = get_importable
+        self._subscribers: set[Callable[[str], None]] = set()
+        self._remove_listeners: list[Callable[[], None]] = []
+        self._changes: dict[str, tuple[str, DashboardEntry]] = {}
+        self._importable_changed = False
+        self._timer: asyncio.TimerHandle | None = None
+
+    def async_subscribe(self, callback: Callable[[str], None]) -> Callable[[], None]:
+        """Subscribe to the delta messages, return a function to unsubscribe."""
+        if not self._subscribers:
+            self._remove_listeners = [
+                self._bus.async_add_listener(event_type, self._async_on_event)
+                for event_type in _ENTRY_EVENT_KINDS
+            ]
+            self._remove_listeners.append(
+                self._bus.async_add_listener(
+                    EVENT_IMPORTABLE_CHANGED, self._async_on_importable_changed
+                )
+            )
+        self._subscribers.add(callback)
+        return partial(self._async_unsubscribe, callback)
+
+    def _async_unsubscribe(self, callback: Callable[[str], None]) -> None:
+        self._subscribers.discard(callback)
+        if self._subscribers:
+            return
+        for remove_listener in self._remove_listeners:
+            remove_listener()
+        self._remove_listeners.clear()
+        self._changes.clear()
+        self._importable_changed = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _async_on_event(self, event: Event) -> None:
+        entry: DashboardEntry = event.data["entry"]
+        previous = self._changes.get(entry.path)
+        kind = _merge_entry_change(
+            previous and previous[0], _ENTRY_EVENT_KINDS[event.event_type]
+        )
+        if kind is None:
+            del self._changes[entry.path]
+        else:
+            self._changes[entry.path] = (kind, entry)
+        self._async_schedule_flush()
+
+    def _async_on_importable_changed(self, event: Event) -> None:
+        self._importable_changed = True
+        self._async_schedule_flush()
+
+    def _async_schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                EVENT_BATCH_INTERVAL, self._async_flush
+            )
+
+    def _async_flush(self) -> None:
+        self._timer = None
+        changes, self._changes = self._changes, {}
+        importable_changed, self._importable_changed = self._importable_changed, False
+        if not changes and not importable_changed:
+            return
+        data: dict[str, Any] = {"added": [], "updated": [], "removed": [], "states": {}}
+        for kind, entry in changes.values():
+            if kind == "removed":
+                data["removed"].append(entry.filename)
+                importable_changed = True
+                continue
+            if kind != "state":
+                data[kind].append(entry.to_dict())
+                importable_changed = True
+            data["states"][entry.filename] = entry_state_to_bool(entry.state)
+        if importable_changed:
+            data["importable"] = self._get_importable()
+        message = json.dumps({"event": "entries", "data": data})
+        for callback in list(self._subscribers):
+            callback(message)
+
+
+class EntriesSnapshot:
+    """JSON views of the entries, only rendered again after an entry changed.
+
+    State changes don't count as a change, none of the views include the state.
+    """
+
+    def __init__(self, bus: EventBus) -> None:
+        """Initialize the snapshot."""
+        # Distinguishes the ETags of different runs of the dashboard
+        self._run_id = secrets.token_hex(4)
+        self._version = 0
+        self._views: dict[str, tuple[int, str, str]] = {}
+        for event_type in (EVENT_ENTRY_ADDED, EVENT_ENTRY_UPDATED, EVENT_ENTRY_REMOVED):
+            bus.async_add_listener(event_type, self._async_on_change)
+
+    def _async_on_change(self, event: Event) -> None:
+        self._version += 1
+
+    def async_get(self, name: str, render: Callable[[], Any]) -> tuple[str, str]:
+        """Return the JSON of a view and its ETag.
+
+        The view is rendered again with render() if an entry changed since.
+        """
+        view = self._views.get(name)
+        if view is None or view[0] != self._version:
+            view = (
+                self._version,
+                json.dumps(render()),
+                f"{self._run_id}-{self._version}",
+            )
+            self._views[name] = view
+        return view[1], view[2]
+
+
 class ESPHomeDashboard:
     """Class that represents the dashboard."""
 
@@ -82,6 +242,10 @@ class ESPHomeDashboard:
         "_background_tasks",
         "ignored_devices",
         "_ping_status_task",
+        "workers",
+        "json_configs",
+        "entry_events",
+        "entries_snapshot",
     )
 
     def __init__(self) -> None:
@@ -99,12 +263,34 @@ class ESPHomeDashboard:
         self._background_tasks: set[asyncio.Task] = set()
         self.ignored_devices: set[str] = set()
         self._ping_status_task: asyncio.Task | None = None
+        self.workers: WorkerPool | None = None
+        self.json_configs = JsonConfigCache()
+        self.entry_events = EntryEventBatcher(self.bus, self.get_importable_devices)
+        self.entries_snapshot = EntriesSnapshot(self.bus)
+
+    def get_importable_devices(self) -> list[dict[str, Any]]:
+        """Return the discovered devices that are not configured yet."""
+        configured = {entry.name for entry in self.entries.async_all()}
+        return [
+            {
+                "name": res.device_name,
+                "friendly_name": res.friendly_name,
+                "package_import_url": res.package_import_url,
+                "project_name": res.project_name,
+                "project_version": res.project_version,
+                "network": res.network,
+                "ignored": res.device_name in self.ignored_devices,
+            }
+            for res in self.import_result.values()
+            if res.device_name not in configured
+        ]
 
     async def async_setup(self) -> None:
         """Setup the dashboard."""
         self.loop = asyncio.get_running_loop()
         self.ping_request = asyncio.Event()
         self.entries = DashboardEntries(self)
+        self.workers = WorkerPool(self.settings.worker_count)
         await self.loop.run_in_executor(None, self.load_ignored_devices)
 
     def load_ignored_devices(self) -> None:
@@ -130,7 +316,16 @@ class ESPHomeDashboard:
         """Run the dashboard."""
         settings = self.settings
         mdns_task: asyncio.Task | None = None
+        if settings.watch_files:
+            # Started first, so no change after the initial scan is missed
+            self.entries.async_start_watching()
         await self.entries.async_update_entries()
+        # Import the components of the existing devices before they are needed
+        await self.workers.async_start(
+            integration
+            for entry in self.entries.async_all()
+            for integration in entry.loaded_integrations
+        )
 
         mdns_status = MDNSStatus(self)
         ping_status = PingStatus(self)
@@ -160,6 +355,8 @@ class ESPHomeDashboard:
             _LOGGER.info("Shutting down...")
             self.stop_event.set()
             self.ping_request.set()
+            self.workers.stop()
+            self.entries.stop_watching()
             if start_ping_timer:
                 start_ping_timer.cancel()
             if self._ping_status_task:
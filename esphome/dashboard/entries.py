@@ -19,7 +19,7 @@ from .const import (
     EVENT_ENTRY_UPDATED,
 )
 from .enum import StrEnum
-from .util.subprocess import async_run_system_command
+from .util.inotify import DirectoryWatcher
 
 if TYPE_CHECKING:
     from .core import ESPHomeDashboard
@@ -29,6 +29,9 @@ _LOGGER = logging.getLogger(__name__)
 
 DashboardCacheKeyType = tuple[int, int, float, int]
 
+# Editors and compiles touch a file several times in a row
+WATCH_DEBOUNCE = 0.5
+
 
 @dataclass(frozen=True)
 class EntryState:
@@ -90,6 +93,9 @@ class DashboardEntries:
         "_loaded_entries",
         "_update_lock",
         "_name_to_entry",
+        "_watcher",
+        "_changed_paths",
+        "_update_timer",
     )
 
     def __init__(self, dashboard: ESPHomeDashboard) -> None:
@@ -106,6 +112,11 @@ class DashboardEntries:
         self._loaded_entries = False
         self._update_lock = asyncio.Lock()
         self._name_to_entry: dict[str, set[DashboardEntry]] = defaultdict(set)
+        self._watcher: DirectoryWatcher | None = None
+        # Paths changed since the last update, None if all of them have to be
+        # checked because there is no watcher or it may have missed changes
+        self._changed_paths: set[str] | None = None
+        self._update_timer: asyncio.TimerHandle | None = None
 
     def get(self, path: str) -> DashboardEntry | None:
         """Get an entry by path."""
@@ -195,6 +206,63 @@ class DashboardEntries:
             EVENT_ENTRY_STATE_CHANGED, {"entry": entry, "state": state}
         )
 
+    def async_start_watching(self) -> bool:
+        """Watch the configuration and storage directories for changes.
+
+        Returns False if the file system can't be watched, in which case every
+        update stats all files instead.
+        """
+        storage_dir = os.path.dirname(ext_storage_path("_"))
+        watcher = DirectoryWatcher(self._async_path_changed, self._async_watch_stopped)
+        # The storage directory is created by the first compile
+        if not os.path.isdir(storage_dir) or not watcher.async_start(
+            [self._config_dir, storage_dir]
+        ):
+            _LOGGER.debug("Watching files is not available, polling for changes")
+            return False
+        self._watcher = watcher
+        self._changed_paths = None
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop watching for changes."""
+        if self._update_timer:
+            self._update_timer.cancel()
+            self._update_timer = None
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
+        self._changed_paths = None
+
+    def _async_path_changed(self, directory: str, name: str | None) -> None:
+        """Record a changed file reported by the watcher."""
+        if name is None:
+            self._changed_paths = None
+        elif self._changed_paths is not None:
+            if directory != self._config_dir:
+                # Storage files are named after their configuration
+                name = name.removesuffix(".json")
+            path = os.path.join(self._config_dir, name)
+            if not util.filter_yaml_files([path]):
+                return
+            self._changed_paths.add(path)
+        if self._update_timer is None:
+            self._update_timer = self._loop.call_later(
+                WATCH_DEBOUNCE, self._async_schedule_update
+            )
+
+    def _async_watch_stopped(self) -> None:
+        """Fall back to polling, a watched directory was removed."""
+        _LOGGER.debug("Watched directory removed, polling for changes")
+        self._watcher = None
+        self._async_path_changed(self._config_dir, None)
+
+    def _async_schedule_update(self) -> None:
+        self._update_timer = None
+        self._dashboard.async_create_background_task(
+            self.async_request_update_entries()
+        )
+
     async def async_request_update_entries(self) -> None:
         """Request an update of the dashboard entries from disk.
 
@@ -224,11 +292,15 @@ class DashboardEntries:
 
     async def _async_update_entries(self) -> list[DashboardEntry]:
         """Sync the dashboard entries from disk."""
-        _LOGGER.debug("Updating dashboard entries")
-        # At some point it would be nice to use watchdog to avoid polling
+        changed_paths = self._changed_paths
+        if self._watcher:
+            self._changed_paths = set()
+            if not changed_paths and changed_paths is not None:
+                return
+        _LOGGER.debug("Updating dashboard entries: %s", changed_paths or "all")
 
         path_to_cache_key = await self._loop.run_in_executor(
-            None, self._get_path_to_cache_key
+            None, self._get_path_to_cache_key, changed_paths
         )
         entries = self._entries
         name_to_entry = self._name_to_entry
@@ -238,6 +310,7 @@ class DashboardEntries:
             entry
             for filename, entry in entries.items()
             if filename not in path_to_cache_key
+            and (changed_paths is None or filename in changed_paths)
         }
         original_names: dict[DashboardEntry, str] = {}
 
@@ -273,8 +346,13 @@ class DashboardEntries:
                 name_to_entry[current_name].add(entry)
             bus.async_fire(EVENT_ENTRY_UPDATED, {"entry": entry})
 
-    def _get_path_to_cache_key(self) -> dict[str, DashboardCacheKeyType]:
-        """Return a dict of path to cache key."""
+    def _get_path_to_cache_key(
+        self, paths: set[str] | None = None
+    ) -> dict[str, DashboardCacheKeyType]:
+        """Return a dict of path to cache key.
+
+        Only the given configuration paths are checked if paths is not None.
+        """
         path_to_cache_key: dict[str, DashboardCacheKeyType] = {}
         #
         # The cache key is (inode, device, mtime, size)
@@ -284,7 +362,11 @@ class DashboardEntries:
         # file which is much faster than reading the file
         # for the cache hit case which is the common case.
         #
-        for file in util.list_yaml_files([self._config_dir]):
+        if paths is None:
+            files = util.list_yaml_files([self._config_dir])
+        else:
+            files = sorted(path for path in paths if os.path.isfile(path))
+        for file in files:
             try:
                 # Prefer the json storage path if it exists
                 stat = os.stat(ext_storage_path(os.path.basename(file)))
@@ -307,7 +389,7 @@ class DashboardEntries:
     def async_schedule_storage_json_update(self, filename: str) -> None:
         """Schedule a task to update the storage JSON file."""
         self._dashboard.async_create_background_task(
-            async_run_system_command(
+            self._dashboard.workers.async_run_command(
                 [*DASHBOARD_COMMAND, "compile", "--only-generate", filename]
             )
         )
@@ -326,6 +408,8 @@ class DashboardEntry:
         "cache_key",
         "storage",
         "state",
+        "last_seen",
+        "rtt",
         "_to_dict",
     )
 
@@ -337,6 +421,9 @@ class DashboardEntry:
         self.cache_key = cache_key
         self.storage: StorageJSON | None = None
         self.state = UNKNOWN_STATE
+        # Time the device last answered a ping and the round trip time in ms
+        self.last_seen: float | None = None
+        self.rtt: float | None = None
         self._to_dict: dict[str, Any] | None = None
 
     def __repr__(self) -> str:
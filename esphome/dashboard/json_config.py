@@ -0,0 +1,117 @@
+"""JSON representation of validated configurations for the dashboard.
+
+The configuration is validated in a worker process and converted to JSON there,
+instead of dumping it as YAML and parsing that again. The result is cached until
+one of the files the configuration was loaded from changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING, Any
+
+from esphome import core, loader, yaml_util
+
+if TYPE_CHECKING:
+    from .workers import WorkerPool
+
+FileKeyType = tuple[int, int, int, int]
+
+
+def _file_key(path: str) -> FileKeyType | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_dev, stat.st_mtime_ns, stat.st_size
+
+
+def _component_files() -> list[str]:
+    """Return the files of the imported custom and external components."""
+    result = []
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("esphome.components."):
+            continue
+        if (path := getattr(module, "__file__", None)) is None:
+            continue
+        if not Path(path).resolve().is_relative_to(loader.CORE_COMPONENTS_PATH):
+            result.append(path)
+    return result
+
+
+def config_to_json_data(value: Any) -> Any:
+    """Convert a validated configuration to JSON compatible types.
+
+    The values match what `esphome config --show-secrets` shows.
+    """
+    if isinstance(value, dict):
+        return {
+            config_to_json_data(key): config_to_json_data(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list | tuple):
+        return [config_to_json_data(item) for item in value]
+    if value is None or isinstance(value, bool | int | float):
+        return value
+    if isinstance(value, core.Lambda):
+        return f"!lambda {value.value}"
+    if isinstance(value, core.ID):
+        return value.id
+    return str(value)
+
+
+def load_json_config(
+    filename: str, use_cache: bool = False
+) -> tuple[dict[str, FileKeyType | None], str] | None:
+    """Validate a configuration and return it as JSON, None if it is invalid.
+
+    Runs in a worker process. Also returns the files the configuration and its
+    custom components were loaded from, the result stays valid as long as none
+    of them change. The on-disk configuration cache is only used if use_cache
+    is set, like with --config-cache.
+    """
+    # pylint: disable=import-outside-toplevel
+    from esphome.config import read_config, strip_default_ids
+
+    core.CORE.config_path = filename
+    core.CORE.dashboard = True
+    config = read_config({}, use_cache=use_cache)
+    if config is None:
+        return None
+    if not core.CORE.verbose:
+        config = strip_default_ids(config)
+    files = {path: _file_key(path) for path in yaml_util.loaded_files()}
+    # Custom and external components define the schema the result depends on
+    files.update((path, _file_key(path)) for path in _component_files())
+    return files, json.dumps(config_to_json_data(config))
+
+
+def _is_unchanged(files: dict[str, FileKeyType | None]) -> bool:
+    return all(_file_key(path) == key for path, key in files.items())
+
+
+class JsonConfigCache:
+    """Cache of the JSON configuration of every configuration file."""
+
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[dict[str, FileKeyType | None], str]] = {}
+
+    async def async_get(
+        self, workers: WorkerPool, filename: str, use_cache: bool = False
+    ) -> str | None:
+        """Return the JSON configuration, None if it is invalid."""
+        loop = asyncio.get_running_loop()
+        if (cached := self._cache.get(filename)) is not None and (
+            await loop.run_in_executor(None, _is_unchanged, cached[0])
+        ):
+            return cached[1]
+        result = await workers.async_call(load_json_config, filename, use_cache)
+        if result is None:
+            self._cache.pop(filename, None)
+            return None
+        self._cache[filename] = result
+        return result[1]
@@ -10,6 +10,8 @@ from esphome.helpers import get_bool_env
 
 from .util.password import password_hash
 
+DEFAULT_WORKERS = 2
+
 
 class DashboardSettings:
     """Settings for the dashboard."""
@@ -23,6 +25,7 @@ class DashboardSettings:
         "cookie_secret",
         "absolute_config_dir",
         "verbose",
+        "config_cache",
     )
 
     def __init__(self) -> None:
@@ -35,6 +38,7 @@ class DashboardSettings:
         self.cookie_secret: str | None = None
         self.absolute_config_dir: Path | None = None
         self.verbose: bool = False
+        self.config_cache: bool = False
 
     def parse_args(self, args: Any) -> None:
         """Parse the arguments."""
@@ -48,6 +52,7 @@ class DashboardSettings:
         self.config_dir = args.configuration
         self.absolute_config_dir = Path(self.config_dir).resolve()
         self.verbose = args.verbose
+        self.config_cache = args.config_cache
         CORE.config_path = os.path.join(self.config_dir, ".")
 
     @property
@@ -58,6 +63,23 @@ class DashboardSettings:
     def status_use_mqtt(self) -> bool:
         return get_bool_env("ESPHOME_DASHBOARD_USE_MQTT")
 
+    @property
+    def worker_count(self) -> int:
+        """Number of processes running validation jobs, 0 spawns one per job."""
+        try:
+            return int(os.getenv("ESPHOME_DASHBOARD_WORKERS", DEFAULT_WORKERS))
+        except ValueError:
+            return DEFAULT_WORKERS
+
+    @property
+    def watch_files(self) -> bool:
+        """Whether to watch the configuration directory instead of polling it.
+
+        Changes made by other hosts on network file systems are not reported
+        by inotify, ESPHOME_DASHBOARD_POLL_FILES switches back to polling.
+        """
+        return not get_bool_env("ESPHOME_DASHBOARD_POLL_FILES")
+
     @property
     def using_ha_addon_auth(self) -> bool:
         if not self.on_ha_addon:
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import typing
 
+from esphome.resolver import get_resolver
 from esphome.zeroconf import (
     ESPHOME_SERVICE_TYPE,
     AsyncEsphomeZeroconf,
@@ -12,7 +14,7 @@ from esphome.zeroconf import (
     DashboardStatus,
 )
 
-from ..const import SENTINEL
+from ..const import EVENT_IMPORTABLE_CHANGED, SENTINEL
 from ..entries import DashboardEntry, EntryStateSource, bool_to_entry_state
 
 if typing.TYPE_CHECKING:
@@ -20,6 +22,10 @@ if typing.TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Addresses of devices that were seen are collected for this many seconds
+# before they are saved for the command line
+ADDRESS_SAVE_DELAY = 5.0
+
 
 class MDNSStatus:
     """Class that updates the mdns status."""
@@ -32,6 +38,8 @@ class MDNSStatus:
         self.host_mdns_state: dict[str, bool | None] = {}
         self._loop = asyncio.get_running_loop()
         self.dashboard = dashboard
+        self._seen_hosts: set[str] = set()
+        self._save_task: asyncio.Task | None = None
 
     def async_setup(self) -> bool:
         """Set up the MDNSStatus class."""
@@ -50,6 +58,37 @@ class MDNSStatus:
             return await aiozc.async_resolve_host(host_name)
         return None
 
+    def _async_host_seen(self, host_name: str) -> None:
+        """Save the addresses of a host that was seen, for the command line."""
+        self._seen_hosts.add(host_name)
+        if self._save_task is None:
+            self._save_task = self.dashboard.async_create_background_task(
+                self._async_save_addresses()
+            )
+
+    async def _async_save_addresses(self) -> None:
+        """Save the cached addresses of the hosts seen recently.
+
+        Commands started from the command line find them in the shared address
+        cache, instead of having to wait for an mDNS response.
+        """
+        await asyncio.sleep(ADDRESS_SAVE_DELAY)
+        self._save_task = None
+        host_names, self._seen_hosts = self._seen_hosts, set()
+        if not (aiozc := self.aiozc):
+            return
+        addresses: dict[str, tuple[list[str], float]] = {}
+        for host_name in host_names:
+            # Only what is in the zeroconf cache, without a request
+            if (address_list := await aiozc.async_resolve_host(host_name, 0)) and (
+                ttl := aiozc.address_ttl(host_name)
+            ):
+                addresses[f"{host_name}.local"] = (address_list, ttl)
+        if addresses:
+            await self._loop.run_in_executor(
+                None, get_resolver().cache.update, addresses, time.time()
+            )
+
     async def async_refresh_hosts(self) -> None:
         """Refresh the hosts to track."""
         dashboard = self.dashboard
@@ -75,6 +114,8 @@ class MDNSStatus:
             for name, address_list in zip(poll_names, results):
                 result = bool(address_list)
                 host_mdns_state[name] = result
+                if result:
+                    self._async_host_seen(name)
                 for entry in poll_names[name]:
                     self._async_set_state(entry, result)
 
@@ -101,12 +142,16 @@ class MDNSStatus:
             """Update the entry state."""
             for name, result in dat.items():
                 host_mdns_state[name] = result
+                if result:
+                    self._async_host_seen(name)
                 if matching_entries := entries.get_by_name(name):
                     for entry in matching_entries:
                         self._async_set_state(entry, result)
 
         stat = DashboardStatus(on_update)
-        imports = DashboardImportDiscovery()
+        imports = DashboardImportDiscovery(
+            lambda: dashboard.bus.async_fire(EVENT_IMPORTABLE_CHANGED, {})
+        )
         dashboard.import_result = imports.import_state
 
         browser = DashboardBrowser(
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass, field
+import heapq
+import itertools
 import logging
+import random
 import time
 import typing
-from typing import cast
 
-from icmplib import Host, SocketPermissionError, async_ping
+from icmplib import (
+    AsyncSocket,
+    ICMPLibError,
+    ICMPRequest,
+    ICMPv4Socket,
+    ICMPv6Socket,
+    SocketPermissionError,
+    TimeoutExceeded,
+    async_ping,
+    is_ipv6_address,
+)
 
-from ..const import MAX_EXECUTOR_WORKERS
 from ..entries import (
     DashboardEntry,
     EntryState,
@@ -16,7 +28,6 @@ from ..entries import (
     ReachableState,
     bool_to_entry_state,
 )
-from ..util.itertools import chunked
 
 if typing.TYPE_CHECKING:
     from ..core import ESPHomeDashboard
@@ -24,110 +35,228 @@ if typing.TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-GROUP_SIZE = int(MAX_EXECUTOR_WORKERS / 2)
-
 DNS_FAILURE_STATE = EntryState(ReachableState.DNS_FAILURE, EntryStateSource.PING)
 
 MIN_PING_INTERVAL = 5  # ensure we don't ping too often
+# Devices whose state doesn't change are pinged less and less often, up to this
+MAX_PING_INTERVAL = 60
+PING_TIMEOUT = 1
+PING_ATTEMPTS = 3
+
+
+@dataclass
+class _Schedule:
+    """When and how often an entry is pinged."""
+
+    interval: float = MIN_PING_INTERVAL
+    reachable: bool | None = None
+    handle: list = field(default_factory=list)
+
+
+class ICMPProber:
+    """Sends echo requests over one socket per address family.
+
+    Any number of probes can be in flight at the same time, a single reader
+    per socket hands the replies to the probe waiting for them.
+    """
+
+    def __init__(self, privileged: bool) -> None:
+        self._privileged = privileged
+        self._sockets: dict[int, AsyncSocket] = {}
+        self._readers: list[asyncio.Task] = []
+        self._waiting: dict[tuple[int, int, int], asyncio.Future[float]] = {}
+        self._sequence = itertools.count()
+        self._id = random.randint(0, 0xFFFF)
+
+    def _get_socket(self, family: int) -> AsyncSocket:
+        if (sock := self._sockets.get(family)) is None:
+            socket_class = ICMPv6Socket if family == 6 else ICMPv4Socket
+            sock = AsyncSocket(socket_class(privileged=self._privileged))
+            self._sockets[family] = sock
+            self._readers.append(
+                asyncio.create_task(self._async_read_replies(family, sock))
+            )
+        return sock
+
+    async def _async_read_replies(self, family: int, sock: AsyncSocket) -> None:
+        while True:
+            try:
+                reply = await sock.receive(timeout=3600)
+            except TimeoutExceeded:
+                continue
+            except ICMPLibError as err:
+                _LOGGER.debug("Error receiving ICMP reply: %s", err)
+                await asyncio.sleep(PING_TIMEOUT)
+                continue
+            if reply.type != (129 if family == 6 else 0):
+                continue
+            future = self._waiting.get((family, reply.id, reply.sequence))
+            if future is not None and not future.done():
+                future.set_result(reply.time)
+
+    async def async_probe(self, address: str) -> float | None:
+        """Return the round trip time in milliseconds, None if unreachable."""
+        family = 6 if is_ipv6_address(address) else 4
+        loop = asyncio.get_running_loop()
+        for _ in range(PING_ATTEMPTS):
+            sequence = next(self._sequence) & 0xFFFF
+            request = ICMPRequest(address, self._id, sequence)
+            future: asyncio.Future[float] = loop.create_future()
+            try:
+                self._get_socket(family).send(request)
+            except ICMPLibError as err:
+                _LOGGER.debug("Cannot ping %s: %s", address, err)
+                return None
+            # The kernel replaces the id of unprivileged sockets
+            key = (family, request.id, request.sequence)
+            self._waiting[key] = future
+            try:
+                reply_time = await asyncio.wait_for(future, PING_TIMEOUT)
+            except asyncio.TimeoutError:
+                continue
+            finally:
+                del self._waiting[key]
+            return (reply_time - request.time) * 1000
+        return None
+
+    async def async_close(self) -> None:
+        """Stop the readers and close the sockets."""
+        for task in self._readers:
+            task.cancel()
+        await asyncio.gather(*self._readers, return_exceptions=True)
+        for sock in self._sockets.values():
+            sock.close()
+        self._readers.clear()
+        self._sockets.clear()
 
 
 class PingStatus:
+    """Pings the devices, each on its own schedule.
+
+    A device is pinged every MIN_PING_INTERVAL seconds after its state changed
+    and the interval doubles up to MAX_PING_INTERVAL while it stays the same.
+    """
+
     def __init__(self, dashboard: ESPHomeDashboard) -> None:
         """Initialize the PingStatus class."""
         super().__init__()
         self._loop = asyncio.get_running_loop()
         self.dashboard = dashboard
+        self._schedules: dict[str, _Schedule] = {}
+        # Heap of [due time, path] of the next ping of every entry
+        self._queue: list[list] = []
+
+    def _async_schedule(self, path: str, schedule: _Schedule, delay: float) -> None:
+        # Spread out devices that would otherwise all be due at the same time
+        delay *= random.uniform(0.9, 1.1)
+        schedule.handle = [time.monotonic() + delay, path]
+        heapq.heappush(self._queue, schedule.handle)
+
+    def _async_pop_due(self, now: float) -> list[DashboardEntry]:
+        """Return the entries that are due for a ping."""
+        entries = self.dashboard.entries
+        for entry in entries.async_all():
+            if entry.path not in self._schedules:
+                self._schedules[entry.path] = schedule = _Schedule()
+                self._async_schedule(entry.path, schedule, 0)
+
+        due: list[DashboardEntry] = []
+        queue = self._queue
+        while queue and queue[0][0] <= now:
+            handle = heapq.heappop(queue)
+            path = handle[1]
+            schedule = self._schedules.get(path)
+            if schedule is None or schedule.handle is not handle:
+                continue
+            if (entry := entries.get(path)) is None:
+                del self._schedules[path]
+                continue
+            if entry.address is None or (
+                entry.state.reachable is ReachableState.ONLINE
+                and entry.state.source
+                not in (EntryStateSource.PING, EntryStateSource.UNKNOWN)
+            ):
+                # No address or we already have a state from another source
+                # so no need to ping, check again later
+                self._async_schedule(path, schedule, MIN_PING_INTERVAL)
+                continue
+            due.append(entry)
+        return due
+
+    async def _async_ping_entry(
+        self, prober: ICMPProber, entry: DashboardEntry
+    ) -> None:
+        schedule = self._schedules[entry.path]
+        reachable = None
+        try:
+            reachable = await self._async_ping(prober, entry)
+        finally:
+            if reachable is schedule.reachable:
+                schedule.interval = min(schedule.interval * 2, MAX_PING_INTERVAL)
+            else:
+                schedule.reachable = reachable
+                schedule.interval = MIN_PING_INTERVAL
+            self._async_schedule(entry.path, schedule, schedule.interval)
+
+    async def _async_ping(
+        self, prober: ICMPProber, entry: DashboardEntry
+    ) -> bool | None:
+        """Ping an entry and update its state, return None if DNS failed."""
+        dashboard = self.dashboard
+        entries = dashboard.entries
+        result = await dashboard.dns_cache.async_resolve(entry.address)
+        if isinstance(result, Exception):
+            # Only update state if its unknown or from ping
+            # so we don't mark it as offline if we have a state
+            # from mDNS or MQTT
+            entries.async_set_state_if_source(entry, DNS_FAILURE_STATE)
+            return None
+
+        rtt = await prober.async_probe(result[0])
+        if rtt is not None:
+            entry.last_seen = time.time()
+            entry.rtt = rtt
+        # If we can reach it via ping, we always set it
+        # online, however if we can't reach it via ping
+        # we only set it to offline if the state is unknown
+        # or from ping
+        entries.async_set_state_if_online_or_source(
+            entry, bool_to_entry_state(rtt is not None, EntryStateSource.PING)
+        )
+        return rtt is not None
 
     async def async_run(self) -> None:
         """Run the ping status."""
         dashboard = self.dashboard
-        entries = dashboard.entries
         privileged = await _can_use_icmp_lib_with_privilege()
         if privileged is None:
             _LOGGER.warning("Cannot use icmplib because privileges are insufficient")
             return
 
-        while not dashboard.stop_event.is_set():
-            # Only ping if the dashboard is open
-            await dashboard.ping_request.wait()
-            dashboard.ping_request.clear()
-            iteration_start = time.monotonic()
-            current_entries = dashboard.entries.async_all()
-            to_ping: list[DashboardEntry] = []
-
-            for entry in current_entries:
-                if entry.address is None:
-                    # No address or we already have a state from another source
-                    # so no need to ping
-                    continue
-                if (
-                    entry.state.reachable is ReachableState.ONLINE
-                    and entry.state.source
-                    not in (EntryStateSource.PING, EntryStateSource.UNKNOWN)
-                ):
-                    # If we already have a state from another source and
-                    # it's online, we don't need to ping
-                    continue
-                to_ping.append(entry)
-
-            # Resolve DNS for all entries
-            entries_with_addresses: dict[DashboardEntry, list[str]] = {}
-            for ping_group in chunked(to_ping, GROUP_SIZE):
-                ping_group = cast(list[DashboardEntry], ping_group)
-                now_monotonic = time.monotonic()
-                dns_results = await asyncio.gather(
-                    *(
-                        dashboard.dns_cache.async_resolve(entry.address, now_monotonic)
-                        for entry in ping_group
-                    ),
-                    return_exceptions=True,
-                )
-
-                for entry, result in zip(ping_group, dns_results):
-                    if isinstance(result, Exception):
-                        # Only update state if its unknown or from ping
-                        # so we don't mark it as offline if we have a state
-                        # from mDNS or MQTT
-                        entries.async_set_state_if_source(entry, DNS_FAILURE_STATE)
-                        continue
-                    if isinstance(result, BaseException):
-                        raise result
-                    entries_with_addresses[entry] = result
-
-            # Ping all entries with valid addresses
-            for ping_group in chunked(entries_with_addresses.items(), GROUP_SIZE):
-                entry_addresses = cast(tuple[DashboardEntry, list[str]], ping_group)
-
+        prober = ICMPProber(privileged)
+        try:
+            while not dashboard.stop_event.is_set():
+                # Only ping if the dashboard is open
+                await dashboard.ping_request.wait()
+                dashboard.ping_request.clear()
+                iteration_start = time.monotonic()
+                due = self._async_pop_due(iteration_start)
                 results = await asyncio.gather(
-                    *(
-                        async_ping(addresses[0], privileged=privileged)
-                        for _, addresses in entry_addresses
-                    ),
+                    *(self._async_ping_entry(prober, entry) for entry in due),
                     return_exceptions=True,
                 )
-
-                for entry_addresses, result in zip(entry_addresses, results):
+                for entry, result in zip(due, results):
                     if isinstance(result, Exception):
-                        ping_result = False
+                        _LOGGER.error("Error pinging %s: %s", entry.path, result)
                     elif isinstance(result, BaseException):
                         raise result
-                    else:
-                        host: Host = result
-                        ping_result = host.is_alive
-                    entry: DashboardEntry = entry_addresses[0]
-                    # If we can reach it via ping, we always set it
-                    # online, however if we can't reach it via ping
-                    # we only set it to offline if the state is unknown
-                    # or from ping
-                    entries.async_set_state_if_online_or_source(
-                        entry,
-                        bool_to_entry_state(ping_result, EntryStateSource.PING),
-                    )
-
-            if not dashboard.stop_event.is_set():
-                iteration_duration = time.monotonic() - iteration_start
-                if iteration_duration < MIN_PING_INTERVAL:
-                    await asyncio.sleep(MIN_PING_INTERVAL - iteration_duration)
+
+                if not dashboard.stop_event.is_set():
+                    iteration_duration = time.monotonic() - iteration_start
+                    if iteration_duration < MIN_PING_INTERVAL:
+                        await asyncio.sleep(MIN_PING_INTERVAL - iteration_duration)
+        finally:
+            await prober.async_close()
 
 
 async def _can_use_icmp_lib_with_privilege() -> None | bool:
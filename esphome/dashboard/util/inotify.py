@@ -0,0 +1,156 @@
+"""Watch directories for changed files with inotify.
+
+Only available on Linux, DirectoryWatcher.async_start returns False elsewhere so
+the caller can fall back to polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+
+_LOGGER = logging.getLogger(__name__)
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+class DirectoryWatcher:
+    """Reports the names of the files that changed in a set of directories.
+
+    ``on_change`` is called with the directory and the file name for every
+    change. It is called with a file name of None if changes may have been
+    missed, for example when the kernel queue overflowed or a watched directory
+    was replaced, and everything has to be checked again.
+
+    ``on_stop`` is called if a watched directory was removed and can't be
+    watched again, the watcher has stopped then.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[str, str | None], None],
+        on_stop: Callable[[], None],
+    ) -> None:
+        self._on_change = on_change
+        self._on_stop = on_stop
+        self._libc: ctypes.CDLL | None = None
+        self._fd: int | None = None
+        self._watches: dict[int, str] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def async_start(self, directories: list[str]) -> bool:
+        """Start watching the directories, return False if not possible."""
+        if (libc := _load_libc()) is None:
+            return False
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            _LOGGER.debug("inotify_init1 failed: %s", os.strerror(ctypes.get_errno()))
+            return False
+        self._libc = libc
+        self._fd = fd
+        for directory in directories:
+            if not self._add_watch(directory):
+                os.close(fd)
+                self._fd = None
+                self._watches.clear()
+                return False
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._async_read_events)
+        return True
+
+    def _add_watch(self, directory: str) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            _LOGGER.debug(
+                "Cannot watch %s: %s", directory, os.strerror(ctypes.get_errno())
+            )
+            return False
+        self._watches[wd] = directory
+        return True
+
+    def stop(self) -> None:
+        """Stop watching."""
+        if self._fd is None:
+            return
+        self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+        self._watches.clear()
+
+    def _async_read_events(self) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except OSError as err:
+            if err.errno in (errno.EAGAIN, errno.EINTR):
+                return
+            raise
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                for directory in set(self._watches.values()):
+                    self._on_change(directory, None)
+                continue
+            if (directory := self._watches.get(wd)) is None:
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                # The watch is gone or follows the directory to its new name,
+                # watch whatever is at the path now
+                del self._watches[wd]
+                self._libc.inotify_rm_watch(self._fd, wd)
+                if not self._add_watch(directory):
+                    self.stop()
+                    self._on_stop()
+                    return
+                self._on_change(directory, None)
+                continue
+            if name:
+                self._on_change(directory, os.fsdecode(name))
@@ -3,9 +3,9 @@ from __future__ import annotations
 import asyncio
 import base64
 from collections.abc import Callable, Iterable
+import contextlib
 import datetime
 import functools
-import gzip
 import hashlib
 import importlib
 import json
@@ -16,9 +16,9 @@ import secrets
 import shutil
 import subprocess
 import threading
-import time
 from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlparse
+import zlib
 
 import tornado
 import tornado.concurrent
@@ -37,7 +37,8 @@ import voluptuous as vol
 import yaml
 from yaml.nodes import Node
 
-from esphome import const, platformio_api, yaml_util
+from esphome import const, espota2, platformio_api, yaml_util
+from esphome.core import EsphomeError
 from esphome.helpers import get_bool_env, mkdir_p, sort_ip_addresses
 from esphome.storage_json import (
     StorageJSON,
@@ -48,11 +49,10 @@ from esphome.storage_json import (
 from esphome.util import get_serial_ports, shlex_quote
 from esphome.yaml_util import FastestAvailableSafeLoader
 
-from .const import DASHBOARD_COMMAND
+from .const import DASHBOARD_COMMAND, EVENT_IMPORTABLE_CHANGED
 from .core import DASHBOARD
 from .entries import UNKNOWN_STATE, entry_state_to_bool
 from .util.file import write_file
-from .util.subprocess import async_run_system_command
 from .util.text import friendly_name_slugify
 
 if TYPE_CHECKING:
@@ -66,6 +66,13 @@ COOKIE_AUTHENTICATED_YES = b"yes"
 
 AUTH_COOKIE_NAME = "authenticated"
 
+# Size of the blocks binaries are streamed to clients in
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# How often the devices are checked while the events websocket is open, like
+# the device list polls /ping
+EVENTS_STATUS_INTERVAL = 5
+
 
 settings = DASHBOARD.settings
 
@@ -134,9 +141,35 @@ def bind_config(func):
     return decorator
 
 
+def is_trusted_origin(origin: str) -> bool:
+    """Check if a websocket origin is in ESPHOME_TRUSTED_DOMAINS."""
+    trusted_domains = [
+        s.strip() for s in os.environ["ESPHOME_TRUSTED_DOMAINS"].split(",")
+    ]
+    url = urlparse(origin)
+    if url.hostname in trusted_domains:
+        return True
+    _LOGGER.info("check_origin %s, domain is not trusted", origin)
+    return False
+
+
+def request_status_update() -> None:
+    """Ask the status sources to check the devices again."""
+    DASHBOARD.ping_request.set()
+    if settings.status_use_mqtt:
+        DASHBOARD.mqtt_ping_request.set()
+
+
 # pylint: disable=abstract-method
 class BaseHandler(tornado.web.RequestHandler):
-    pass
+    def write_versioned_json(self, body: str, etag: str) -> None:
+        """Write a JSON body, or 304 if the client already has this version."""
+        self.set_header("content-type", "application/json")
+        self.set_header("Etag", f'"{etag}"')
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        self.write(body)
 
 
 def websocket_class(cls):
@@ -173,6 +206,7 @@ class EsphomeCommandWebSocket(tornado.websocket.WebSocketHandler):
         """Initialize the websocket."""
         super().__init__(application, request, **kwargs)
         self._proc = None
+        self._worker_task: asyncio.Task | None = None
         self._queue = None
         self._is_closed = False
         # Windows doesn't support non-blocking pipes,
@@ -182,14 +216,7 @@ class EsphomeCommandWebSocket(tornado.websocket.WebSocketHandler):
     def check_origin(self, origin):
         if "ESPHOME_TRUSTED_DOMAINS" not in os.environ:
             return super().check_origin(origin)
-        trusted_domains = [
-            s.strip() for s in os.environ["ESPHOME_TRUSTED_DOMAINS"].split(",")
-        ]
-        url = urlparse(origin)
-        if url.hostname in trusted_domains:
-            return True
-        _LOGGER.info("check_origin %s, domain is not trusted", origin)
-        return False
+        return is_trusted_origin(origin)
 
     def open(self, *args: str, **kwargs: str) -> None:
         """Handle new WebSocket connection."""
@@ -215,12 +242,19 @@ class EsphomeCommandWebSocket(tornado.websocket.WebSocketHandler):
 
     @websocket_method("spawn")
     async def handle_spawn(self, json_message: dict[str, Any]) -> None:
-        if self._proc is not None:
+        if self._proc is not None or self._worker_task is not None:
             # spawn can only be called once
             return
         command = await self.build_command(json_message)
         _LOGGER.info("Running command '%s'", " ".join(shlex_quote(x) for x in command))
 
+        workers = DASHBOARD.workers
+        if workers.size > 0 and self.runs_in_worker(json_message):
+            self._worker_task = DASHBOARD.async_create_background_task(
+                self._run_in_worker(command)
+            )
+            return
+
         if self._use_popen:
             self._queue = tornado.queues.Queue()
             # pylint: disable=consider-using-with
@@ -245,6 +279,12 @@ class EsphomeCommandWebSocket(tornado.websocket.WebSocketHandler):
 
         tornado.ioloop.IOLoop.current().spawn_callback(self._redirect_stdout)
 
+    async def _run_in_worker(self, command: list[str]) -> None:
+        returncode = await DASHBOARD.workers.async_run(
+            command, lambda _, text: self.write_message({"event": "line", "data": text})
+        )
+        self._proc_on_exit(returncode)
+
     @property
     def is_process_active(self) -> bool:
         return self._proc is not None and self._proc.returncode is None
@@ -305,12 +345,21 @@ class EsphomeCommandWebSocket(tornado.websocket.WebSocketHandler):
                 self._proc.terminate()
             else:
                 self._proc.proc.terminate()
+        if self._worker_task is not None:
+            self._worker_task.cancel()
         # Shutdown proc on WS close
         self._is_closed = True
 
     async def build_command(self, json_message: dict[str, Any]) -> list[str]:
         raise NotImplementedError
 
+    def runs_in_worker(self, json_message: dict[str, Any]) -> bool:
+        """Return if the command can run in the shared worker pool.
+
+        Only commands that don't need stdin and don't outlive the request qualify.
+        """
+        return False
+
 
 class EsphomePortCommandWebSocket(EsphomeCommandWebSocket):
     """Base class for commands that require a port."""
@@ -319,11 +368,20 @@ class EsphomePortCommandWebSocket(EsphomeCommandWebSocket):
         self, args: list[str], json_message: dict[str, Any]
     ) -> list[str]:
         """Build the command to run."""
+        config_file = settings.rel_path(json_message["configuration"])
+        port = await self.async_resolve_port(config_file, json_message["port"])
+        return [
+            *DASHBOARD_COMMAND,
+            *args,
+            config_file,
+            "--device",
+            port,
+        ]
+
+    async def async_resolve_port(self, config_file: str, port: str) -> str:
+        """Replace OTA by the address of the device if it is known."""
         dashboard = DASHBOARD
         entries = dashboard.entries
-        configuration = json_message["configuration"]
-        config_file = settings.rel_path(configuration)
-        port = json_message["port"]
         if (
             port == "OTA"  # pylint: disable=too-many-boolean-expressions
             and (entry := entries.get(config_file))
@@ -341,7 +399,7 @@ class EsphomePortCommandWebSocket(EsphomeCommandWebSocket):
                 entry.address
                 and (
                     address_list := await dashboard.dns_cache.async_resolve(
-                        entry.address, time.monotonic()
+                        entry.address
                     )
                 )
                 and not isinstance(address_list, Exception)
@@ -349,13 +407,7 @@ class EsphomePortCommandWebSocket(EsphomeCommandWebSocket):
                 # If mdns is not available, try to use the DNS cache
                 port = sort_ip_addresses(address_list)[0]
 
-        return [
-            *DASHBOARD_COMMAND,
-            *args,
-            config_file,
-            "--device",
-            port,
-        ]
+        return port
 
 
 class EsphomeLogsHandler(EsphomePortCommandWebSocket):
@@ -391,8 +443,18 @@ class EsphomeRenameHandler(EsphomeCommandWebSocket):
 
 class EsphomeUploadHandler(EsphomePortCommandWebSocket):
     async def build_command(self, json_message: dict[str, Any]) -> list[str]:
-        """Build the command to run."""
-        return await self.build_device_command(["upload"], json_message)
+        """Build the command to run.
+
+        The port can also be a list to upload to several devices at once.
+        """
+        ports = json_message["port"]
+        if not isinstance(ports, list):
+            return await self.build_device_command(["upload"], json_message)
+        config_file = settings.rel_path(json_message["configuration"])
+        command = [*DASHBOARD_COMMAND, "upload", config_file]
+        for port in ports:
+            command += ["--device", await self.async_resolve_port(config_file, port)]
+        return command
 
 
 class EsphomeRunHandler(EsphomePortCommandWebSocket):
@@ -410,6 +472,9 @@ class EsphomeCompileHandler(EsphomeCommandWebSocket):
         command.append(config_file)
         return command
 
+    def runs_in_worker(self, json_message: dict[str, Any]) -> bool:
+        return json_message.get("only_generate", False)
+
 
 class EsphomeValidateHandler(EsphomeCommandWebSocket):
     async def build_command(self, json_message: dict[str, Any]) -> list[str]:
@@ -419,6 +484,9 @@ class EsphomeValidateHandler(EsphomeCommandWebSocket):
             command.append("--show-secrets")
         return command
 
+    def runs_in_worker(self, json_message: dict[str, Any]) -> bool:
+        return True
+
 
 class EsphomeCleanMqttHandler(EsphomeCommandWebSocket):
     async def build_command(self, json_message: dict[str, Any]) -> list[str]:
@@ -586,6 +654,7 @@ class IgnoreDeviceRequestHandler(BaseHandler):
             dashboard.ignored_devices.add(ignored_device.device_name)
         else:
             dashboard.ignored_devices.discard(ignored_device.device_name)
+        dashboard.bus.async_fire(EVENT_IMPORTABLE_CHANGED, {})
 
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, dashboard.save_ignored_devices)
@@ -651,14 +720,73 @@ class DownloadListRequestHandler(BaseHandler):
         return json.dumps(downloads)
 
 
+# Compressed copies of downloadable files, by path, with the stat key of the file
+# they were compressed from
+_COMPRESSED_FILES: dict[str, tuple[tuple[int, int, int, int], str]] = {}
+
+
+def _get_compressed_file(path: str) -> str:
+    """Return the path of the gzip compressed file, compress it if it changed."""
+    stat = os.stat(path)
+    key = (stat.st_ino, stat.st_dev, stat.st_mtime_ns, stat.st_size)
+    cached = _COMPRESSED_FILES.get(path)
+    if cached is not None and cached[0] == key and os.path.isfile(cached[1]):
+        return cached[1]
+    compressed_path = espota2.get_compressed_firmware(path)
+    _COMPRESSED_FILES[path] = (key, compressed_path)
+    return compressed_path
+
+
+def _parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    """Return the start and end of a single byte range, None if unsatisfiable."""
+    unit, _, spec = header.partition("=")
+    first, sep, last = spec.strip().partition("-")
+    if unit.strip() != "bytes" or not sep or "," in spec:
+        return None
+    try:
+        if not first:
+            # The last bytes of the file
+            length = int(last)
+            return (max(size - length, 0), size) if length > 0 else None
+        start = int(first)
+        end = int(last) + 1 if last else size
+    except ValueError:
+        return None
+    if start >= size or end <= start:
+        return None
+    return start, min(end, size)
+
+
 class DownloadBinaryRequestHandler(BaseHandler):
-    def _load_file(self, path: str, compressed: bool) -> bytes:
-        """Load a file from disk and compress it if requested."""
-        with open(path, "rb") as f:
-            data = f.read()
-            if compressed:
-                return gzip.compress(data, 9)
-            return data
+    async def _async_find_extra_image(
+        self, configuration: str, storage_json: StorageJSON, file_name: str
+    ) -> str | None:
+        """Return the path of an extra flash image, None if it does not exist."""
+        loop = asyncio.get_running_loop()
+        idedata = None
+        if storage_json.build_path is not None:
+            idedata = await loop.run_in_executor(
+                None,
+                platformio_api.load_cached_idedata,
+                storage_json.build_path,
+                storage_json.name,
+            )
+        if idedata is None:
+            args = ["esphome", "idedata", settings.rel_path(configuration)]
+            rc, stdout, _ = await DASHBOARD.workers.async_run_command(args)
+
+            if rc != 0:
+                self.send_error(404 if rc == 2 else 500)
+                return None
+
+            idedata = platformio_api.IDEData(json.loads(stdout))
+
+        for image in idedata.extra_flash_images:
+            if image.path.endswith(file_name):
+                return image.path
+
+        self.send_error(404)
+        return None
 
     @authenticated
     @bind_config
@@ -689,41 +817,70 @@ class DownloadBinaryRequestHandler(BaseHandler):
         path = os.path.join(path, file_name)
 
         if not Path(path).is_file():
-            args = ["esphome", "idedata", settings.rel_path(configuration)]
-            rc, stdout, _ = await async_run_system_command(args)
-
-            if rc != 0:
-                self.send_error(404 if rc == 2 else 500)
-                return
-
-            idedata = platformio_api.IDEData(json.loads(stdout))
-
-            found = False
-            for image in idedata.extra_flash_images:
-                if image.path.endswith(file_name):
-                    path = image.path
-                    download_name = file_name
-                    found = True
-                    break
-
-            if not found:
-                self.send_error(404)
+            path = await self._async_find_extra_image(
+                configuration, storage_json, file_name
+            )
+            if path is None:
                 return
+            download_name = file_name
 
         download_name = download_name + ".gz" if compressed else download_name
 
-        self.set_header("Content-Type", "application/octet-stream")
-        self.set_header(
-            "Content-Disposition", f'attachment; filename="{download_name}"'
-        )
-        self.set_header("Cache-Control", "no-cache")
-        if not Path(path).is_file():
+        try:
+            if compressed:
+                path = await loop.run_in_executor(None, _get_compressed_file, path)
+            file_handle = await loop.run_in_executor(None, open, path, "rb")
+        except OSError:
             self.send_error(404)
             return
 
-        data = await loop.run_in_executor(None, self._load_file, path, compressed)
-        self.write(data)
+        with file_handle:
+            stat = os.fstat(file_handle.fileno())
+            self.set_header("Content-Type", "application/octet-stream")
+            self.set_header(
+                "Content-Disposition", f'attachment; filename="{download_name}"'
+            )
+            self.set_header("Cache-Control", "no-cache")
+            self.set_header("Accept-Ranges", "bytes")
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            self.set_header("Etag", etag)
+            if self.check_etag_header():
+                self.set_status(304)
+                self.finish()
+                return
+
+            start, end = 0, stat.st_size
+            range_header = self.request.headers.get("Range")
+            # A range of a file that changed since is useless to the client
+            if range_header is not None and (
+                self.request.headers.get("If-Range", etag) == etag
+            ):
+                byte_range = _parse_byte_range(range_header, stat.st_size)
+                if byte_range is None:
+                    # send_error() would clear the Content-Range header
+                    self.set_status(416)
+                    self.clear_header("Content-Disposition")
+                    self.set_header("Content-Range", f"bytes */{stat.st_size}")
+                    self.finish()
+                    return
+                start, end = byte_range
+                self.set_status(206)
+                self.set_header(
+                    "Content-Range", f"bytes {start}-{end - 1}/{stat.st_size}"
+                )
+            self.set_header("Content-Length", end - start)
 
+            file_handle.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = await loop.run_in_executor(
+                    None, file_handle.read, min(DOWNLOAD_CHUNK_SIZE, remaining)
+                )
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                self.write(chunk)
+                await self.flush()
         self.finish()
 
 
@@ -735,36 +892,108 @@ class EsphomeVersionHandler(BaseHandler):
         self.finish()
 
 
+def get_configured_devices() -> list[dict[str, Any]]:
+    """Return the configured devices."""
+    return [entry.to_dict() for entry in DASHBOARD.entries.async_all()]
+
+
+def get_importable_devices() -> list[dict[str, Any]]:
+    """Return the discovered devices that are not configured yet."""
+    return DASHBOARD.get_importable_devices()
+
+
+def get_devices_data() -> dict[str, Any]:
+    """Return the configured and importable devices."""
+    return {
+        "configured": get_configured_devices(),
+        "importable": get_importable_devices(),
+    }
+
+
 class ListDevicesHandler(BaseHandler):
     @authenticated
     async def get(self) -> None:
         dashboard = DASHBOARD
         await dashboard.entries.async_request_update_entries()
-        entries = dashboard.entries.async_all()
-        self.set_header("content-type", "application/json")
-        configured = {entry.name for entry in entries}
+        configured, etag = dashboard.entries_snapshot.async_get(
+            "devices", get_configured_devices
+        )
+        # Discovered devices change without entry events, but there are few
+        importable = json.dumps(get_importable_devices())
+        self.write_versioned_json(
+            f'{{"configured": {configured}, "importable": {importable}}}',
+            f"{etag}-{zlib.crc32(importable.encode()):08x}",
+        )
 
-        self.write(
-            json.dumps(
-                {
-                    "configured": [entry.to_dict() for entry in entries],
-                    "importable": [
-                        {
-                            "name": res.device_name,
-                            "friendly_name": res.friendly_name,
-                            "package_import_url": res.package_import_url,
-                            "project_name": res.project_name,
-                            "project_version": res.project_version,
-                            "network": res.network,
-                            "ignored": res.device_name in dashboard.ignored_devices,
-                        }
-                        for res in dashboard.import_result.values()
-                        if res.device_name not in configured
-                    ],
-                }
-            )
+
+class DashboardEventsWebSocket(tornado.websocket.WebSocketHandler):
+    """Streams the devices and batched changes to them to the device list.
+
+    The first message has the devices and their states, every following one
+    has the entries added, updated and removed and the states that changed
+    since the previous one, and the importable devices if they may have
+    changed. While connected, the devices are checked as if
+    /ping was polled.
+    """
+
+    def __init__(
+        self,
+        application: tornado.web.Application,
+        request: tornado.httputil.HTTPServerRequest,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the websocket."""
+        super().__init__(application, request, **kwargs)
+        self._unsubscribe: Callable[[], None] | None = None
+        self._status_timer: asyncio.TimerHandle | None = None
+
+    def check_origin(self, origin):
+        if "ESPHOME_TRUSTED_DOMAINS" not in os.environ:
+            return super().check_origin(origin)
+        return is_trusted_origin(origin)
+
+    @authenticated
+    async def get(self, *args: Any, **kwargs: Any) -> None:
+        await super().get(*args, **kwargs)
+
+    async def open(self, *args: str, **kwargs: str) -> None:
+        """Send the current devices and subscribe to changes."""
+        self.set_nodelay(True)
+        dashboard = DASHBOARD
+        # Subscribe first, so no change during the update is lost
+        self._unsubscribe = dashboard.entry_events.async_subscribe(
+            self._async_send_message
+        )
+        await dashboard.entries.async_request_update_entries()
+        if self._unsubscribe is None:
+            # Closed in the meantime
+            return
+        data = get_devices_data()
+        data["states"] = {
+            entry.filename: entry_state_to_bool(entry.state)
+            for entry in dashboard.entries.async_all()
+        }
+        self.write_message({"event": "initial_state", "data": data})
+        self._async_request_status_update()
+
+    def _async_request_status_update(self) -> None:
+        request_status_update()
+        self._status_timer = asyncio.get_running_loop().call_later(
+            EVENTS_STATUS_INTERVAL, self._async_request_status_update
         )
 
+    def _async_send_message(self, message: str) -> None:
+        with contextlib.suppress(tornado.websocket.WebSocketClosedError):
+            self.write_message(message)
+
+    def on_close(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._status_timer is not None:
+            self._status_timer.cancel()
+            self._status_timer = None
+
 
 class MainRequestHandler(BaseHandler):
     @authenticated
@@ -784,33 +1013,40 @@ class MainRequestHandler(BaseHandler):
         )
 
 
+def get_prometheus_targets() -> list[dict[str, Any]]:
+    """Return the Prometheus targets of the devices with a web server."""
+    sd = []
+    for entry in DASHBOARD.entries.async_all():
+        if entry.web_port is None:
+            continue
+        labels = {
+            "__meta_name": entry.name,
+            "__meta_esp_platform": entry.target_platform,
+            "__meta_esphome_version": entry.storage.esphome_version,
+        }
+        for integration in entry.storage.loaded_integrations:
+            labels[f"__meta_integration_{integration}"] = "true"
+        sd.append(
+            {
+                "targets": [
+                    f"{entry.address}:{entry.web_port}",
+                ],
+                "labels": labels,
+            }
+        )
+    return sd
+
+
 class PrometheusServiceDiscoveryHandler(BaseHandler):
     @authenticated
     async def get(self) -> None:
         dashboard = DASHBOARD
         await dashboard.entries.async_request_update_entries()
-        entries = dashboard.entries.async_all()
-        self.set_header("content-type", "application/json")
-        sd = []
-        for entry in entries:
-            if entry.web_port is None:
-                continue
-            labels = {
-                "__meta_name": entry.name,
-                "__meta_esp_platform": entry.target_platform,
-                "__meta_esphome_version": entry.storage.esphome_version,
-            }
-            for integration in entry.storage.loaded_integrations:
-                labels[f"__meta_integration_{integration}"] = "true"
-            sd.append(
-                {
-                    "targets": [
-                        f"{entry.address}:{entry.web_port}",
-                    ],
-                    "labels": labels,
-                }
+        self.write_versioned_json(
+            *dashboard.entries_snapshot.async_get(
+                "prometheus-sd", get_prometheus_targets
             )
-        self.write(json.dumps(sd))
+        )
 
 
 class BoardsRequestHandler(BaseHandler):
@@ -858,9 +1094,7 @@ class PingRequestHandler(BaseHandler):
     @authenticated
     def get(self) -> None:
         dashboard = DASHBOARD
-        dashboard.ping_request.set()
-        if settings.status_use_mqtt:
-            dashboard.mqtt_ping_request.set()
+        request_status_update()
         self.set_header("content-type", "application/json")
 
         self.write(
@@ -873,6 +1107,21 @@ class PingRequestHandler(BaseHandler):
         )
 
 
+class PingStatsRequestHandler(BaseHandler):
+    @authenticated
+    def get(self) -> None:
+        """Return when each device last answered a ping and its round trip time."""
+        self.set_header("content-type", "application/json")
+        self.write(
+            json.dumps(
+                {
+                    entry.filename: {"last_seen": entry.last_seen, "rtt": entry.rtt}
+                    for entry in DASHBOARD.entries.async_all()
+                }
+            )
+        )
+
+
 class InfoRequestHandler(BaseHandler):
     @authenticated
     @bind_config
@@ -1096,19 +1345,38 @@ class JsonConfigRequestHandler(BaseHandler):
             self.send_error(404)
             return
 
-        args = ["esphome", "config", filename, "--show-secrets"]
-
-        rc, stdout, _ = await async_run_system_command(args)
+        dashboard = DASHBOARD
+        if dashboard.workers.size > 0:
+            try:
+                json_config = await dashboard.json_configs.async_get(
+                    dashboard.workers, filename, dashboard.settings.config_cache
+                )
+            except EsphomeError as err:
+                _LOGGER.error("Error loading configuration %s: %s", filename, err)
+                json_config = None
+        else:
+            json_config = await self._async_load_json_config(filename)
 
-        if rc != 0:
+        if json_config is None:
             self.send_error(422)
             return
 
-        data = yaml.load(stdout, Loader=SafeLoaderIgnoreUnknown)
         self.set_header("content-type", "application/json")
-        self.write(json.dumps(data))
+        self.write(json_config)
         self.finish()
 
+    async def _async_load_json_config(self, filename: str) -> str | None:
+        """Load the configuration in a new process, used without workers."""
+        args = ["esphome", "config", filename, "--show-secrets"]
+
+        rc, stdout, _ = await DASHBOARD.workers.async_run_command(args)
+
+        if rc != 0:
+            return None
+
+        data = yaml.load(stdout, Loader=SafeLoaderIgnoreUnknown)
+        return json.dumps(data)
+
 
 def get_base_frontend_path() -> str:
     if ENV_DEV not in os.environ:
@@ -1213,6 +1481,7 @@ def make_app(debug=get_bool_env(ENV_DEV)) -> tornado.web.Application:
             (f"{rel}download.bin", DownloadBinaryRequestHandler),
             (f"{rel}serial-ports", SerialPortRequestHandler),
             (f"{rel}ping", PingRequestHandler),
+            (f"{rel}ping-stats", PingStatsRequestHandler),
             (f"{rel}delete", ArchiveRequestHandler),
             (f"{rel}undo-delete", UnArchiveRequestHandler),
             (f"{rel}archive", ArchiveRequestHandler),
@@ -1220,6 +1489,7 @@ def make_app(debug=get_bool_env(ENV_DEV)) -> tornado.web.Application:
             (f"{rel}wizard", WizardRequestHandler),
             (f"{rel}static/(.*)", StaticFileHandler, {"path": get_static_path()}),
             (f"{rel}devices", ListDevicesHandler),
+            (f"{rel}events", DashboardEventsWebSocket),
             (f"{rel}import", ImportRequestHandler),
             (f"{rel}secret_keys", SecretKeysRequestHandler),
             (f"{rel}json-config", JsonConfigRequestHandler),
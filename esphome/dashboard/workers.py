@@ -0,0 +1,259 @@
+"""Pool of long-lived processes running esphome commands for the dashboard.
+
+Spawning a new ``esphome`` process for every validation, idedata or only-generate
+request pays for the interpreter startup and for importing esphome and the libraries
+the components use over and over again. The workers of this pool stay alive between
+jobs, so those are only imported once per worker.
+
+The components themselves are imported again by every job, as a configuration may
+replace any of them with an external or custom component.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import importlib
+import io
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection
+import sys
+from typing import Any
+
+from esphome.core import EsphomeError
+
+from .util.subprocess import async_run_system_command
+
+_LOGGER = logging.getLogger(__name__)
+
+OutputCallback = Callable[[str, str], None]
+
+
+class _ConnectionWriter(io.TextIOBase):
+    """Text stream that sends every complete line over a connection."""
+
+    def __init__(self, conn: Connection, stream: str) -> None:
+        super().__init__()
+        self._conn = conn
+        self._stream = stream
+        self._buffer = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        if "\n" in text:
+            *lines, self._buffer = self._buffer.split("\n")
+            for line in lines:
+                self._conn.send((self._stream, f"{line}\n"))
+        return len(text)
+
+    def send_remaining(self) -> None:
+        """Send the output that is not terminated by a newline yet."""
+        if self._buffer:
+            self._conn.send((self._stream, self._buffer))
+            self._buffer = ""
+
+
+def _reset_logging() -> None:
+    """Undo the logging setup of the previous job, so the next one can set it up."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.setLevel(logging.WARNING)
+    logging.getLogger("esphome").setLevel(logging.NOTSET)
+    logging.disable(logging.NOTSET)
+
+
+def _worker_main(conn: Connection, preload: list[str]) -> None:
+    """Entry point of a worker process."""
+    # pylint: disable=import-outside-toplevel
+    from esphome import loader
+    from esphome.__main__ import run_esphome
+    from esphome.core import CORE, EsphomeError
+
+    # Imports the libraries of the components, the components are imported
+    # again by every job
+    for name in preload:
+        try:
+            importlib.import_module(f"esphome.components.{name}")
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    # Replaced before the first command configures logging, so the log handler
+    # writes to the connection as well
+    stdout = sys.stdout = _ConnectionWriter(conn, "stdout")
+    stderr = sys.stderr = _ConnectionWriter(conn, "stderr")
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        CORE.reset()
+        # Set up again from the arguments of the job
+        CORE.verbose = CORE.quiet = False
+        loader.reset_components()
+        _reset_logging()
+        if isinstance(job, tuple):
+            # A function call, see WorkerPool.async_call
+            func, args = job
+            try:
+                result = ("result", func(*args))
+            except Exception as err:  # pylint: disable=broad-except
+                logging.getLogger("esphome").exception("Unexpected error")
+                result = ("error", str(err))
+        else:
+            try:
+                result = ("exit", run_esphome(job))
+            except EsphomeError as err:
+                logging.getLogger("esphome").error(err)
+                result = ("exit", 1)
+            except SystemExit as err:
+                # Raised by argparse for invalid arguments
+                result = ("exit", err.code if isinstance(err.code, int) else 1)
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger("esphome").exception("Unexpected error")
+                result = ("exit", 1)
+        stdout.send_remaining()
+        stderr.send_remaining()
+        conn.send(result)
+
+
+class _Worker:
+    """A single worker process and the connection to it."""
+
+    __slots__ = ("process", "conn")
+
+    def __init__(self, context, preload: list[str]) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, preload),
+            name="esphome-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        # The connection is left open, a thread may still be blocked reading
+        # from it until it sees the end of the terminated process
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+class WorkerPool:
+    """Runs esphome commands in a pool of long-lived worker processes."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize the pool, workers are started by async_start."""
+        self.size = size
+        # Forking the dashboard with its running event loop and threads is not safe
+        self._context = multiprocessing.get_context("spawn")
+        self._preload: list[str] = []
+        self._idle: asyncio.Queue[_Worker] = asyncio.Queue()
+        self._workers: set[_Worker] = set()
+
+    async def async_start(self, preload: Iterable[str] = ()) -> None:
+        """Start the workers, importing the given components in advance."""
+        self._preload = sorted(set(preload))
+        loop = asyncio.get_running_loop()
+        for _ in range(self.size - len(self._workers)):
+            worker = await loop.run_in_executor(None, self._start_worker)
+            self._idle.put_nowait(worker)
+
+    def _start_worker(self) -> _Worker:
+        worker = _Worker(self._context, self._preload)
+        self._workers.add(worker)
+        return worker
+
+    def _replace_worker(self, worker: _Worker) -> _Worker:
+        self._workers.discard(worker)
+        worker.stop()
+        return self._start_worker()
+
+    def stop(self) -> None:
+        """Stop all workers."""
+        for worker in self._workers:
+            worker.stop()
+        self._workers.clear()
+
+    async def _async_run_job(
+        self, job: list[str] | tuple, on_output: OutputCallback | None
+    ) -> tuple[str, Any]:
+        """Run a job in a worker and return its final message.
+
+        If the call is cancelled or ``on_output`` raises, the worker is killed
+        and replaced as it is still in the middle of the job.
+        """
+        loop = asyncio.get_running_loop()
+        worker = await self._idle.get()
+        try:
+            try:
+                worker.conn.send(job)
+            except OSError as err:
+                worker = self._replace_worker(worker)
+                return "error", f"Worker died: {err}"
+            while True:
+                try:
+                    stream, data = await loop.run_in_executor(None, worker.conn.recv)
+                except (EOFError, OSError) as err:
+                    worker = self._replace_worker(worker)
+                    return "error", f"Worker died: {err}"
+                if stream in ("exit", "result", "error"):
+                    return stream, data
+                if on_output is not None:
+                    on_output(stream, data)
+        except BaseException:
+            worker = self._replace_worker(worker)
+            raise
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def async_run(
+        self, command: list[str], on_output: OutputCallback | None = None
+    ) -> int:
+        """Run an esphome command in a worker and return its exit code.
+
+        ``on_output`` is called with the stream name ("stdout" or "stderr") and
+        each line the command writes.
+        """
+        kind, data = await self._async_run_job(command, on_output)
+        if kind == "error":
+            _LOGGER.error("Running '%s' failed: %s", " ".join(command), data)
+            return 1
+        return data
+
+    async def async_call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call a module level function in a worker and return its result.
+
+        The arguments and the result have to be picklable. Raises EsphomeError
+        if the function raised.
+        """
+        kind, data = await self._async_run_job((func, args), None)
+        if kind == "error":
+            raise EsphomeError(f"Calling {func.__name__} in a worker failed: {data}")
+        return data
+
+    async def async_run_command(self, command: list[str]) -> tuple[int, bytes, bytes]:
+        """Run an esphome command and return a tuple of returncode, stdout, stderr.
+
+        Falls back to a new process if the pool is disabled.
+        """
+        if self.size <= 0:
+            return await async_run_system_command(command)
+        output: dict[str, list[str]] = {"stdout": [], "stderr": []}
+        rc = await self.async_run(
+            command, lambda stream, data: output[stream].append(data)
+        )
+        return (
+            rc,
+            "".join(output["stdout"]).encode(),
+            "".join(output["stderr"]).encode(),
+        )
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import gzip
 import hashlib
 import io
 import logging
+import os
+from pathlib import Path
 import random
+import shutil
 import socket
 import sys
+import tempfile
 import time
 
 from esphome.core import EsphomeError
@@ -48,6 +54,13 @@ FEATURE_SUPPORTS_COMPRESSION = 0x01
 
 UPLOAD_BLOCK_SIZE = 8192
 UPLOAD_BUFFER_SIZE = UPLOAD_BLOCK_SIZE * 8
+# Number of blocks sent ahead of the chunk acknowledgements of OTA version 2
+UPLOAD_WINDOW_BLOCKS = UPLOAD_BUFFER_SIZE // UPLOAD_BLOCK_SIZE
+
+CONNECT_TIMEOUT = 10.0
+UPLOAD_TIMEOUT = 30.0
+# Time to wait for a connection attempt before also trying the next address
+HAPPY_EYEBALLS_DELAY = 0.25
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -80,38 +93,6 @@ class OTAError(EsphomeError):
     pass
 
 
-def recv_decode(sock, amount, decode=True):
-    data = sock.recv(amount)
-    if not decode:
-        return data
-    return list(data)
-
-
-def receive_exactly(sock, amount, msg, expect, decode=True):
-    if decode:
-        data = []
-    else:
-        data = b""
-
-    try:
-        data += recv_decode(sock, 1, decode=decode)
-    except OSError as err:
-        raise OTAError(f"Error receiving acknowledge {msg}: {err}") from err
-
-    try:
-        check_error(data, expect)
-    except OTAError as err:
-        sock.close()
-        raise OTAError(f"Error {msg}: {err}") from err
-
-    while len(data) < amount:
-        try:
-            data += recv_decode(sock, amount - len(data), decode=decode)
-        except OSError as err:
-            raise OTAError(f"Error receiving {msg}: {err}") from err
-    return data
-
-
 def check_error(data, expect):
     if not expect:
         return
@@ -179,33 +160,151 @@ def check_error(data, expect):
         raise OTAError(f"Unexpected response from ESP: 0x{data[0]:02X}")
 
 
-def send_check(sock, data, msg):
-    try:
+def _hash_file(file_handle: io.IOBase, digest):
+    file_handle.seek(0)
+    while block := file_handle.read(UPLOAD_BUFFER_SIZE):
+        digest.update(block)
+    file_handle.seek(0)
+    return digest
+
+
+def _file_size(file_handle: io.IOBase) -> int:
+    size = file_handle.seek(0, os.SEEK_END)
+    file_handle.seek(0)
+    return size
+
+
+def get_compressed_firmware(filename: str) -> str:
+    """Return the path of the gzip compressed firmware.
+
+    The result is cached next to the firmware and only compressed again when the
+    firmware changed.
+    """
+    path = Path(f"{filename}.gz")
+    key_path = Path(f"{path}.sha256")
+    with open(filename, "rb") as file_handle:
+        key = _hash_file(file_handle, hashlib.sha256()).hexdigest()
+    with contextlib.suppress(OSError):
+        if key_path.read_text(encoding="utf-8") == key and path.is_file():
+            return str(path)
+        # The cached file is about to be replaced
+        key_path.unlink()
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp_handle:
+        try:
+            with (
+                open(filename, "rb") as file_handle,
+                gzip.GzipFile(
+                    filename="", mode="wb", fileobj=tmp_handle, compresslevel=9, mtime=0
+                ) as gzip_handle,
+            ):
+                shutil.copyfileobj(file_handle, gzip_handle, UPLOAD_BUFFER_SIZE)
+        except BaseException:
+            os.remove(tmp_handle.name)
+            raise
+    os.replace(tmp_handle.name, path)
+    key_path.write_text(key, encoding="utf-8")
+    return str(path)
+
+
+class _Connection:
+    """Stream of an OTA session with a timeout for every read and write."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.timeout = CONNECT_TIMEOUT
+
+    async def receive(self, amount, msg, expect, decode=True):
+        try:
+            data = await asyncio.wait_for(self.reader.readexactly(1), self.timeout)
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as err:
+            raise OTAError(f"Error receiving acknowledge {msg}: {err!r}") from err
+
+        try:
+            check_error(data, expect)
+        except OTAError as err:
+            raise OTAError(f"Error {msg}: {err}") from err
+
+        if amount > 1:
+            try:
+                data += await asyncio.wait_for(
+                    self.reader.readexactly(amount - 1), self.timeout
+                )
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as err:
+                raise OTAError(f"Error receiving {msg}: {err!r}") from err
+        if not decode:
+            return data
+        return list(data)
+
+    async def send(self, data, msg):
         if isinstance(data, (list, tuple)):
             data = bytes(data)
         elif isinstance(data, int):
             data = bytes([data])
         elif isinstance(data, str):
             data = data.encode("utf8")
+        try:
+            self.writer.write(data)
+            await asyncio.wait_for(self.writer.drain(), self.timeout)
+        except (OSError, asyncio.TimeoutError) as err:
+            raise OTAError(f"Error sending {msg}: {err!r}") from err
 
-        sock.sendall(data)
-    except OSError as err:
-        raise OTAError(f"Error sending {msg}: {err}") from err
+    def set_nodelay(self, enabled: bool) -> None:
+        sock = self.writer.get_extra_info("socket")
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(enabled))
 
 
-def perform_ota(
-    sock: socket.socket, password: str, file_handle: io.IOBase, filename: str
+async def _async_send_firmware(
+    conn: _Connection, file_handle: io.IOBase, size: int, version: int, progress
 ) -> None:
-    file_contents = file_handle.read()
-    file_size = len(file_contents)
-    _LOGGER.info("Uploading %s (%s bytes)", filename, file_size)
+    """Send the firmware block by block.
+
+    With OTA version 2 the device acknowledges every UPLOAD_BLOCK_SIZE bytes. Up
+    to UPLOAD_WINDOW_BLOCKS blocks are sent before waiting for their
+    acknowledgement, so the transfer doesn't wait a round trip per block.
+    """
+    window = UPLOAD_WINDOW_BLOCKS * UPLOAD_BLOCK_SIZE
+    sent = 0
+    acknowledged = 0
+    while sent < size:
+        # A new block every time, the transport may keep a reference to it
+        block = file_handle.read(UPLOAD_BLOCK_SIZE)
+        if not block:
+            raise OTAError("Firmware file is shorter than expected")
+        await conn.send(block, "data")
+        sent += len(block)
+
+        if version < OTA_VERSION_2_0:
+            progress.update(sent / size)
+            continue
+        while sent - acknowledged >= window or (sent == size and acknowledged < size):
+            await conn.receive(1, "chunk OK", RESPONSE_CHUNK_OK)
+            acknowledged = min(acknowledged + UPLOAD_BLOCK_SIZE, size)
+            progress.update(acknowledged / size)
+    progress.done()
 
-    # Enable nodelay, we need it for phase 1
-    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-    send_check(sock, MAGIC_BYTES, "magic bytes")
 
-    _, version = receive_exactly(sock, 2, "version", RESPONSE_OK)
-    _LOGGER.debug("Device support OTA version: %s", version)
+async def async_perform_ota(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    password: str,
+    filename: str,
+    progress=None,
+    logger: logging.Logger | logging.LoggerAdapter = _LOGGER,
+) -> None:
+    """Upload the firmware over an open connection to the device."""
+    conn = _Connection(reader, writer)
+    if progress is None:
+        progress = ProgressBar()
+    conn.set_nodelay(True)
+    await conn.send(MAGIC_BYTES, "magic bytes")
+
+    _, version = await conn.receive(2, "version", RESPONSE_OK)
+    logger.debug("Device support OTA version: %s", version)
     supported_versions = (OTA_VERSION_1_0, OTA_VERSION_2_0)
     if version not in supported_versions:
         raise OTAError(
@@ -213,149 +312,256 @@ def perform_ota(
         )
 
     # Features
-    send_check(sock, FEATURE_SUPPORTS_COMPRESSION, "features")
-    features = receive_exactly(
-        sock, 1, "features", [RESPONSE_HEADER_OK, RESPONSE_SUPPORTS_COMPRESSION]
+    await conn.send(FEATURE_SUPPORTS_COMPRESSION, "features")
+    features = (
+        await conn.receive(
+            1, "features", [RESPONSE_HEADER_OK, RESPONSE_SUPPORTS_COMPRESSION]
+        )
     )[0]
 
     if features == RESPONSE_SUPPORTS_COMPRESSION:
-        upload_contents = gzip.compress(file_contents, compresslevel=9)
-        _LOGGER.info("Compressed to %s bytes", len(upload_contents))
+        upload_filename = get_compressed_firmware(filename)
     else:
-        upload_contents = file_contents
+        upload_filename = filename
+    with open(upload_filename, "rb") as upload_handle:
+        upload_size = _file_size(upload_handle)
+        if upload_filename != filename:
+            logger.info("Compressed to %s bytes", upload_size)
+        await _async_perform_upload(
+            conn, password, upload_handle, upload_size, version, progress, logger
+        )
 
-    (auth,) = receive_exactly(
-        sock, 1, "auth", [RESPONSE_REQUEST_AUTH, RESPONSE_AUTH_OK]
-    )
+
+async def _async_perform_upload(
+    conn: _Connection,
+    password: str,
+    upload_handle: io.IOBase,
+    upload_size: int,
+    version: int,
+    progress,
+    logger: logging.Logger | logging.LoggerAdapter,
+) -> None:
+    (auth,) = await conn.receive(1, "auth", [RESPONSE_REQUEST_AUTH, RESPONSE_AUTH_OK])
     if auth == RESPONSE_REQUEST_AUTH:
         if not password:
             raise OTAError("ESP requests password, but no password given!")
-        nonce = receive_exactly(
-            sock, 32, "authentication nonce", [], decode=False
+        nonce = (
+            await conn.receive(32, "authentication nonce", [], decode=False)
         ).decode()
-        _LOGGER.debug("Auth: Nonce is %s", nonce)
+        logger.debug("Auth: Nonce is %s", nonce)
         cnonce = hashlib.md5(str(random.random()).encode()).hexdigest()
-        _LOGGER.debug("Auth: CNonce is %s", cnonce)
+        logger.debug("Auth: CNonce is %s", cnonce)
 
-        send_check(sock, cnonce, "auth cnonce")
+        await conn.send(cnonce, "auth cnonce")
 
         result_md5 = hashlib.md5()
         result_md5.update(password.encode("utf-8"))
         result_md5.update(nonce.encode())
         result_md5.update(cnonce.encode())
         result = result_md5.hexdigest()
-        _LOGGER.debug("Auth: Result is %s", result)
+        logger.debug("Auth: Result is %s", result)
 
-        send_check(sock, result, "auth result")
-        receive_exactly(sock, 1, "auth result", RESPONSE_AUTH_OK)
+        await conn.send(result, "auth result")
+        await conn.receive(1, "auth result", RESPONSE_AUTH_OK)
 
     # Set higher timeout during upload
-    sock.settimeout(30.0)
+    conn.timeout = UPLOAD_TIMEOUT
 
-    upload_size = len(upload_contents)
     upload_size_encoded = [
         (upload_size >> 24) & 0xFF,
         (upload_size >> 16) & 0xFF,
         (upload_size >> 8) & 0xFF,
         (upload_size >> 0) & 0xFF,
     ]
-    send_check(sock, upload_size_encoded, "binary size")
-    receive_exactly(sock, 1, "binary size", RESPONSE_UPDATE_PREPARE_OK)
+    await conn.send(upload_size_encoded, "binary size")
+    await conn.receive(1, "binary size", RESPONSE_UPDATE_PREPARE_OK)
 
-    upload_md5 = hashlib.md5(upload_contents).hexdigest()
-    _LOGGER.debug("MD5 of upload is %s", upload_md5)
+    upload_md5 = _hash_file(upload_handle, hashlib.md5()).hexdigest()
+    logger.debug("MD5 of upload is %s", upload_md5)
 
-    send_check(sock, upload_md5, "file checksum")
-    receive_exactly(sock, 1, "file checksum", RESPONSE_BIN_MD5_OK)
+    await conn.send(upload_md5, "file checksum")
+    await conn.receive(1, "file checksum", RESPONSE_BIN_MD5_OK)
 
     # Disable nodelay for transfer
-    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
-    # Limit send buffer (usually around 100kB) in order to have progress bar
+    conn.set_nodelay(False)
+    # Limit the buffers (usually around 100kB) in order to have the progress
     # show the actual progress
-
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UPLOAD_BUFFER_SIZE)
+    conn.writer.get_extra_info("socket").setsockopt(
+        socket.SOL_SOCKET, socket.SO_SNDBUF, UPLOAD_BUFFER_SIZE
+    )
+    conn.writer.transport.set_write_buffer_limits(high=UPLOAD_BLOCK_SIZE)
     start_time = time.perf_counter()
 
-    offset = 0
-    progress = ProgressBar()
-    while True:
-        chunk = upload_contents[offset : offset + UPLOAD_BLOCK_SIZE]
-        if not chunk:
-            break
-        offset += len(chunk)
-
-        try:
-            sock.sendall(chunk)
-            if version >= OTA_VERSION_2_0:
-                receive_exactly(sock, 1, "chunk OK", RESPONSE_CHUNK_OK)
-        except OSError as err:
-            sys.stderr.write("\n")
-            raise OTAError(f"Error sending data: {err}") from err
-
-        progress.update(offset / upload_size)
-    progress.done()
+    await _async_send_firmware(conn, upload_handle, upload_size, version, progress)
 
     # Enable nodelay for last checks
-    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    conn.set_nodelay(True)
     duration = time.perf_counter() - start_time
 
-    _LOGGER.info("Upload took %.2f seconds, waiting for result...", duration)
+    logger.info("Upload took %.2f seconds, waiting for result...", duration)
+
+    await conn.receive(1, "receive OK", RESPONSE_RECEIVE_OK)
+    await conn.receive(1, "Update end", RESPONSE_UPDATE_END_OK)
+    await conn.send(RESPONSE_OK, "end acknowledgement")
 
-    receive_exactly(sock, 1, "receive OK", RESPONSE_RECEIVE_OK)
-    receive_exactly(sock, 1, "Update end", RESPONSE_UPDATE_END_OK)
-    send_check(sock, RESPONSE_OK, "end acknowledgement")
+    logger.info("OTA successful")
 
-    _LOGGER.info("OTA successful")
 
-    # Do not connect logs until it is fully on
-    time.sleep(1)
+async def _async_connect_socket(af, socktype, sa) -> socket.socket:
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(af, socktype)
+    sock.setblocking(False)
+    try:
+        await asyncio.wait_for(loop.sock_connect(sock, sa), CONNECT_TIMEOUT)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
 
+async def async_connect(
+    addresses, logger: logging.Logger | logging.LoggerAdapter = _LOGGER
+) -> socket.socket:
+    """Connect to the first address that answers, happy eyeballs style.
 
-def run_ota_impl_(remote_host, remote_port, password, filename):
+    The next address is tried when the previous attempt failed or didn't
+    succeed within HAPPY_EYEBALLS_DELAY, without aborting the earlier attempts.
+    """
+    remaining = list(addresses)
+    pending: dict[asyncio.Task, tuple] = {}
+    sock = None
+    try:
+        while sock is None and (remaining or pending):
+            if remaining:
+                af, socktype, _, _, sa = remaining.pop(0)
+                logger.info("Connecting to %s port %s...", sa[0], sa[1])
+                task = asyncio.create_task(_async_connect_socket(af, socktype, sa))
+                pending[task] = sa
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=HAPPY_EYEBALLS_DELAY if remaining else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                sa = pending.pop(task)
+                if (err := task.exception()) is not None:
+                    logger.error(
+                        "Connecting to %s port %s failed: %r", sa[0], sa[1], err
+                    )
+                elif sock is None:
+                    logger.info("Connected to %s", sa[0])
+                    sock = task.result()
+                else:
+                    task.result().close()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+    if sock is None:
+        raise OTAError("Connection failed.")
+    return sock
+
+
+async def async_run_ota(
+    remote_host,
+    remote_port,
+    password,
+    filename,
+    progress=None,
+    logger: logging.Logger | logging.LoggerAdapter = _LOGGER,
+) -> int:
+    """Upload the firmware to a single device and return the exit code."""
+    loop = asyncio.get_running_loop()
     try:
-        res = resolve_ip_address(remote_host, remote_port)
+        res = await loop.run_in_executor(
+            None, resolve_ip_address, remote_host, remote_port
+        )
     except EsphomeError as err:
-        _LOGGER.error(
+        logger.error(
             "Error resolving IP address of %s. Is it connected to WiFi?",
             remote_host,
         )
-        _LOGGER.error(
+        logger.error(
             "(If this error persists, please set a static IP address: "
             "https://esphome.io/components/wifi.html#manual-ips)"
         )
-        raise OTAError(err) from err
+        logger.error(err)
+        return 1
 
-    for r in res:
-        af, socktype, _, _, sa = r
-        _LOGGER.info("Connecting to %s port %s...", sa[0], sa[1])
-        sock = socket.socket(af, socktype)
-        sock.settimeout(10.0)
-        try:
-            sock.connect(sa)
-        except OSError as err:
-            sock.close()
-            _LOGGER.error("Connecting to %s port %s failed: %s", sa[0], sa[1], err)
-            continue
+    try:
+        sock = await async_connect(res, logger)
+    except OTAError as err:
+        logger.error(err)
+        return 1
+
+    reader, writer = await asyncio.open_connection(sock=sock)
+    try:
+        await async_perform_ota(reader, writer, password, filename, progress, logger)
+    except OTAError as err:
+        logger.error(err)
+        return 1
+    finally:
+        writer.close()
+    return 0
 
-        _LOGGER.info("Connected to %s", sa[0])
-        with open(filename, "rb") as file_handle:
-            try:
-                perform_ota(sock, password, file_handle, filename)
-            except OTAError as err:
-                _LOGGER.error(str(err))
-                return 1
-            finally:
-                sock.close()
 
-        return 0
+class _HostLogger(logging.LoggerAdapter):
+    """Prefixes the messages of an upload with the device it goes to."""
 
-    _LOGGER.error("Connection failed.")
-    return 1
+    def process(self, msg, kwargs):
+        return f"{self.extra['host']}: {msg}", kwargs
+
+
+class _LogProgress:
+    """Logs the progress of an upload in steps of 10%."""
+
+    def __init__(self, logger: logging.LoggerAdapter) -> None:
+        self.logger = logger
+        self.last_step = 0
+
+    def update(self, progress):
+        step = int(min(progress, 1) * 10)
+        if step > self.last_step:
+            self.last_step = step
+            self.logger.info("Uploading: %s%%", step * 10)
+
+    def done(self):
+        pass
+
+
+async def async_run_ota_many(
+    remote_hosts, remote_port, password, filename, max_concurrent
+) -> dict[str, int]:
+    """Upload the firmware to several devices concurrently.
+
+    At most max_concurrent uploads run at the same time. Returns the exit code
+    of every host.
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrent, 1))
+
+    async def upload(host) -> int:
+        logger = _HostLogger(_LOGGER, {"host": host})
+        async with semaphore:
+            return await async_run_ota(
+                host, remote_port, password, filename, _LogProgress(logger), logger
+            )
+
+    results = await asyncio.gather(*(upload(host) for host in remote_hosts))
+    return dict(zip(remote_hosts, results))
 
 
 def run_ota(remote_host, remote_port, password, filename):
-    try:
-        return run_ota_impl_(remote_host, remote_port, password, filename)
-    except OTAError as err:
-        _LOGGER.error(err)
-        return 1
+    rc = asyncio.run(async_run_ota(remote_host, remote_port, password, filename))
+    if rc == 0:
+        # Do not connect logs until it is fully on
+        time.sleep(1)
+    return rc
+
+
+def run_ota_many(remote_hosts, remote_port, password, filename, max_concurrent):
+    return asyncio.run(
+        async_run_ota_many(
+            remote_hosts, remote_port, password, filename, max_concurrent
+        )
+    )
@@ -1,18 +1,29 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+import functools
 import hashlib
+import json
 import logging
 from pathlib import Path
 import re
 import subprocess
+import sys
+import threading
+import time
+from typing import Any
 import urllib.parse
 
 import esphome.config_validation as cv
 from esphome.core import CORE, TimePeriodSeconds
+from esphome.helpers import write_file
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of repositories that are cloned or updated at the same time
+MAX_PARALLEL_FETCHES = 8
+
 
 def run_git_command(cmd, cwd=None) -> str:
     _LOGGER.debug("Running git command: %s", " ".join(cmd))
@@ -41,6 +52,109 @@ def _compute_destination_path(key: str, domain: str) -> Path:
     return base_dir / h.hexdigest()[:8]
 
 
+def _compute_store_path(url: str) -> Path:
+    h = hashlib.new("sha256")
+    h.update(url.encode())
+    return Path(CORE.data_dir) / "git" / f"{h.hexdigest()[:8]}.git"
+
+
+_LOCKS: dict[Path, threading.Lock] = {}
+_LOCKS_LOCK = threading.Lock()
+
+
+def _get_lock(path: Path) -> threading.Lock:
+    """Return the lock of this process for the repository at path."""
+    with _LOCKS_LOCK:
+        return _LOCKS.setdefault(path, threading.Lock())
+
+
+@contextmanager
+def _lock_store(store: Path) -> Iterator[None]:
+    """Lock a store against git commands of other threads and processes.
+
+    Several processes use the same store, for example the dashboard and the
+    command line, or the jobs of update-all.
+    """
+    with _get_lock(store):
+        store.parent.mkdir(parents=True, exist_ok=True)
+        with open(store.with_suffix(".lock"), "wb") as lock_file:
+            if sys.platform == "win32":
+                import msvcrt  # pylint: disable=import-outside-toplevel
+
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK gives up after trying for 10 seconds
+                        continue
+                try:
+                    yield
+                finally:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl  # pylint: disable=import-outside-toplevel
+
+                # Released when the file is closed
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                yield
+
+
+def _fetch_into_store(repo_url: str, url: str, ref: str | None) -> tuple[Path, str]:
+    """Fetch a ref of a repository into the object store shared by all its refs.
+
+    repo_url identifies the repository, url is the one to fetch from and may
+    include credentials. Returns the path of the store and the commit the ref
+    points to.
+    """
+    store = _compute_store_path(repo_url)
+    ref = ref or "HEAD"
+    # Every ref is fetched into its own local ref, FETCH_HEAD is shared by all
+    local_ref = f"refs/esphome/{hashlib.sha256(ref.encode()).hexdigest()[:8]}"
+    with _lock_store(store):
+        if not store.is_dir():
+            run_git_command(["git", "init", "--bare", "--quiet", str(store)])
+        run_git_command(
+            ["git", "fetch", "--depth=1", "--", url, f"+{ref}:{local_ref}"],
+            str(store),
+        )
+        return store, run_git_command(["git", "rev-parse", local_ref], str(store))
+
+
+def _refresh_index_path() -> Path:
+    return Path(CORE.data_dir) / "git" / "refresh.json"
+
+
+_REFRESH_INDEX_LOCK = threading.Lock()
+
+
+def _read_refresh_index() -> dict[str, float]:
+    try:
+        return json.loads(_refresh_index_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_last_refresh(repo_dir: Path) -> float | None:
+    """Return when a repository was last fetched, None if unknown."""
+    with _REFRESH_INDEX_LOCK:
+        if (timestamp := _read_refresh_index().get(str(repo_dir))) is not None:
+            return timestamp
+    # Repositories cloned before the index existed
+    git_dir = repo_dir / ".git"
+    for name in ("FETCH_HEAD", "HEAD"):
+        if (git_dir / name).is_file():
+            return (git_dir / name).stat().st_mtime
+    return None
+
+
+def _set_last_refresh(repo_dir: Path) -> None:
+    with _REFRESH_INDEX_LOCK:
+        index = _read_refresh_index()
+        index[str(repo_dir)] = time.time()
+        write_file(_refresh_index_path(), json.dumps(index, indent=2, sort_keys=True))
+
+
 def clone_or_update(
     *,
     url: str,
@@ -52,6 +166,7 @@ def clone_or_update(
     submodules: list[str] | None = None,
 ) -> tuple[Path, Callable[[], None] | None]:
     key = f"{url}@{ref}"
+    repo_url = url
 
     if username is not None and password is not None:
         url = url.replace(
@@ -62,16 +177,15 @@ def clone_or_update(
     if not repo_dir.is_dir():
         _LOGGER.info("Cloning %s", key)
         _LOGGER.debug("Location: %s", repo_dir)
-        cmd = ["git", "clone", "--depth=1"]
-        cmd += ["--", url, str(repo_dir)]
-        run_git_command(cmd)
-
-        if ref is not None:
-            # We need to fetch the PR branch first, otherwise git will complain
-            # about missing objects
-            _LOGGER.info("Fetching %s", ref)
-            run_git_command(["git", "fetch", "--", "origin", ref], str(repo_dir))
-            run_git_command(["git", "reset", "--hard", "FETCH_HEAD"], str(repo_dir))
+        store, sha = _fetch_into_store(repo_url, url, ref)
+        with _lock_store(store):
+            # Another process may have checked it out in the meantime
+            if not repo_dir.is_dir():
+                # A checkout of the store, so all refs share its objects
+                run_git_command(["git", "worktree", "prune"], str(store))
+                cmd = ["git", "worktree", "add", "--force", "--detach"]
+                run_git_command([*cmd, str(repo_dir), sha], str(store))
+        _set_last_refresh(repo_dir)
 
         if submodules is not None:
             _LOGGER.info(
@@ -83,26 +197,33 @@ def clone_or_update(
 
     else:
         # Check refresh needed
-        file_timestamp = Path(repo_dir / ".git" / "FETCH_HEAD")
-        # On first clone, FETCH_HEAD does not exists
-        if not file_timestamp.exists():
-            file_timestamp = Path(repo_dir / ".git" / "HEAD")
-        age = datetime.now() - datetime.fromtimestamp(file_timestamp.stat().st_mtime)
-        if refresh is None or age.total_seconds() > refresh.total_seconds:
+        last_refresh = _get_last_refresh(repo_dir)
+        if (
+            refresh is None
+            or last_refresh is None
+            or time.time() - last_refresh > refresh.total_seconds
+        ):
             old_sha = run_git_command(["git", "rev-parse", "HEAD"], str(repo_dir))
             _LOGGER.info("Updating %s", key)
             _LOGGER.debug("Location: %s", repo_dir)
             # Stash local changes (if any)
-            run_git_command(
-                ["git", "stash", "push", "--include-untracked"], str(repo_dir)
-            )
-            # Fetch remote ref
-            cmd = ["git", "fetch", "--", "origin"]
-            if ref is not None:
-                cmd.append(ref)
-            run_git_command(cmd, str(repo_dir))
-            # Hard reset to FETCH_HEAD (short-lived git ref corresponding to most recent fetch)
-            run_git_command(["git", "reset", "--hard", "FETCH_HEAD"], str(repo_dir))
+            stash = ["git", "stash", "push", "--include-untracked"]
+            if (repo_dir / ".git").is_dir():
+                run_git_command(stash, str(repo_dir))
+                # A standalone clone, made before the object store existed
+                cmd = ["git", "fetch", "--", "origin"]
+                if ref is not None:
+                    cmd.append(ref)
+                run_git_command(cmd, str(repo_dir))
+                # FETCH_HEAD is a short-lived git ref corresponding to most recent fetch
+                target = "FETCH_HEAD"
+            else:
+                # refs/stash is shared by all checkouts of the store
+                with _lock_store(_compute_store_path(repo_url)):
+                    run_git_command(stash, str(repo_dir))
+                _, target = _fetch_into_store(repo_url, url, ref)
+            run_git_command(["git", "reset", "--hard", target], str(repo_dir))
+            _set_last_refresh(repo_dir)
 
             if submodules is not None:
                 _LOGGER.info(
@@ -121,6 +242,57 @@ def clone_or_update(
     return repo_dir, None
 
 
+def _merge_sources(sources: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge the arguments of sources that share one checkout.
+
+    The shortest refresh interval and all submodules of any of them are used,
+    as well as the first credentials given.
+    """
+    merged = dict(sources[0])
+    for source in sources[1:]:
+        refresh = source["refresh"]
+        if merged["refresh"] is not None and (
+            refresh is None or refresh.total_seconds < merged["refresh"].total_seconds
+        ):
+            merged["refresh"] = refresh
+        if (submodules := source.get("submodules")) is not None:
+            merged["submodules"] = list(
+                dict.fromkeys([*(merged.get("submodules") or []), *submodules])
+            )
+        if merged.get("username") is None and source.get("username") is not None:
+            merged["username"] = source["username"]
+            merged["password"] = source.get("password")
+    return merged
+
+
+def clone_or_update_many(
+    sources: list[dict[str, Any]],
+) -> list[Future[tuple[Path, Callable[[], None] | None]]]:
+    """Run clone_or_update for several sources at the same time.
+
+    Every source is a dict of the arguments of clone_or_update, the same
+    repository and ref is only cloned or updated once with the merged
+    arguments of all its sources. Returns a future of the result for each
+    source, errors are raised by their result().
+    """
+    groups: dict[tuple, list[dict[str, Any]]] = {}
+    keys = []
+    for source in sources:
+        key = (source["domain"], source["url"], source.get("ref"))
+        groups.setdefault(key, []).append(source)
+        keys.append(key)
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_PARALLEL_FETCHES, len(groups)))
+    ) as executor:
+        futures = {
+            key: executor.submit(
+                functools.partial(clone_or_update, **_merge_sources(group))
+            )
+            for key, group in groups.items()
+        }
+        return [futures[key] for key in keys]
+
+
 GIT_DOMAINS = {
     "github": "github.com",
     "gitlab": "gitlab.com",
@@ -98,31 +98,6 @@ def is_ip_address(host):
         return False
 
 
-def _resolve_with_zeroconf(host):
-    from esphome.core import EsphomeError
-    from esphome.zeroconf import EsphomeZeroconf
-
-    try:
-        zc = EsphomeZeroconf()
-    except Exception as err:
-        raise EsphomeError(
-            "Cannot start mDNS sockets, is this a docker container without "
-            "host network mode?"
-        ) from err
-    try:
-        info = zc.resolve_host(f"{host}.")
-    except Exception as err:
-        raise EsphomeError(f"Error resolving mDNS hostname: {err}") from err
-    finally:
-        zc.close()
-    if info is None:
-        raise EsphomeError(
-            "Error resolving address with mDNS: Did not respond. "
-            "Maybe the device is offline."
-        )
-    return info
-
-
 def addr_preference_(res):
     # Trivial alternative to RFC6724 sorting. Put sane IPv6 first, then
     # Legacy IP, then IPv6 link-local addresses without an actual link.
@@ -147,49 +122,37 @@ def resolve_ip_address(host, port):
     #  • a normal hostname to be resolved in DNS, or
     #  • A URL from which we should extract the hostname.
     #
-    # In each of the first three cases, we end up with IP addresses in
-    # string form which need to be converted to a 5-tuple to be used
-    # for the socket connection attempt. The easiest way to construct
-    # those is to pass the IP address string to getaddrinfo(). Which,
-    # coincidentally, is how we do hostname lookups in the other cases
-    # too. So first build a list which contains either IP addresses or
-    # a single hostname, then call getaddrinfo() on each element of
-    # that list.
-
-    errs = []
+    # Host names are resolved to IP addresses in string form by the shared
+    # resolver, which caches them. The IP addresses then need to be converted
+    # to a 5-tuple to be used for the socket connection attempt. The easiest
+    # way to construct those is to pass each IP address string to
+    # getaddrinfo().
+
     if isinstance(host, list):
         addr_list = host
     elif is_ip_address(host):
         addr_list = [host]
     else:
+        from esphome.resolver import get_resolver
+
         url = urlparse(host)
         if url.scheme != "":
             host = url.hostname
 
-        addr_list = []
-        if host.endswith(".local"):
-            try:
-                _LOGGER.info("Resolving IP address of %s in mDNS", host)
-                addr_list = _resolve_with_zeroconf(host)
-            except EsphomeError as err:
-                errs.append(str(err))
-
-        # If not mDNS, or if mDNS failed, use normal DNS
-        if not addr_list:
-            addr_list = [host]
+        # mDNS for .local names, falling back to normal DNS. The result is
+        # cached, so later commands don't have to wait for the network.
+        try:
+            addr_list = get_resolver().resolve(host)
+        except EsphomeError as err:
+            raise EsphomeError(f"Error resolving IP address: {err}") from err
 
-    # Now we have a list containing either IP addresses or a hostname
+    # Now we have a list of IP addresses
     res = []
     for addr in addr_list:
-        if not is_ip_address(addr):
-            _LOGGER.info("Resolving IP address of %s", host)
         try:
             r = socket.getaddrinfo(addr, port, proto=socket.IPPROTO_TCP)
         except OSError as err:
-            errs.append(str(err))
-            raise EsphomeError(
-                f"Error resolving IP address: {', '.join(errs)}"
-            ) from err
+            raise EsphomeError(f"Error resolving IP address: {err}") from err
 
         res = res + r
 
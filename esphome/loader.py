@@ -178,6 +178,27 @@ def install_custom_components_meta_finder():
     install_meta_finder(custom_components_dir)
 
 
+def reset_components() -> None:
+    """Forget all imported components, the next lookup imports them again.
+
+    Used by processes that load several configurations one after another, so
+    the external and custom components of one configuration neither leak into
+    the next nor get shadowed by a core component imported before.
+    """
+    clear_component_meta_finders()
+    package = sys.modules.get("esphome.components")
+    for name in [
+        name for name in sys.modules if name.startswith("esphome.components.")
+    ]:
+        del sys.modules[name]
+        if package is not None and name.count(".") == 2:
+            # `from esphome.components import x` would return the old module
+            package.__dict__.pop(name.rsplit(".", 1)[1], None)
+    _COMPONENT_CACHE.clear()
+    _COMPONENT_CACHE["esphome"] = ComponentManifest(esphome.core.config)
+    importlib.invalidate_caches()
+
+
 def _lookup_module(domain, exception):
     if domain in _COMPONENT_CACHE:
         return _COMPONENT_CACHE[domain]
@@ -124,21 +124,24 @@ def _run_idedata(config):
         raise
 
 
+def _read_cached_idedata(platformio_ini: Path, temp_idedata: Path):
+    """Return the cached idedata, None if it is missing or outdated."""
+    if not platformio_ini.is_file() or not temp_idedata.is_file():
+        return None
+    if platformio_ini.stat().st_mtime >= temp_idedata.stat().st_mtime:
+        return None
+    try:
+        return json.loads(temp_idedata.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+
+
 def _load_idedata(config):
     platformio_ini = Path(CORE.relative_build_path("platformio.ini"))
     temp_idedata = Path(CORE.relative_internal_path("idedata", f"{CORE.name}.json"))
 
-    changed = False
-    if not platformio_ini.is_file() or not temp_idedata.is_file():
-        changed = True
-    elif platformio_ini.stat().st_mtime >= temp_idedata.stat().st_mtime:
-        changed = True
-
-    if not changed:
-        try:
-            return json.loads(temp_idedata.read_text(encoding="utf-8"))
-        except ValueError:
-            pass
+    if (data := _read_cached_idedata(platformio_ini, temp_idedata)) is not None:
+        return data
 
     temp_idedata.parent.mkdir(exist_ok=True, parents=True)
 
@@ -148,6 +151,18 @@ def _load_idedata(config):
     return data
 
 
+def load_cached_idedata(build_path: str, name: str) -> "IDEData | None":
+    """Return the idedata of the last build, without running platformio.
+
+    Returns None if there is no cached idedata or the build changed since.
+    """
+    data = _read_cached_idedata(
+        Path(build_path, "platformio.ini"),
+        Path(CORE.relative_internal_path("idedata", f"{name}.json")),
+    )
+    return None if data is None else IDEData(data)
+
+
 KEY_IDEDATA = "idedata"
 
 
@@ -0,0 +1,304 @@
+"""Resolve host names to IP addresses, with a cache shared by all users.
+
+Every record expires after its own TTL and failed lookups are cached for a short
+time. Concurrent lookups of the same host share a single request. The command
+line keeps the addresses on disk until they expire, so the next command finds
+known devices right away.
+
+Expired addresses are never used, the device that held them may have been
+replaced by another one on the network since.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from collections.abc import Callable
+import concurrent.futures
+from dataclasses import dataclass
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from esphome.core import CORE, EsphomeError
+from esphome.helpers import is_ip_address, write_file_if_changed
+
+if TYPE_CHECKING:
+    from esphome.zeroconf import EsphomeZeroconf
+
+_LOGGER = logging.getLogger(__name__)
+
+# getaddrinfo doesn't return the TTL of the records
+DEFAULT_TTL = 120.0
+NEGATIVE_TTL = 10.0
+RESOLVE_TIMEOUT = 3.0
+MDNS_TIMEOUT = 10.0
+CACHE_FILE_NAME = "addresses.json"
+
+LookupType = Callable[[str], tuple[list[str], float]]
+
+
+@dataclass
+class _Record:
+    """Result of the last lookup of a host."""
+
+    expires: float
+    addresses: list[str] | None = None
+    error: EsphomeError | None = None
+
+
+class AddressCache:
+    """Addresses of hosts until their TTL expires.
+
+    If a path is given, the addresses are loaded from and saved to it.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        """Initialize the cache."""
+        self._path = path
+        self._records: dict[str, _Record] = {}
+        self._lock = threading.Lock()
+        # Modification time of the file when it was last read or written
+        self._mtime: int | None = None
+
+    def _refresh(self) -> None:
+        """Merge the records other processes saved since the file was read."""
+        try:
+            mtime = os.stat(self._path).st_mtime_ns
+            if mtime == self._mtime:
+                return
+            self._mtime = mtime
+            with open(self._path, encoding="utf-8") as f_handle:
+                data = json.load(f_handle)
+            records = {
+                host: _Record(float(record["expires"]), list(record["addresses"]))
+                for host, record in data.items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as err:
+            _LOGGER.debug("Ignoring address cache %s: %s", self._path, err)
+            return
+        for host, record in records.items():
+            current = self._records.get(host)
+            if current is None or current.expires < record.expires:
+                self._records[host] = record
+
+    def _save(self) -> None:
+        self._refresh()
+        data = {
+            host: {"addresses": record.addresses, "expires": record.expires}
+            for host, record in self._records.items()
+            if record.addresses
+        }
+        try:
+            write_file_if_changed(
+                self._path, json.dumps(data, indent=2, sort_keys=True)
+            )
+            self._mtime = os.stat(self._path).st_mtime_ns
+        except (EsphomeError, OSError) as err:
+            _LOGGER.debug("Cannot save address cache: %s", err)
+
+    def get(self, host: str, now: float) -> _Record | None:
+        """Return the record of a host, None if there is none or it expired."""
+        with self._lock:
+            record = self._records.get(host)
+            if self._path is not None and (record is None or record.expires <= now):
+                self._refresh()
+                record = self._records.get(host)
+        if record is None or record.expires <= now:
+            return None
+        return record
+
+    def update(self, addresses: dict[str, tuple[list[str], float]], now: float) -> None:
+        """Store the addresses and TTL of several hosts at once."""
+        with self._lock:
+            for host, (host_addresses, ttl) in addresses.items():
+                self._records[host] = _Record(now + ttl, host_addresses)
+            if self._path is not None:
+                self._save()
+
+    def set_addresses(
+        self, host: str, addresses: list[str], ttl: float, now: float
+    ) -> None:
+        """Store the addresses of a host."""
+        self.update({host: (addresses, ttl)}, now)
+
+    def set_error(self, host: str, error: EsphomeError, now: float) -> None:
+        """Store a failed lookup."""
+        with self._lock:
+            self._records[host] = _Record(now + NEGATIVE_TTL, error=error)
+
+
+class Resolver:
+    """Resolves host names with a lookup function, through an AddressCache."""
+
+    def __init__(self, lookup: LookupType, cache: AddressCache | None = None) -> None:
+        """Initialize the resolver."""
+        self._lookup = lookup
+        self.cache = cache or AddressCache()
+        self._lock = threading.Lock()
+        self._pending: dict[str, concurrent.futures.Future[list[str]]] = {}
+        self._tasks: dict[str, asyncio.Task[list[str] | Exception]] = {}
+
+    @staticmethod
+    def _from_record(record: _Record) -> list[str]:
+        if record.error is not None:
+            raise record.error
+        return record.addresses
+
+    def cached(self, host: str) -> list[str] | None:
+        """Return the addresses of a host if they are cached and still valid."""
+        record = self.cache.get(host, time.time())
+        return None if record is None or record.error else record.addresses
+
+    def resolve(self, host: str) -> list[str]:
+        """Return the addresses of a host, raise EsphomeError if it fails."""
+        if is_ip_address(host):
+            return [host]
+        if (record := self.cache.get(host, time.time())) is not None:
+            return self._from_record(record)
+
+        with self._lock:
+            future = self._pending.get(host)
+            if owner := future is None:
+                future = self._pending[host] = concurrent.futures.Future()
+        if not owner:
+            return future.result()
+
+        try:
+            try:
+                addresses, ttl = self._lookup(host)
+            except EsphomeError as err:
+                self.cache.set_error(host, err, time.time())
+                raise
+            self.cache.set_addresses(host, addresses, ttl, time.time())
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[host]
+        future.set_result(addresses)
+        return addresses
+
+    async def _async_resolve(self, host: str) -> list[str] | Exception:
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(None, self.resolve, host), RESOLVE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return EsphomeError(f"Timeout resolving {host}")
+        except EsphomeError as err:
+            return err
+
+    async def async_resolve(self, host: str) -> list[str] | Exception:
+        """Return the addresses of a host, or the error if it fails."""
+        if is_ip_address(host):
+            return [host]
+        if (record := self.cache.get(host, time.time())) is not None:
+            try:
+                return self._from_record(record)
+            except EsphomeError as err:
+                return err
+        if (task := self._tasks.get(host)) is None:
+            task = asyncio.create_task(self._async_resolve(host))
+            self._tasks[host] = task
+            task.add_done_callback(lambda _: self._tasks.pop(host, None))
+        return await asyncio.shield(task)
+
+
+def lookup_dns(host: str) -> tuple[list[str], float]:
+    """Look up the addresses of a host in DNS."""
+    try:
+        results = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+    except (OSError, UnicodeError) as err:
+        raise EsphomeError(f"Error resolving IP address of {host}: {err}") from err
+    return list(dict.fromkeys(result[4][0] for result in results)), DEFAULT_TTL
+
+
+_ZEROCONF: EsphomeZeroconf | None = None
+_ZEROCONF_LOCK = threading.Lock()
+
+
+def _get_zeroconf() -> EsphomeZeroconf:
+    """Return the zeroconf instance shared by all lookups of this process.
+
+    It browses for ESPHome devices from the first lookup on, so the addresses
+    of the other devices are usually cached before they are looked up.
+    """
+    global _ZEROCONF  # noqa: PLW0603
+    from zeroconf import ServiceBrowser
+
+    from esphome.zeroconf import ESPHOME_SERVICE_TYPE, EsphomeZeroconf
+
+    with _ZEROCONF_LOCK:
+        if _ZEROCONF is None:
+            try:
+                zc = EsphomeZeroconf()
+            except Exception as err:
+                raise EsphomeError(
+                    "Cannot start mDNS sockets, is this a docker container without "
+                    "host network mode?"
+                ) from err
+            ServiceBrowser(zc, ESPHOME_SERVICE_TYPE, handlers=[lambda **kwargs: None])
+            atexit.register(zc.close)
+            _ZEROCONF = zc
+        return _ZEROCONF
+
+
+def lookup_mdns(host: str) -> tuple[list[str], float]:
+    """Look up the addresses of a .local host with mDNS."""
+    zc = _get_zeroconf()
+    try:
+        addresses = zc.resolve_host(f"{host}.", MDNS_TIMEOUT)
+        ttl = zc.address_ttl(host)
+    except Exception as err:
+        raise EsphomeError(f"Error resolving mDNS hostname: {err}") from err
+    if addresses is None:
+        raise EsphomeError(
+            "Error resolving address with mDNS: Did not respond. "
+            "Maybe the device is offline."
+        )
+    return addresses, DEFAULT_TTL if ttl is None else ttl
+
+
+def lookup_host(host: str) -> tuple[list[str], float]:
+    """Look up a host with mDNS if it is a .local name, otherwise or if that fails in DNS."""
+    errors = []
+    if host.endswith(".local"):
+        _LOGGER.info("Resolving IP address of %s in mDNS", host)
+        try:
+            return lookup_mdns(host)
+        except EsphomeError as err:
+            errors.append(str(err))
+    _LOGGER.info("Resolving IP address of %s", host)
+    try:
+        return lookup_dns(host)
+    except EsphomeError as err:
+        errors.append(str(err))
+        raise EsphomeError(", ".join(errors)) from err
+
+
+_RESOLVERS: dict[str | None, Resolver] = {}
+
+
+def get_resolver() -> Resolver:
+    """Return the resolver of the command line.
+
+    The addresses are kept in the data directory of the configuration.
+    """
+    path = (
+        None
+        if CORE.config_path is None
+        else os.path.join(CORE.data_dir, CACHE_FILE_NAME)
+    )
+    if (resolver := _RESOLVERS.get(path)) is None:
+        resolver = Resolver(lookup_host, AddressCache(path))
+        _RESOLVERS[path] = resolver
+    return resolver
@@ -6,6 +6,7 @@ from pathlib import Path
 import re
 import subprocess
 import sys
+import threading
 
 from esphome import const
 
@@ -242,6 +243,47 @@ def run_external_process(*cmd, **kwargs):
         return 1
 
 
+# Serializes the lines printed by run_external_process_prefixed
+_PREFIXED_OUTPUT_LOCK = threading.Lock()
+
+
+def safe_print_lines(*lines: str) -> None:
+    """Print lines together, never interleaved with prefixed process output."""
+    with _PREFIXED_OUTPUT_LOCK:
+        for line in lines:
+            safe_print(line)
+
+
+def run_external_process_prefixed(prefix: str, *cmd: str) -> int:
+    """Run a process and print each line of its output with the given prefix.
+
+    Used when several processes run at the same time, so their output can still be
+    told apart. Lines are printed whole so output of different processes is never
+    interleaved within a line.
+    """
+    full_cmd = " ".join(shlex_quote(x) for x in cmd)
+    _LOGGER.debug("Running:  %s", full_cmd)
+
+    try:
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding="utf-8",
+            errors="backslashreplace",
+        ) as proc:
+            for line in proc.stdout:
+                with _PREFIXED_OUTPUT_LOCK:
+                    safe_print(f"{prefix}{line.rstrip()}")
+            return proc.wait()
+    except KeyboardInterrupt:  # pylint: disable=try-except-raise
+        raise
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.error("Running command failed: %s", err)
+        _LOGGER.error("Please try running %s locally.", full_cmd)
+        return 1
+
+
 def is_dev_esphome_version():
     return "dev" in const.__version__
 
@@ -20,6 +20,7 @@ from esphome.helpers import (
     mkdir_p,
     read_file,
     walk_files,
+    write_file,
     write_file_if_changed,
 )
 from esphome.storage_json import StorageJSON, storage_path
@@ -64,6 +65,9 @@ upload_flags =
 """,
 )
 
+# Directory in src/ holding the sources of progmem arrays given as bytes
+PROGMEM_DATA_DIR = "progmem"
+
 UPLOAD_SPEED_OVERRIDE = {
     "esp210": 57600,
 }
@@ -306,6 +310,30 @@ def copy_src_tree():
         pass
 
 
+def write_progmem_data():
+    """Write a source file for each bytes backed progmem array.
+
+    The first line of each file holds the digest of its contents, so the
+    unchanged ones don't have to be formatted and written again.
+    """
+    directory = CORE.relative_src_path(PROGMEM_DATA_DIR)
+    paths = set()
+    for data in CORE.progmem_data:
+        path = os.path.join(directory, f"{data.name}.cpp")
+        paths.add(path)
+        try:
+            with open(path, encoding="utf-8") as f_handle:
+                if f_handle.readline() == f"// {data.digest}\n":
+                    continue
+        except OSError:
+            pass
+        write_file(path, data.source)
+
+    for fname in walk_files(directory):
+        if fname not in paths:
+            os.remove(fname)
+
+
 def generate_defines_h():
     define_content_l = [x.as_macro for x in CORE.defines]
     define_content_l.sort()
@@ -336,6 +364,7 @@ def write_cpp(code_s):
         code_format = CPP_BASE_FORMAT
 
     copy_src_tree()
+    write_progmem_data()
     global_s = '#include "esphome.h"\n'
     global_s += CORE.cpp_global_section
 
@@ -3,8 +3,9 @@ from __future__ import annotations
 from collections.abc import Callable
 import fnmatch
 import functools
+import hashlib
 import inspect
-from io import BytesIO, TextIOBase, TextIOWrapper
+from io import BytesIO, StringIO, TextIOBase, TextIOWrapper
 from ipaddress import _BaseAddress
 import logging
 import math
@@ -42,6 +43,11 @@ _LOGGER = logging.getLogger(__name__)
 SECRET_YAML = "secrets.yaml"
 _SECRET_CACHE = {}
 _SECRET_VALUES = {}
+# Digest of every file read while loading YAML (None if the file could not be read),
+# used to decide whether a previously validated configuration is still up to date.
+_LOADED_FILES: dict[str, str | None] = {}
+# Environment variables looked up with !env_var while loading YAML
+_LOADED_ENV_VARS: dict[str, str | None] = {}
 
 
 class ESPHomeDataBase:
@@ -242,6 +248,7 @@ class ESPHomeLoaderMixin:
     @_add_data_ref
     def construct_env_var(self, node: yaml.Node) -> str:
         args = node.value.split()
+        _LOADED_ENV_VARS[args[0]] = os.environ.get(args[0])
         # Check for a default value
         if len(args) > 1:
             return os.getenv(args[0], " ".join(args[1:]))
@@ -258,6 +265,13 @@ class ESPHomeLoaderMixin:
     def _rel_path(self, *args: str) -> str:
         return os.path.join(self._directory, *args)
 
+    def _find_yaml_files(self, directory: str) -> list[str]:
+        directory = self._rel_path(directory)
+        files = filter_yaml_files(_find_files(directory, "*.yaml"))
+        # Record the directory listing so adding or removing a file is detected
+        _LOADED_FILES[os.path.abspath(directory)] = _listing_digest(directory, files)
+        return files
+
     @_add_data_ref
     def construct_secret(self, node: yaml.Node) -> str:
         try:
@@ -309,12 +323,12 @@ class ESPHomeLoaderMixin:
 
     @_add_data_ref
     def construct_include_dir_list(self, node: yaml.Node) -> list[dict[str, Any]]:
-        files = filter_yaml_files(_find_files(self._rel_path(node.value), "*.yaml"))
+        files = self._find_yaml_files(node.value)
         return [self.yaml_loader(f) for f in files]
 
     @_add_data_ref
     def construct_include_dir_merge_list(self, node: yaml.Node) -> list[dict[str, Any]]:
-        files = filter_yaml_files(_find_files(self._rel_path(node.value), "*.yaml"))
+        files = self._find_yaml_files(node.value)
         merged_list = []
         for fname in files:
             loaded_yaml = self.yaml_loader(fname)
@@ -326,7 +340,7 @@ class ESPHomeLoaderMixin:
     def construct_include_dir_named(
         self, node: yaml.Node
     ) -> OrderedDict[str, dict[str, Any]]:
-        files = filter_yaml_files(_find_files(self._rel_path(node.value), "*.yaml"))
+        files = self._find_yaml_files(node.value)
         mapping = OrderedDict()
         for fname in files:
             filename = os.path.splitext(os.path.basename(fname))[0]
@@ -337,7 +351,7 @@ class ESPHomeLoaderMixin:
     def construct_include_dir_merge_named(
         self, node: yaml.Node
     ) -> OrderedDict[str, dict[str, Any]]:
-        files = filter_yaml_files(_find_files(self._rel_path(node.value), "*.yaml"))
+        files = self._find_yaml_files(node.value)
         mapping = OrderedDict()
         for fname in files:
             loaded_yaml = self.yaml_loader(fname)
@@ -423,11 +437,62 @@ def load_yaml(fname: str, clear_secrets: bool = True) -> Any:
 
 def _load_yaml_internal(fname: str) -> Any:
     """Load a YAML file."""
+    path = os.path.abspath(fname)
+    try:
+        with open(fname, "rb") as f_handle:
+            content = f_handle.read()
+    except OSError as err:
+        _LOADED_FILES[path] = None
+        raise EsphomeError(f"Error reading file {fname}: {err}") from err
+    _LOADED_FILES[path] = hashlib.sha256(content).hexdigest()
     try:
-        with open(fname, encoding="utf-8") as f_handle:
-            return parse_yaml(fname, f_handle)
-    except (UnicodeDecodeError, OSError) as err:
+        f_handle = StringIO(content.decode("utf-8"), newline=None)
+    except UnicodeDecodeError as err:
         raise EsphomeError(f"Error reading file {fname}: {err}") from err
+    # The YAML reader takes the document name for error marks from the stream
+    f_handle.name = str(fname)
+    return parse_yaml(fname, f_handle)
+
+
+def _listing_digest(directory: str, files: list[str]) -> str:
+    names = sorted(os.path.relpath(f, directory) for f in files)
+    return hashlib.sha256("\n".join(names).encode()).hexdigest()
+
+
+def clear_loaded_files() -> None:
+    """Reset the record of files and environment variables used while loading."""
+    _LOADED_FILES.clear()
+    _LOADED_ENV_VARS.clear()
+
+
+def restore_loaded_files(
+    files: dict[str, str | None], env_vars: dict[str, str | None]
+) -> None:
+    """Replace the record of loaded files, for example from a cached load."""
+    clear_loaded_files()
+    _LOADED_FILES.update(files)
+    _LOADED_ENV_VARS.update(env_vars)
+
+
+def loaded_files() -> dict[str, str | None]:
+    """Return the digest of every file read since the last clear_loaded_files()."""
+    return dict(_LOADED_FILES)
+
+
+def loaded_env_vars() -> dict[str, str | None]:
+    """Return the environment variables used since the last clear_loaded_files()."""
+    return dict(_LOADED_ENV_VARS)
+
+
+def file_digest(path: str) -> str | None:
+    """Return the digest of a file or directory listing as stored by the loader."""
+    if os.path.isdir(path):
+        return _listing_digest(path, filter_yaml_files(_find_files(path, "*.yaml")))
+    try:
+        with open(path, "rb") as f_handle:
+            return hashlib.sha256(f_handle.read()).hexdigest()
+    except OSError:
+        return None
 
 
 def parse_yaml(
@@ -11,8 +11,10 @@ from zeroconf import (
     ServiceInfo,
     ServiceStateChange,
     Zeroconf,
+    current_time_millis,
 )
 from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
+from zeroconf.const import _CLASS_IN, _TYPE_A, _TYPE_AAAA
 
 from esphome.storage_json import StorageJSON, ext_storage_path
 
@@ -68,8 +70,10 @@ class DashboardBrowser(AsyncServiceBrowser):
 
 
 class DashboardImportDiscovery:
-    def __init__(self) -> None:
+    def __init__(self, on_update: Callable[[], None] | None = None) -> None:
+        """Initialize the discovery, on_update is called when import_state changed."""
         self.import_state: dict[str, DiscoveredImport] = {}
+        self.on_update = on_update
 
     def browser_callback(
         self,
@@ -85,7 +89,8 @@ class DashboardImportDiscovery:
             state_change,
         )
         if state_change == ServiceStateChange.Removed:
-            self.import_state.pop(name, None)
+            if self.import_state.pop(name, None) is not None and self.on_update:
+                self.on_update()
             return
 
         if state_change == ServiceStateChange.Updated and name not in self.import_state:
@@ -139,7 +144,7 @@ class DashboardImportDiscovery:
         if friendly_name is not None:
             friendly_name = friendly_name.decode()
 
-        self.import_state[name] = DiscoveredImport(
+        discovered = DiscoveredImport(
             friendly_name=friendly_name,
             device_name=node_name,
             package_import_url=import_url,
@@ -147,6 +152,11 @@ class DashboardImportDiscovery:
             project_version=project_version,
             network=network,
         )
+        if self.import_state.get(name) == discovered:
+            return
+        self.import_state[name] = discovered
+        if self.on_update:
+            self.on_update()
 
     def update_device_mdns(self, node_name: str, version: str):
         storage_path = ext_storage_path(node_name + ".yaml")
@@ -165,6 +175,19 @@ class DashboardImportDiscovery:
                 )
 
 
+def _address_ttl(zc: Zeroconf, host: str) -> float | None:
+    name = f"{host.partition('.')[0]}.local.".lower()
+    now = current_time_millis()
+    return min(
+        (
+            record.get_remaining_ttl(now)
+            for type_ in (_TYPE_A, _TYPE_AAAA)
+            for record in zc.cache.get_all_by_details(name, type_, _CLASS_IN)
+        ),
+        default=None,
+    )
+
+
 class EsphomeZeroconf(Zeroconf):
     def resolve_host(
         self, host: str, timeout: float = DEFAULT_TIMEOUT
@@ -178,6 +201,10 @@ class EsphomeZeroconf(Zeroconf):
             return addresses
         return None
 
+    def address_ttl(self, host: str) -> float | None:
+        """Return the seconds until the first cached address of a host expires."""
+        return _address_ttl(self, host)
+
 
 class AsyncEsphomeZeroconf(AsyncZeroconf):
     async def async_resolve_host(
@@ -191,3 +218,7 @@ class AsyncEsphomeZeroconf(AsyncZeroconf):
         ) and (addresses := info.parsed_scoped_addresses(IPVersion.All)):
             return addresses
         return None
+
+    def address_ttl(self, host: str) -> float | None:
+        """Return the seconds until the first cached address of a host expires."""
+        return _address_ttl(self.zeroconf, host)
@@ -444,6 +444,42 @@ class StringType(TypeInfo):
         return o
 
 
+class StringRefType(TypeInfo):
+    """A string the server only sends, referenced instead of copied.
+
+    The message stores a StringRef set with set_<name>(), the string it points
+    to must stay valid until the message is encoded.
+    """
+
+    cpp_type = "StringRef"
+    default_value = ""
+    encode_func = "encode_string"
+    wire_type = WireType.LENGTH_DELIMITED  # Uses wire type 2
+
+    @property
+    def field_name(self) -> str:
+        return f"{self.name}_ref_"
+
+    @property
+    def public_content(self) -> list[str]:
+        return [
+            f"void set_{self.name}(const StringRef &ref) {{ this->{self.field_name} = ref; }}"
+        ]
+
+    @property
+    def protected_content(self) -> list[str]:
+        return [self.class_member]
+
+    def dump(self, name: str) -> str:
+        o = f'out.append("\'").append({name}.c_str(), {name}.size()).append("\'");'
+        return o
+
+    def get_size_calculation(self, name: str, force: bool = False) -> str:
+        field_id_size = self.calculate_field_id_size()
+        o = f"ProtoSize::add_string_field(total_size, {field_id_size}, {name}, {force_str(force)});"
+        return o
+
+
 @register_type(11)
 class MessageType(TypeInfo):
     @property
@@ -773,9 +809,16 @@ def build_message_type(desc: descriptor.DescriptorProto) -> tuple[str, str]:
     dump: list[str] = []
     size_calc: list[str] = []
 
+    # Entity descriptions only reference the strings the entities own
+    string_ref = get_opt(desc, pb.source, SOURCE_BOTH) == SOURCE_SERVER and (
+        desc.name.startswith("ListEntities")
+    )
+
     for field in desc.field:
         if field.label == 3:
             ti = RepeatedTypeInfo(field)
+        elif string_ref and field.type == 9:
+            ti = StringRefType(field)
         else:
             ti = TYPE_INFO[field.type](field)
         protected_content.extend(ti.protected_content)
@@ -0,0 +1,68 @@
+"""Tests for the font component glyph rendering."""
+
+from pathlib import Path
+
+from freetype import Face, ft_pixel_mode_mono
+import pytest
+
+from esphome.components.font import GlyphCache, render_glyph
+
+FONTS = Path(__file__).parents[2] / "components" / "font"
+CODEPOINTS = "AgÄ%@ "
+
+
+def _pack_per_pixel(bitmap, bpp):
+    """The original nested loop packing, used as reference."""
+    width, height, pitch = bitmap.width, bitmap.rows, bitmap.pitch
+    buffer = bitmap.buffer
+    scale = 256 // (1 << bpp)
+    glyph_data = [0] * ((height * width * bpp + 7) // 8)
+    pos = 0
+    for y in range(height):
+        for x in range(width):
+            if bitmap.pixel_mode == ft_pixel_mode_mono:
+                pixel = (
+                    (1 << bpp) - 1
+                    if buffer[y * pitch + x // 8] & (1 << (7 - x % 8))
+                    else 0
+                )
+            else:
+                pixel = buffer[y * pitch + x] // scale
+            for bit_num in range(bpp):
+                if pixel & (1 << (bpp - bit_num - 1)):
+                    glyph_data[pos // 8] |= 0x80 >> (pos % 8)
+                pos += 1
+    return bytes(glyph_data)
+
+
+@pytest.mark.parametrize("bpp", (1, 2, 4, 8))
+@pytest.mark.parametrize("font_file", ("Monocraft.ttf", "Tamzen5x9b.bdf"))
+def test_render_glyph_packs_like_per_pixel(font_file: str, bpp: int) -> None:
+    font = Face(str(FONTS / font_file))
+    if font.is_scalable:
+        font.set_pixel_sizes(20, 0)
+
+    for codepoint in CODEPOINTS:
+        if not font.get_char_index(codepoint):
+            continue
+        glyph = render_glyph(font, codepoint, bpp)
+        assert glyph.width == font.glyph.bitmap.width
+        assert glyph.height == font.glyph.bitmap.rows
+        assert glyph.data == _pack_per_pixel(font.glyph.bitmap, bpp)
+
+
+def test_glyph_cache_round_trip(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(
+        "esphome.external_files.compute_local_file_dir", lambda domain: tmp_path
+    )
+    font = Face(str(FONTS / "Monocraft.ttf"))
+    font.set_pixel_sizes(20, 0)
+    glyph = render_glyph(font, "g", 4)
+
+    cache = GlyphCache("digest", 20, 4)
+    assert cache.get("g") is None
+    cache.add("g", glyph)
+    cache.save()
+
+    assert GlyphCache("digest", 20, 4).get("g") == glyph
+    assert GlyphCache("digest", 20, 2).get("g") is None
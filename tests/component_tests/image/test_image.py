@@ -0,0 +1,71 @@
+"""Tests for the image component encoders."""
+
+import random
+
+from PIL import Image
+import pytest
+
+from esphome.components.image import (
+    CONF_ALPHA_CHANNEL,
+    CONF_CHROMA_KEY,
+    CONF_OPAQUE,
+    IMAGE_TYPE,
+    ImageEncoder,
+)
+
+WIDTH = 13
+HEIGHT = 7
+
+
+def _random_image(seed: int) -> Image.Image:
+    rnd = random.Random(seed)
+    # Bias towards the values the chroma key and alpha handling treat specially
+    values = (0, 1, 2, 4, 7, 8, 127, 128, 254, 255)
+    data = bytes(
+        rnd.choice(values) if rnd.random() < 0.5 else rnd.randrange(256)
+        for _ in range(WIDTH * HEIGHT * 4)
+    )
+    return Image.frombytes("RGBA", (WIDTH, HEIGHT), data)
+
+
+def _encode(image_type, transparency, invert_alpha, bulk, image):
+    encoder = IMAGE_TYPE[image_type](
+        WIDTH, HEIGHT * 2, transparency, Image.Dither.NONE, invert_alpha
+    )
+    for _ in range(2):
+        frame = encoder.convert(image, "test.png")
+        if bulk:
+            encoder.encode_frame(frame)
+        else:
+            encoder.add_bytes(ImageEncoder.frame_bytes(encoder, frame))
+    return encoder
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("invert_alpha", (False, True))
+@pytest.mark.parametrize(
+    "transparency", (CONF_OPAQUE, CONF_CHROMA_KEY, CONF_ALPHA_CHANNEL)
+)
+@pytest.mark.parametrize("image_type", ("BINARY", "GRAYSCALE", "RGB565", "RGB"))
+def test_bulk_encoding_matches_per_pixel(
+    image_type: str, transparency: str, invert_alpha: bool, seed: int
+) -> None:
+    image = _random_image(seed)
+
+    expected = _encode(image_type, transparency, invert_alpha, False, image)
+    result = _encode(image_type, transparency, invert_alpha, True, image)
+
+    assert result.index == expected.index == len(expected.data)
+    assert result.data == expected.data
+    assert result.transparency == expected.transparency
+
+
+def test_bulk_encoding_alpha_only_grayscale() -> None:
+    image = Image.new("RGBA", (WIDTH, HEIGHT))
+    image.putalpha(Image.linear_gradient("L").resize((WIDTH, HEIGHT)))
+
+    expected = _encode("GRAYSCALE", CONF_OPAQUE, False, False, image)
+    result = _encode("GRAYSCALE", CONF_OPAQUE, False, True, image)
+
+    assert result.data == expected.data
+    assert result.transparency == CONF_ALPHA_CHANNEL
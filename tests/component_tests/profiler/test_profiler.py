@@ -0,0 +1,48 @@
+"""Tests for the profiler component."""
+
+from esphome.components.profiler.client import ReportParser, render_report
+
+REPORT = [
+    "\033[0;32m[I][profiler:085]: report interval_ms=10000 rows=2\033[0m",
+    "[I][profiler:095]: api loop_calls=600 loop_us=30000 loop_max_us=400 "
+    "loop_p99_us=120 scheduler_calls=0 scheduler_us=0 scheduler_max_us=0 "
+    "scheduler_p99_us=0 setup_us=1500",
+    "[D][sensor:094]: 'Temperature': Sending state 21.50000 °C",
+    "[I][profiler:095]: sensor.template loop_calls=0 loop_us=0 loop_max_us=0 "
+    "loop_p99_us=0 scheduler_calls=10 scheduler_us=500000 scheduler_max_us=60000 "
+    "scheduler_p99_us=60000 setup_us=20",
+]
+
+
+def test_profiler_is_setup(generate_main):
+    main_cpp = generate_main("tests/component_tests/profiler/test_profiler.yaml")
+
+    assert "new profiler::Profiler();" in main_cpp
+    assert "->set_report_interval(5000);" in main_cpp
+
+
+def test_report_is_parsed_once_complete():
+    parser = ReportParser()
+
+    results = [parser.feed(line) for line in REPORT]
+
+    assert results[:3] == [None, None, None]
+    report = results[3]
+    assert report.interval_ms == 10000
+    assert [row.source for row in report.rows] == ["api", "sensor.template"]
+    assert report.rows[0].loop_calls == 600
+    assert report.rows[1].scheduler_us == 500000
+    # Lines after a complete report are ignored until the next header
+    assert parser.feed(REPORT[1]) is None
+
+
+def test_render_report_sorts_by_time():
+    parser = ReportParser()
+    report = [parser.feed(line) for line in REPORT][-1]
+
+    lines = render_report(report).splitlines()
+
+    assert lines[0] == "Profile over 10.0s, 5.3% spent in components"
+    assert lines[2].split()[0] == "COMPONENT"
+    assert lines[3].split()[:3] == ["sensor.template", "5.0", "0"]
+    assert lines[4].split()[:4] == ["api", "0.3", "600", "50us"]
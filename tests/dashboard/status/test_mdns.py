@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from esphome.core import CORE
+from esphome.dashboard.status import mdns
+from esphome.dashboard.status.mdns import MDNSStatus
+from esphome.resolver import get_resolver
+
+
+class FakeZeroconf:
+    async def async_resolve_host(self, host: str, timeout: float) -> list[str] | None:
+        assert timeout == 0
+        return ["192.168.1.10"] if host == "kitchen" else None
+
+    def address_ttl(self, host: str) -> float | None:
+        return 100.0
+
+
+@pytest.mark.asyncio
+async def test_seen_hosts_are_shared_with_the_cli(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(mdns, "ADDRESS_SAVE_DELAY", 0)
+    monkeypatch.setattr(CORE, "config_path", os.path.join(tmp_path, "."))
+    dashboard = Mock()
+    status = MDNSStatus(dashboard)
+    status.aiozc = FakeZeroconf()
+    tasks = []
+
+    def create_task(coro):
+        tasks.append(coro)
+        return coro
+
+    dashboard.async_create_background_task = create_task
+
+    status._async_host_seen("kitchen")
+    status._async_host_seen("garage")
+    assert len(tasks) == 1
+    await tasks[0]
+
+    assert get_resolver().cached("kitchen.local") == ["192.168.1.10"]
+    assert get_resolver().cached("garage.local") is None
+    assert (tmp_path / ".esphome" / "addresses.json").is_file()
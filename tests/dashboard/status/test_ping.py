@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+
+from esphome.core import CORE
+from esphome.dashboard.entries import (
+    DashboardEntry,
+    EntryStateSource,
+    ReachableState,
+    bool_to_entry_state,
+)
+from esphome.dashboard.status import ping
+from esphome.dashboard.status.ping import ICMPProber, PingStatus
+
+
+class FakeEntries:
+    def __init__(self, entries: list[DashboardEntry]) -> None:
+        self._entries = {entry.path: entry for entry in entries}
+
+    def get(self, path: str) -> DashboardEntry | None:
+        return self._entries.get(path)
+
+    def async_all(self) -> list[DashboardEntry]:
+        return list(self._entries.values())
+
+    def async_set_state_if_online_or_source(self, entry, state) -> None:
+        entry.state = state
+
+    def async_set_state_if_source(self, entry, state) -> None:
+        entry.state = state
+
+
+class FakeProber:
+    def __init__(self) -> None:
+        self.reachable: set[str] = set()
+        self.probed: list[str] = []
+
+    async def async_probe(self, address: str) -> float | None:
+        self.probed.append(address)
+        return 1.5 if address in self.reachable else None
+
+
+def _entry(name: str, address: str) -> DashboardEntry:
+    entry = DashboardEntry(f"/config/{name}.yaml", (0, 0, 0, 0))
+    entry.storage = Mock(address=address)
+    return entry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(ping, "time", clock)
+    return clock
+
+
+@pytest_asyncio.fixture()
+async def ping_status(monkeypatch: pytest.MonkeyPatch) -> PingStatus:
+    # No jitter, so the schedule is predictable
+    monkeypatch.setattr(ping.random, "uniform", lambda low, high: 1)
+    monkeypatch.setattr(CORE, "config_path", "/config/.")
+    dashboard = Mock()
+    dashboard.entries = FakeEntries([_entry("a", "10.0.0.1"), _entry("b", "10.0.0.2")])
+
+    async def async_resolve(address: str) -> list[str]:
+        return [address]
+
+    dashboard.dns_cache.async_resolve = async_resolve
+    dashboard.stop_event = threading.Event()
+    return PingStatus(dashboard)
+
+
+async def _ping_due(ping_status: PingStatus, prober: FakeProber) -> list[str]:
+    prober.probed.clear()
+    due = ping_status._async_pop_due(ping.time.monotonic())
+    await asyncio.gather(*(ping_status._async_ping_entry(prober, e) for e in due))
+    return sorted(prober.probed)
+
+
+@pytest.mark.asyncio
+async def test_backs_off_while_state_is_stable(
+    ping_status: PingStatus, clock: FakeClock
+) -> None:
+    prober = FakeProber()
+    prober.reachable = {"10.0.0.1"}
+
+    assert await _ping_due(ping_status, prober) == ["10.0.0.1", "10.0.0.2"]
+    entry = ping_status.dashboard.entries.get("/config/a.yaml")
+    assert entry.state == bool_to_entry_state(True, EntryStateSource.PING)
+    assert entry.rtt == 1.5
+    assert entry.last_seen is not None
+
+    # Both states are new, so both devices are pinged again after 5 seconds
+    clock.now += 4
+    assert await _ping_due(ping_status, prober) == []
+    clock.now += 1
+    assert await _ping_due(ping_status, prober) == ["10.0.0.1", "10.0.0.2"]
+    # Unchanged, the interval doubles
+    clock.now += 5
+    assert await _ping_due(ping_status, prober) == []
+    clock.now += 5
+    assert await _ping_due(ping_status, prober) == ["10.0.0.1", "10.0.0.2"]
+
+    # A device that goes offline is checked quickly again
+    prober.reachable = set()
+    clock.now += 20
+    assert await _ping_due(ping_status, prober) == ["10.0.0.1", "10.0.0.2"]
+    assert entry.state.reachable is ReachableState.OFFLINE
+    clock.now += 5
+    assert await _ping_due(ping_status, prober) == ["10.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_skips_entries_online_from_other_source(
+    ping_status: PingStatus, clock: FakeClock
+) -> None:
+    entry = ping_status.dashboard.entries.get("/config/a.yaml")
+    entry.state = bool_to_entry_state(True, EntryStateSource.MDNS)
+    prober = FakeProber()
+
+    assert await _ping_due(ping_status, prober) == ["10.0.0.2"]
+
+
+@pytest.mark.asyncio
+async def test_prober_pings_concurrently_on_one_socket() -> None:
+    privileged = await ping._can_use_icmp_lib_with_privilege()
+    if privileged is None:
+        pytest.skip("Cannot create ICMP sockets")
+    prober = ICMPProber(privileged)
+    try:
+        results = await asyncio.gather(
+            *(prober.async_probe("127.0.0.1") for _ in range(10))
+        )
+    finally:
+        await prober.async_close()
+
+    assert all(rtt is not None and rtt >= 0 for rtt in results)
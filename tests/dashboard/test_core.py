@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from esphome.dashboard import core
+from esphome.dashboard.const import (
+    EVENT_ENTRY_ADDED,
+    EVENT_ENTRY_REMOVED,
+    EVENT_ENTRY_STATE_CHANGED,
+    EVENT_ENTRY_UPDATED,
+    EVENT_IMPORTABLE_CHANGED,
+)
+from esphome.dashboard.core import EntryEventBatcher, EventBus
+from esphome.dashboard.entries import EntryState, EntryStateSource, ReachableState
+
+
+def _entry(name: str, reachable: ReachableState = ReachableState.ONLINE) -> Mock:
+    entry = Mock(path=f"/config/{name}.yaml", filename=f"{name}.yaml")
+    entry.state = EntryState(reachable, EntryStateSource.PING)
+    entry.to_dict.return_value = {"name": name}
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_entry_events_are_batched(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(core, "EVENT_BATCH_INTERVAL", 0.01)
+    bus = EventBus()
+    batcher = EntryEventBatcher(bus, lambda: [])
+    messages: list[dict] = []
+    unsubscribe = batcher.async_subscribe(
+        lambda text: messages.append(json.loads(text))
+    )
+
+    flapping = [_entry(f"device{i}") for i in range(100)]
+    for _ in range(3):
+        for entry in flapping:
+            bus.async_fire(EVENT_ENTRY_STATE_CHANGED, {"entry": entry})
+    added = _entry("added", ReachableState.OFFLINE)
+    bus.async_fire(EVENT_ENTRY_ADDED, {"entry": added})
+    bus.async_fire(EVENT_ENTRY_STATE_CHANGED, {"entry": added})
+    short_lived = _entry("short_lived")
+    bus.async_fire(EVENT_ENTRY_ADDED, {"entry": short_lived})
+    bus.async_fire(EVENT_ENTRY_REMOVED, {"entry": short_lived})
+    bus.async_fire(EVENT_ENTRY_REMOVED, {"entry": flapping[0]})
+    await asyncio.sleep(0.05)
+
+    assert len(messages) == 1
+    data = messages[0]["data"]
+    assert data["added"] == [{"name": "added"}]
+    assert data["updated"] == []
+    assert data["removed"] == ["device0.yaml"]
+    assert len(data["states"]) == 100
+    assert data["states"]["added.yaml"] is False
+    assert data["states"]["device1.yaml"] is True
+
+    # Without subscribers, events are not collected
+    unsubscribe()
+    bus.async_fire(EVENT_ENTRY_UPDATED, {"entry": flapping[1]})
+    await asyncio.sleep(0.05)
+    assert len(messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_importable_changes_are_sent(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(core, "EVENT_BATCH_INTERVAL", 0.01)
+    bus = EventBus()
+    importable = [{"name": "discovered"}]
+    batcher = EntryEventBatcher(bus, lambda: importable)
+    messages: list[dict] = []
+    batcher.async_subscribe(lambda text: messages.append(json.loads(text)))
+
+    bus.async_fire(EVENT_IMPORTABLE_CHANGED, {})
+    bus.async_fire(EVENT_IMPORTABLE_CHANGED, {})
+    await asyncio.sleep(0.05)
+    assert len(messages) == 1
+    assert messages[0]["data"]["importable"] == [{"name": "discovered"}]
+    assert messages[0]["data"]["added"] == []
+
+    # Only state changes don't change which devices are importable
+    bus.async_fire(EVENT_ENTRY_STATE_CHANGED, {"entry": _entry("device")})
+    await asyncio.sleep(0.05)
+    assert "importable" not in messages[1]["data"]
+
+    # Configuring a discovered device does
+    importable = []
+    bus.async_fire(EVENT_ENTRY_ADDED, {"entry": _entry("discovered")})
+    await asyncio.sleep(0.05)
+    assert messages[2]["data"]["importable"] == []
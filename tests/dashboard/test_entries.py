@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from esphome.core import CORE
+from esphome.dashboard import entries as entries_module
+from esphome.dashboard.const import (
+    EVENT_ENTRY_ADDED,
+    EVENT_ENTRY_REMOVED,
+    EVENT_ENTRY_UPDATED,
+)
+from esphome.dashboard.core import EventBus
+from esphome.dashboard.entries import DashboardEntries
+from esphome.dashboard.util import inotify
+
+CONFIG = """\
+esphome:
+  name: {name}
+"""
+
+
+class FakeDashboard:
+    def __init__(self, config_dir: Path) -> None:
+        self.bus = EventBus()
+        self.settings = type("Settings", (), {"config_dir": str(config_dir)})()
+        self.events: list[tuple[str, str]] = []
+        self.updated = asyncio.Event()
+        for event_type in (EVENT_ENTRY_ADDED, EVENT_ENTRY_UPDATED, EVENT_ENTRY_REMOVED):
+            self.bus.async_add_listener(event_type, self._on_event)
+
+    def _on_event(self, event) -> None:
+        self.events.append(
+            (event.event_type, os.path.basename(event.data["entry"].path))
+        )
+        self.updated.set()
+
+    def async_create_background_task(self, coro) -> asyncio.Task:
+        return asyncio.create_task(coro)
+
+
+@pytest_asyncio.fixture()
+async def dashboard(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeDashboard:
+    monkeypatch.setattr(entries_module, "WATCH_DEBOUNCE", 0.01)
+    monkeypatch.setattr(CORE, "config_path", os.path.join(tmp_path, "."))
+    (tmp_path / ".esphome" / "storage").mkdir(parents=True)
+    (tmp_path / "first.yaml").write_text(CONFIG.format(name="first"))
+    return FakeDashboard(tmp_path)
+
+
+async def _next_events(dashboard: FakeDashboard) -> list[tuple[str, str]]:
+    await asyncio.wait_for(dashboard.updated.wait(), 5)
+    # Let the rest of the update fire its events
+    await asyncio.sleep(0)
+    events = list(dashboard.events)
+    dashboard.events.clear()
+    dashboard.updated.clear()
+    return events
+
+
+@pytest.mark.skipif(inotify._load_libc() is None, reason="inotify not available")
+@pytest.mark.asyncio
+async def test_watched_entries(dashboard: FakeDashboard, tmp_path: Path) -> None:
+    entries = DashboardEntries(dashboard)
+    assert entries.async_start_watching()
+    try:
+        await entries.async_update_entries()
+        assert await _next_events(dashboard) == [(EVENT_ENTRY_ADDED, "first.yaml")]
+
+        (tmp_path / "second.yaml").write_text(CONFIG.format(name="second"))
+        (tmp_path / "notes.txt").write_text("ignored")
+        assert await _next_events(dashboard) == [(EVENT_ENTRY_ADDED, "second.yaml")]
+
+        storage = tmp_path / ".esphome" / "storage" / "first.yaml.json"
+        storage.write_text('{"storage_version": 1, "name": "renamed"}')
+        assert await _next_events(dashboard) == [(EVENT_ENTRY_UPDATED, "first.yaml")]
+
+        (tmp_path / "second.yaml").rename(tmp_path / "third.yaml")
+        assert sorted(await _next_events(dashboard)) == [
+            (EVENT_ENTRY_ADDED, "third.yaml"),
+            (EVENT_ENTRY_REMOVED, "second.yaml"),
+        ]
+        assert sorted(entry.name for entry in entries.async_all()) == [
+            "renamed",
+            "third",
+        ]
+        assert entries.get_by_name("renamed")
+    finally:
+        entries.stop_watching()
+
+
+@pytest.mark.asyncio
+async def test_watched_entries_only_stat_changed_files(
+    dashboard: FakeDashboard, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    entries = DashboardEntries(dashboard)
+    if not entries.async_start_watching():
+        pytest.skip("inotify not available")
+    try:
+        await entries.async_update_entries()
+        await _next_events(dashboard)
+
+        checked = []
+        get_path_to_cache_key = DashboardEntries._get_path_to_cache_key
+
+        def record(self, paths=None):
+            checked.append(paths)
+            return get_path_to_cache_key(self, paths)
+
+        monkeypatch.setattr(DashboardEntries, "_get_path_to_cache_key", record)
+        # Nothing changed, so nothing is checked
+        await entries.async_request_update_entries()
+        assert checked == []
+
+        (tmp_path / "second.yaml").write_text(CONFIG.format(name="second"))
+        await _next_events(dashboard)
+        assert checked == [{str(tmp_path / "second.yaml")}]
+    finally:
+        entries.stop_watching()
+
+
+@pytest.mark.asyncio
+async def test_polling_fallback(
+    dashboard: FakeDashboard, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(inotify, "_load_libc", lambda: None)
+    entries = DashboardEntries(dashboard)
+    assert not entries.async_start_watching()
+
+    await entries.async_update_entries()
+    assert await _next_events(dashboard) == [(EVENT_ENTRY_ADDED, "first.yaml")]
+
+    (tmp_path / "first.yaml").unlink()
+    await entries.async_update_entries()
+    assert await _next_events(dashboard) == [(EVENT_ENTRY_REMOVED, "first.yaml")]
+
+
+@pytest.mark.asyncio
+async def test_watched_directory_recreated(
+    dashboard: FakeDashboard, tmp_path: Path
+) -> None:
+    entries = DashboardEntries(dashboard)
+    if not entries.async_start_watching():
+        pytest.skip("inotify not available")
+    try:
+        await entries.async_update_entries()
+        await _next_events(dashboard)
+
+        # Deleting .esphome and compiling again creates the storage directory anew
+        storage_dir = tmp_path / ".esphome" / "storage"
+        storage_dir.rmdir()
+        storage_dir.mkdir()
+        (storage_dir / "first.yaml.json").write_text(
+            '{"storage_version": 1, "name": "renamed"}'
+        )
+        assert await _next_events(dashboard) == [(EVENT_ENTRY_UPDATED, "first.yaml")]
+
+        (storage_dir / "first.yaml.json").write_text(
+            '{"storage_version": 1, "name": "renamed-again"}'
+        )
+        assert await _next_events(dashboard) == [(EVENT_ENTRY_UPDATED, "first.yaml")]
+        assert entries.get_by_name("renamed-again")
+    finally:
+        entries.stop_watching()
+
+
+@pytest.mark.asyncio
+async def test_watched_directory_removed(
+    dashboard: FakeDashboard, tmp_path: Path
+) -> None:
+    entries = DashboardEntries(dashboard)
+    if not entries.async_start_watching():
+        pytest.skip("inotify not available")
+    try:
+        await entries.async_update_entries()
+        await _next_events(dashboard)
+
+        storage_dir = tmp_path / ".esphome" / "storage"
+        storage_dir.rmdir()
+        # Let the watcher notice that the directory is gone
+        for _ in range(500):
+            if entries._watcher is None:
+                break
+            await asyncio.sleep(0.01)
+        assert entries._watcher is None
+
+        storage_dir.mkdir()
+        (storage_dir / "first.yaml.json").write_text(
+            '{"storage_version": 1, "name": "renamed"}'
+        )
+        # Every update checks all files again
+        await entries.async_request_update_entries()
+        assert await _next_events(dashboard) == [(EVENT_ENTRY_UPDATED, "first.yaml")]
+        assert entries.get_by_name("renamed")
+    finally:
+        entries.stop_watching()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from esphome import yaml_util
+from esphome.config import read_config, strip_default_ids
+from esphome.config_cache import cache_path
+from esphome.core import CORE
+from esphome.dashboard.json_config import (
+    JsonConfigCache,
+    config_to_json_data,
+    load_json_config,
+)
+from esphome.dashboard.web_server import SafeLoaderIgnoreUnknown
+
+CONFIG = """\
+substitutions:
+  name: jsontest
+
+esphome:
+  name: ${name}
+  on_boot:
+    - lambda: ESP_LOGD("test", "booted");
+
+host:
+
+logger:
+  level: DEBUG
+
+api:
+  encryption:
+    key: !secret api_key
+  reboot_timeout: 5min
+
+sensor:
+  - platform: template
+    id: value
+    name: Value
+    lambda: return 1.5;
+    update_interval: 30s
+    filters:
+      - multiply: 2.5
+"""
+
+SECRETS = """\
+api_key: "kCmUpDykqNMzmfNbIL3wGBwXMdOvRqJfDrj7mQHi5vA="
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    (tmp_path / "secrets.yaml").write_text(SECRETS)
+    path = tmp_path / "jsontest.yaml"
+    path.write_text(CONFIG)
+    yield path
+    CORE.reset()
+
+
+def test_json_matches_yaml_output(config_file: Path) -> None:
+    CORE.config_path = str(config_file)
+    config = strip_default_ids(read_config({}))
+    # What the dashboard used to do with the output of esphome config
+    expected = yaml.load(
+        yaml_util.dump(config, show_secrets=True), Loader=SafeLoaderIgnoreUnknown
+    )
+
+    assert config_to_json_data(config) == expected
+    assert expected["api"]["encryption"]["key"] == (
+        "kCmUpDykqNMzmfNbIL3wGBwXMdOvRqJfDrj7mQHi5vA="
+    )
+
+
+def test_load_json_config(config_file: Path) -> None:
+    files, text = load_json_config(str(config_file))
+
+    assert json.loads(text)["esphome"]["name"] == "jsontest"
+    assert set(files) == {str(config_file), str(config_file.parent / "secrets.yaml")}
+
+
+def test_load_json_config_cache_is_opt_in(config_file: Path) -> None:
+    assert load_json_config(str(config_file)) is not None
+    assert not os.path.exists(cache_path())
+
+    assert load_json_config(str(config_file), use_cache=True) is not None
+    assert os.path.exists(cache_path())
+
+
+class FakeWorkers:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def async_call(self, func, *args):
+        self.calls += 1
+        CORE.reset()
+        return func(*args)
+
+
+@pytest.mark.asyncio
+async def test_cache_until_a_file_changes(config_file: Path) -> None:
+    cache = JsonConfigCache()
+    workers = FakeWorkers()
+
+    first = await cache.async_get(workers, str(config_file))
+    assert await cache.async_get(workers, str(config_file)) == first
+    assert workers.calls == 1
+
+    secrets = config_file.parent / "secrets.yaml"
+    secrets.write_text(SECRETS.replace("kCmU", "AAAA"))
+    stat = secrets.stat()
+    os.utime(secrets, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = await cache.async_get(workers, str(config_file))
+    assert workers.calls == 2
+    assert json.loads(second)["api"]["encryption"]["key"].startswith("AAAA")
+
+    config_file.write_text("invalid: [")
+    assert await cache.async_get(workers, str(config_file)) is None
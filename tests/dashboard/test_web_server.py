@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import json
 import os
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -11,9 +13,14 @@ from tornado.httpclient import AsyncHTTPClient, HTTPResponse
 from tornado.httpserver import HTTPServer
 from tornado.ioloop import IOLoop
 from tornado.testing import bind_unused_port
+from tornado.websocket import websocket_connect
 
-from esphome.dashboard import web_server
+from esphome import espota2
+from esphome.dashboard import core, web_server
+from esphome.dashboard.const import EVENT_ENTRY_UPDATED, EVENT_IMPORTABLE_CHANGED
 from esphome.dashboard.core import DASHBOARD
+from esphome.dashboard.entries import EntryState, EntryStateSource, ReachableState
+from esphome.zeroconf import ESPHOME_SERVICE_TYPE, DashboardImportDiscovery
 
 from .common import get_fixture_path
 
@@ -24,17 +31,25 @@ class DashboardTestHelper:
         self.client = client
         self.port = port
 
-    async def fetch(self, path: str, **kwargs) -> HTTPResponse:
+    async def fetch(
+        self, path: str, raise_error: bool = True, **kwargs
+    ) -> HTTPResponse:
         """Get a response for the given path."""
         if path.lower().startswith(("http://", "https://")):
             url = path
         else:
             url = f"http://127.0.0.1:{self.port}{path}"
-        future = self.client.fetch(url, raise_error=True, **kwargs)
+        future = self.client.fetch(url, raise_error=raise_error, **kwargs)
         result = await future
         return result
 
 
+@pytest.fixture
+def mdns_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the mdns status from replacing the discovered devices."""
+    monkeypatch.setattr(core.MDNSStatus, "async_setup", lambda self: False)
+
+
 @pytest_asyncio.fixture()
 async def dashboard() -> DashboardTestHelper:
     sock, port = bind_unused_port()
@@ -42,6 +57,7 @@ async def dashboard() -> DashboardTestHelper:
         ha_addon=True,
         configuration=get_fixture_path("conf"),
         port=port,
+        config_cache=False,
     )
     DASHBOARD.settings.parse_args(args)
     app = web_server.make_app()
@@ -81,3 +97,205 @@ async def test_devices_page(dashboard: DashboardTestHelper) -> None:
     first_device = configured_devices[0]
     assert first_device["name"] == "pico"
     assert first_device["configuration"] == "pico.yaml"
+
+
+@pytest.mark.asyncio
+async def test_devices_page_is_cached(
+    dashboard: DashboardTestHelper, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = await dashboard.fetch("/devices")
+    etag = first.headers["Etag"]
+    renders = []
+    get_configured_devices = web_server.get_configured_devices
+
+    def record() -> list:
+        renders.append(True)
+        return get_configured_devices()
+
+    monkeypatch.setattr(web_server, "get_configured_devices", record)
+    response = await dashboard.fetch("/devices")
+    assert response.body == first.body
+    assert response.headers["Etag"] == etag
+    response = await dashboard.fetch(
+        "/devices", raise_error=False, headers={"If-None-Match": etag}
+    )
+    assert response.code == 304
+    assert renders == []
+
+    entry = DASHBOARD.entries.async_all()[0]
+    DASHBOARD.bus.async_fire(EVENT_ENTRY_UPDATED, {"entry": entry})
+    response = await dashboard.fetch(
+        "/devices", raise_error=False, headers={"If-None-Match": etag}
+    )
+    assert response.code == 200
+    assert response.headers["Etag"] != etag
+    assert json.loads(response.body) == json.loads(first.body)
+    assert renders == [True]
+
+
+@pytest.mark.asyncio
+async def test_prometheus_sd_not_modified(dashboard: DashboardTestHelper) -> None:
+    response = await dashboard.fetch("/prometheus-sd")
+    assert json.loads(response.body) == []
+    response = await dashboard.fetch(
+        "/prometheus-sd",
+        raise_error=False,
+        headers={"If-None-Match": response.headers["Etag"]},
+    )
+    assert response.code == 304
+
+
+@pytest.mark.asyncio
+async def test_events_websocket(
+    mdns_disabled: None,
+    dashboard: DashboardTestHelper,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(core, "EVENT_BATCH_INTERVAL", 0.01)
+    websocket = await websocket_connect(f"ws://127.0.0.1:{dashboard.port}/events")
+    try:
+        initial = json.loads(await websocket.read_message())
+        assert initial["event"] == "initial_state"
+        assert initial["data"]["configured"][0]["name"] == "pico"
+        assert initial["data"]["states"] == {"pico.yaml": None}
+
+        entry = DASHBOARD.entries.async_all()[0]
+        for reachable in (ReachableState.ONLINE, ReachableState.OFFLINE):
+            DASHBOARD.entries.async_set_state(
+                entry, EntryState(reachable, EntryStateSource.MDNS)
+            )
+        delta = json.loads(await websocket.read_message())
+        assert delta == {
+            "event": "entries",
+            "data": {
+                "added": [],
+                "updated": [],
+                "removed": [],
+                "states": {"pico.yaml": False},
+            },
+        }
+
+        # Discovered devices are sent when they change, like mdns.py wires it
+        imports = DashboardImportDiscovery(
+            lambda: DASHBOARD.bus.async_fire(EVENT_IMPORTABLE_CHANGED, {})
+        )
+        monkeypatch.setattr(DASHBOARD, "import_result", imports.import_state)
+        info = Mock(
+            properties={
+                b"package_import_url": b"github://esphome/example/example.yaml",
+                b"project_name": b"esphome.example",
+                b"project_version": b"1.0",
+            }
+        )
+        imports._process_service_info(f"discovered.{ESPHOME_SERVICE_TYPE}", info)
+        delta = json.loads(await websocket.read_message())
+        assert [device["name"] for device in delta["data"]["importable"]] == [
+            "discovered"
+        ]
+    finally:
+        websocket.close()
+
+
+@pytest.fixture
+def firmware(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> bytes:
+    monkeypatch.setenv("ESPHOME_DATA_DIR", str(tmp_path))
+    build_path = tmp_path / "build" / "pico"
+    bin_path = build_path / ".pioenvs" / "pico" / "firmware.bin"
+    bin_path.parent.mkdir(parents=True)
+    data = os.urandom(1024) * 200
+    bin_path.write_bytes(data)
+    (build_path / "platformio.ini").write_text("")
+    storage = {
+        "storage_version": 1,
+        "name": "pico",
+        "build_path": str(build_path),
+        "firmware_bin_path": str(bin_path),
+    }
+    (tmp_path / "storage").mkdir()
+    (tmp_path / "storage" / "pico.yaml.json").write_text(json.dumps(storage))
+    return data
+
+
+@pytest.mark.asyncio
+async def test_download_binary(dashboard: DashboardTestHelper, firmware: bytes) -> None:
+    response = await dashboard.fetch(
+        "/download.bin?configuration=pico.yaml&file=firmware.bin"
+    )
+    assert response.body == firmware
+    assert response.headers["Content-Disposition"] == (
+        'attachment; filename="pico-firmware.bin"'
+    )
+    etag = response.headers["Etag"]
+
+    response = await dashboard.fetch(
+        "/download.bin?configuration=pico.yaml&file=firmware.bin",
+        raise_error=False,
+        headers={"If-None-Match": etag},
+    )
+    assert response.code == 304
+
+    response = await dashboard.fetch(
+        "/download.bin?configuration=pico.yaml&file=firmware.bin",
+        headers={"Range": "bytes=100-199"},
+    )
+    assert response.code == 206
+    assert response.headers["Content-Range"] == f"bytes 100-199/{len(firmware)}"
+    assert response.body == firmware[100:200]
+
+    response = await dashboard.fetch(
+        "/download.bin?configuration=pico.yaml&file=firmware.bin",
+        raise_error=False,
+        headers={"Range": f"bytes={len(firmware)}-"},
+    )
+    assert response.code == 416
+    assert response.headers["Content-Range"] == f"bytes */{len(firmware)}"
+
+
+@pytest.mark.asyncio
+async def test_download_binary_compressed(
+    dashboard: DashboardTestHelper, firmware: bytes, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    compressed = []
+    get_compressed_firmware = espota2.get_compressed_firmware
+
+    def record(filename: str) -> str:
+        compressed.append(filename)
+        return get_compressed_firmware(filename)
+
+    monkeypatch.setattr(espota2, "get_compressed_firmware", record)
+    url = "/download.bin?configuration=pico.yaml&file=firmware.bin&compressed=1"
+    first = await dashboard.fetch(url)
+    second = await dashboard.fetch(url)
+
+    assert gzip.decompress(first.body) == firmware
+    assert second.body == first.body
+    assert len(compressed) == 1
+
+
+@pytest.mark.asyncio
+async def test_download_extra_image_from_cached_idedata(
+    dashboard: DashboardTestHelper,
+    firmware: bytes,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bootloader = tmp_path / "packages" / "bootloader_dio_40m.bin"
+    bootloader.parent.mkdir()
+    bootloader.write_bytes(b"bootloader")
+    idedata = {
+        "extra": {"flash_images": [{"path": str(bootloader), "offset": "0x1000"}]}
+    }
+    (tmp_path / "idedata").mkdir()
+    (tmp_path / "idedata" / "pico.json").write_text(json.dumps(idedata))
+    # The cache is only used if it is newer than the build
+    ini = tmp_path / "build" / "pico" / "platformio.ini"
+    os.utime(ini, (0, 0))
+
+    async def fail(*args):
+        raise AssertionError("idedata should not be run")
+
+    monkeypatch.setattr(web_server.DASHBOARD.workers, "async_run_command", fail)
+    response = await dashboard.fetch(
+        "/download.bin?configuration=pico.yaml&file=bootloader_dio_40m.bin"
+    )
+    assert response.body == b"bootloader"
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from esphome.core import EsphomeError
+from esphome.dashboard.json_config import load_json_config
+from esphome.dashboard.workers import WorkerPool
+
+CONFIG = """\
+esphome:
+  name: {name}
+host:
+"""
+
+
+@pytest_asyncio.fixture()
+async def pool() -> WorkerPool:
+    pool = WorkerPool(1)
+    await pool.async_start(["host", "json"])
+    yield pool
+    pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_runs_commands_in_same_worker(pool: WorkerPool, tmp_path: Path) -> None:
+    results = []
+    for name in ("first", "second"):
+        path = tmp_path / f"{name}.yaml"
+        path.write_text(CONFIG.format(name=name))
+        results.append(await pool.async_run_command(["esphome", "config", str(path)]))
+
+    for (rc, stdout, stderr), name in zip(results, ("first", "second")):
+        assert rc == 0
+        assert f"name: {name}" in stdout.decode()
+        assert "Reading configuration" in stderr.decode()
+
+
+@pytest.mark.asyncio
+async def test_streams_output_and_exit_code(pool: WorkerPool, tmp_path: Path) -> None:
+    lines = []
+    rc = await pool.async_run(
+        ["esphome", "config", str(tmp_path / "missing.yaml")],
+        lambda stream, text: lines.append(text),
+    )
+
+    assert rc == 2
+    assert all(line.endswith("\n") for line in lines)
+    assert any("missing.yaml" in line for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_calls_function(pool: WorkerPool, tmp_path: Path) -> None:
+    path = tmp_path / "device.yaml"
+    path.write_text(CONFIG.format(name="device"))
+
+    files, text = await pool.async_call(load_json_config, str(path))
+
+    assert json.loads(text)["esphome"]["name"] == "device"
+    assert list(files) == [str(path)]
+
+    with pytest.raises(EsphomeError):
+        await pool.async_call(os.listdir, str(tmp_path / "missing"))
+
+
+CUSTOM_JSON = """\
+import esphome.config_validation as cv
+
+CONFIG_SCHEMA = cv.Schema({cv.Required("custom_key"): cv.string})
+"""
+
+
+@pytest.mark.asyncio
+async def test_custom_components_do_not_leak(pool: WorkerPool, tmp_path: Path) -> None:
+    plain = tmp_path / "plain"
+    custom = tmp_path / "custom"
+    (custom / "custom_components" / "json").mkdir(parents=True)
+    (custom / "custom_components" / "json" / "__init__.py").write_text(CUSTOM_JSON)
+    plain.mkdir()
+    config = CONFIG.format(name="device") + "json:\n  custom_key: value\n"
+    (plain / "device.yaml").write_text(config)
+    (custom / "device.yaml").write_text(config)
+
+    async def validate(path: Path) -> int:
+        rc, _, _ = await pool.async_run_command(["esphome", "config", str(path)])
+        return rc
+
+    # The core json component is already imported, the custom one replaces it
+    assert await validate(custom / "device.yaml") == 0
+    assert await validate(plain / "device.yaml") != 0
+
+
+@pytest.mark.asyncio
+async def test_log_level_of_each_job(pool: WorkerPool, tmp_path: Path) -> None:
+    path = tmp_path / "device.yaml"
+    path.write_text(CONFIG.format(name="device"))
+
+    _, _, quiet = await pool.async_run_command(["esphome", "-q", "config", str(path)])
+    _, _, normal = await pool.async_run_command(["esphome", "config", str(path)])
+    _, verbose, _ = await pool.async_run_command(["esphome", "-v", "config", str(path)])
+    _, normal_again, _ = await pool.async_run_command(["esphome", "config", str(path)])
+
+    assert b"Reading configuration" not in quiet
+    assert b"Reading configuration" in normal
+    # Only verbose output keeps the automatically generated IDs
+    assert b"mdns_mdnscomponent_id" in verbose
+    assert b"mdns_mdnscomponent_id" not in normal_again
+
+
+@pytest.mark.asyncio
+async def test_output_callback_error_replaces_worker(
+    pool: WorkerPool, tmp_path: Path
+) -> None:
+    path = tmp_path / "device.yaml"
+    path.write_text(CONFIG.format(name="device"))
+
+    def on_output(stream: str, text: str) -> None:
+        raise ConnectionError("websocket closed")
+
+    with pytest.raises(ConnectionError):
+        await pool.async_run(["esphome", "config", str(path)], on_output)
+
+    rc, stdout, _ = await pool.async_run_command(["esphome", "config", str(path)])
+    assert rc == 0
+    assert stdout.decode().startswith("esphome:")
+
+
+@pytest.mark.asyncio
+async def test_json_config_of_custom_components(
+    pool: WorkerPool, tmp_path: Path
+) -> None:
+    plain = tmp_path / "plain"
+    custom = tmp_path / "custom"
+    custom_json = custom / "custom_components" / "json" / "__init__.py"
+    custom_json.parent.mkdir(parents=True)
+    custom_json.write_text(CUSTOM_JSON)
+    plain.mkdir()
+    (plain / "device.yaml").write_text(CONFIG.format(name="device") + "json:\n")
+    (custom / "device.yaml").write_text(
+        CONFIG.format(name="device") + "json:\n  custom_key: value\n"
+    )
+
+    assert await pool.async_call(load_json_config, str(plain / "device.yaml"))
+    files, text = await pool.async_call(load_json_config, str(custom / "device.yaml"))
+    assert json.loads(text)["json"] == {"custom_key": "value"}
+    assert str(custom_json) in files
+    files, _ = await pool.async_call(load_json_config, str(plain / "device.yaml"))
+    assert list(files) == [str(plain / "device.yaml")]
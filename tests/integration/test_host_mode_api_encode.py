@@ -0,0 +1,42 @@
+"""Integration test and benchmark of the API message encoding in Host mode."""
+
+from __future__ import annotations
+
+import asyncio
+
+from aioesphomeapi import EntityState, SensorState
+import pytest
+
+from .types import APIClientConnectedFactory, RunCompiledFunction
+
+
+@pytest.mark.asyncio
+async def test_host_mode_api_encode(
+    yaml_config: str,
+    run_compiled: RunCompiledFunction,
+    api_client_connected: APIClientConnectedFactory,
+) -> None:
+    """Test that the encoding of entity info and state messages is timed."""
+    async with run_compiled(yaml_config), api_client_connected() as client:
+        entities, _ = await client.list_entities_services()
+        keys = {entity.key: entity.name for entity in entities}
+        times: dict[str, float] = {}
+        done: asyncio.Future[None] = asyncio.Future()
+
+        def on_state(state: EntityState) -> None:
+            if not isinstance(state, SensorState) or state.missing_state:
+                return
+            times[keys[state.key]] = state.state
+            if len(times) == len(keys) and not done.done():
+                done.set_result(None)
+
+        client.subscribe_states(on_state)
+        try:
+            await asyncio.wait_for(done, timeout=5.0)
+        except asyncio.TimeoutError:
+            pytest.fail(f"Encode times not received, got {times}")
+
+        # Nanoseconds per message, they are logged by the device
+        assert times["Sensor Info Time"] > 0
+        assert times["Services Time"] > 0
+        assert times["Sensor State Time"] > 0
@@ -0,0 +1,86 @@
+"""Integration test for batched state updates in Host mode."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from aioesphomeapi import EntityState, LogLevel, SensorState
+import pytest
+
+from .types import APIClientConnectedFactory, RunCompiledFunction
+
+if TYPE_CHECKING:
+    from aioesphomeapi.api_pb2 import (
+        SubscribeLogsResponse,  # pylint: disable=no-name-in-module
+    )
+
+NOISE_KEY = "N4Yle5YirwZhPiHHsdZLdOA73ndj/84veVaLhTvxCuU="
+
+
+@pytest.mark.parametrize("noise_psk", [None, NOISE_KEY], ids=["plaintext", "noise"])
+@pytest.mark.asyncio
+async def test_host_mode_batch(
+    yaml_config: str,
+    run_compiled: RunCompiledFunction,
+    api_client_connected: APIClientConnectedFactory,
+    noise_psk: str | None,
+) -> None:
+    """Test that batched states all arrive in order and after the batch delay."""
+    if noise_psk is not None:
+        yaml_config = yaml_config.replace(
+            "api:\n", f"api:\n  encryption:\n    key: {noise_psk}\n", 1
+        )
+    loop = asyncio.get_running_loop()
+    async with (
+        run_compiled(yaml_config),
+        api_client_connected(noise_psk=noise_psk) as client,
+    ):
+        entities, _ = await client.list_entities_services()
+        keys = {entity.name: entity.key for entity in entities}
+        received: list[tuple[float, float | str]] = []
+        complete = asyncio.Event()
+        expected = 0
+
+        def on_state(state: EntityState) -> None:
+            if not isinstance(state, SensorState) or state.missing_state:
+                return
+            received.append((loop.time(), state.state))
+            if len([value for _, value in received if value != "Halfway"]) == expected:
+                complete.set()
+
+        def on_log(msg: SubscribeLogsResponse) -> None:
+            if b"Halfway" in msg.message:
+                received.append((loop.time(), "Halfway"))
+
+        client.subscribe_states(on_state)
+        client.subscribe_logs(on_log, log_level=LogLevel.LOG_LEVEL_INFO)
+
+        async def burst(name: str, count: int) -> float:
+            nonlocal expected
+            received.clear()
+            complete.clear()
+            expected = count
+            start = loop.time()
+            client.button_command(keys[name])
+            try:
+                await asyncio.wait_for(complete.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                pytest.fail(f"{name} states not received, got {received}")
+            return start
+
+        # A small burst is held back for the batch delay and sent at once
+        start = await burst("Small Burst", 10)
+        assert [value for _, value in received] == list(range(1, 11))
+        assert received[0][0] - start >= 0.04
+        assert received[-1][0] - received[0][0] < 0.02
+
+        # A large one is sent as the batch fills up, the log message flushes it
+        await burst("Large Burst", 200)
+        # Let a log message that is out of order arrive too
+        await asyncio.sleep(0.1)
+        assert [value for _, value in received] == [
+            *range(1001, 1101),
+            "Halfway",
+            *range(1101, 1201),
+        ]
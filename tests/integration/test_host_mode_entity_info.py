@@ -0,0 +1,37 @@
+"""Integration test for the entity info sent by Host mode."""
+
+from __future__ import annotations
+
+from aioesphomeapi import SensorInfo, TextSensorInfo
+import pytest
+
+from .types import APIClientConnectedFactory, RunCompiledFunction
+
+
+@pytest.mark.asyncio
+async def test_host_mode_entity_info(
+    yaml_config: str,
+    run_compiled: RunCompiledFunction,
+    api_client_connected: APIClientConnectedFactory,
+) -> None:
+    """Test that the strings of the entity info reach the client intact."""
+    async with run_compiled(yaml_config), api_client_connected() as client:
+        entities, services = await client.list_entities_services()
+
+        sensor = next(e for e in entities if isinstance(e, SensorInfo))
+        assert sensor.name == "Test Temperature"
+        assert sensor.object_id == "test_temperature"
+        assert sensor.icon == "mdi:thermometer"
+        assert sensor.unit_of_measurement == "°C"
+        assert sensor.device_class == "temperature"
+        assert sensor.unique_id
+
+        text_sensor = next(e for e in entities if isinstance(e, TextSensorInfo))
+        assert text_sensor.name == "Test Text"
+        assert text_sensor.object_id == "test_text"
+        assert text_sensor.icon == ""
+        assert text_sensor.device_class == ""
+
+        assert len(services) == 1
+        assert services[0].name == "test_service"
+        assert services[0].args[0].name == "value"
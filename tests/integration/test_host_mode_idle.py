@@ -0,0 +1,72 @@
+"""Integration test of the main loop sleeping while idle in Host mode."""
+
+from __future__ import annotations
+
+import asyncio
+
+from aioesphomeapi import EntityState, SensorState
+import pytest
+
+from .types import APIClientConnectedFactory, RunCompiledFunction
+
+
+@pytest.mark.asyncio
+async def test_host_mode_idle(
+    yaml_config: str,
+    run_compiled: RunCompiledFunction,
+    api_client_connected: APIClientConnectedFactory,
+) -> None:
+    """Test that an idle loop sleeps and is woken by sockets and wake_loop()."""
+    loop = asyncio.get_running_loop()
+    async with run_compiled(yaml_config), api_client_connected() as client:
+        entities, _ = await client.list_entities_services()
+        keys = {entity.name: entity.key for entity in entities}
+        latency: asyncio.Future[float] = loop.create_future()
+        wakeups: list[float] = []
+        window: asyncio.Future[None] = loop.create_future()
+        measuring = False
+        presses: asyncio.Queue[float] = asyncio.Queue()
+
+        def on_state(state: EntityState) -> None:
+            if not isinstance(state, SensorState) or state.missing_state:
+                return
+            if state.key == keys["Wake Latency"] and not latency.done():
+                latency.set_result(state.state)
+            elif state.key == keys["Delayed Presses"]:
+                presses.put_nowait(state.state)
+            elif state.key == keys["Loop Wakeups"] and measuring:
+                wakeups.append(state.state)
+                if len(wakeups) == 2 and not window.done():
+                    window.set_result(None)
+
+        client.subscribe_states(on_state)
+
+        # wake_loop() from another thread runs the component right away instead of at the next timer
+        try:
+            assert await asyncio.wait_for(latency, timeout=10.0) < 50
+        except asyncio.TimeoutError:
+            pytest.fail("Wake latency not received")
+
+        # Requests are handled as soon as they arrive, not when the loop wakes up next
+        for _ in range(5):
+            start = loop.time()
+            await client.device_info()
+            assert loop.time() - start < 0.25
+
+        # A delay started by a request ends on time, not when the loop wakes up next
+        for count in range(1, 6):
+            start = loop.time()
+            client.button_command(keys["Delayed Press"])
+            try:
+                assert await asyncio.wait_for(presses.get(), timeout=5.0) == count
+            except asyncio.TimeoutError:
+                pytest.fail("Delayed press not received")
+            assert loop.time() - start < 0.3
+
+        # Without anything to do, the loop only wakes up for its timers, instead of every loop interval
+        measuring = True
+        try:
+            await asyncio.wait_for(window, timeout=10.0)
+        except asyncio.TimeoutError:
+            pytest.fail(f"Loop wakeups not received, got {wakeups}")
+        assert wakeups[1] - wakeups[0] < 25
@@ -0,0 +1,50 @@
+"""Integration test and benchmark of the scheduler in Host mode."""
+
+from __future__ import annotations
+
+import asyncio
+
+from aioesphomeapi import EntityState, SensorState
+import pytest
+
+from .types import APIClientConnectedFactory, RunCompiledFunction
+
+
+@pytest.mark.asyncio
+async def test_host_mode_scheduler(
+    yaml_config: str,
+    run_compiled: RunCompiledFunction,
+    api_client_connected: APIClientConnectedFactory,
+) -> None:
+    """Test that re-armed timeouts replace each other and only those of the same name."""
+    async with run_compiled(yaml_config), api_client_connected() as client:
+        entities, _ = await client.list_entities_services()
+        keys = {entity.name: entity.key for entity in entities}
+        states: dict[int, float] = {}
+        done: asyncio.Future[None] = asyncio.Future()
+
+        def on_state(state: EntityState) -> None:
+            if not isinstance(state, SensorState) or state.missing_state:
+                return
+            states[state.key] = state.state
+            if (
+                keys["Re-arm Time"] in states
+                and states.get(keys["Anonymous Fired"]) == 10
+                and keys["Debounce Fired"] in states
+                and states.get(keys["Colliding Fired"]) == 2
+                and not done.done()
+            ):
+                done.set_result(None)
+
+        client.subscribe_states(on_state)
+        try:
+            await asyncio.wait_for(done, timeout=5.0)
+        except asyncio.TimeoutError:
+            pytest.fail(f"Scheduler results not received, got {states}")
+        # Let a wrongly kept timeout fire too
+        await asyncio.sleep(0.2)
+
+        assert states[keys["Debounce Fired"]] == 1
+        assert states[keys["Anonymous Fired"]] == 10
+        assert states[keys["Colliding Fired"]] == 2
+        assert states[keys["Re-arm Time"]] > 0
@@ -0,0 +1,69 @@
+import pytest
+
+from esphome import config
+from esphome.core import CORE, ID
+from esphome.cpp_generator import MockObjClass
+
+BASE = MockObjClass("test::Base", parents=[])
+CHILD = MockObjClass("test::Child", parents=[BASE])
+OTHER = MockObjClass("test::Other", parents=[])
+
+
+@pytest.fixture(autouse=True)
+def reset_core():
+    CORE.reset()
+    yield
+    CORE.reset()
+
+
+def _run_id_pass(result: config.Config) -> None:
+    config.IDPassValidationStep().run(result)
+
+
+def test_id_pass_resolves_default_ids_uniquely():
+    result = config.Config()
+    result["a"] = [
+        {"id": ID(None, is_declaration=True, type=CHILD)},
+        {"id": ID("test_child_id_2", is_declaration=True, type=CHILD)},
+        {"id": ID(None, is_declaration=True, type=CHILD)},
+        {"id": ID(None, is_declaration=True, type=CHILD)},
+    ]
+
+    _run_id_pass(result)
+
+    assert not result.errors
+    assert [conf["id"].id for conf in result["a"]] == [
+        "test_child_id",
+        "test_child_id_2",
+        "test_child_id_3",
+        "test_child_id_4",
+    ]
+    assert result.get_path_for_id(ID("test_child_id_3")) == ["a", 2, "id"]
+
+
+def test_id_pass_finds_id_by_parent_type():
+    result = config.Config()
+    result["a"] = {"id": ID("child", is_declaration=True, type=CHILD)}
+    result["b"] = {"id": ID("other", is_declaration=True, type=OTHER)}
+    result["c"] = {"parent_id": ID(None, type=BASE)}
+
+    _run_id_pass(result)
+
+    assert not result.errors
+    assert result["c"]["parent_id"].id == "child"
+    assert [i.id for i in result.get_declared_ids_of_type(BASE)] == ["child"]
+
+
+def test_id_pass_duplicate_id():
+    result = config.Config()
+    result["a"] = {"id": ID("same", is_declaration=True, type=CHILD)}
+    result["b"] = {"id": ID("same", is_declaration=True, type=OTHER)}
+
+    _run_id_pass(result)
+
+    assert "ID same redefined! Check a->id" in result.errors[0].msg
+
+
+def test_get_path_for_id_missing():
+    with pytest.raises(KeyError):
+        config.Config().get_path_for_id(ID("missing"))
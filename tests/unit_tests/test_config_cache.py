@@ -0,0 +1,142 @@
+"""Tests for the validated configuration cache."""
+
+from pathlib import Path
+
+import pytest
+
+from esphome import config, config_cache, yaml_util
+from esphome.core import CORE
+
+CONFIG = """\
+esphome:
+  name: cached
+host:
+logger:
+sensor: !include sensors.yaml
+"""
+
+SENSORS = """\
+- platform: template
+  name: {name}
+  lambda: return 1.0;
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "cached.yaml"
+    path.write_text(CONFIG)
+    (tmp_path / "sensors.yaml").write_text(SENSORS.format(name="first"))
+    yield path
+    CORE.reset()
+
+
+def _load(path: Path) -> config.Config:
+    CORE.reset()
+    CORE.config_path = str(path)
+    return config.load_config({}, use_cache=True)
+
+
+def test_config_cache_restores_validated_config(config_path: Path) -> None:
+    first = _load(config_path)
+    assert not first.errors
+    assert Path(config_cache.cache_path()).is_file()
+
+    second = _load(config_path)
+
+    assert second is not first
+    assert second["sensor"][0]["name"] == "first"
+    assert second["sensor"][0]["id"].id == first["sensor"][0]["id"].id
+    assert CORE.name == "cached"
+    assert "template" in CORE.loaded_integrations
+
+
+def test_config_cache_invalidated_by_included_file(config_path: Path) -> None:
+    _load(config_path)
+
+    (config_path.parent / "sensors.yaml").write_text(SENSORS.format(name="second"))
+    result = _load(config_path)
+
+    assert result["sensor"][0]["name"] == "second"
+
+
+def test_config_cache_keyed_by_substitutions(config_path: Path) -> None:
+    _load(config_path)
+    CORE.reset()
+    CORE.config_path = str(config_path)
+
+    assert config_cache.load_cached_config({"name": "other"}) is None
+
+
+def test_config_cache_does_not_store_secret_values(config_path: Path) -> None:
+    config_path.write_text(
+        CONFIG.replace("name: cached", "name: cached\n  comment: !secret comment")
+    )
+    (config_path.parent / "secrets.yaml").write_text("comment: hidden-comment\n")
+    _load(config_path)
+
+    assert b"hidden-comment" not in Path(config_cache.cache_path()).read_bytes()
+
+    result = _load(config_path)
+    assert result["esphome"]["comment"] == "hidden-comment"
+    assert yaml_util.is_secret(result["esphome"]["comment"]) == "comment"
+
+
+def test_config_cache_skips_values_derived_from_secrets(config_path: Path) -> None:
+    config_path.write_text(CONFIG.replace("name: cached", "name: !secret name"))
+    (config_path.parent / "secrets.yaml").write_text("name: hidden-node\n")
+    _load(config_path)
+
+    assert not Path(config_cache.cache_path()).exists()
+
+
+def test_config_cache_skips_components_with_validation_state(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config_cache, "_UNCACHEABLE_COMPONENTS", {"template"})
+    _load(config_path)
+
+    assert not Path(config_cache.cache_path()).exists()
+
+
+I2S_CONFIG = """\
+esphome:
+  name: cached-i2s
+esp32:
+  board: esp32dev
+  framework:
+    type: esp-idf
+i2s_audio:
+  i2s_lrclk_pin: GPIO25
+  use_legacy: {use_legacy}
+"""
+
+
+def _generate_defines(path: Path) -> set[str]:
+    # pylint: disable=import-outside-toplevel
+    from esphome.__main__ import generate_cpp_contents
+
+    CORE.reset()
+    CORE.config_path = str(path)
+    CORE.config = config.read_config({}, use_cache=True)
+    generate_cpp_contents(CORE.config)
+    return {define.name for define in CORE.defines}
+
+
+def test_config_cache_keeps_validation_state(tmp_path: Path) -> None:
+    new_driver = tmp_path / "new.yaml"
+    new_driver.write_text(I2S_CONFIG.format(use_legacy="false"))
+    legacy_driver = tmp_path / "legacy.yaml"
+    legacy_driver.write_text(I2S_CONFIG.format(use_legacy="true"))
+    try:
+        uncached = _generate_defines(new_driver)
+        assert Path(config_cache.cache_path()).is_file()
+        # Validation of another configuration in the same process in between
+        assert "USE_I2S_LEGACY" in _generate_defines(legacy_driver)
+
+        cached = _generate_defines(new_driver)
+    finally:
+        CORE.reset()
+
+    assert "USE_I2S_LEGACY" not in uncached
+    assert cached == uncached
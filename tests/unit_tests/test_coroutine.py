@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+
+from esphome.core import CORE, ID
+from esphome.coroutine import FakeAwaitable
+
+
+@pytest.fixture(autouse=True)
+def reset_core():
+    CORE.reset()
+    yield
+    CORE.reset()
+
+
+def test_waiting_task_resumes_when_variable_registered():
+    order = []
+
+    async def consumer(config):
+        order.append("consumer waiting")
+        value = await CORE.get_variable(ID("producer_id"))
+        order.append(f"consumer got {value}")
+
+    async def producer(config):
+        order.append("producer")
+        CORE.register_variable(ID("producer_id"), "obj")
+
+    CORE.add_job(consumer, {})
+    CORE.add_job(producer, {})
+    CORE.flush_tasks()
+
+    assert order == ["consumer waiting", "producer", "consumer got obj"]
+
+
+def test_waiting_task_is_not_retried(caplog):
+    async def consumer(config):
+        await CORE.get_variable(ID("late_id"))
+
+    def poll(times):
+        for _ in range(times):
+            yield
+
+    async def slow_producer(config):
+        await FakeAwaitable(poll(100))
+        CORE.register_variable(ID("late_id"), "obj")
+
+    CORE.add_job(consumer, {})
+    CORE.add_job(slow_producer, {})
+    with caplog.at_level(logging.DEBUG, logger="esphome.coroutine"):
+        CORE.flush_tasks()
+
+    consumer_steps = [
+        r
+        for r in caplog.records
+        if r.msg.startswith("Running") and r.args[0].endswith("consumer")
+    ]
+    # Once until it blocks, once after the variable is registered
+    assert len(consumer_steps) == 2
+
+
+def test_circular_dependency_reports_id_chain():
+    async def component(config):
+        await CORE.get_variable(config["needs"])
+        CORE.register_variable(config["id"], "obj")
+
+    CORE.add_job(component, {"id": ID("a"), "needs": ID("b")})
+    CORE.add_job(component, {"id": ID("b"), "needs": ID("c")})
+    CORE.add_job(component, {"id": ID("c"), "needs": ID("a")})
+
+    with pytest.raises(Exception, match="'a' -> 'b' -> 'c' -> 'a'"):
+        CORE.flush_tasks()
+
+
+def test_missing_variable_reported():
+    async def component(config):
+        await CORE.get_variable(ID("missing"))
+
+    CORE.add_job(component, {})
+
+    with pytest.raises(Exception, match="never registered: 'missing'"):
+        CORE.flush_tasks()
@@ -285,6 +285,29 @@ class TestStatements:
 #     pass
 
 
+class TestProgmemData:
+    def test_source(self):
+        target = cg.ProgmemData(ct.uint8, "foo", bytes(range(20)))
+
+        assert target.declaration == "extern const uint8_t foo[] PROGMEM;"
+        lines = target.source.splitlines()
+        assert lines[0] == f"// {target.digest}"
+        assert lines[-4:] == [
+            "const uint8_t foo[] PROGMEM = {",
+            "  0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07,"
+            " 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F,",
+            "  0x10, 0x11, 0x12, 0x13,",
+            "};",
+        ]
+
+    def test_digest(self):
+        target = cg.ProgmemData(ct.uint8, "foo", b"\x01")
+
+        assert target.digest == cg.ProgmemData(ct.uint8, "foo", b"\x01").digest
+        assert target.digest != cg.ProgmemData(ct.uint8, "bar", b"\x01").digest
+        assert target.digest != cg.ProgmemData(ct.uint8, "foo", b"\x02").digest
+
+
 class TestMockObj:
     def test_getattr(self):
         target = cg.MockObj("foo")
@@ -0,0 +1,189 @@
+"""Tests for the OTA upload protocol."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+from pathlib import Path
+import socket
+import threading
+
+import pytest
+
+from esphome import espota2
+
+
+def _recv_exactly(conn: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        assert chunk
+        data += chunk
+    return data
+
+
+class FakeDevice:
+    """Device side of the OTA protocol, acknowledging every OTA block."""
+
+    def __init__(self, version: int, compression: bool) -> None:
+        self.version = version
+        self.compression = compression
+        self.uploads: list[tuple[bytes, str]] = []
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.server.settimeout(5)
+        self.threads: list[threading.Thread] = []
+
+    @property
+    def port(self) -> int:
+        return self.server.getsockname()[1]
+
+    def accept(self, count: int = 1) -> None:
+        """Serve the given number of uploads in the background."""
+
+        def accept() -> None:
+            for _ in range(count):
+                conn, _ = self.server.accept()
+                thread = threading.Thread(target=self._serve, args=(conn,))
+                thread.start()
+                self.threads.append(thread)
+
+        thread = threading.Thread(target=accept)
+        thread.start()
+        self.threads.append(thread)
+
+    def join(self) -> None:
+        for thread in self.threads:
+            thread.join(5)
+        self.server.close()
+
+    def _serve(self, conn: socket.socket) -> None:
+        with conn:
+            assert list(_recv_exactly(conn, 5)) == espota2.MAGIC_BYTES
+            conn.sendall(bytes([espota2.RESPONSE_OK, self.version]))
+            _recv_exactly(conn, 1)
+            features = (
+                espota2.RESPONSE_SUPPORTS_COMPRESSION
+                if self.compression
+                else espota2.RESPONSE_HEADER_OK
+            )
+            conn.sendall(bytes([features, espota2.RESPONSE_AUTH_OK]))
+            size = int.from_bytes(_recv_exactly(conn, 4), "big")
+            conn.sendall(bytes([espota2.RESPONSE_UPDATE_PREPARE_OK]))
+            md5 = _recv_exactly(conn, 32).decode()
+            conn.sendall(bytes([espota2.RESPONSE_BIN_MD5_OK]))
+            received = b""
+            last_ack = 0
+            while len(received) < size:
+                received += conn.recv(1024)
+                if self.version < espota2.OTA_VERSION_2_0:
+                    continue
+                while len(received) - last_ack >= 8192:
+                    last_ack += 8192
+                    conn.sendall(bytes([espota2.RESPONSE_CHUNK_OK]))
+            if self.version >= espota2.OTA_VERSION_2_0 and last_ack < size:
+                conn.sendall(bytes([espota2.RESPONSE_CHUNK_OK]))
+            conn.sendall(
+                bytes([espota2.RESPONSE_RECEIVE_OK, espota2.RESPONSE_UPDATE_END_OK])
+            )
+            _recv_exactly(conn, 1)
+            self.uploads.append((received, md5))
+
+    def upload(self, firmware: Path) -> tuple[bytes, str]:
+        self.accept()
+        assert espota2.run_ota("127.0.0.1", self.port, "", str(firmware)) == 0
+        self.join()
+        (upload,) = self.uploads
+        return upload
+
+
+@pytest.fixture
+def firmware(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(espota2.time, "sleep", lambda _: None)
+    path = tmp_path / "firmware.bin"
+    # Not a multiple of the block size, so the last acknowledgement is partial
+    path.write_bytes(bytes(range(256)) * 400 + b"x" * 1234)
+    return path
+
+
+@pytest.mark.parametrize("version", [espota2.OTA_VERSION_1_0, espota2.OTA_VERSION_2_0])
+def test_upload_uncompressed(firmware: Path, version: int) -> None:
+    received, md5 = FakeDevice(version, compression=False).upload(firmware)
+
+    assert received == firmware.read_bytes()
+    assert md5 == hashlib.md5(firmware.read_bytes()).hexdigest()
+
+
+def test_upload_compressed(firmware: Path) -> None:
+    received, md5 = FakeDevice(espota2.OTA_VERSION_2_0, compression=True).upload(
+        firmware
+    )
+
+    assert gzip.decompress(received) == firmware.read_bytes()
+    assert md5 == hashlib.md5(received).hexdigest()
+
+
+def test_compressed_firmware_is_cached(firmware: Path) -> None:
+    path = Path(espota2.get_compressed_firmware(str(firmware)))
+    assert path == firmware.with_name("firmware.bin.gz")
+    assert gzip.decompress(path.read_bytes()) == firmware.read_bytes()
+
+    path.write_bytes(b"cached")
+    assert espota2.get_compressed_firmware(str(firmware)) == str(path)
+    assert path.read_bytes() == b"cached"
+
+    firmware.write_bytes(b"new firmware")
+    espota2.get_compressed_firmware(str(firmware))
+    assert gzip.decompress(path.read_bytes()) == b"new firmware"
+
+
+def test_upload_to_many_devices(firmware: Path) -> None:
+    device = FakeDevice(espota2.OTA_VERSION_2_0, compression=False)
+    device.accept(2)
+    hosts = ["127.0.0.1", "localhost"]
+
+    results = espota2.run_ota_many(hosts, device.port, "", str(firmware), 2)
+    device.join()
+
+    assert results == dict.fromkeys(hosts, 0)
+    assert [received for received, _ in device.uploads] == [firmware.read_bytes()] * 2
+
+
+def test_upload_to_many_devices_reports_failures(firmware: Path) -> None:
+    device = FakeDevice(espota2.OTA_VERSION_2_0, compression=False)
+    device.accept()
+
+    results = espota2.run_ota_many(
+        ["127.0.0.1", "device.invalid"], device.port, "", str(firmware), 4
+    )
+    device.join()
+
+    assert results == {"127.0.0.1": 0, "device.invalid": 1}
+
+
+@pytest.mark.asyncio
+async def test_connect_races_slow_addresses(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(espota2, "HAPPY_EYEBALLS_DELAY", 0.01)
+    connect_socket = espota2._async_connect_socket
+    cancelled = asyncio.Event()
+
+    async def slow_connect_socket(af, socktype, sa):
+        if sa[1] == 1:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return await connect_socket(af, socktype, sa)
+
+    monkeypatch.setattr(espota2, "_async_connect_socket", slow_connect_socket)
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        addresses = [
+            (socket.AF_INET, socket.SOCK_STREAM, 0, "", ("127.0.0.1", 1)),
+            (socket.AF_INET, socket.SOCK_STREAM, 0, "", server.getsockname()),
+        ]
+        sock = await espota2.async_connect(addresses)
+        with sock:
+            assert sock.getpeername() == server.getsockname()
+
+    assert cancelled.is_set()
@@ -0,0 +1,142 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from esphome import git
+from esphome.core import CORE, TimePeriodSeconds
+
+
+def _git(*args: str, cwd: Path) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def origin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+    monkeypatch.setattr(CORE, "config_path", os.path.join(tmp_path, "."))
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git("init", "--quiet", "-b", "main", cwd=origin)
+    (origin / "file.txt").write_text("main")
+    _git("add", "file.txt", cwd=origin)
+    _git("commit", "--quiet", "-m", "main", cwd=origin)
+    _git("checkout", "--quiet", "-b", "dev", cwd=origin)
+    (origin / "file.txt").write_text("dev")
+    _git("commit", "--quiet", "-am", "dev", cwd=origin)
+    _git("checkout", "--quiet", "main", cwd=origin)
+    return origin
+
+
+def test_refs_share_one_object_store(origin: Path, tmp_path: Path) -> None:
+    url = f"file://{origin}"
+    sources = [
+        {"url": url, "ref": ref, "refresh": None, "domain": "packages"}
+        for ref in ("main", "dev", "main")
+    ]
+    results = [future.result() for future in git.clone_or_update_many(sources)]
+
+    assert [(path / "file.txt").read_text() for path, _ in results] == [
+        "main",
+        "dev",
+        "main",
+    ]
+    assert results[0] == results[2]
+    stores = list((tmp_path / ".esphome" / "git").glob("*.git"))
+    assert len(stores) == 1
+    assert len(list((stores[0] / "worktrees").iterdir())) == 2
+    # Each ref is fetched into its own local ref instead of the shared FETCH_HEAD
+    refs = _git("for-each-ref", "--format=%(refname)", "refs/esphome", cwd=stores[0])
+    assert len(refs.splitlines()) == 2
+    index = git._read_refresh_index()
+    assert sorted(index) == sorted({str(path) for path, _ in results})
+
+
+def test_update_and_revert(origin: Path) -> None:
+    url = f"file://{origin}"
+    day = TimePeriodSeconds(days=1)
+    repo_dir, revert = git.clone_or_update(
+        url=url, ref="main", refresh=day, domain="packages"
+    )
+    assert revert is None
+
+    (origin / "file.txt").write_text("changed")
+    _git("commit", "--quiet", "-am", "changed", cwd=origin)
+    # Refreshed recently, so nothing is fetched
+    assert git.clone_or_update(url=url, ref="main", refresh=day, domain="packages") == (
+        repo_dir,
+        None,
+    )
+    assert (repo_dir / "file.txt").read_text() == "main"
+
+    _, revert = git.clone_or_update(
+        url=url, ref="main", refresh=None, domain="packages"
+    )
+    assert (repo_dir / "file.txt").read_text() == "changed"
+    revert()
+    assert (repo_dir / "file.txt").read_text() == "main"
+
+
+FETCH_SCRIPT = """
+import sys
+from esphome import git
+from esphome.core import CORE
+
+CORE.config_path = sys.argv[1]
+path, _ = git.clone_or_update(
+    url=sys.argv[2], ref=sys.argv[3], refresh=None, domain="packages"
+)
+print((path / "file.txt").read_text())
+"""
+
+
+def test_processes_share_one_store(origin: Path, tmp_path: Path) -> None:
+    url = f"file://{origin}"
+    refs = ["main", "dev"] * 3
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", FETCH_SCRIPT, CORE.config_path, url, ref],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for ref in refs
+    ]
+    results = [process.communicate(timeout=60) for process in processes]
+
+    assert [process.returncode for process in processes] == [0] * len(refs), results
+    assert [stdout.strip() for stdout, _ in results] == refs
+
+
+def test_sources_of_one_checkout_are_merged(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    monkeypatch.setattr(
+        git, "clone_or_update", lambda **kwargs: calls.append(kwargs) or len(calls)
+    )
+    url = "https://github.com/esphome/example"
+    sources = [
+        {"url": url, "ref": "main", "refresh": TimePeriodSeconds(days=1)},
+        {"url": url, "ref": "main", "refresh": TimePeriodSeconds(hours=1)},
+        {"url": url, "ref": "main", "refresh": None, "submodules": ["lib"]},
+        {"url": url, "ref": "main", "username": "user", "password": "secret"},
+        {"url": url, "ref": "main", "refresh": None, "submodules": ["lib", "more"]},
+        {"url": url, "ref": "dev", "refresh": TimePeriodSeconds(days=1)},
+    ]
+    for source in sources:
+        source.setdefault("refresh", TimePeriodSeconds(days=1))
+        source["domain"] = "packages"
+
+    results = [future.result() for future in git.clone_or_update_many(sources)]
+
+    assert len(calls) == 2
+    assert results == [results[0]] * 5 + [results[5]]
+    main = next(call for call in calls if call["ref"] == "main")
+    assert main["refresh"] is None
+    assert main["submodules"] == ["lib", "more"]
+    assert (main["username"], main["password"]) == ("user", "secret")
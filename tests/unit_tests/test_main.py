@@ -0,0 +1,148 @@
+"""Tests for the command line interface."""
+
+from __future__ import annotations
+
+from argparse import Namespace
+import os
+from pathlib import Path
+import threading
+
+import pytest
+import voluptuous as vol
+
+from esphome import __main__ as main, yaml_util
+from esphome.core import CORE
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_jobs_must_be_positive(value: str) -> None:
+    with pytest.raises(SystemExit):
+        main.parse_args(["esphome", "update-all", "--ota-jobs", value, "configs"])
+    with pytest.raises(SystemExit):
+        main.parse_args(["esphome", "update-all", "--jobs", value, "configs"])
+
+
+def test_jobs_argument() -> None:
+    args = main.parse_args(["esphome", "update-all", "-j", "3", "configs"])
+
+    assert args.jobs == 3
+    assert args.ota_jobs == 4
+
+
+def test_update_all_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    commands: list[tuple[str, str]] = []
+    lock = threading.Lock()
+
+    def run(prefix: str, *cmd: str) -> int:
+        with lock:
+            commands.append((cmd[1], cmd[2]))
+        if cmd[1:] == ("compile", "b.yaml") or cmd[1:3] == ("upload", "c.yaml"):
+            return 1
+        return 0
+
+    monkeypatch.setattr(main, "run_external_process_prefixed", run)
+    bars: list[str] = []
+    args = Namespace(jobs=2, ota_jobs=1)
+
+    success = main._update_all_parallel(
+        args, ["a.yaml", "b.yaml", "c.yaml"], bars.append
+    )
+
+    assert success == {"a.yaml": True, "b.yaml": False, "c.yaml": False}
+    assert sorted(commands) == [
+        ("compile", "a.yaml"),
+        ("compile", "b.yaml"),
+        ("compile", "c.yaml"),
+        ("upload", "a.yaml"),
+        ("upload", "c.yaml"),
+    ]
+    assert len(bars) == 3
+
+
+def test_wait_for_file_change(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    path = tmp_path / "device.yaml"
+    path.write_text("esphome:\n")
+    files = {str(path): yaml_util.file_digest(str(path))}
+    stat = path.stat()
+    steps = [
+        # Saved without changes, only the modification time differs
+        lambda: os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000)),
+        lambda: None,
+        lambda: path.write_text("esphome:\n  name: changed\n"),
+        lambda: pytest.fail("Change was not detected"),
+    ]
+    sleeps = []
+
+    def sleep(interval: float) -> None:
+        sleeps.append(interval)
+        steps[len(sleeps) - 1]()
+
+    monkeypatch.setattr(main.time, "sleep", sleep)
+
+    main._wait_for_file_change(files, 0.5)
+
+    # The change is noticed by the check after the sleep it happened in
+    assert sleeps == [0.5, 0.5, 0.5]
+
+
+def test_build_watched_config_reports_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def generate(config) -> None:
+        raise RuntimeError("Tasks are deadlocked")
+
+    compiled = []
+    monkeypatch.setattr(main, "generate_cpp_contents", generate)
+    monkeypatch.setattr(main, "compile_program", lambda *args: compiled.append(args))
+    args = Namespace(verbose=False, only_generate=False)
+
+    main._build_watched_config(args, {})
+
+    assert compiled == []
+
+
+def test_build_watched_config_compiles(monkeypatch: pytest.MonkeyPatch) -> None:
+    compiled = []
+    monkeypatch.setattr(main, "generate_cpp_contents", lambda config: None)
+    monkeypatch.setattr(main, "write_cpp_file", lambda: None)
+    monkeypatch.setattr(
+        main, "compile_program", lambda args, config: compiled.append(config) or 0
+    )
+
+    main._build_watched_config(Namespace(verbose=False, only_generate=True), {})
+    assert compiled == []
+    main._build_watched_config(Namespace(verbose=False, only_generate=False), {})
+    assert compiled == [{}]
+
+
+def test_read_watched_config_reports_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def read(substitutions):
+        raise vol.Invalid("bad value")
+
+    reset = []
+    monkeypatch.setattr(main, "read_config", read)
+    monkeypatch.setattr(main.loader, "reset_components", lambda: reset.append(True))
+    monkeypatch.setattr(CORE, "config_path", "/config/device.yaml")
+
+    assert main._read_watched_config(Namespace(dashboard=False), {}) is None
+    assert CORE.config_path == "/config/device.yaml"
+    assert reset == [True]
+
+
+def test_watch_keeps_going_after_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    configs = iter([None, {"second": True}])
+    built = []
+    waits = []
+
+    def wait(files, interval) -> None:
+        waits.append(interval)
+        if len(waits) == 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(main, "_build_watched_config", lambda a, c: built.append(c))
+    monkeypatch.setattr(main, "_read_watched_config", lambda a, s: next(configs))
+    monkeypatch.setattr(main, "_wait_for_file_change", wait)
+    args = Namespace(substitution=None, interval=1.0)
+
+    with pytest.raises(KeyboardInterrupt):
+        main.command_watch(args, {"first": True})
+
+    assert built == [{"first": True}, {"second": True}]
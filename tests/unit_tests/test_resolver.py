@@ -0,0 +1,123 @@
+import asyncio
+import threading
+
+import pytest
+
+from esphome import resolver
+from esphome.core import EsphomeError
+from esphome.resolver import AddressCache, Resolver
+
+
+class FakeLookup:
+    def __init__(self, ttl: float = 60) -> None:
+        self.ttl = ttl
+        self.calls: list[str] = []
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, host: str) -> tuple[list[str], float]:
+        self.calls.append(host)
+        self.release.wait(5)
+        if self.fail:
+            raise EsphomeError(f"Cannot resolve {host}")
+        return [f"192.168.1.{len(self.calls)}"], self.ttl
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resolver.time, "time", lambda: now[0])
+    return now
+
+
+def test_records_expire_after_their_ttl(clock):
+    lookup = FakeLookup(ttl=30)
+    res = Resolver(lookup)
+
+    assert res.resolve("device.local") == ["192.168.1.1"]
+    clock[0] += 29
+    assert res.resolve("device.local") == ["192.168.1.1"]
+    clock[0] += 1
+    assert res.resolve("device.local") == ["192.168.1.2"]
+    assert res.resolve("10.0.0.1") == ["10.0.0.1"]
+    assert lookup.calls == ["device.local", "device.local"]
+
+
+def test_failures_are_cached(clock):
+    lookup = FakeLookup()
+    lookup.fail = True
+    res = Resolver(lookup)
+
+    for _ in range(2):
+        with pytest.raises(EsphomeError, match="Cannot resolve"):
+            res.resolve("device.local")
+    assert len(lookup.calls) == 1
+    clock[0] += resolver.NEGATIVE_TTL
+    lookup.fail = False
+    assert res.resolve("device.local") == ["192.168.1.2"]
+
+
+def test_concurrent_lookups_are_coalesced():
+    lookup = FakeLookup()
+    lookup.release.clear()
+    res = Resolver(lookup)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(res.resolve("device.local")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    lookup.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [["192.168.1.1"]] * 5
+    assert lookup.calls == ["device.local"]
+
+
+@pytest.mark.asyncio
+async def test_async_lookups_are_coalesced():
+    lookup = FakeLookup()
+    lookup.fail = True
+    res = Resolver(lookup)
+
+    results = await asyncio.gather(
+        *(res.async_resolve("device.local") for _ in range(5))
+    )
+    assert all(isinstance(result, EsphomeError) for result in results)
+    assert lookup.calls == ["device.local"]
+
+
+def test_addresses_are_kept_on_disk(tmp_path, clock):
+    path = str(tmp_path / "addresses.json")
+    Resolver(FakeLookup(), AddressCache(path)).resolve("device.local")
+
+    # A new command uses the cached addresses without a lookup
+    lookup = FakeLookup()
+    res = Resolver(lookup, AddressCache(path))
+    assert res.resolve("device.local") == ["192.168.1.1"]
+    assert lookup.calls == []
+
+    # But never expired ones, another device may use the address by now
+    clock[0] += 3600
+    lookup.fail = True
+    with pytest.raises(EsphomeError):
+        res.resolve("device.local")
+    assert lookup.calls == ["device.local"]
+    assert res.cached("device.local") is None
+
+
+def test_records_saved_by_another_process_are_used(tmp_path, clock):
+    path = str(tmp_path / "addresses.json")
+    lookup = FakeLookup()
+    res = Resolver(lookup, AddressCache(path))
+    res.resolve("first.local")
+
+    # For example the dashboard, which saw the device announce itself
+    AddressCache(path).update({"second.local": (["10.0.0.2"], 120)}, clock[0])
+
+    assert res.resolve("second.local") == ["10.0.0.2"]
+    assert res.resolve("first.local") == ["192.168.1.1"]
+    assert lookup.calls == ["first.local"]
@@ -0,0 +1,39 @@
+"""Tests for the utility functions of the command line."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from esphome import util
+
+
+def test_run_external_process_prefixed(capsys: pytest.CaptureFixture[str]) -> None:
+    rc = util.run_external_process_prefixed(
+        "dev | ",
+        sys.executable,
+        "-c",
+        "import sys; print('one', flush=True); print('two', file=sys.stderr); sys.exit(3)",
+    )
+
+    assert rc == 3
+    assert capsys.readouterr().out.splitlines() == ["dev | one", "dev | two"]
+
+
+def test_run_external_process_prefixed_missing_command() -> None:
+    assert util.run_external_process_prefixed("dev | ", "/nonexistent/command") == 1
+
+
+def test_safe_print_lines_holds_output_lock(monkeypatch: pytest.MonkeyPatch) -> None:
+    printed: list[tuple[str, bool]] = []
+    monkeypatch.setattr(
+        util,
+        "safe_print",
+        lambda line: printed.append((line, util._PREFIXED_OUTPUT_LOCK.locked())),
+    )
+
+    util.safe_print_lines("==== SUCCESS ====", "")
+
+    assert printed == [("==== SUCCESS ====", True), ("", True)]
+    assert not util._PREFIXED_OUTPUT_LOCK.locked()
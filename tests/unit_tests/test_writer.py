@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from esphome import cpp_generator as cg, cpp_types as ct, writer
+from esphome.core import CORE
+
+
+@pytest.fixture
+def build_path(tmp_path: Path) -> Path:
+    CORE.reset()
+    CORE.build_path = str(tmp_path)
+    yield tmp_path / "src" / writer.PROGMEM_DATA_DIR
+    CORE.reset()
+
+
+def test_write_progmem_data(build_path: Path) -> None:
+    CORE.progmem_data = [
+        cg.ProgmemData(ct.uint8, "first", b"\x01\x02"),
+        cg.ProgmemData(ct.uint8, "second", b"\x03"),
+    ]
+    writer.write_progmem_data()
+
+    assert sorted(p.name for p in build_path.iterdir()) == ["first.cpp", "second.cpp"]
+    assert "0x01, 0x02" in (build_path / "first.cpp").read_text()
+
+
+def test_write_progmem_data_only_writes_changes(build_path: Path) -> None:
+    CORE.progmem_data = [
+        cg.ProgmemData(ct.uint8, "first", b"\x01"),
+        cg.ProgmemData(ct.uint8, "second", b"\x02"),
+    ]
+    writer.write_progmem_data()
+    mtime = (build_path / "first.cpp").stat().st_mtime_ns
+    (build_path / "second.cpp").write_text("// stale\n")
+
+    CORE.progmem_data = [
+        cg.ProgmemData(ct.uint8, "first", b"\x01"),
+        cg.ProgmemData(ct.uint8, "third", b"\x03"),
+    ]
+    writer.write_progmem_data()
+
+    assert (build_path / "first.cpp").stat().st_mtime_ns == mtime
+    assert sorted(p.name for p in build_path.iterdir()) == ["first.cpp", "third.cpp"]
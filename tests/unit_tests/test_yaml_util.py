@@ -62,3 +62,12 @@ def test_parsing_with_custom_loader(fixture_path):
     assert loader_calls[0].endswith("includes/included.yaml")
     assert loader_calls[1].endswith("includes/list.yaml")
     assert loader_calls[2].endswith("includes/scalar.yaml")
+
+
+def test_loaded_values_reference_source_file(fixture_path):
+    """Document ranges point at the file the value was loaded from."""
+    yaml_file = fixture_path / "yaml_util" / "includetest.yaml"
+
+    actual = yaml_util.load_yaml(yaml_file)
+
+    assert actual["esphome"].esp_range.start_mark.document == str(yaml_file)